@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+파이프라인 스크립트 import 시간 벤치마크
+
+각 대상을 새 파이썬 프로세스에서 로드하여 import 시간과 함께 불러온 무거운 패키지
+(torch/whisper, moviepy, openai, google 클라이언트 등)를 보고합니다.
+메타데이터 전용 명령은 1초 안에 시작해야 합니다.
+
+Usage:
+    python scripts/benchmark_imports.py
+    python scripts/benchmark_imports.py 20_create_episode_metadata.py --budget 1.0
+    python scripts/benchmark_imports.py --repeat 3
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = [
+    "torch", "whisper", "moviepy", "openai", "anthropic",
+    "googleapiclient", "google.cloud.texttospeech", "google.genai", "replicate",
+]
+
+# 메타데이터 전용 경로 (영상 렌더링/AI 호출 없이 동작해야 함)
+DEFAULT_TARGETS = [
+    "src.utils.file_utils",
+    "20_create_episode_metadata.py",
+    "08_create_and_preview_videos.py",
+    "08_generate_summary.py",
+    "09_text_to_speech_multi.py",
+    "03_make_video.py",
+]
+
+_PROBE = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+target = {target!r}
+if target.endswith(".py"):
+    from src.utils.module_loader import load_script
+    load_script(target)
+else:
+    import importlib
+    importlib.import_module(target)
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print("__BENCH__" + json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure(target: str) -> dict:
+    """새 프로세스에서 대상 로드 시간 측정"""
+    code = _PROBE.format(
+        root=str(PROJECT_ROOT), src=str(PROJECT_ROOT / "src"), target=target, heavy=HEAVY_MODULES,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("__BENCH__"):
+            return json.loads(line[len("__BENCH__"):])
+    error = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+    return {"seconds": None, "heavy": [], "error": error}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 스크립트 import 시간 벤치마크")
+    parser.add_argument("targets", nargs="*", help="src/ 기준 스크립트 파일명 또는 모듈 경로")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--budget", type=float, default=None, help="허용 시간(초). 초과 시 종료 코드 1")
+    args = parser.parse_args()
+
+    targets = args.targets or DEFAULT_TARGETS
+    over_budget = False
+
+    print(f"{'대상':<40} {'시간':>8}  무거운 패키지")
+    print("-" * 80)
+    for target in targets:
+        runs = [measure(target) for _ in range(max(1, args.repeat))]
+        ok = [r for r in runs if r["seconds"] is not None]
+        if not ok:
+            print(f"{target:<40} {'실패':>8}  {runs[0]['error']}")
+            over_budget = over_budget or args.budget is not None
+            continue
+        best = min(ok, key=lambda r: r["seconds"])
+        heavy = ", ".join(best["heavy"]) or "-"
+        mark = ""
+        if args.budget is not None and best["seconds"] > args.budget:
+            over_budget = True
+            mark = "  ⚠️ 초과"
+        print(f"{target:<40} {best['seconds']:>7.2f}s  {heavy}{mark}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,10 +20,11 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-import requests
-
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.http_client import get_http_client
 
 
 def get_uploaded_books() -> set[str]:
@@ -68,7 +69,7 @@ def _fetch_aladin_api(api_key: str, limit: int) -> list[dict]:
             "CategoryId": 0,  # 전체
         }
         try:
-            resp = requests.get(url, params=params, timeout=10)
+            resp = get_http_client().get(url, params=params, timeout=10)
             data = resp.json()
             for item in data.get("item", []):
                 books.append({
@@ -102,7 +103,7 @@ def _fetch_aladin_scrape(limit: int) -> list[dict]:
 
     for url in urls:
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = get_http_client().get(url, headers=headers, timeout=10)
             # 책 제목 파싱 (알라딘 HTML 구조 기반)
             titles = re.findall(
                 r'class="bo3"[^>]*>\s*<a[^>]*>([^<]+)</a>', resp.text
@@ -138,7 +139,7 @@ def _fetch_kyobo_scrape(limit: int) -> list[dict]:
     headers = {"User-Agent": "Mozilla/5.0"}
     url = "https://product.kyobobook.co.kr/best?period=002&type=001&gbCode=TOT&pageSize=100"
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = get_http_client().get(url, headers=headers, timeout=10)
         titles = re.findall(r'"book_name"\s*:\s*"([^"]+)"', resp.text)
         authors = re.findall(r'"author"\s*:\s*"([^"]+)"', resp.text)
         for i, title in enumerate(titles[:limit]):
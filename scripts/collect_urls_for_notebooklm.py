@@ -15,9 +15,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from duckduckgo_search import DDGS
 from bs4 import BeautifulSoup
-import requests
 from dotenv import load_dotenv
 
+from utils.http_client import get_http_client
+
 # YouTube API import
 try:
     from googleapiclient.discovery import build
@@ -31,10 +32,10 @@ class NotebookLMURLCollector:
     """NotebookLM용 URL 수집 클래스 (한글/영어 분리 수집)"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.http = get_http_client()
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        }
         self.urls = []
         self.ddgs = DDGS()  # DuckDuckGo 검색 인스턴스
         
@@ -345,7 +346,7 @@ class NotebookLMURLCollector:
     def validate_url(self, url: str) -> Dict[str, any]:
         """URL 유효성 검증"""
         try:
-            response = self.session.get(url, timeout=10, allow_redirects=True)
+            response = self.http.get(url, headers=self.headers, timeout=10, retries=1)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -20,6 +20,12 @@ NotebookLM 완전 자동화 파이프라인
 
   # 특정 단계만 재시도
   python scripts/notebooklm_full_pipeline.py --book-title "어린왕자" --retry-step notebooklm_ko
+
+  # 입력 변경과 무관하게 모든 단계 다시 실행
+  python scripts/notebooklm_full_pipeline.py --book-title "어린왕자" --force
+
+재실행 시 각 단계의 입력(파일 내용 해시)과 파라미터가 이전 실행과 같으면 해당 단계를
+건너뜁니다 (.pipeline_state/{책제목}_artifacts.json).
 """
 
 import sys
@@ -37,6 +43,8 @@ from enum import Enum
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.utils.artifact_graph import ArtifactGraph
+
 # 상태 저장 디렉토리
 STATE_DIR = PROJECT_ROOT / ".pipeline_state"
 STATE_DIR.mkdir(exist_ok=True)
@@ -141,6 +149,129 @@ def is_step_completed(state: PipelineState, step_name: str) -> bool:
     return state.steps.get(step_name, {}).get("status") == StepStatus.COMPLETED.value
 
 
+def get_artifacts_path(book_title: str) -> Path:
+    """산출물 그래프 매니페스트 경로 반환"""
+    safe_title = "".join(c if c.isalnum() or c in "-_" else "_" for c in book_title)
+    return STATE_DIR / f"{safe_title}_artifacts.json"
+
+
+def build_artifact_graph(state: PipelineState, langs: List[str]) -> ArtifactGraph:
+    """
+    단계별 입력/출력/파라미터 선언
+
+    요약 텍스트·TTS 오디오는 영상 제작 단계(10_create_video_with_summary.py)가 함께 만들고,
+    썸네일은 파이프라인 밖에서 준비되므로 실행 단계가 아닌 산출물로만 선언합니다.
+    """
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    from utils.asset_resolver import get_asset_resolver, lang_suffixes
+    from utils.file_utils import get_standard_safe_title
+
+    safe_title = "".join(c if c.isalnum() or c in "-_" else "_" for c in state.book_title)
+    standard_title = get_standard_safe_title(state.book_title)
+    args = state.args
+    book = {"book_title": state.book_title, "author": state.author}
+
+    graph = ArtifactGraph(get_artifacts_path(state.book_title), root=PROJECT_ROOT)
+    graph.stage(
+        "images",
+        outputs=[f"assets/images/{safe_title}"],
+        params={**book, "num_mood": 100, "skip_validation": bool(args.get("skip_validation"))},
+    )
+
+    for lang in langs:
+        lang_suffix = "kr" if lang == "ko" else "en"
+        graph.stage(
+            f"collect_urls_{lang}",
+            outputs=[f"data/notebooklm_urls/{safe_title}_{lang}.md"],
+            params={**book, "language": lang, "num_urls": args.get("num_urls", 30)},
+        )
+        graph.stage(
+            f"notebooklm_{lang}",
+            deps=[f"collect_urls_{lang}"],
+            outputs=[f"input/{safe_title}_video_{lang_suffix}.mp4"],
+            params={**book, "language": lang},
+        )
+        graph.stage(
+            f"summary_{lang}",
+            outputs=[f"assets/summaries/{standard_title}_summary_{lang_suffix}.md"],
+            params={**book, "language": lang, "summary_duration": args.get("summary_duration", 5.0)},
+        )
+        graph.stage(
+            f"tts_{lang}",
+            deps=[f"summary_{lang}"],
+            outputs=[f"assets/audio/{standard_title}_summary_{lang_suffix}.mp3"],
+            params={"tts_provider": args.get("tts_provider"), "tts_voice": args.get("tts_voice")},
+        )
+        graph.stage(
+            f"video_{lang}",
+            deps=[f"notebooklm_{lang}", f"tts_{lang}", "images"],
+            outputs=[f"output/{standard_title}_{lang_suffix}.mp4"],
+            params={**book, "language": lang,
+                    "summary_audio_volume": args.get("summary_audio_volume", 1.2)},
+        )
+        # 표준 이름은 _kr, 이전 생성기가 만든 _ko 썸네일도 그대로 추적
+        thumbnail = get_asset_resolver().find(
+            PROJECT_ROOT / "output", [standard_title], ("thumbnail",), lang_suffixes(lang), (".jpg",)
+        )
+        graph.stage(
+            f"thumbnail_{lang}",
+            outputs=[thumbnail or f"output/{standard_title}_thumbnail_{lang_suffix}.jpg"],
+        )
+
+    # 설명/제목 템플릿이 바뀌면 메타데이터만 다시 생성
+    graph.stage(
+        "metadata",
+        inputs=[
+            "src/08_create_and_preview_videos.py",
+            "src/utils/title_generator.py",
+            f"assets/images/{safe_title}/book_info.json",
+        ],
+        deps=[f"{kind}_{lang}" for lang in langs for kind in ("video", "thumbnail")],
+        outputs=[f"output/{standard_title}_{'kr' if lang == 'ko' else 'en'}.metadata.json" for lang in langs],
+        params=book,
+    )
+    graph.stage(
+        "upload",
+        deps=["metadata"] + [f"{kind}_{lang}" for lang in langs for kind in ("video", "thumbnail")],
+        params={"privacy": args.get("privacy", "private")},
+    )
+    return graph
+
+
+def is_artifact_fresh(state: PipelineState, graph: Optional[ArtifactGraph], step_name: str) -> bool:
+    """입력 해시/파라미터가 이전 실행과 같으면 단계를 완료 처리하고 True 반환"""
+    if graph is None or step_name not in graph or state.args.get("force"):
+        return False
+    reason = graph.stale_reason(step_name)
+    if reason is None:
+        outputs = graph.stages[step_name].outputs
+        update_step(state, step_name, StepStatus.COMPLETED.value, str(outputs[0]) if outputs else None)
+        print(f"   ⏭️  {step_name}: 입력 변경 없음, 건너뜀")
+        return True
+    if graph.has_record(step_name):
+        print(f"   🔁 {step_name}: 다시 실행 ({reason})")
+    return False
+
+
+def clean_stale_derived(graph: Optional[ArtifactGraph], lang: str) -> None:
+    """
+    요약 텍스트/TTS 오디오가 입력 변경으로 낡았으면 삭제
+
+    10_create_video_with_summary.py는 파일이 있으면 재사용하므로, 낡은 파생 산출물을
+    지워야 새 파라미터/텍스트로 다시 생성됩니다. 기록이 없는 파일(직접 준비한 파일)은 건드리지 않습니다.
+    """
+    if graph is None:
+        return
+    for step_name in (f"summary_{lang}", f"tts_{lang}"):
+        if step_name not in graph or not graph.has_record(step_name):
+            continue
+        reason = graph.stale_reason(step_name)
+        if reason is None:
+            continue
+        for path in graph.clean(step_name):
+            print(f"   🧹 {step_name}: {path.name} 삭제 ({reason})")
+
+
 def run_subprocess(cmd: List[str], timeout: int, _step_name: str,
                    env: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
     """서브프로세스 실행"""
@@ -181,12 +312,15 @@ def _xvfb_wrap(cmd: List[str]) -> List[str]:
     return cmd
 
 
-def step_collect_urls(state: PipelineState, lang: str) -> Tuple[bool, Optional[str]]:
+def step_collect_urls(state: PipelineState, lang: str,
+                      graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """URL 수집 단계"""
     step_name = f"collect_urls_{lang}"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     print(f"\n{'='*60}")
     print(f"📋 Step: URL 수집 ({lang.upper()})")
@@ -228,12 +362,16 @@ def step_collect_urls(state: PipelineState, lang: str) -> Tuple[bool, Optional[s
             import shutil
             shutil.copy(found_files[0], output_path)
             update_step(state, step_name, StepStatus.COMPLETED.value, str(output_path))
+            if graph:
+                graph.record(step_name)
             print(f"   ✅ URL 수집 완료: {output_path}")
             return True, str(output_path)
         else:
             # 파일이 없어도 성공으로 처리 (이미 data/notebooklm_urls에 있을 수 있음)
             if output_path.exists():
                 update_step(state, step_name, StepStatus.COMPLETED.value, str(output_path))
+                if graph:
+                    graph.record(step_name)
                 print(f"   ✅ URL 파일 확인: {output_path}")
                 return True, str(output_path)
             update_step(state, step_name, StepStatus.FAILED.value, error="URL 파일을 찾을 수 없음")
@@ -244,12 +382,15 @@ def step_collect_urls(state: PipelineState, lang: str) -> Tuple[bool, Optional[s
         return False, None
 
 
-def step_notebooklm(state: PipelineState, lang: str) -> Tuple[bool, Optional[str]]:
+def step_notebooklm(state: PipelineState, lang: str,
+                    graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """NotebookLM 비디오 생성 단계"""
     step_name = f"notebooklm_{lang}"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     print(f"\n{'='*60}")
     print(f"🎬 Step: NotebookLM 비디오 생성 ({lang.upper()})")
@@ -321,6 +462,8 @@ def step_notebooklm(state: PipelineState, lang: str) -> Tuple[bool, Optional[str
 
     if success and output_path.exists():
         update_step(state, step_name, StepStatus.COMPLETED.value, str(output_path))
+        if graph:
+            graph.record(step_name)
         print(f"   ✅ NotebookLM 비디오 생성 완료: {output_path}")
         return True, str(output_path)
     else:
@@ -330,12 +473,15 @@ def step_notebooklm(state: PipelineState, lang: str) -> Tuple[bool, Optional[str
         return False, None
 
 
-def step_images(state: PipelineState) -> Tuple[bool, Optional[str]]:
+def step_images(state: PipelineState,
+                graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """이미지 다운로드 단계"""
     step_name = "images"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     print(f"\n{'='*60}")
     print(f"🖼️  Step: 이미지 다운로드")
@@ -365,6 +511,8 @@ def step_images(state: PipelineState) -> Tuple[bool, Optional[str]]:
 
     if success:
         update_step(state, step_name, StepStatus.COMPLETED.value, str(output_dir))
+        if graph:
+            graph.record(step_name)
         print(f"   ✅ 이미지 다운로드 완료: {output_dir}")
         return True, str(output_dir)
     else:
@@ -373,18 +521,22 @@ def step_images(state: PipelineState) -> Tuple[bool, Optional[str]]:
         return False, None
 
 
-def step_video_creation(state: PipelineState, lang: str) -> Tuple[bool, Optional[str]]:
+def step_video_creation(state: PipelineState, lang: str,
+                        graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """영상 제작 단계 (Summary + NotebookLM)"""
     step_name = f"video_{lang}"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     print(f"\n{'='*60}")
     print(f"🎥 Step: 영상 제작 ({lang.upper()})")
     print(f"{'='*60}")
 
     update_step(state, step_name, StepStatus.RUNNING.value)
+    clean_stale_derived(graph, lang)
 
     # 출력 경로
     lang_suffix = "kr" if lang == "ko" else "en"
@@ -427,6 +579,12 @@ def step_video_creation(state: PipelineState, lang: str) -> Tuple[bool, Optional
 
     if success and output_path.exists():
         update_step(state, step_name, StepStatus.COMPLETED.value, str(output_path))
+        if graph:
+            # 영상 제작 중 생성/재사용된 요약 텍스트와 TTS 오디오도 함께 기록
+            for derived in (f"summary_{lang}", f"tts_{lang}"):
+                if all(path.exists() for path in graph.stages[derived].outputs):
+                    graph.record(derived)
+            graph.record(step_name)
         print(f"   ✅ 영상 제작 완료: {output_path}")
         return True, str(output_path)
     else:
@@ -436,12 +594,15 @@ def step_video_creation(state: PipelineState, lang: str) -> Tuple[bool, Optional
         return False, None
 
 
-def step_metadata(state: PipelineState) -> Tuple[bool, Optional[str]]:
+def step_metadata(state: PipelineState,
+                  graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """메타데이터 생성 단계"""
     step_name = "metadata"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     print(f"\n{'='*60}")
     print(f"📝 Step: 메타데이터 생성")
@@ -467,6 +628,9 @@ def step_metadata(state: PipelineState) -> Tuple[bool, Optional[str]]:
         output_dir = PROJECT_ROOT / "output"
         metadata_files = list(output_dir.glob(f"{safe_title}_*_metadata.json"))
 
+        if graph:
+            graph.record(step_name)
+
         if metadata_files:
             update_step(state, step_name, StepStatus.COMPLETED.value, str(output_dir))
             print(f"   ✅ 메타데이터 생성 완료")
@@ -481,12 +645,15 @@ def step_metadata(state: PipelineState) -> Tuple[bool, Optional[str]]:
         return False, None
 
 
-def step_upload(state: PipelineState) -> Tuple[bool, Optional[str]]:
+def step_upload(state: PipelineState,
+                graph: Optional[ArtifactGraph] = None) -> Tuple[bool, Optional[str]]:
     """YouTube 업로드 단계"""
     step_name = "upload"
     if is_step_completed(state, step_name):
         print(f"   ⏭️  {step_name}: 이미 완료됨, 건너뜀")
         return True, state.steps[step_name].get("output_path")
+    if is_artifact_fresh(state, graph, step_name):
+        return True, state.steps[step_name].get("output_path")
 
     if state.args.get("skip_upload"):
         print(f"\n   ⏭️  업로드 건너뜀 (--skip-upload)")
@@ -512,6 +679,8 @@ def step_upload(state: PipelineState) -> Tuple[bool, Optional[str]]:
 
     if success:
         update_step(state, step_name, StepStatus.COMPLETED.value)
+        if graph:
+            graph.record(step_name)
         print(f"   ✅ YouTube 업로드 완료")
         return True, None
     else:
@@ -550,6 +719,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     if args.resume and state:
         print(f"📂 이전 상태 로드: {get_state_path(book_title)}")
         print(f"   시작 시간: {state.started_at}")
+        state.args["force"] = args.force
         # CLI에서 profile_dir가 명시된 경우 기존 state 덮어쓰기
         if args.profile_dir:
             state.args["profile_dir"] = args.profile_dir
@@ -558,6 +728,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
         # 해당 단계 상태를 pending으로 리셋
         if args.retry_step in state.steps:
             state.steps[args.retry_step] = asdict(PipelineStep())
+        state.args["force"] = args.force
     else:
         # 새 상태 생성
         state = PipelineState(
@@ -576,6 +747,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
                 "tts_voice": args.tts_voice,
                 "skip_validation": args.skip_validation,
                 "profile_dir": args.profile_dir,
+                "force": args.force,
             }
         )
         save_state(state)
@@ -596,6 +768,16 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     if language in ["en", "both"]:
         langs.append("en")
 
+    # 산출물 그래프 (입력이 바뀌지 않은 단계는 건너뜀)
+    graph = build_artifact_graph(state, langs)
+    if args.retry_step and args.retry_step in graph:
+        graph.invalidate(args.retry_step)
+    if not args.force:
+        stale = {name for name, _ in graph.plan()}
+        fresh = [name for name in graph.stages if graph.has_record(name) and name not in stale]
+        if fresh:
+            print(f"🧮 변경 없는 단계 {len(fresh)}개: {', '.join(fresh)}")
+
     # ===========================================
     # Phase 1: URL 수집 (병렬)
     # ===========================================
@@ -603,7 +785,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
 
     url_tasks = []
     for lang in langs:
-        url_tasks.append(step_collect_urls(state, lang))
+        url_tasks.append(step_collect_urls(state, lang, graph))
 
     # 병렬 실행 (동기 함수이므로 순차 실행하지만 결과는 동일)
     url_results = {}
@@ -623,7 +805,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     print(f"\n📍 Phase 2: NotebookLM 비디오 생성 (순차)")
 
     for lang in langs:
-        success, output = step_notebooklm(state, lang)
+        success, output = step_notebooklm(state, lang, graph)
         if not success:
             print(f"\n❌ 파이프라인 실패: NotebookLM 비디오 생성 ({lang}) 실패")
             return False
@@ -633,7 +815,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     # ===========================================
     print(f"\n📍 Phase 3: 이미지 다운로드")
 
-    success, output = step_images(state)
+    success, output = step_images(state, graph)
     if not success:
         print(f"\n❌ 파이프라인 실패: 이미지 다운로드 실패")
         return False
@@ -644,7 +826,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     print(f"\n📍 Phase 4: 영상 제작")
 
     for lang in langs:
-        success, output = step_video_creation(state, lang)
+        success, output = step_video_creation(state, lang, graph)
         if not success:
             print(f"\n❌ 파이프라인 실패: 영상 제작 ({lang}) 실패")
             return False
@@ -654,7 +836,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     # ===========================================
     print(f"\n📍 Phase 5: 메타데이터 생성")
 
-    success, output = step_metadata(state)
+    success, output = step_metadata(state, graph)
     if not success:
         print(f"\n❌ 파이프라인 실패: 메타데이터 생성 실패")
         return False
@@ -665,7 +847,7 @@ async def run_pipeline(args: argparse.Namespace) -> bool:
     if not args.skip_upload:
         print(f"\n📍 Phase 6: YouTube 업로드")
 
-        success, output = step_upload(state)
+        success, output = step_upload(state, graph)
         if not success:
             print(f"\n⚠️  업로드 실패 (영상은 생성됨)")
     else:
@@ -748,6 +930,8 @@ def main():
     parser.add_argument("--resume", action="store_true",
                         help="중단된 파이프라인 재개")
     parser.add_argument("--retry-step", help="특정 단계만 재시도")
+    parser.add_argument("--force", action="store_true",
+                        help="입력 변경 여부와 관계없이 모든 단계 다시 실행")
 
     # NotebookLM 옵션
     parser.add_argument("--headless", action="store_true",
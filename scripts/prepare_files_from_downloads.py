@@ -18,6 +18,7 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.file_utils import get_standard_safe_title
+from src.utils.image_loader import load_rgb
 
 # YouTube 롱폼 썸네일 크기 (16:9 비율)
 THUMBNAIL_SIZE = (3840, 2160)  # 4K 해상도
@@ -55,16 +56,8 @@ def resize_and_crop(img: Image.Image, target_size: tuple) -> Image.Image:
 def convert_png_to_jpg(input_path: Path, output_path: Path) -> bool:
     """PNG 파일을 JPG로 변환"""
     try:
-        img = Image.open(input_path)
-        
-        # RGBA를 RGB로 변환 (PNG 투명도 처리)
-        if img.mode == 'RGBA':
-            # 흰색 배경에 합성
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])  # alpha 채널을 마스크로 사용
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        # RGB로 변환 (PNG 투명도는 흰색 배경에 합성, JPEG는 축소 디코딩)
+        img = load_rgb(input_path, THUMBNAIL_SIZE, background=(255, 255, 255))
         
         # 리사이즈 (비율 유지하며 크롭)
         img = resize_and_crop(img, THUMBNAIL_SIZE)
@@ -119,7 +119,7 @@ def main():
         print("")
         print("다음 단계:")
         print("  1. analytics 스크립트 실행: python src/22_analytics_recommendations.py --days 90")
-        print("  2. 업로드 시간 분석: python src/18_analyze_optimal_upload_time.py")
+        print("  2. 업로드 시간 분석: python src/18_analyze_optimal_upload_time.py --sync")
 
     except Exception as e:
         print(f"오류 발생: {e}")
@@ -103,17 +103,21 @@ def main():
             print(f"   ❌ 영상 파일 없음: {video_path}")
             continue
 
-        result = uploader.upload_video(
-            channel_id=args.channel_id,
-            video_path=str(video_path),
-            title=title,
-            description=description,
-            tags=tags,
-            privacy_status='private',
-            publish_at=publish_at,
-            thumbnail_path=thumbnail_path,
-            localizations=localizations,
-        )
+        try:
+            result = uploader.upload_video(
+                channel_id=args.channel_id,
+                video_path=str(video_path),
+                title=title,
+                description=description,
+                tags=tags,
+                privacy_status='private',
+                publish_at=publish_at,
+                thumbnail_path=thumbnail_path,
+                localizations=localizations,
+            )
+        except mod.QuotaExhausted as e:
+            print(f"   ⏸️ {e}")
+            break
 
         if result:
             vid_id = result.get('video_id', '')
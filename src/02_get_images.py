@@ -8,7 +8,6 @@ import os
 import json
 import time
 import base64
-import requests
 from pathlib import Path
 from typing import List, Dict, Optional
 import concurrent.futures
@@ -24,6 +23,21 @@ try:
 except ImportError:
     from src.utils.logger import get_logger
 
+try:
+    from utils.http_client import get_http_client
+except ImportError:
+    from src.utils.http_client import get_http_client
+
+try:
+    from utils.image_quality import prerank_images
+except ImportError:
+    from src.utils.image_quality import prerank_images
+
+try:
+    from utils.image_variants import build_variants_for_dir
+except ImportError:
+    from src.utils.image_variants import build_variants_for_dir
+
 try:
     import openai
     OPENAI_AVAILABLE = True
@@ -56,6 +70,7 @@ class ImageDownloader:
     
     def __init__(self):
         self.logger = get_logger(__name__)
+        self.http = get_http_client()
         
         # API 키 로드
         self.google_books_api_key = os.getenv("GOOGLE_BOOKS_API_KEY")
@@ -83,25 +98,15 @@ class ImageDownloader:
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.claude_api_key = os.getenv("CLAUDE_API_KEY")
     
-    @retry_with_backoff(retries=3, backoff_in_seconds=1.0)
     def _download_single_image(self, url: str, output_path: Path) -> str:
-        """단일 이미지 다운로드 (병렬 처리용)"""
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
-        return str(output_path)
+        """단일 이미지 다운로드 (병렬 처리용, 재시도는 HTTP 클라이언트가 처리)"""
+        return str(self.http.download(url, output_path, timeout=10))
 
-    @retry_with_backoff(retries=3, backoff_in_seconds=2.0)
     def _make_request(self, url: str, headers: Dict = None, params: Dict = None) -> Dict:
-        """API 요청 수행 (재시도 로직 포함)"""
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        """API 요청 수행 (재시도/Retry-After 처리는 HTTP 클라이언트가 담당)"""
+        return self.http.get_json(url, headers=headers, params=params, timeout=10)
 
-    @retry_with_backoff(retries=3, backoff_in_seconds=2.0)
+    @retry_with_backoff(retries=3, backoff_in_seconds=2.0, provider="pexels")
     def _search_pexels(self, keyword: str, page: int, results_per_page: int) -> Dict:
         """Pexels 검색 수행 (재시도 로직 포함)"""
         if not self.pexels:
@@ -229,15 +234,8 @@ class ImageDownloader:
                     
                     if image_url:
                         try:
-                            # 이미지 다운로드
-                            response = requests.get(image_url, timeout=10)
-                            response.raise_for_status()
-                            
-                            output_path = output_dir / "cover.jpg"
-                            
-                            # 파일 저장
-                            with open(output_path, 'wb') as f:
-                                f.write(response.content)
+                            # 이미지 다운로드 및 저장
+                            output_path = self.http.download(image_url, output_dir / "cover.jpg", timeout=10)
                             
                             self.logger.info(f"✅ 표지 다운로드 완료: {output_path}")
                         except Exception as e:
@@ -317,6 +315,8 @@ class ImageDownloader:
             self.logger.error(f"오류: {e}")
             return None
     
+    # 제공자 서킷은 검색 호출(_search_pexels, HTTP 클라이언트의 호스트별 서킷)에서만 판정:
+    # 배치는 검색 오류를 삼키고 정상 반환하므로 여기서 판정하면 열린 서킷이 매번 닫힘
     @retry_with_backoff(retries=3, backoff_in_seconds=2.0)
     def download_mood_images_unsplash(self, keywords: List[str], num_images: int = 100, output_dir: Path = None, max_per_keyword_override: Optional[int] = None) -> List[str]:
         """
@@ -606,27 +606,79 @@ class ImageDownloader:
         
         return downloaded
     
-    def validate_images_with_ai(self, image_dir: Path, book_title: str, author: str = None, target_count: int = 100) -> List[Path]:
+    def _delete_images(self, image_paths: List[Path]) -> int:
+        """이미지 파일 삭제 (삭제된 개수 반환)"""
+        deleted_count = 0
+        for img_path in image_paths:
+            try:
+                img_path.unlink()
+                deleted_count += 1
+            except Exception as e:
+                self.logger.warning(f"이미지 삭제 실패 ({img_path.name}): {e}")
+        return deleted_count
+
+    def prerank_images_locally(self, image_dir: Path, target_count: int, margin: int = 10) -> List[Path]:
+        """
+        AI 검증 전 로컬 품질 점수로 후보 이미지를 추림.
+
+        해상도/16:9 적합도/선명도/노출/색상 다양성/중복 거리를 측정하여
+        사용 불가 이미지와 후보권(target_count + margin) 밖 이미지를 삭제합니다.
+
+        Args:
+            image_dir: 이미지 디렉토리 경로
+            target_count: 최종 유지할 이미지 수
+            margin: AI 검증에 추가로 보낼 여유 후보 수
+
+        Returns:
+            로컬 점수 내림차순 후보 이미지 경로 목록
+        """
+        all_images = sorted(image_dir.glob("mood_*.jpg"))
+        if not all_images:
+            return []
+
+        usable, rejected = prerank_images(all_images)
+        for q in rejected:
+            self.logger.debug(f"  ✗ {q.path.name}: {', '.join(q.reasons)}")
+
+        shortlist_size = target_count + margin
+        overflow = usable[shortlist_size:]
+        deleted_count = self._delete_images([q.path for q in rejected + overflow])
+        self.logger.info(
+            f"🧮 로컬 사전 평가: {len(all_images)}개 중 사용 불가 {len(rejected)}개, "
+            f"후보권 밖 {len(overflow)}개 삭제 ({deleted_count}개) → {min(len(usable), shortlist_size)}개 후보"
+        )
+        return [q.path for q in usable[:shortlist_size]]
+
+    def validate_images_with_ai(self, image_dir: Path, book_title: str, author: str = None, target_count: int = 100, prerank_margin: int = 10) -> List[Path]:
         """
         GPT-4o Vision으로 다운로드된 이미지의 책 관련성을 검증하고 상위 이미지만 유지.
 
+        Vision 호출 전에 로컬 품질 점수(prerank_images_locally)로 후보를 먼저 추려,
+        상위 target_count + prerank_margin개만 AI 검증에 보냅니다.
+
         Args:
             image_dir: 이미지 디렉토리 경로
             book_title: 책 제목
             author: 저자 이름
             target_count: 최종 유지할 이미지 수 (기본: 100)
+            prerank_margin: 로컬 사전 평가 후 AI 검증에 추가로 보낼 후보 수 (기본: 10)
 
         Returns:
             검증 후 유지된 이미지 경로 목록
         """
-        if not OPENAI_AVAILABLE or not self.openai_api_key:
-            self.logger.warning("OpenAI API 키가 없어 이미지 검증을 건너뜁니다.")
-            return list(image_dir.glob("mood_*.jpg"))[:target_count]
-
-        all_images = sorted(image_dir.glob("mood_*.jpg"))
+        all_images = self.prerank_images_locally(image_dir, target_count, margin=prerank_margin)
         if not all_images:
             return []
 
+        if len(all_images) <= target_count:
+            self.logger.info(f"✅ 사전 평가 후 후보 {len(all_images)}개 ≤ 목표 {target_count}개 - AI 검증 생략")
+            return all_images
+
+        if not OPENAI_AVAILABLE or not self.openai_api_key:
+            self.logger.warning("OpenAI API 키가 없어 이미지 검증을 건너뜁니다. (로컬 점수 상위 이미지 유지)")
+            self._delete_images(all_images[target_count:])
+            return all_images[:target_count]
+
         self.logger.info(f"🔍 AI 이미지 검증 시작: {len(all_images)}개 이미지 → 상위 {target_count}개 선별")
 
         author_str = f" by {author}" if author else ""
@@ -709,7 +761,7 @@ class ImageDownloader:
             self.logger.warning("검증 결과 없음 - 원본 이미지 목록 반환")
             return list(all_images)[:target_count]
 
-        # 점수순 내림차순 정렬
+        # 점수순 내림차순 정렬 (안정 정렬이므로 동점이면 로컬 품질 점수 순서 유지)
         scored_images.sort(key=lambda x: x[0], reverse=True)
 
         # 점수 분포 로깅
@@ -720,13 +772,7 @@ class ImageDownloader:
         removed = [p for _, p in scored_images[target_count:]]
 
         # 점수 낮은 이미지 삭제
-        deleted_count = 0
-        for img_path in removed:
-            try:
-                img_path.unlink()
-                deleted_count += 1
-            except Exception as e:
-                self.logger.warning(f"이미지 삭제 실패 ({img_path.name}): {e}")
+        deleted_count = self._delete_images(removed)
 
         # 유지된 이미지 중 점수 낮은 것(1-4점) 개수 로깅
         low_score_kept = sum(1 for s, _ in scored_images[:target_count] if s <= 4)
@@ -793,6 +839,7 @@ class ImageDownloader:
         if existing_count >= num_mood_images:
             self.logger.info(f"✅ 기존 이미지 발견: {existing_count}개 (목표: {num_mood_images}개)")
             self.logger.info("이미지 다운로드를 건너뜁니다.")
+            self.prepare_render_variants(output_dir)
             return {
                 'cover_path': str(cover_path) if cover_path else None,
                 'mood_images': [str(img) for img in existing_images[:num_mood_images]],
@@ -929,6 +976,9 @@ class ImageDownloader:
                 self.logger.info("⏩ AI 검증 건너뜀 (--skip-validation)")
             mood_images = mood_images[:num_mood_images]
 
+        # 5. 렌더용 변형 생성 (Ken Burns 캔버스 / letterbox 프레임 / Shorts 크롭)
+        self.prepare_render_variants(output_dir)
+
         # mood_images가 Path 객체 리스트인 경우 문자열로 변환
         mood_images_str = [str(img) if isinstance(img, Path) else img for img in mood_images]
 
@@ -939,6 +989,23 @@ class ImageDownloader:
             'total_mood_images': len(mood_images_str)
         }
     
+    def prepare_render_variants(self, image_dir: Path) -> int:
+        """
+        다운로드 후처리: 무드 이미지별 렌더용 변형 생성
+
+        렌더 시 원본 디코딩/리사이즈를 건너뛸 수 있도록 1920x1080 Ken Burns 캔버스,
+        세로형 letterbox 프레임, 1080x1920 Shorts 크롭을 미리 만들어 둡니다.
+        이미 최신 변형이 있는 이미지는 건너뜁니다.
+        """
+        self.logger.info("🧩 렌더용 이미지 변형 생성 중...")
+        try:
+            ready = build_variants_for_dir(image_dir, logger=self.logger)
+        except Exception as e:
+            self.logger.warning(f"렌더용 변형 생성 실패 (렌더 시 원본 사용): {e}")
+            return 0
+        self.logger.info(f"✅ 렌더용 변형 준비 완료: {ready}개 이미지")
+        return ready
+
     def _generate_keywords(self, book_title: str, author: str = None) -> List[str]:
         """
         책과 관련된 키워드 생성 (저작권 없는 이미지 검색용)
@@ -37,15 +37,36 @@ except ImportError as e:
         print("pip install moviepy")
 
 try:
-    import whisper
-    WHISPER_AVAILABLE = True
+    from utils.logger import get_logger
+    from utils.module_loader import is_available, lazy_import
 except ImportError:
-    WHISPER_AVAILABLE = False
+    from src.utils.logger import get_logger
+    from src.utils.module_loader import is_available, lazy_import
+
+# whisper는 torch를 함께 불러오므로 자막 생성 시점에만 import
+whisper = lazy_import("whisper")
+WHISPER_AVAILABLE = is_available("whisper")
 
 try:
-    from utils.logger import get_logger
+    from utils.image_variants import VIDEO_RESOLUTION, kenburns_canvas_size, load_render_variant
+    from utils.image_loader import image_size, load_rgb
 except ImportError:
-    from src.utils.logger import get_logger
+    from src.utils.image_variants import VIDEO_RESOLUTION, kenburns_canvas_size, load_render_variant
+    from src.utils.image_loader import image_size, load_rgb
+
+try:
+    from utils.segment_cache import concat_segments, get_segment_cache, segment_key, text_digest
+    from utils.audio_mixer import AudioMixer
+    from utils.audio_master import resolve_master
+    from utils.text_alignment import align_sentences, segments_to_words
+except ImportError:
+    from src.utils.segment_cache import concat_segments, get_segment_cache, segment_key, text_digest
+    from src.utils.audio_mixer import AudioMixer
+    from src.utils.audio_master import resolve_master
+    from src.utils.text_alignment import align_sentences, segments_to_words
+
+# Summary 구간 렌더링 로직이 바뀌면 올려서 기존 캐시 무효화
+SUMMARY_SEGMENT_VERSION = 2
 
 load_dotenv()
 
@@ -102,102 +123,63 @@ class VideoMaker:
             gap_duration: 오디오 간 간격 시간 (초, 기본값: 3.0)
             
         Returns:
-            연결된 오디오 클립
+            연결된 오디오 클립 (output_path가 없으면 임시 파일 기반이며, 클립을 close()하면 삭제됨)
         """
         if not audio_paths:
             raise ValueError("오디오 파일 경로가 필요합니다.")
         
         self.logger.info("🔗 오디오 연결 중...")
-        audio_clips = []
+        # PCM 버퍼를 샘플 단위로 배치하고 한 번만 인코딩 (MoviePy 프레임 콜백/무음 클립 없음)
+        mixer = AudioMixer()
+        cursor = 0.0
         
         for i, audio_path in enumerate(audio_paths):
             self.logger.info(f"[{i+1}/{len(audio_paths)}] 로드: {Path(audio_path).name}")
-            audio_clip = self.load_audio(audio_path)
+            if i > 0 and gap_duration > 0:
+                # 오디오 간 간격 (무음 구간은 배치하지 않은 타임라인 그 자체)
+                self.logger.info(f"⏸️  {gap_duration}초 간격 추가...")
+                cursor += gap_duration
             
-            # 오디오 클립에 fade 효과 적용 (오디오 전용 메서드 사용)
-            if i > 0:
-                # 이전 클립에 fade out
-                if audio_clips:
-                    try:
-                        from moviepy.audio.fx.all import audio_fadeout
-                        audio_clips[-1] = audio_clips[-1].fx(audio_fadeout, fade_duration)
-                    except ImportError:
-                        # 구버전 호환성 또는 fade 효과 없이 진행
-                        pass
-                
-                # 오디오 간 간격 추가 (조용한 구간)
-                if gap_duration > 0:
-                    self.logger.info(f"⏸️  {gap_duration}초 간격 추가...")
-                    try:
-                        # 무음 오디오 클립 생성
-                        from moviepy.audio.AudioClip import AudioArrayClip
-                        import numpy as np
-                        # 샘플레이트 가져오기
-                        sample_rate = audio_clip.fps if hasattr(audio_clip, 'fps') else 44100
-                        # 무음 배열 생성 (스테레오)
-                        silence_array = np.zeros((int(sample_rate * gap_duration), 2))
-                        silence = AudioArrayClip(silence_array, fps=sample_rate)
-                        audio_clips.append(silence)
-                    except Exception as e:
-                        # AudioArrayClip 실패 시 다른 방법 시도
-                        try:
-                            from moviepy.editor import ColorClip
-                            # 검은색 비디오 클립 생성 (무음 오디오 포함)
-                            silence_video = ColorClip(size=(1, 1), color=(0, 0, 0), duration=gap_duration)
-                            # 무음 오디오 추가
-                            from moviepy.audio.AudioClip import AudioClip
-                            silence_audio = AudioClip(lambda t: [0, 0], duration=gap_duration, fps=44100)
-                            silence_video = silence_video.set_audio(silence_audio)
-                            audio_clips.append(silence_video)
-                        except Exception as e2:
-                            # 간격 추가 실패 시 경고만 출력하고 계속 진행
-                            self.logger.warning(f"간격 추가 실패: {e2}, 간격 없이 연결합니다.")
-                
-                # 현재 클립에 fade in
-                try:
-                    from moviepy.audio.fx.all import audio_fadein
-                    audio_clip = audio_clip.fx(audio_fadein, fade_duration)
-                except ImportError:
-                    # 구버전 호환성 또는 fade 효과 없이 진행
-                    pass
-            
-            audio_clips.append(audio_clip)
+            # 첫 클립 이후는 fade in, 모든 클립은 다음 전환/끝에서 fade out
+            track = mixer.add(
+                audio_path,
+                start=cursor,
+                fade_in=fade_duration if i > 0 else 0.0,
+                fade_out=fade_duration,
+            )
+            cursor = track.end / mixer.sample_rate
         
-        # 마지막 클립에 fade out
-        if audio_clips:
-            try:
-                from moviepy.audio.fx.all import audio_fadeout
-                audio_clips[-1] = audio_clips[-1].fx(audio_fadeout, fade_duration)
-            except ImportError:
-                pass
+        self.logger.info(f"✅ 연결 완료: 총 길이 {mixer.duration:.2f}초")
         
-        # 오디오 클립들을 연결
-        self.logger.info("연결 중...")
-        try:
-            from moviepy.audio.AudioClip import concatenate_audioclips
-            final_audio = concatenate_audioclips(audio_clips)
-        except ImportError:
-            # 구버전 호환성: 비디오 클립으로 변환 후 연결
-            from moviepy.editor import ColorClip
-            video_clips = []
-            for audio_clip in audio_clips:
-                # 오디오 길이만큼의 검은색 비디오 클립 생성
-                video_clip = ColorClip(size=(1, 1), color=(0, 0, 0), duration=audio_clip.duration)
-                video_clip = video_clip.set_audio(audio_clip)
-                video_clips.append(video_clip)
-            concatenated = concatenate_videoclips(video_clips, method="compose")
-            final_audio = concatenated.audio
-        
-        self.logger.info(f"✅ 연결 완료: 총 길이 {final_audio.duration:.2f}초")
-        
-        # 저장 (선택사항)
+        # 저장 경로가 없으면 임시 파일에 인코딩 (AudioFileClip 반환 형식 유지)
         if output_path:
             self.logger.info(f"💾 저장 중: {output_path}")
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            final_audio.write_audiofile(output_path, codec='aac', bitrate='192k')
+            mixer.export(Path(output_path), bitrate='192k')
             self.logger.info("✅ 저장 완료")
+            return AudioFileClip(str(output_path))
+        
+        import tempfile
+        fd, temp_name = tempfile.mkstemp(suffix=".m4a", prefix="concat_audio_")
+        os.close(fd)
+        temp_path = Path(temp_name)
+        try:
+            mixer.export(temp_path, bitrate='192k')
+            clip = AudioFileClip(str(temp_path))
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+        
+        # 클립 리더가 재생 위치를 옮길 때마다 파일을 다시 열기 때문에 close() 시점에 삭제
+        close_clip = clip.close
+        
+        def close_and_remove():
+            try:
+                close_clip()
+            finally:
+                temp_path.unlink(missing_ok=True)
         
-        return final_audio
+        clip.close = close_and_remove
+        return clip
     
     def _ease_in_out(self, t: float) -> float:
         """
@@ -209,6 +191,38 @@ class VideoMaker:
         else:
             return 1 - pow(-2 * t + 2, 3) / 2
     
+    def _load_render_ready_image(self, image_path: str, max_scale: float) -> Optional[Tuple[str, np.ndarray, Tuple[int, int]]]:
+        """
+        다운로드 단계에서 만든 렌더용 변형 로드 (02_get_images.prepare_render_variants)
+        
+        Returns:
+            (변형 이름, RGB 배열, 원본 (width, height)) 또는 None (변형 없음/해상도 불일치)
+        """
+        if tuple(self.resolution) != VIDEO_RESOLUTION:
+            return None
+        try:
+            letterbox = load_render_variant(image_path, 'letterbox')
+            if letterbox is not None:
+                return ('letterbox',) + letterbox
+            canvas = load_render_variant(image_path, 'kenburns')
+            if canvas is not None:
+                img_array, original_size = canvas
+                expected = kenburns_canvas_size(original_size, self.resolution, max_scale)
+                if (img_array.shape[1], img_array.shape[0]) == expected:
+                    return ('kenburns', img_array, original_size)
+        except Exception as e:
+            self.logger.debug(f"렌더용 변형 로드 실패 ({Path(image_path).name}): {e}")
+        return None
+    
+    def _load_frame_source(self, image_path: str):
+        """
+        정적 프레임용 이미지 로드 (RGB, 축소 디코딩)
+        
+        세로형은 높이에 맞춰 letterbox, 가로형은 해상도로 리사이즈하므로
+        높이가 해상도 이상이 되는 크기로만 디코딩하면 두 경우 모두 충분합니다.
+        """
+        return load_rgb(image_path, (1, self.resolution[1]), fit="cover")
+    
     def create_image_clip_with_ken_burns(
         self,
         image_path: str,
@@ -232,52 +246,37 @@ class VideoMaker:
         from PIL import Image
         import numpy as np
         
-        # 이미지 로드 및 리사이즈 (해상도보다 크게)
-        img = Image.open(image_path)
-        img_width, img_height = img.size
-        
         # 해상도 비율 계산
         target_width, target_height = self.resolution
         aspect_ratio = target_width / target_height
-        img_aspect = img_width / img_height
         
         # 이미지를 해상도보다 크게 리사이즈 (줌 효과를 위해)
         # 최대 스케일보다 더 크게 리사이즈하여 패닝 여유 공간 확보
         max_scale = max(end_scale, start_scale) * 1.2  # 20% 여유
-        scaled_width = int(target_width * max_scale)
-        scaled_height = int(target_height * max_scale)
         
-        # 종횡비 유지하며 리사이즈
-        if img_aspect > aspect_ratio:
-            # 이미지가 더 넓음
-            scaled_height = int(scaled_width / img_aspect)
+        # 다운로드 시 생성된 렌더용 변형이 있으면 원본 디코딩/리사이즈 생략
+        render_ready = self._load_render_ready_image(image_path, max_scale)
+        if render_ready is not None:
+            variant, img_array, (img_width, img_height) = render_ready
+            if variant == 'letterbox':
+                # 세로형 이미지는 스케일 효과 없이 고정 프레임으로 표시
+                return ImageClip(img_array, duration=duration)
+            img_aspect = img_width / img_height
+            scaled_height, scaled_width = img_array.shape[:2]
         else:
-            # 이미지가 더 높음
-            scaled_width = int(scaled_height * img_aspect)
-        
-        # 이미지 모드 변환 (RGB로 통일)
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # 고품질 리사이즈
-        img = img.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
-        
-        # 이미지를 numpy 배열로 변환 (한 번만)
-        img_array = np.array(img)
-        
-        # 배열 shape 확인 및 수정 (높이, 너비, 채널 순서)
-        if len(img_array.shape) == 2:
-            # Grayscale 이미지인 경우 RGB로 변환
-            img_array = np.stack([img_array, img_array, img_array], axis=-1)
-        elif len(img_array.shape) == 3 and img_array.shape[2] != 3:
-            # 채널이 3개가 아닌 경우 (예: RGBA)
-            if img_array.shape[2] == 4:
-                # RGBA -> RGB 변환
-                img_array = img_array[:, :, :3]
-            else:
-                # 다른 채널 수인 경우 RGB로 변환
-                img = Image.fromarray(img_array).convert('RGB')
-                img_array = np.array(img)
+            # 이미지 크기는 헤더에서만 읽음
+            img_width, img_height = image_size(image_path)
+            img_aspect = img_width / img_height
+            
+            # 종횡비 유지하며 리사이즈할 크기 (해상도보다 크게)
+            scaled_width, scaled_height = kenburns_canvas_size((img_width, img_height), self.resolution, max_scale)
+            
+            # 캔버스를 덮는 최소 크기로 축소 디코딩 + RGB 정규화 후 고품질 리사이즈
+            img = load_rgb(image_path, (scaled_width, scaled_height), fit="cover")
+            img = img.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+            
+            # 이미지를 numpy 배열로 변환 (한 번만)
+            img_array = np.array(img)
         
         # 세로형 이미지 여부 확인 (높이가 더 긴 이미지)
         is_portrait = img_aspect < aspect_ratio
@@ -532,50 +531,17 @@ class VideoMaker:
                     self.logger.warning(f"Ken Burns 효과 적용 실패 ({Path(image_path).name}): {e}, 정적 이미지로 대체")
                     use_ken_burns = False  # 이후 이미지는 정적으로
             if not use_ken_burns:
-                try:
-                    img = PILImage.open(image_path)
-                    # RGB로 변환
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-
-                    # 세로형 이미지 여부 확인
-                    img_width, img_height = img.size
-                    target_width, target_height = self.resolution
-                    aspect_ratio = target_width / target_height
-                    img_aspect = img_width / img_height
-                    is_portrait = img_aspect < aspect_ratio
-
-                    if is_portrait:
-                        # 세로형 이미지: 높이에 맞추고 좌우는 검은색
-                        display_height = target_height
-                        display_width = int(display_height * img_aspect)
-                        resized_img = img.resize((display_width, display_height), PILImage.Resampling.LANCZOS)
-
-                        # 검은색 배경에 중앙 배치
-                        final_img = PILImage.new('RGB', (target_width, target_height), (0, 0, 0))
-                        paste_x = (target_width - display_width) // 2
-                        paste_y = 0
-                        final_img.paste(resized_img, (paste_x, paste_y))
-                        img_array = np.array(final_img)
-                        clip = ImageClip(img_array, duration=clip_duration)
-                    else:
-                        # 가로형 이미지: 기존 로직 (해상도에 맞게 리사이즈)
-                        img = img.resize(self.resolution, PILImage.Resampling.LANCZOS)
-                        img_array = np.array(img)
-
-                        # shape 확인: (height, width, channels) 형식이어야 함
-                        if len(img_array.shape) != 3 or img_array.shape[2] != 3:
-                            img = PILImage.fromarray(img_array).convert('RGB')
-                            img_array = np.array(img)
-                        clip = ImageClip(img_array, duration=clip_duration)
-                except Exception as e:
-                    self.logger.warning(f"이미지 로드 실패 ({Path(image_path).name}): {e}, 기본 방법 사용")
+                # 세로형 이미지는 다운로드 시 만든 letterbox 프레임을 그대로 사용
+                letterbox = None
+                if tuple(self.resolution) == VIDEO_RESOLUTION:
+                    letterbox = load_render_variant(image_path, 'letterbox')
+                if letterbox is not None:
+                    clip = ImageClip(letterbox[0], duration=clip_duration)
+                else:
                     try:
-                        # 예외 처리: 세로형 이미지 처리 포함
-                        img = PILImage.open(image_path)
-                        if img.mode != 'RGB':
-                            img = img.convert('RGB')
+                        img = self._load_frame_source(image_path)
 
+                        # 세로형 이미지 여부 확인
                         img_width, img_height = img.size
                         target_width, target_height = self.resolution
                         aspect_ratio = target_width / target_height
@@ -583,38 +549,73 @@ class VideoMaker:
                         is_portrait = img_aspect < aspect_ratio
 
                         if is_portrait:
+                            # 세로형 이미지: 높이에 맞추고 좌우는 검은색
                             display_height = target_height
                             display_width = int(display_height * img_aspect)
                             resized_img = img.resize((display_width, display_height), PILImage.Resampling.LANCZOS)
-                            final_img = PILImage.new('RGB', (target_width, target_height), (0, 0, 0))
-                            paste_x = (target_width - display_width) // 2
-                            paste_y = 0
-                            final_img.paste(resized_img, (paste_x, paste_y))
-                            clip = ImageClip(np.array(final_img), duration=clip_duration)
-                        else:
-                            clip = ImageClip(image_path, duration=clip_duration)
-                            clip = clip.resized(newsize=self.resolution)
-                    except Exception:
-                        # 최후의 수단: 세로형 이미지 처리 포함
-                        img = PILImage.open(image_path).convert('RGB')
-                        img_width, img_height = img.size
-                        target_width, target_height = self.resolution
-                        aspect_ratio = target_width / target_height
-                        img_aspect = img_width / img_height
-                        is_portrait = img_aspect < aspect_ratio
 
-                        if is_portrait:
-                            display_height = target_height
-                            display_width = int(display_height * img_aspect)
-                            resized_img = img.resize((display_width, display_height), PILImage.Resampling.LANCZOS)
+                            # 검은색 배경에 중앙 배치
                             final_img = PILImage.new('RGB', (target_width, target_height), (0, 0, 0))
                             paste_x = (target_width - display_width) // 2
                             paste_y = 0
                             final_img.paste(resized_img, (paste_x, paste_y))
-                            clip = ImageClip(np.array(final_img), duration=clip_duration)
+                            img_array = np.array(final_img)
+                            clip = ImageClip(img_array, duration=clip_duration)
                         else:
+                            # 가로형 이미지: 기존 로직 (해상도에 맞게 리사이즈)
                             img = img.resize(self.resolution, PILImage.Resampling.LANCZOS)
-                            clip = ImageClip(np.array(img), duration=clip_duration)
+                            img_array = np.array(img)
+
+                            # shape 확인: (height, width, channels) 형식이어야 함
+                            if len(img_array.shape) != 3 or img_array.shape[2] != 3:
+                                img = PILImage.fromarray(img_array).convert('RGB')
+                                img_array = np.array(img)
+                            clip = ImageClip(img_array, duration=clip_duration)
+                    except Exception as e:
+                        self.logger.warning(f"이미지 로드 실패 ({Path(image_path).name}): {e}, 기본 방법 사용")
+                        try:
+                            # 예외 처리: 세로형 이미지 처리 포함
+                            img = self._load_frame_source(image_path)
+
+                            img_width, img_height = img.size
+                            target_width, target_height = self.resolution
+                            aspect_ratio = target_width / target_height
+                            img_aspect = img_width / img_height
+                            is_portrait = img_aspect < aspect_ratio
+
+                            if is_portrait:
+                                display_height = target_height
+                                display_width = int(display_height * img_aspect)
+                                resized_img = img.resize((display_width, display_height), PILImage.Resampling.LANCZOS)
+                                final_img = PILImage.new('RGB', (target_width, target_height), (0, 0, 0))
+                                paste_x = (target_width - display_width) // 2
+                                paste_y = 0
+                                final_img.paste(resized_img, (paste_x, paste_y))
+                                clip = ImageClip(np.array(final_img), duration=clip_duration)
+                            else:
+                                clip = ImageClip(image_path, duration=clip_duration)
+                                clip = clip.resized(newsize=self.resolution)
+                        except Exception:
+                            # 최후의 수단: 세로형 이미지 처리 포함
+                            img = self._load_frame_source(image_path)
+                            img_width, img_height = img.size
+                            target_width, target_height = self.resolution
+                            aspect_ratio = target_width / target_height
+                            img_aspect = img_width / img_height
+                            is_portrait = img_aspect < aspect_ratio
+
+                            if is_portrait:
+                                display_height = target_height
+                                display_width = int(display_height * img_aspect)
+                                resized_img = img.resize((display_width, display_height), PILImage.Resampling.LANCZOS)
+                                final_img = PILImage.new('RGB', (target_width, target_height), (0, 0, 0))
+                                paste_x = (target_width - display_width) // 2
+                                paste_y = 0
+                                final_img.paste(resized_img, (paste_x, paste_y))
+                                clip = ImageClip(np.array(final_img), duration=clip_duration)
+                            else:
+                                img = img.resize(self.resolution, PILImage.Resampling.LANCZOS)
+                                clip = ImageClip(np.array(img), duration=clip_duration)
             
             # fade out/in 전환 효과 적용
             # 모든 이미지에 fade out과 fade in을 모두 적용하여 크로스페이드 효과
@@ -746,9 +747,6 @@ class VideoMaker:
         Returns:
             자막 리스트 [{"start": float, "end": float, "text": str}, ...]
         """
-        import re
-        from difflib import SequenceMatcher
-        
         # 오디오 파일이 있으면 Whisper로 정확한 타이밍 분석
         if audio_path and Path(audio_path).exists() and WHISPER_AVAILABLE:
             self.logger.info("📝 자막 생성 중 (Whisper 단어 단위 타이밍 분석)...")
@@ -981,100 +979,9 @@ class VideoMaker:
     ) -> Optional[List[dict]]:
         """
         단어 단위 정렬을 사용하여 문장별 자막 생성
-        원본 문장의 단어들을 Whisper 단어 타임스탬프와 매칭
+        원본 문장 전체 토큰열과 Whisper 단어 토큰열을 banded DP로 한 번에 정렬 (O(n·band))
         """
-        import re
-        from difflib import SequenceMatcher
-        
-        subtitles = []
-        whisper_word_idx = 0
-        
-        # Whisper 단어들을 텍스트로 변환 (매칭용)
-        whisper_text = ' '.join([w["word"] for w in whisper_words])
-        
-        for orig_sentence in original_sentences:
-            if whisper_word_idx >= len(whisper_words):
-                break
-            
-            # 원본 문장을 단어로 분할
-            if language == "ko":
-                # 한국어: 공백과 구두점으로 분할
-                orig_words = re.findall(r'\S+', orig_sentence.lower())
-            else:
-                # 영어: 공백으로 분할
-                orig_words = [w.lower().strip('.,!?;:') for w in orig_sentence.split() if w.strip()]
-            
-            if not orig_words:
-                continue
-            
-            # 현재 위치부터 시작하여 원본 문장의 단어들을 찾기
-            matched_word_indices = []
-            search_start = whisper_word_idx
-            
-            # 각 원본 단어를 Whisper 단어 리스트에서 찾기
-            for orig_word in orig_words:
-                # 원본 단어 정리 (구두점 제거)
-                clean_orig_word = re.sub(r'[^\w\s]', '', orig_word.lower())
-                if not clean_orig_word:
-                    continue
-                
-                # 현재 위치부터 최대 20개 단어까지 검색
-                best_match_idx = -1
-                best_similarity = 0.0
-                
-                for i in range(search_start, min(search_start + 20, len(whisper_words))):
-                    whisper_word = re.sub(r'[^\w\s]', '', whisper_words[i]["word"].lower())
-                    
-                    # 정확히 일치하는 경우
-                    if clean_orig_word == whisper_word:
-                        best_match_idx = i
-                        best_similarity = 1.0
-                        break
-                    
-                    # 유사도 계산
-                    sim = SequenceMatcher(None, clean_orig_word, whisper_word).ratio()
-                    if sim > best_similarity and sim > 0.6:  # 60% 이상 유사도
-                        best_similarity = sim
-                        best_match_idx = i
-                
-                if best_match_idx >= 0:
-                    matched_word_indices.append(best_match_idx)
-                    search_start = best_match_idx + 1
-                else:
-                    # 매칭 실패 시 다음 단어로 넘어감
-                    continue
-            
-            # 매칭된 단어가 있으면 자막 생성
-            if matched_word_indices:
-                # 첫 번째와 마지막 단어의 타임스탬프 사용
-                start_time = whisper_words[matched_word_indices[0]]["start"]
-                end_time = whisper_words[matched_word_indices[-1]]["end"]
-                
-                subtitles.append({
-                    "start": start_time,
-                    "end": end_time,
-                    "text": orig_sentence  # 원본 텍스트 사용
-                })
-                
-                # 다음 문장을 위해 마지막 매칭 단어 다음으로 이동
-                whisper_word_idx = matched_word_indices[-1] + 1
-            else:
-                # 매칭 실패 시 현재 위치의 Whisper 단어 시간 사용
-                if whisper_word_idx < len(whisper_words):
-                    # 다음 몇 개 단어의 시간 범위 사용
-                    end_idx = min(whisper_word_idx + len(orig_words), len(whisper_words) - 1)
-                    start_time = whisper_words[whisper_word_idx]["start"]
-                    end_time = whisper_words[end_idx]["end"]
-                    
-                    subtitles.append({
-                        "start": start_time,
-                        "end": end_time,
-                        "text": orig_sentence
-                    })
-                    
-                    whisper_word_idx = end_idx + 1
-        
-        return subtitles if subtitles else None
+        return align_sentences(original_sentences, whisper_words, language)
     
     def _match_sentences_to_whisper(
         self, 
@@ -1082,69 +989,16 @@ class VideoMaker:
         whisper_segments: List[dict],
         language: str
     ) -> Optional[List[dict]]:
-        """원본 문장과 Whisper 결과를 매칭하여 자막 생성"""
-        from difflib import SequenceMatcher
-        
-        subtitles = []
-        whisper_text = ' '.join([seg["text"] for seg in whisper_segments])
-        
-        # 원본 텍스트 전체와 Whisper 텍스트 전체의 유사도 확인
-        original_full = ' '.join(original_sentences)
-        similarity = SequenceMatcher(None, original_full.lower(), whisper_text.lower()).ratio()
-        
-        if similarity < 0.3:  # 유사도가 너무 낮으면 매칭 실패
-            return None
-        
-        # 각 원본 문장을 Whisper 세그먼트와 매칭
-        whisper_idx = 0
-        for orig_sentence in original_sentences:
-            if whisper_idx >= len(whisper_segments):
-                break
-            
-            # 현재 Whisper 세그먼트부터 시작하여 매칭 시도
-            best_match_idx = whisper_idx
-            best_similarity = 0.0
-            best_end_idx = whisper_idx
-            
-            # 여러 세그먼트를 합쳐서 매칭 시도 (최대 5개 세그먼트까지)
-            for end_idx in range(whisper_idx, min(whisper_idx + 5, len(whisper_segments))):
-                combined_whisper = ' '.join([
-                    whisper_segments[i]["text"] 
-                    for i in range(whisper_idx, end_idx + 1)
-                ])
-                sim = SequenceMatcher(
-                    None, 
-                    orig_sentence.lower(), 
-                    combined_whisper.lower()
-                ).ratio()
-                
-                if sim > best_similarity:
-                    best_similarity = sim
-                    best_end_idx = end_idx
-            
-            # 유사도가 0.4 이상이면 매칭 성공
-            if best_similarity >= 0.4:
-                start_time = whisper_segments[whisper_idx]["start"]
-                end_time = whisper_segments[best_end_idx]["end"]
-                
-                subtitles.append({
-                    "start": start_time,
-                    "end": end_time,
-                    "text": orig_sentence  # 원본 텍스트 사용
-                })
-                
-                whisper_idx = best_end_idx + 1
-            else:
-                # 매칭 실패 시 현재 세그먼트만 사용하고 다음으로
-                if whisper_idx < len(whisper_segments):
-                    subtitles.append({
-                        "start": whisper_segments[whisper_idx]["start"],
-                        "end": whisper_segments[whisper_idx]["end"],
-                        "text": orig_sentence  # 원본 텍스트 사용
-                    })
-                    whisper_idx += 1
-        
-        return subtitles if subtitles else None
+        """
+        원본 문장과 Whisper 세그먼트를 매칭하여 자막 생성
+        세그먼트를 글자 수 비례 단어로 나눈 뒤 같은 정렬 사용 (일치 토큰 30% 미만이면 실패)
+        """
+        return align_sentences(
+            original_sentences,
+            segments_to_words(whisper_segments),
+            language,
+            min_match_ratio=0.3
+        )
     
     def _validate_and_adjust_subtitle_timing(
         self,
@@ -1476,6 +1330,255 @@ class VideoMaker:
         self.logger.warning("생성된 자막 클립이 없습니다")
         return video_clip
     
+    def _summary_segment_key(
+        self,
+        summary_audio_path: str,
+        image_paths: List[str],
+        summary_text: Optional[str],
+        add_subtitles_flag: bool,
+        language: str,
+        summary_audio_volume: float,
+        with_cta: bool = False
+    ) -> str:
+        """Summary 구간 캐시 키 (입력 파일 내용 해시 + 시각 설정, Summary만 있는 영상이면 CTA 포함 여부)"""
+        return segment_key(
+            "summary",
+            files={"audio": summary_audio_path, "images": image_paths},
+            params={
+                "version": SUMMARY_SEGMENT_VERSION,
+                "text": text_digest(summary_text),
+                "subtitles": add_subtitles_flag,
+                "language": language,
+                "volume": summary_audio_volume,
+                "resolution": list(self.resolution),
+                "fps": self.fps,
+                "bitrate": self.bitrate,
+                "audio_bitrate": self.audio_bitrate,
+                "waveform": os.getenv("ENABLE_WAVEFORM", "1").lower() not in ("0", "false", "no"),
+                "fade": MOVIEPY_VERSION_NEW,
+                "cta": with_cta,
+            },
+        )
+
+    def _render_summary_clip(
+        self,
+        summary_audio_path: str,
+        image_paths: List[str],
+        summary_text: Optional[str],
+        add_subtitles_flag: bool,
+        language: str,
+        summary_audio_volume: float,
+        seed: Optional[int] = None
+    ):
+        """
+        Summary 슬라이드쇼 클립 구성 (이미지 시퀀스 + 시각화 + 자막). (클립, 오디오) 반환
+
+        seed는 시각화 폴백의 난수 시드 (캐시 키에서 만들어 같은 키 → 같은 화면)
+        """
+        summary_audio = self.load_audio(summary_audio_path)
+        summary_duration = summary_audio.duration
+        
+        # Summary 오디오 음량 조정
+        if summary_audio_volume != 1.0:
+            self.logger.info(f"🔊 Summary 오디오 음량 조정: {summary_audio_volume}x")
+            try:
+                from moviepy.audio.fx.all import volumex
+                summary_audio = summary_audio.fx(volumex, summary_audio_volume)
+            except ImportError:
+                try:
+                    # 구버전 호환성
+                    summary_audio = summary_audio.volumex(summary_audio_volume)
+                except AttributeError:
+                    self.logger.warning("음량 조정 실패, 원본 음량 사용")
+        
+        self.logger.info(f"요약 오디오 길이: {summary_duration:.2f}초")
+        
+        # Summary 부분 이미지 시퀀스 생성
+        summary_image_clips = self.create_image_sequence(
+            image_paths=image_paths,
+            total_duration=summary_duration,
+            fade_duration=1.5
+        )
+        summary_video = concatenate_videoclips(summary_image_clips, method="compose")
+        summary_video = summary_video.set_audio(summary_audio)
+        
+        # 영상 시각화 개선: 동적 자막, 파형 등 추가 (정지 화면 방어)
+        try:
+            import os
+            from src.utils.video_enhancements import enhance_video_with_visuals
+            self.logger.info("🎨 영상 시각화 개선 적용 중...")
+            self.logger.info("   - 동적 자막 (Kinetic Typography): 핵심 키워드 강조")
+            self.logger.info("   - 파형 시각화: 오디오 스펙트럼 표시")
+            enable_waveform = os.getenv("ENABLE_WAVEFORM", "1").lower() not in ("0", "false", "no")
+            
+            summary_video = enhance_video_with_visuals(
+                video_clip=summary_video,
+                audio_path=summary_audio_path,
+                text=summary_text,
+                language=language,
+                enable_kinetic_typography=True,  # 동적 자막 활성화
+                enable_waveform=enable_waveform,  # 기본 ON (ENABLE_WAVEFORM=0 로 끄기)
+                enable_footage=False,  # 푸티지는 선택사항 (Pexels API 키 필요)
+                seed=seed
+            )
+            self.logger.info("✅ 영상 시각화 개선 완료")
+        except ImportError as e:
+            self.logger.warning(f"영상 시각화 개선 모듈을 찾을 수 없습니다: {e}")
+            self.logger.warning("기본 영상만 사용합니다.")
+        except Exception as e:
+            self.logger.warning(f"영상 시각화 개선 실패 (기본 영상 사용): {e}")
+            import traceback
+            traceback.print_exc()
+        
+        # Summary 부분에 자막 추가 (텍스트가 있고 자막 옵션이 켜져 있는 경우)
+        self.logger.info(f"🔍 자막 옵션 확인: add_subtitles_flag={add_subtitles_flag}, summary_text={'있음' if summary_text else '없음'}")
+        if add_subtitles_flag and summary_text:
+            self.logger.info("📝 Summary 자막 생성 중...")
+            summary_subtitles = self.generate_subtitles_from_text(
+                text=summary_text,
+                audio_duration=summary_duration,
+                language=language,
+                audio_path=summary_audio_path  # 실제 오디오 파일 경로 전달
+            )
+            if summary_subtitles:
+                self.logger.info(f"📝 {len(summary_subtitles)}개의 자막 생성됨")
+                self.logger.info("📝 Summary 자막 오버레이 추가 중...")
+                summary_video = self.add_subtitles(
+                    summary_video,
+                    summary_subtitles,
+                    font_size=70,  # 개선: 60 -> 70
+                    font_color="white",
+                    stroke_color="black",
+                    stroke_width=3,  # 개선: 2 -> 3
+                    language=language
+                )
+                self.logger.info("✅ Summary 자막 추가 완료")
+            else:
+                self.logger.warning("자막 생성 실패 또는 빈 자막")
+        else:
+            if not add_subtitles_flag:
+                self.logger.warning("자막 옵션이 비활성화되어 있습니다")
+            if not summary_text:
+                self.logger.warning("Summary 텍스트가 없습니다")
+
+        return summary_video, summary_audio
+
+    def _store_summary_segment(
+        self,
+        summary_video,
+        segment_cache,
+        key: str,
+        cta_language: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Summary 구간을 캐시에 렌더링 (끝 페이드 아웃 포함)
+
+        cta_language가 있으면 (Summary만 있는 영상) 구독 유도 CTA까지 구간에 포함해,
+        재사용할 때 구간을 그대로 복사만 하면 되도록 합니다.
+
+        Returns:
+            캐시된 구간 경로 (실패 시 None → 메모리 클립으로 계속 진행)
+        """
+        self.logger.info("💾 Summary 구간 렌더링 및 캐시 저장 중...")
+        clip = summary_video
+        if MOVIEPY_AVAILABLE and MOVIEPY_VERSION_NEW:
+            try:
+                clip = summary_video.fx(fadeout, 0.5)
+            except Exception as e:
+                self.logger.warning(f"페이드 아웃 효과 적용 실패: {e}")
+        if cta_language:
+            cta_duration = min(20.0, clip.duration * 0.1)
+            clip = self._overlay_subscribe_cta(clip, cta_duration, cta_language)
+        tmp_path = segment_cache.temp_path(key)
+        try:
+            self._write_video(clip, str(tmp_path))
+            cached_path = segment_cache.put(key, tmp_path)
+            self.logger.info(f"✅ Summary 구간 캐시 저장: {cached_path.name}")
+            return cached_path
+        except Exception as e:
+            self.logger.warning(f"Summary 구간 캐시 저장 실패 (전체 렌더링으로 진행): {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+    def _write_video(self, clip, output_path: str) -> None:
+        """공통 인코딩 설정으로 렌더링 (구간끼리 재인코딩 없이 연결할 수 있도록 항상 같은 설정)"""
+        clip.write_videofile(
+            output_path,
+            fps=self.fps,
+            codec='libx264',
+            audio_codec='aac',
+            bitrate=self.bitrate,
+            audio_bitrate=self.audio_bitrate,
+            preset='medium'
+        )
+
+    def _overlay_subscribe_cta(self, clip, cta_duration: float, language: str):
+        """클립 마지막 cta_duration초에 구독 유도 CTA 오버레이 (실패 시 원본 반환)"""
+        try:
+            try:
+                from src.utils.subscribe_cta import create_subscribe_cta_clip  # type: ignore[import]
+            except ImportError:
+                from utils.subscribe_cta import create_subscribe_cta_clip  # type: ignore[import]
+            cta_clip = create_subscribe_cta_clip(
+                duration=cta_duration,
+                language=language,
+                resolution=self.resolution
+            )
+            if cta_clip is not None:
+                cta_clip = cta_clip.set_start(clip.duration - cta_duration)
+                self.logger.info(f"✅ 구독 유도 CTA 오버레이 추가 (마지막 {cta_duration:.0f}초)")
+                return CompositeVideoClip([clip, cta_clip])
+            self.logger.warning("CTA 클립 생성 실패 (PIL/moviepy 확인 필요), 건너뜁니다")
+        except Exception as e:
+            self.logger.warning(f"CTA 오버레이 추가 실패: {e}, 건너뜁니다")
+        return clip
+
+    def _assemble_with_cached_summary(
+        self,
+        final_clips: list,
+        summary_segment_path: Path,
+        output_path: str,
+        language: str,
+        add_subscribe_cta: bool
+    ) -> bool:
+        """
+        캐시된 Summary 구간 + (전환/NotebookLM/CTA) 구간을 재인코딩 없이 연결
+
+        캐시된 구간은 어떤 경우에도 다시 인코딩하지 않습니다 (세대 손실 방지).
+        Summary만 있는 영상은 CTA가 포함된 구간을 그대로 복사합니다.
+
+        Returns:
+            성공 여부 (False면 호출 측에서 전체 렌더링)
+        """
+        if len(final_clips) == 1:
+            self.logger.info("🎞️ 캐시된 Summary 구간을 그대로 복사합니다 (재인코딩 없음)")
+            joined = concat_segments([summary_segment_path], output_path)
+            if not joined:
+                self.logger.warning("구간 복사 실패, 전체 영상을 다시 렌더링합니다")
+            return joined
+
+        tail = concatenate_videoclips(final_clips[1:], method="compose")
+        total_duration = final_clips[0].duration + tail.duration
+        if add_subscribe_cta:
+            # CTA는 뒤 구간 안에서만 표시 (Summary 구간까지 걸치면 캐시 구간을 다시 인코딩해야 함)
+            cta_duration = min(20.0, total_duration * 0.1, tail.duration)
+            tail = self._overlay_subscribe_cta(tail, cta_duration, language)
+
+        output_path_obj = Path(output_path)
+        tail_path = output_path_obj.with_name(f"{output_path_obj.stem}.tail{output_path_obj.suffix}")
+        self.logger.info("🎞️ 영상 렌더링 중... (Summary 구간은 캐시 재사용, 나머지 구간만 렌더링)")
+        self.logger.info(f"총 길이: {total_duration:.2f}초 ({total_duration/60:.2f}분)")
+        try:
+            self._write_video(tail, str(tail_path))
+            joined = concat_segments([summary_segment_path, tail_path], output_path)
+        finally:
+            tail.close()
+            tail_path.unlink(missing_ok=True)
+
+        if not joined:
+            self.logger.warning("구간 연결 실패, 전체 영상을 다시 렌더링합니다")
+        return joined
+
     def create_video(
         self,
         audio_path: str = "",
@@ -1488,7 +1591,8 @@ class VideoMaker:
         notebooklm_video_path: Optional[str] = None,
         summary_audio_volume: float = 1.2,
         summary_text: Optional[str] = None,
-        add_subscribe_cta: bool = True
+        add_subscribe_cta: bool = True,
+        reuse_summary_segment: bool = True
     ) -> str:
         """
         최종 영상 생성 (Summary -> NotebookLM Video 순서)
@@ -1505,6 +1609,9 @@ class VideoMaker:
             summary_audio_volume: Summary 오디오 음량 배율 (기본값: 1.2, 20% 증가)
             summary_text: Summary 텍스트 (자막 생성용, 선택사항)
             add_subscribe_cta: 구독 유도 CTA 오버레이 추가 여부 (기본값: True)
+            reuse_summary_segment: Summary 구간을 .cache/segments에 저장/재사용 (기본값: True)
+                요약 오디오·이미지·텍스트·시각 설정이 같으면 슬라이드쇼를 다시 렌더링하지 않고
+                캐시된 구간에 NotebookLM/CTA 구간만 렌더링해 이어 붙입니다.
         """
         self.logger.info("=" * 60)
         self.logger.info("🎬 영상 제작 시작")
@@ -1547,101 +1654,52 @@ class VideoMaker:
             raise FileNotFoundError(f"이미지를 찾을 수 없습니다: {image_dir}")
         
         video_clips = []
-        
+        summary_audio = None
+        summary_segment_path = None
+
         # 1. Summary 부분: 요약 오디오 + 이미지 슬라이드쇼
+        # 무손실 마스터(.flac)가 있으면 디코딩/Whisper/파형/최종 인코딩 모두 마스터에서 (MP3→AAC 세대 손실 없음)
+        if summary_audio_path:
+            summary_audio_path = str(resolve_master(summary_audio_path))
         if summary_audio_path and Path(summary_audio_path).exists():
             self.logger.info("📚 1단계: Summary 부분 영상 생성")
             self.logger.info("-" * 60)
-            summary_audio = self.load_audio(summary_audio_path)
-            summary_duration = summary_audio.duration
-            
-            # Summary 오디오 음량 조정
-            if summary_audio_volume != 1.0:
-                self.logger.info(f"🔊 Summary 오디오 음량 조정: {summary_audio_volume}x")
-                try:
-                    from moviepy.audio.fx.all import volumex
-                    summary_audio = summary_audio.fx(volumex, summary_audio_volume)
-                except ImportError:
-                    try:
-                        # 구버전 호환성
-                        summary_audio = summary_audio.volumex(summary_audio_volume)
-                    except AttributeError:
-                        self.logger.warning("음량 조정 실패, 원본 음량 사용")
-            
-            self.logger.info(f"요약 오디오 길이: {summary_duration:.2f}초")
-            
-            # Summary 부분 이미지 시퀀스 생성
-            summary_image_clips = self.create_image_sequence(
-                image_paths=image_paths,
-                total_duration=summary_duration,
-                fade_duration=1.5
-            )
-            summary_video = concatenate_videoclips(summary_image_clips, method="compose")
-            summary_video = summary_video.set_audio(summary_audio)
-            
-            # 영상 시각화 개선: 동적 자막, 파형 등 추가 (정지 화면 방어)
-            try:
-                import os
-                from src.utils.video_enhancements import enhance_video_with_visuals
-                self.logger.info("🎨 영상 시각화 개선 적용 중...")
-                self.logger.info("   - 동적 자막 (Kinetic Typography): 핵심 키워드 강조")
-                self.logger.info("   - 파형 시각화: 오디오 스펙트럼 표시")
-                enable_waveform = os.getenv("ENABLE_WAVEFORM", "1").lower() not in ("0", "false", "no")
-                
-                summary_video = enhance_video_with_visuals(
-                    video_clip=summary_video,
-                    audio_path=summary_audio_path,
-                    text=summary_text,
-                    language=language,
-                    enable_kinetic_typography=True,  # 동적 자막 활성화
-                    enable_waveform=enable_waveform,  # 기본 ON (ENABLE_WAVEFORM=0 로 끄기)
-                    enable_footage=False  # 푸티지는 선택사항 (Pexels API 키 필요)
+
+            segment_cache = get_segment_cache() if reuse_summary_segment else None
+            summary_key = None
+            summary_seed = None
+            # Summary만 있는 영상은 CTA까지 구간에 포함 (재사용 시 복사만)
+            summary_cta = add_subscribe_cta and not (notebooklm_video_path and Path(notebooklm_video_path).exists())
+            if segment_cache is not None:
+                summary_key = self._summary_segment_key(
+                    summary_audio_path, image_paths, summary_text,
+                    add_subtitles_flag, language, summary_audio_volume, with_cta=summary_cta
                 )
-                self.logger.info("✅ 영상 시각화 개선 완료")
-            except ImportError as e:
-                self.logger.warning(f"영상 시각화 개선 모듈을 찾을 수 없습니다: {e}")
-                self.logger.warning("기본 영상만 사용합니다.")
-            except Exception as e:
-                self.logger.warning(f"영상 시각화 개선 실패 (기본 영상 사용): {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # Summary 부분에 자막 추가 (텍스트가 있고 자막 옵션이 켜져 있는 경우)
-            self.logger.info(f"🔍 자막 옵션 확인: add_subtitles_flag={add_subtitles_flag}, summary_text={'있음' if summary_text else '없음'}")
-            if add_subtitles_flag and summary_text:
-                self.logger.info("📝 Summary 자막 생성 중...")
-                summary_subtitles = self.generate_subtitles_from_text(
-                    text=summary_text,
-                    audio_duration=summary_duration,
-                    language=language,
-                    audio_path=summary_audio_path  # 실제 오디오 파일 경로 전달
+                summary_seed = int(summary_key.rsplit("_", 1)[-1], 16)
+                summary_segment_path = segment_cache.get(summary_key)
+
+            if summary_segment_path:
+                self.logger.info(f"♻️ 캐시된 Summary 구간 재사용: {summary_segment_path.name}")
+                summary_video = VideoFileClip(str(summary_segment_path))
+            else:
+                summary_video, summary_audio = self._render_summary_clip(
+                    summary_audio_path, image_paths, summary_text,
+                    add_subtitles_flag, language, summary_audio_volume, seed=summary_seed
                 )
-                if summary_subtitles:
-                    self.logger.info(f"📝 {len(summary_subtitles)}개의 자막 생성됨")
-                    self.logger.info("📝 Summary 자막 오버레이 추가 중...")
-                    summary_video = self.add_subtitles(
-                        summary_video,
-                        summary_subtitles,
-                        font_size=70,  # 개선: 60 -> 70
-                        font_color="white",
-                        stroke_color="black",
-                        stroke_width=3,  # 개선: 2 -> 3
-                        language=language
+                if segment_cache is not None:
+                    summary_segment_path = self._store_summary_segment(
+                        summary_video, segment_cache, summary_key,
+                        cta_language=language if summary_cta else None
                     )
-                    self.logger.info("✅ Summary 자막 추가 완료")
-                else:
-                    self.logger.warning("자막 생성 실패 또는 빈 자막")
-            else:
-                if not add_subtitles_flag:
-                    self.logger.warning("자막 옵션이 비활성화되어 있습니다")
-                if not summary_text:
-                    self.logger.warning("Summary 텍스트가 없습니다")
-            
+                    if summary_segment_path:
+                        summary_video.close()
+                        summary_video = VideoFileClip(str(summary_segment_path))
+
             video_clips.append(summary_video)
-            self.logger.info(f"✅ Summary 부분 완료 ({summary_duration:.2f}초)")
+            self.logger.info(f"✅ Summary 부분 완료 ({summary_video.duration:.2f}초)")
         else:
             self.logger.info("📚 Summary 부분: 요약 오디오가 없어 건너뜁니다.")
-        
+
         # 2. NotebookLM Video 부분
         if notebooklm_video_path and Path(notebooklm_video_path).exists():
             self.logger.info("🎥 2단계: NotebookLM Video 부분")
@@ -1703,8 +1761,8 @@ class VideoMaker:
         transition_duration = 2.0  # 서머리 → NLM 전환 시 2초 검정 화면
         
         for i, clip in enumerate(video_clips):
-            # 클립 끝에 페이드 아웃 효과 추가 (전환 강화)
-            if MOVIEPY_AVAILABLE and MOVIEPY_VERSION_NEW:
+            # 클립 끝에 페이드 아웃 효과 추가 (전환 강화, 캐시된 Summary 구간에는 이미 포함)
+            if MOVIEPY_AVAILABLE and MOVIEPY_VERSION_NEW and not (i == 0 and summary_segment_path):
                 try:
                     fade_duration = 0.5  # 0.5초 페이드 아웃
                     clip = clip.fx(fadeout, fade_duration)
@@ -1740,71 +1798,53 @@ class VideoMaker:
             else:
                 self.logger.info(f"[{i}] {clip.duration:.2f}초 (전환)")
         
-        # 페이드 효과로 자연스럽게 연결 (개선: 전환 효과 강화)
-        final_video = concatenate_videoclips(final_clips, method="compose")
-        total_duration = final_video.duration
-        self.logger.info(f"✅ 연결 완료: 총 길이 {total_duration:.2f}초 ({total_duration/60:.2f}분)")
+        # 4. 출력 디렉토리 생성
+        output_path_obj = Path(output_path)
+        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        # 4.5. 구독 유도 CTA 오버레이 추가 (마지막 20초)
-        if add_subscribe_cta:
-            try:
-                try:
-                    from src.utils.subscribe_cta import create_subscribe_cta_clip  # type: ignore[import]
-                except ImportError:
-                    from utils.subscribe_cta import create_subscribe_cta_clip  # type: ignore[import]
+        # Summary 구간이 캐시에 있으면 나머지 구간만 렌더링해서 이어 붙임
+        assembled = False
+        if summary_segment_path:
+            assembled = self._assemble_with_cached_summary(
+                final_clips, summary_segment_path, output_path, language, add_subscribe_cta
+            )
+
+        if not assembled:
+            # 페이드 효과로 자연스럽게 연결 (개선: 전환 효과 강화)
+            final_video = concatenate_videoclips(final_clips, method="compose")
+            total_duration = final_video.duration
+            self.logger.info(f"✅ 연결 완료: 총 길이 {total_duration:.2f}초 ({total_duration/60:.2f}분)")
+
+            # 5. 구독 유도 CTA 오버레이 추가 (마지막 20초, Summary만 있는 캐시 구간에는 이미 포함)
+            if add_subscribe_cta and not (summary_segment_path and len(final_clips) == 1):
                 cta_duration = min(20.0, total_duration * 0.1)
-                cta_start = total_duration - cta_duration
-                cta_clip = create_subscribe_cta_clip(
-                    duration=cta_duration,
-                    language=language,
-                    resolution=self.resolution
-                )
-                if cta_clip is not None:
-                    cta_clip = cta_clip.set_start(cta_start)
-                    final_video = CompositeVideoClip([final_video, cta_clip])
-                    self.logger.info(f"✅ 구독 유도 CTA 오버레이 추가 (마지막 {cta_duration:.0f}초)")
-                else:
-                    self.logger.warning("CTA 클립 생성 실패 (PIL/moviepy 확인 필요), 건너뜁니다")
-            except Exception as e:
-                self.logger.warning(f"CTA 오버레이 추가 실패: {e}, 건너뜁니다")
+                final_video = self._overlay_subscribe_cta(final_video, cta_duration, language)
+
+            # Note: Summary 부분의 자막은 이미 위에서 추가되었습니다.
+            # 현재는 Summary 부분에만 자막을 추가하므로 전체 영상 자막은 사용하지 않습니다.
+
+            # 6. 렌더링
+            self.logger.info("🎞️ 영상 렌더링 중...")
+            self.logger.info(f"해상도: {self.resolution[0]}x{self.resolution[1]}")
+            self.logger.info(f"프레임레이트: {self.fps}fps")
+            self.logger.info(f"총 길이: {total_duration:.2f}초 ({total_duration/60:.2f}분)")
+
+            self._write_video(final_video, output_path)
+            final_video.close()
 
-        # 5. 자막 추가 (선택사항)
-        # Note: Summary 부분의 자막은 이미 위에서 추가되었습니다.
-        # 전체 영상에 대한 추가 자막이 필요한 경우에만 여기서 처리합니다.
-        # 현재는 Summary 부분에만 자막을 추가하므로 이 부분은 사용하지 않습니다.
-        
-        # 6. 출력 디렉토리 생성
-        output_path_obj = Path(output_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        # 7. 렌더링
-        self.logger.info("🎞️ 영상 렌더링 중...")
-        self.logger.info(f"해상도: {self.resolution[0]}x{self.resolution[1]}")
-        self.logger.info(f"프레임레이트: {self.fps}fps")
-        self.logger.info(f"총 길이: {total_duration:.2f}초 ({total_duration/60:.2f}분)")
-        
-        final_video.write_videofile(
-            output_path,
-            fps=self.fps,
-            codec='libx264',
-            audio_codec='aac',
-            bitrate=self.bitrate,
-            audio_bitrate=self.audio_bitrate,
-            preset='medium'
-        )
-        
         self.logger.info("=" * 60)
         self.logger.info("✅ 영상 제작 완료!")
         self.logger.info("=" * 60)
         self.logger.info(f"📁 저장 위치: {output_path}")
-        
+
         # 정리
-        final_video.close()
-        if summary_audio_path and Path(summary_audio_path).exists():
+        if summary_segment_path:
+            video_clips[0].close()
+        if summary_audio is not None:
             summary_audio.close()
         if notebooklm_video_path and Path(notebooklm_video_path).exists():
             notebooklm_video.close()
-        
+
         return output_path
 
 
@@ -11,11 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # 03_make_video.py import
-import importlib.util
-spec = importlib.util.spec_from_file_location("make_video", Path(__file__).parent / "03_make_video.py")
-make_video_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(make_video_module)
-VideoMaker = make_video_module.VideoMaker
+from src.utils.module_loader import load_script
+VideoMaker = load_script("03_make_video.py").VideoMaker
 
 
 def find_audio_files(audio_dir: str = "assets/audio"):
@@ -15,28 +15,31 @@ from typing import Optional, Dict, Tuple, List
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# 썸네일 생성 모듈 import
-try:
-    import importlib.util
-    thumbnail_spec = importlib.util.spec_from_file_location("generate_thumbnail", Path(__file__).parent / "10_generate_thumbnail.py")
-    thumbnail_module = importlib.util.module_from_spec(thumbnail_spec)
-    thumbnail_spec.loader.exec_module(thumbnail_module)
-    ThumbnailGenerator = thumbnail_module.ThumbnailGenerator
-    THUMBNAIL_AVAILABLE = True
-except Exception as e:
-    THUMBNAIL_AVAILABLE = False
-    print(f"⚠️ 썸네일 생성 모듈 로드 실패: {e}")
-
-# 필요한 모듈 import
-import importlib.util
-spec = importlib.util.spec_from_file_location("make_video", Path(__file__).parent / "03_make_video.py")
-make_video_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(make_video_module)
-VideoMaker = make_video_module.VideoMaker
+# 숫자로 시작하는 모듈은 처음 사용할 때 한 번만 로드 (메타데이터만 만들 때는 MoviePy 등을 불러오지 않음)
+from src.utils.module_loader import lazy_script
+
+# 썸네일 생성 모듈
+thumbnail_module = lazy_script("10_generate_thumbnail.py")
+THUMBNAIL_AVAILABLE = (Path(__file__).parent / "10_generate_thumbnail.py").exists()
+
+# 영상 제작 모듈
+make_video_module = lazy_script("03_make_video.py")
+
+
+def __getattr__(name):
+    """다른 스크립트가 `module.VideoMaker` 등으로 접근할 때 지연 로드 (PEP 562)"""
+    if name == "VideoMaker":
+        return make_video_module.VideoMaker
+    if name == "ThumbnailGenerator":
+        return thumbnail_module.ThumbnailGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 공통 유틸리티 import
 from src.utils.translations import translate_book_title, translate_author_name, get_book_alternative_title, translate_book_title_to_korean, is_english_title, translate_author_name_to_korean, contains_korean, remove_korean_from_text
 from src.utils.file_utils import safe_title, load_book_info, get_standard_safe_title
+from src.utils.asset_resolver import get_asset_resolver
+from src.utils.media_probe import get_media_duration
+from src.utils.audio_master import resolve_master
 from src.utils.affiliate_links import generate_affiliate_section
 
 def generate_title(book_title: str, lang: str = "both", author: Optional[str] = None, use_hook_format: bool = False) -> str:
@@ -1115,6 +1118,7 @@ def preview_metadata(title: str, description: str, tags: list, lang: str):
 def calculate_timestamps_from_video(video_path: Path, safe_title_str: str, lang: str, book_title: Optional[str] = None) -> Optional[Dict]:
     """
     영상 파일과 관련 오디오/비디오 파일에서 timestamp 정보 계산
+    (길이는 캐시된 ffprobe 결과 사용, 클립을 열지 않음)
     
     Returns:
         timestamps 딕셔너리 또는 None
@@ -1125,128 +1129,31 @@ def calculate_timestamps_from_video(video_path: Path, safe_title_str: str, lang:
         }
     """
     try:
-        from moviepy.editor import VideoFileClip, AudioFileClip
-        import subprocess
-        
-        lang_suffix = "kr" if lang == "ko" else "en"
         timestamps = {
             'summary_duration': 0,
             'notebooklm_duration': 0,
             'review_duration': 0
         }
         
-        # Summary 오디오 길이 확인 (summary 또는 longform 파일 모두 확인)
-        from src.utils.file_utils import safe_title
-        korean_safe_title = safe_title(book_title) if book_title else safe_title_str
+        # Summary 오디오 길이 확인 (summary 또는 longform, 영문/한글 Safe Title, kr/ko 접미사)
+        resolver = get_asset_resolver()
+        summary_audio_path = resolver.summary_audio(book_title, lang, safe_title_str)
         
-        summary_audio_path = None
-        possible_paths = [
-            Path(f"assets/audio/{safe_title_str}_summary_{lang_suffix}.mp3"),
-            Path(f"assets/audio/{safe_title_str}_longform_{lang_suffix}.mp3"),
-            Path(f"assets/audio/{korean_safe_title}_summary_{lang_suffix}.mp3"),
-            Path(f"assets/audio/{korean_safe_title}_longform_{lang_suffix}.mp3")
-        ]
-        
-        # 호환성을 위해 ko 패턴도 확인
-        if lang_suffix == "kr":
-            possible_paths.extend([
-                Path(f"assets/audio/{safe_title_str}_summary_ko.mp3"),
-                Path(f"assets/audio/{safe_title_str}_longform_ko.mp3"),
-                Path(f"assets/audio/{korean_safe_title}_summary_ko.mp3"),
-                Path(f"assets/audio/{korean_safe_title}_longform_ko.mp3")
-            ])
-        
-        for path in possible_paths:
-            if path and path.exists():
-                summary_audio_path = path
-                break
-        
-        if summary_audio_path and summary_audio_path.exists():
-            try:
-                audio = AudioFileClip(str(summary_audio_path))
-                timestamps['summary_duration'] = audio.duration
-                audio.close()
-            except:
-                # ffprobe로 시도
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1', str(summary_audio_path)],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    timestamps['summary_duration'] = float(result.stdout.strip().split('=')[1])
+        if summary_audio_path:
+            # 영상은 무손실 마스터로 렌더링되므로 길이도 마스터 기준 (MP3 인코더 패딩 제외)
+            timestamps['summary_duration'] = get_media_duration(resolve_master(summary_audio_path)) or 0
         
         # NotebookLM Video 길이 확인
-        notebooklm_video_path = None
-        possible_video_paths = [
-            Path(f"assets/video/{safe_title_str}_notebooklm_{lang_suffix}.mp4"),
-            Path(f"assets/video/{korean_safe_title}_notebooklm_{lang_suffix}.mp4")
-        ]
+        notebooklm_video_path = resolver.notebooklm_video(book_title, lang, safe_title_str)
         
-        if lang_suffix == "kr":
-            possible_video_paths.extend([
-                Path(f"assets/video/{safe_title_str}_notebooklm_ko.mp4"),
-                Path(f"assets/video/{korean_safe_title}_notebooklm_ko.mp4")
-            ])
+        if notebooklm_video_path:
+            timestamps['notebooklm_duration'] = get_media_duration(notebooklm_video_path) or 0
         
-        for path in possible_video_paths:
-            if path and path.exists():
-                notebooklm_video_path = path
-                break
+        # Review 오디오 길이 확인 (m4a 우선, mp3/wav 호환)
+        review_audio_path = resolver.review_audio(book_title, lang, safe_title_str)
         
-        if notebooklm_video_path and notebooklm_video_path.exists():
-            try:
-                video = VideoFileClip(str(notebooklm_video_path))
-                timestamps['notebooklm_duration'] = video.duration
-                video.close()
-            except:
-                # ffprobe로 시도
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1', str(notebooklm_video_path)],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    timestamps['notebooklm_duration'] = float(result.stdout.strip().split('=')[1])
-        
-        # Review 오디오 길이 확인
-        review_audio_path = None
-        possible_review_paths = [
-            Path(f"assets/audio/{safe_title_str}_review_{lang_suffix}.m4a"),
-            Path(f"assets/audio/{korean_safe_title}_review_{lang_suffix}.m4a")
-        ]
-        
-        if lang_suffix == "kr":
-            possible_review_paths.extend([
-                Path(f"assets/audio/{safe_title_str}_review_ko.m4a"),
-                Path(f"assets/audio/{korean_safe_title}_review_ko.m4a")
-            ])
-        
-        # 다른 확장자 시도
-        existing_review_paths = [p for p in possible_review_paths if p.exists()]
-        if not existing_review_paths:
-            for ext in ['.mp3', '.wav']:
-                possible_review_paths.extend([
-                    Path(f"assets/audio/{safe_title_str}_review_{lang_suffix}{ext}"),
-                    Path(f"assets/audio/{korean_safe_title}_review_{lang_suffix}{ext}")
-                ])
-        
-        for path in possible_review_paths:
-            if path and path.exists():
-                review_audio_path = path
-                break
-        
-        if review_audio_path and review_audio_path.exists():
-            try:
-                audio = AudioFileClip(str(review_audio_path))
-                timestamps['review_duration'] = audio.duration
-                audio.close()
-            except:
-                # ffprobe로 시도
-                result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1', str(review_audio_path)],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    timestamps['review_duration'] = float(result.stdout.strip().split('=')[1])
+        if review_audio_path:
+            timestamps['review_duration'] = get_media_duration(review_audio_path) or 0
         
         # Summary가 없으면 timestamp 추가 안 함
         if timestamps['summary_duration'] == 0:
@@ -1270,30 +1177,10 @@ def find_thumbnail_for_video(video_path: Path, lang: str, safe_title_str: str =
         safe_title_str = safe_title_str.replace('_with_summary', '')
     
     # 1순위: 표준 네이밍 규칙 ({safe_title}_thumbnail_{lang}.jpg/png)
-    lang_suffix = "kr" if lang == "ko" else "en"
-    for ext in [".jpg", ".png"]:
-        thumbnail_path = video_dir / f"{safe_title_str}_thumbnail_{lang_suffix}{ext}"
-        if not thumbnail_path.exists() and lang_suffix == "kr":
-            thumbnail_path = video_dir / f"{safe_title_str}_thumbnail_ko{ext}"
-    if thumbnail_path.exists():
-        return str(thumbnail_path)
-    
-    # 2순위: 영상 파일명 기반
-    video_stem = video_path.stem
-    for ext in [".jpg", ".png"]:
-        thumbnail_path = video_dir / f"{video_stem}_thumbnail_{lang_suffix}{ext}"
-        if not thumbnail_path.exists() and lang_suffix == "kr":
-            thumbnail_path = video_dir / f"{video_stem}_thumbnail_ko{ext}"
-    if thumbnail_path.exists():
-        return str(thumbnail_path)
-    
-    # 3순위: 언어 구분 없는 썸네일
-    for ext in [".jpg", ".png"]:
-        thumbnail_path = video_dir / f"{safe_title_str}_thumbnail{ext}"
-    if thumbnail_path.exists():
-        return str(thumbnail_path)
-    
-    return None
+    # 2순위: 영상 파일명 기반 ({video_stem}_thumbnail_{lang}.jpg/png)
+    # 3순위: 언어 구분 없는 썸네일 ({safe_title}_thumbnail.jpg/png)
+    thumbnail_path = get_asset_resolver().thumbnail(video_dir, [safe_title_str, video_path.stem], lang)
+    return str(thumbnail_path) if thumbnail_path else None
 
 
 def save_metadata(video_path: Path, title: str, description: str, tags: list, lang: str, book_info: Optional[Dict] = None, thumbnail_path: Optional[str] = None, safe_title_str: str = None, book_title: Optional[str] = None, author: Optional[str] = None):
@@ -1523,7 +1410,7 @@ def main():
                 if response != 'y':
                     print("   ⏭️ 건너뜀\n")
                 else:
-                    maker = VideoMaker(resolution=(1920, 1080), fps=30)
+                    maker = make_video_module.VideoMaker(resolution=(1920, 1080), fps=30)
                     maker.create_video(
                         audio_path=str(korean_audio),
                         image_dir=args.image_dir,
@@ -1533,7 +1420,7 @@ def main():
                     )
                     print()
             else:
-                maker = VideoMaker(resolution=(1920, 1080), fps=30)
+                maker = make_video_module.VideoMaker(resolution=(1920, 1080), fps=30)
                 maker.create_video(
                     audio_path=str(korean_audio),
                     image_dir=args.image_dir,
@@ -1558,7 +1445,7 @@ def main():
         thumbnail_path = None
         if THUMBNAIL_AVAILABLE and not args.skip_thumbnail:
             try:
-                generator = ThumbnailGenerator(use_dalle=args.use_dalle_thumbnail)
+                generator = thumbnail_module.ThumbnailGenerator(use_dalle=args.use_dalle_thumbnail)
                 
                 # 먼저 output 폴더의 PNG 파일 확인 및 처리
                 print("🖼️ 썸네일 처리 중...")
@@ -1615,7 +1502,7 @@ def main():
                 if response != 'y':
                     print("   ⏭️ 건너뜀\n")
                 else:
-                    maker = VideoMaker(resolution=(1920, 1080), fps=30)
+                    maker = make_video_module.VideoMaker(resolution=(1920, 1080), fps=30)
                     maker.create_video(
                         audio_path=str(english_audio),
                         image_dir=args.image_dir,
@@ -1625,7 +1512,7 @@ def main():
                     )
                     print()
             else:
-                maker = VideoMaker(resolution=(1920, 1080), fps=30)
+                maker = make_video_module.VideoMaker(resolution=(1920, 1080), fps=30)
                 maker.create_video(
                     audio_path=str(english_audio),
                     image_dir=args.image_dir,
@@ -1650,7 +1537,7 @@ def main():
         thumbnail_path = None
         if THUMBNAIL_AVAILABLE and not args.skip_thumbnail:
             try:
-                generator = ThumbnailGenerator(use_dalle=args.use_dalle_thumbnail)
+                generator = thumbnail_module.ThumbnailGenerator(use_dalle=args.use_dalle_thumbnail)
                 
                 # 먼저 output 폴더의 PNG 파일 확인 및 처리
                 print("🖼️ 썸네일 처리 중...")
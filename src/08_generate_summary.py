@@ -9,29 +9,18 @@ from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
-# AI API 임포트
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    from google import genai as _genai_check  # noqa: F401
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-
 try:
     from utils.logger import get_logger
+    from utils.module_loader import is_available, lazy_import
 except ImportError:
     from src.utils.logger import get_logger
+    from src.utils.module_loader import is_available, lazy_import
+
+# AI API 임포트 (실제 호출 시점에 로드, 설치 여부만 미리 확인)
+anthropic = lazy_import("anthropic")
+ANTHROPIC_AVAILABLE = is_available("anthropic")
+OPENAI_AVAILABLE = is_available("openai")
+GEMINI_AVAILABLE = is_available("google.genai")
 
 load_dotenv()
 
@@ -3,6 +3,9 @@
 - OpenAI TTS
 - Google Cloud TTS (Neural2)
 - Replicate (xtts-v2, ElevenLabs Multilingual v2)
+
+제공자에게 무손실(FLAC/LINEAR16) 오디오를 받아 `{이름}.flac` 마스터로 저장하고,
+출력 경로가 MP3/AAC이면 마스터에서 한 번만 인코딩합니다.
 """
 
 import os
@@ -13,31 +16,27 @@ from typing import Optional, Literal
 from dotenv import load_dotenv
 try:
     from utils.retry_utils import retry_with_backoff
+    from utils.module_loader import is_available, lazy_import
+    from utils.audio_master import MASTER_SAMPLE_RATE, build_master, export_delivery, master_path_for
 except ImportError:
     from src.utils.retry_utils import retry_with_backoff
+    from src.utils.module_loader import is_available, lazy_import
+    from src.utils.audio_master import MASTER_SAMPLE_RATE, build_master, export_delivery, master_path_for
 
 load_dotenv()
 
+# 제공자 SDK는 선택된 제공자를 실제로 사용할 때 import (설치 여부만 미리 확인)
 # OpenAI TTS
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+openai = lazy_import("openai")
+OPENAI_AVAILABLE = is_available("openai")
 
 # Google Cloud TTS
-try:
-    from google.cloud import texttospeech
-    GOOGLE_TTS_AVAILABLE = True
-except ImportError:
-    GOOGLE_TTS_AVAILABLE = False
+texttospeech = lazy_import("google.cloud.texttospeech")
+GOOGLE_TTS_AVAILABLE = is_available("google.cloud.texttospeech")
 
 # Replicate
-try:
-    import replicate
-    REPLICATE_AVAILABLE = True
-except ImportError:
-    REPLICATE_AVAILABLE = False
+replicate = lazy_import("replicate")
+REPLICATE_AVAILABLE = is_available("replicate")
 
 
 class MultiTTSEngine:
@@ -63,7 +62,7 @@ class MultiTTSEngine:
             self.openai_api_key = os.getenv("OPENAI_API_KEY")
             if not self.openai_api_key:
                 raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
-            self.client = OpenAI(api_key=self.openai_api_key)
+            self.client = openai.OpenAI(api_key=self.openai_api_key)
         
         elif self.provider == "google":
             if not GOOGLE_TTS_AVAILABLE:
@@ -92,7 +91,8 @@ class MultiTTSEngine:
             if not elevenlabs_api_key:
                 raise ValueError("ELEVENLABS_API_KEY가 설정되지 않았습니다.")
     
-    @retry_with_backoff(retries=3, backoff_in_seconds=1.0)
+    # 제공자별 서킷 브레이커/재시도 예산 공유 (예: tts_openai)
+    @retry_with_backoff(retries=3, backoff_in_seconds=1.0, provider=lambda self, *args, **kwargs: f"tts_{self.provider}")
     def generate_speech(
         self,
         text: str,
@@ -114,18 +114,39 @@ class MultiTTSEngine:
             **kwargs: 제공자별 추가 옵션
             
         Returns:
-            생성된 오디오 파일 경로
+            생성된 오디오 파일 경로 (MP3/AAC 경로면 옆에 `.flac` 마스터도 생성됨)
         """
+        # 제공자는 무손실 마스터를 만들고, 배포용 포맷은 마스터에서 한 번만 인코딩
+        master_path = str(master_path_for(output_path))
         if self.provider == "openai":
-            return self._generate_openai(text, output_path, voice, language, model)
+            self._generate_openai(text, master_path, voice, language, model)
         elif self.provider == "google":
-            return self._generate_google(text, output_path, voice, language, model)
+            self._generate_google(text, master_path, voice, language, model)
         elif self.provider == "replicate_xtts":
-            return self._generate_replicate_xtts(text, output_path, voice, language, model)
+            self._generate_replicate_xtts(text, master_path, voice, language, model)
         elif self.provider == "replicate_elevenlabs":
-            return self._generate_replicate_elevenlabs(text, output_path, voice, language, model)
+            self._generate_replicate_elevenlabs(text, master_path, voice, language, model)
         else:
             raise ValueError(f"지원하지 않는 제공자: {self.provider}")
+        
+        if master_path != str(output_path):
+            export_delivery(master_path, output_path, bitrate='192k')
+            print(f"   🎚️ 마스터 → 배포용 인코딩: {Path(output_path).name}")
+        return str(output_path)
+    
+    @staticmethod
+    def _chunk_path(output_path: str, index: int, suffix: str) -> str:
+        """청크 임시 파일 경로 (예: Sapiens_summary_kr_temp_0.flac)"""
+        output_path_obj = Path(output_path)
+        return str(output_path_obj.with_name(f"{output_path_obj.stem}_temp_{index}{suffix}"))
+    
+    def _write_master(self, chunk_paths: list, output_path: str) -> str:
+        """청크들을 이어 붙여 무손실 마스터 저장 (재인코딩 손실 없음)"""
+        if len(chunk_paths) > 1:
+            print(f"   🔗 {len(chunk_paths)}개의 오디오 파일 연결 중...")
+        build_master(chunk_paths, output_path)
+        print(f"✅ 음성 생성 완료: {output_path}")
+        return output_path
     
     def _generate_openai(self, text: str, output_path: str, voice: str, language: str, model: str) -> str:
         """OpenAI TTS 생성"""
@@ -146,20 +167,20 @@ class MultiTTSEngine:
         
         MAX_CHARS = 4096
         if len(text) <= MAX_CHARS:
+            temp_audio_path = self._chunk_path(output_path, 0, ".flac")
             response = self.client.audio.speech.create(
                 model=model,
                 voice=voice,
-                input=text
+                input=text,
+                response_format="flac"
             )
-            with open(output_path, 'wb') as f:
+            with open(temp_audio_path, 'wb') as f:
                 for chunk in response.iter_bytes():
                     f.write(chunk)
-            print(f"✅ 음성 생성 완료: {output_path}")
+            return self._write_master([temp_audio_path], output_path)
         else:
             # 긴 텍스트는 분할 처리
             return self._generate_openai_long(text, output_path, voice, model, MAX_CHARS)
-        
-        return output_path
     
     def _generate_openai_long(self, text: str, output_path: str, voice: str, model: str, max_chars: int) -> str:
         """OpenAI TTS 긴 텍스트 처리"""
@@ -185,12 +206,13 @@ class MultiTTSEngine:
         audio_files = []
         for i, chunk in enumerate(chunks):
             print(f"   [{i+1}/{len(chunks)}] 청크 생성 중... ({len(chunk)}자)")
-            temp_audio_path = output_path.replace('.mp3', f'_temp_{i}.mp3')
+            temp_audio_path = self._chunk_path(output_path, i, ".flac")
             
             response = self.client.audio.speech.create(
                 model=model,
                 voice=voice,
-                input=chunk
+                input=chunk,
+                response_format="flac"
             )
             
             with open(temp_audio_path, 'wb') as f:
@@ -199,35 +221,7 @@ class MultiTTSEngine:
             
             audio_files.append(temp_audio_path)
         
-        # 오디오 파일 연결
-        print(f"   🔗 {len(audio_files)}개의 오디오 파일 연결 중...")
-        try:
-            from moviepy.editor import AudioFileClip, concatenate_audioclips
-            audio_clips = [AudioFileClip(f) for f in audio_files]
-            final_audio = concatenate_audioclips(audio_clips)
-            final_audio.write_audiofile(output_path, codec='mp3', bitrate='192k')
-            for f in audio_files:
-                Path(f).unlink()
-            for clip in audio_clips:
-                clip.close()
-            final_audio.close()
-        except ImportError:
-            import subprocess
-            temp_list_file = output_path.replace('.mp3', '_temp_list.txt')
-            with open(temp_list_file, 'w') as f:
-                for audio_file in audio_files:
-                    f.write(f"file '{Path(audio_file).absolute()}'\n")
-            subprocess.run([
-                'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-                '-i', temp_list_file,
-                '-c', 'copy', output_path
-            ], check=True, capture_output=True)
-            Path(temp_list_file).unlink()
-            for f in audio_files:
-                Path(f).unlink()
-        
-        print(f"✅ 음성 생성 완료: {output_path}")
-        return output_path
+        return self._write_master(audio_files, output_path)
     
     def _generate_google(self, text: str, output_path: str, voice: str, language: str, model: str) -> str:
         """Google Cloud TTS (Neural2) 생성"""
@@ -267,7 +261,8 @@ class MultiTTSEngine:
             name=voice,
         )
         audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
+            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+            sample_rate_hertz=MASTER_SAMPLE_RATE,
             speaking_rate=1.0,
             pitch=0.0,
         )
@@ -278,11 +273,11 @@ class MultiTTSEngine:
             audio_config=audio_config
         )
         
-        with open(output_path, 'wb') as f:
+        temp_audio_path = self._chunk_path(output_path, 0, ".wav")
+        with open(temp_audio_path, 'wb') as f:
             f.write(response.audio_content)
         
-        print(f"✅ 음성 생성 완료: {output_path}")
-        return output_path
+        return self._write_master([temp_audio_path], output_path)
     
     def _generate_google_long(self, text: str, output_path: str, voice: str, lang_code: str, max_chars: int) -> str:
         """Google TTS 긴 텍스트 처리"""
@@ -313,14 +308,15 @@ class MultiTTSEngine:
             name=voice,
         )
         audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
+            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+            sample_rate_hertz=MASTER_SAMPLE_RATE,
             speaking_rate=1.0,
             pitch=0.0,
         )
         
         for i, chunk in enumerate(chunks):
             print(f"   [{i+1}/{len(chunks)}] 청크 생성 중... ({len(chunk)}자)")
-            temp_audio_path = output_path.replace('.mp3', f'_temp_{i}.mp3')
+            temp_audio_path = self._chunk_path(output_path, i, ".wav")
             
             synthesis_input = texttospeech.SynthesisInput(text=chunk)
             
@@ -335,35 +331,7 @@ class MultiTTSEngine:
             
             audio_files.append(temp_audio_path)
         
-        # 오디오 파일 연결
-        print(f"   🔗 {len(audio_files)}개의 오디오 파일 연결 중...")
-        try:
-            from moviepy.editor import AudioFileClip, concatenate_audioclips
-            audio_clips = [AudioFileClip(f) for f in audio_files]
-            final_audio = concatenate_audioclips(audio_clips)
-            final_audio.write_audiofile(output_path, codec='mp3', bitrate='192k')
-            for f in audio_files:
-                Path(f).unlink()
-            for clip in audio_clips:
-                clip.close()
-            final_audio.close()
-        except ImportError:
-            import subprocess
-            temp_list_file = output_path.replace('.mp3', '_temp_list.txt')
-            with open(temp_list_file, 'w') as f:
-                for audio_file in audio_files:
-                    f.write(f"file '{Path(audio_file).absolute()}'\n")
-            subprocess.run([
-                'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-                '-i', temp_list_file,
-                '-c', 'copy', output_path
-            ], check=True, capture_output=True)
-            Path(temp_list_file).unlink()
-            for f in audio_files:
-                Path(f).unlink()
-        
-        print(f"✅ 음성 생성 완료: {output_path}")
-        return output_path
+        return self._write_master(audio_files, output_path)
     
     def _generate_replicate_xtts(self, text: str, output_path: str, voice: str, language: str, model: str) -> str:
         """Replicate xtts-v2 생성"""
@@ -418,15 +386,16 @@ class MultiTTSEngine:
                 else:
                     raise ValueError(f"예상치 못한 출력 형식: {output}")
             
-            # 오디오 다운로드
+            # 오디오 다운로드 (xtts-v2는 WAV 반환)
             response = requests.get(audio_url)
             response.raise_for_status()
             
-            with open(output_path, 'wb') as f:
+            suffix = Path(audio_url.split("?")[0]).suffix or ".wav"
+            temp_audio_path = self._chunk_path(output_path, 0, suffix)
+            with open(temp_audio_path, 'wb') as f:
                 f.write(response.content)
             
-            print(f"✅ 음성 생성 완료: {output_path}")
-            return output_path
+            return self._write_master([temp_audio_path], output_path)
             
         except Exception as e:
             print(f"❌ Replicate xtts-v2 생성 오류: {e}")
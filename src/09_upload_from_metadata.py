@@ -21,6 +21,19 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 
+try:
+    from utils.retry_utils import retry_with_backoff
+    from utils.quota_scheduler import (
+        PRIORITY_COMMENT, PRIORITY_UPLOAD, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler,
+    )
+    from utils.resumable_upload import UploadJournal, resolve_chunk_size, resumable_upload, upload_key
+except ImportError:
+    from src.utils.retry_utils import retry_with_backoff
+    from src.utils.quota_scheduler import (
+        PRIORITY_COMMENT, PRIORITY_UPLOAD, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler,
+    )
+    from src.utils.resumable_upload import UploadJournal, resolve_chunk_size, resumable_upload, upload_key
+
 GOOGLE_API_AVAILABLE = True
 
 load_dotenv()
@@ -35,7 +48,11 @@ FULL_SCOPES = ['https://www.googleapis.com/auth/youtube.upload', 'https://www.go
 class YouTubeUploader:
     """YouTube 업로더"""
     
-    def __init__(self):
+    def __init__(self, chunk_size: Optional[int] = None):
+        """
+        Args:
+            chunk_size: 업로드 청크 크기 (바이트, None이면 환경 변수/기본값 - resolve_chunk_size)
+        """
         if not GOOGLE_API_AVAILABLE:
             raise ImportError("google-api-python-client가 필요합니다.")
         
@@ -47,6 +64,10 @@ class YouTubeUploader:
             raise ValueError("YouTube API 자격증명이 설정되지 않았습니다.")
         
         self.youtube = None
+        self.quota = None
+        self.chunk_size = chunk_size or resolve_chunk_size()
+        # 재개 세션 기록: 중단된 업로드는 다음 실행에서 확인된 오프셋부터 이어서 전송
+        self.upload_journal = UploadJournal()
         self._authenticate()
     
     def _authenticate(self):
@@ -64,7 +85,10 @@ class YouTubeUploader:
                 scopes=scopes,
             )
             credentials.refresh(Request())
-            return build("youtube", "v3", credentials=credentials)
+            # 업로드는 최우선 순위: 다른 배치가 남겨 둔 쿼터까지 사용
+            service = enable_quota_scheduler(build("youtube", "v3", credentials=credentials), priority=PRIORITY_UPLOAD)
+            self.quota = get_quota_scheduler(service)
+            return service
 
         try:
             self.youtube = _build_with_scopes(FULL_SCOPES)
@@ -288,10 +312,11 @@ class YouTubeUploader:
             file_size_mb = file_size / (1024 * 1024)
             if file_size_mb > 100:
                 print(f"   ⚠️ 큰 파일 크기: {file_size_mb:.2f} MB (업로드에 시간이 걸릴 수 있습니다)")
+                print(f"   📦 {self.chunk_size / (1024 * 1024):.0f} MB 단위로 전송 (중단되면 다음 실행에서 이어서 업로드)")
             
             media = MediaFileUpload(
                 video_path,
-                chunksize=-1,
+                chunksize=self.chunk_size,
                 resumable=True,
                 mimetype='video/*'
             )
@@ -306,6 +331,14 @@ class YouTubeUploader:
                 body['snippet']['localizations'] = localizations
                 print(f"   🌐 다국어 메타데이터 추가: {', '.join(lang_keys)} (defaultLanguage: {lang_keys[0] if lang_keys else 'N/A'})")
             
+            # 업로드 + 썸네일 + 다국어 수정까지 끝낼 쿼터가 있을 때만 전송 시작
+            unit_methods = ["videos.insert"]
+            if thumbnail_path and os.path.exists(thumbnail_path):
+                unit_methods.append("thumbnails.set")
+            if localizations:
+                unit_methods.append("videos.update")
+            self.quota.require(*unit_methods)
+
             assert self.youtube is not None, "YouTube client not initialized"
             insert_request = self.youtube.videos().insert(
                 part=','.join(['snippet', 'status']),
@@ -313,7 +346,7 @@ class YouTubeUploader:
                 media_body=media
             )
             
-            response = self._resumable_upload(insert_request)
+            response = self._resumable_upload(insert_request, upload_key(video_path, body), video_path)
             video_id = response['id']
             
             # 썸네일 업로드 (재시도 포함)
@@ -360,7 +393,9 @@ class YouTubeUploader:
             # 고정 댓글 추가 (있는 경우)
             if pinned_comment and getattr(self, "can_post_comments", True):
                 try:
-                    self.add_pinned_comment(video_id, pinned_comment)
+                    # 댓글은 낮은 우선순위: 다음 업로드 몫의 쿼터는 쓰지 않음
+                    with self.quota.priority(PRIORITY_COMMENT):
+                        self.add_pinned_comment(video_id, pinned_comment)
                     print(f"   ✅ 고정 댓글 추가 완료")
                 except Exception as e:
                     print(f"   ⚠️ 고정 댓글 추가 실패 (무시): {e}")
@@ -369,6 +404,8 @@ class YouTubeUploader:
             
             return result
             
+        except QuotaExhausted:
+            raise
         except HttpError as e:
             error_status = e.resp.status if hasattr(e.resp, 'status') else None
             error_reason = None
@@ -395,97 +432,27 @@ class YouTubeUploader:
             print(f"   상세 오류:\n{traceback.format_exc()}")
             return None
     
-    def _resumable_upload(self, insert_request):
-        """재개 가능한 업로드 (개선된 재시도 로직)"""
-        import time
-        
-        response = None
-        retry = 0
-        max_retries = 5
-        retry_delay = 2  # 초
-        
-        while response is None:
-            try:
-                # 진행 상황 표시
-                status, response = insert_request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    print(f"   진행 중... {progress}%", end='\r')
-                
-                if response and 'id' in response:
-                    print("   완료!      ")
-                    return response
-                    
-            except HttpError as e:
-                error_status = e.resp.status if hasattr(e.resp, 'status') else None
-                
-                # 재시도 가능한 오류 (서버 오류, 네트워크 오류)
-                if error_status in [500, 502, 503, 504] or error_status is None:
-                    retry += 1
-                    if retry > max_retries:
-                        print(f"\n   ❌ 최대 재시도 횟수({max_retries}) 초과")
-                        raise
-                    
-                    wait_time = retry_delay * retry  # 지수 백오프
-                    print(f"\n   ⚠️ 서버 오류 발생 (재시도 {retry}/{max_retries})")
-                    print(f"   {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    # 재시도 불가능한 오류 (인증 오류, 권한 오류 등)
-                    print(f"\n   ❌ 업로드 실패: {e}")
-                    if error_status == 403:
-                        print("   권한이 없습니다. OAuth2 토큰을 확인하세요.")
-                    elif error_status == 401:
-                        print("   인증이 만료되었습니다. 토큰을 갱신하세요.")
-                    raise
-                    
-            except Exception as e:
-                retry += 1
-                if retry > max_retries:
-                    print(f"\n   ❌ 최대 재시도 횟수({max_retries}) 초과: {e}")
-                    raise
-                
-                wait_time = retry_delay * retry
-                print(f"\n   ⚠️ 오류 발생: {e} (재시도 {retry}/{max_retries})")
-                print(f"   {wait_time}초 후 재시도...")
-                time.sleep(wait_time)
-        
-        return response
+    def _resumable_upload(self, insert_request, journal_key: Optional[str] = None, video_path: str = ""):
+        """재개 가능한 업로드 (일시적 오류 재시도, 중단 시 다음 실행에서 이어서 업로드)"""
+        journal = self.upload_journal if journal_key else None
+        return resumable_upload(insert_request, journal=journal, key=journal_key, video_path=video_path)
+    
+    @retry_with_backoff(retries=2, backoff_in_seconds=2.0, provider="youtube")
+    def _set_thumbnail(self, video_id: str, thumbnail_path: str):
+        """thumbnails.set 호출 (일시적 오류만 재시도)"""
+        assert self.youtube is not None, "YouTube client not initialized"
+        self.youtube.thumbnails().set(
+            videoId=video_id,
+            media_body=MediaFileUpload(thumbnail_path)
+        ).execute()
     
     def upload_thumbnail(self, video_id: str, thumbnail_path: str):
         """썸네일 업로드 (재시도 포함)"""
-        import time
-        
-        max_retries = 3
-        retry = 0
-        
-        while retry < max_retries:
-            try:
-                assert self.youtube is not None, "YouTube client not initialized"
-                self.youtube.thumbnails().set(
-                    videoId=video_id,
-                    media_body=MediaFileUpload(thumbnail_path)
-                ).execute()
-                print("   ✅ 썸네일 업로드 완료")
-                return
-            except HttpError as e:
-                error_status = e.resp.status if hasattr(e.resp, 'status') else None
-                if error_status in [500, 502, 503, 504]:
-                    retry += 1
-                    if retry < max_retries:
-                        print(f"   ⚠️ 썸네일 업로드 재시도 중... ({retry}/{max_retries})")
-                        time.sleep(2 * retry)
-                        continue
-                print(f"   ⚠️ 썸네일 업로드 실패: {e}")
-                return
-            except Exception as e:
-                retry += 1
-                if retry < max_retries:
-                    print(f"   ⚠️ 썸네일 업로드 재시도 중... ({retry}/{max_retries})")
-                    time.sleep(2 * retry)
-                    continue
-                print(f"   ⚠️ 썸네일 업로드 실패: {e}")
-                return
+        try:
+            self._set_thumbnail(video_id, thumbnail_path)
+            print("   ✅ 썸네일 업로드 완료")
+        except Exception as e:
+            print(f"   ⚠️ 썸네일 업로드 실패: {e}")
     
     def add_pinned_comment(self, video_id: str, comment_text: str):
         """
@@ -866,6 +833,8 @@ def main():
         default=None,
         help='업로드할 메타데이터 파일 경로 목록 (지정 시 output/ 스캔 대신 이 목록만 업로드)'
     )
+    parser.add_argument('--chunk-mb', type=float, default=None, help='업로드 청크 크기 (MB, 기본값: YOUTUBE_UPLOAD_CHUNK_MB 또는 32)')
+    parser.add_argument('--upload-mbps', type=float, default=None, help='업로드 회선 속도 (Mbps, 청크 하나가 약 30초가 되도록 크기 결정)')
     
     args = parser.parse_args()
     
@@ -879,7 +848,7 @@ def main():
     print()
     
     try:
-        uploader = YouTubeUploader()
+        uploader = YouTubeUploader(chunk_size=resolve_chunk_size(args.chunk_mb, args.upload_mbps))
     except Exception as e:
         print(f"❌ 초기화 실패: {e}")
         return
@@ -1251,18 +1220,23 @@ def main():
         publish_at = metadata.get('publish_at')
         if publish_at:
             print(f"   📅 예약 업로드: {publish_at} (KST 기준 다음 날 19:00)")
-        result = uploader.upload_video(
-            channel_id=channel_id,
-            video_path=str(video_path),
-            title=title,
-            description=description,
-            tags=tags,
-            privacy_status=privacy,
-            thumbnail_path=thumbnail,
-            localizations=localizations,
-            pinned_comment=pinned_comment,
-            publish_at=publish_at
-        )
+        try:
+            result = uploader.upload_video(
+                channel_id=channel_id,
+                video_path=str(video_path),
+                title=title,
+                description=description,
+                tags=tags,
+                privacy_status=privacy,
+                thumbnail_path=thumbnail,
+                localizations=localizations,
+                pinned_comment=pinned_comment,
+                publish_at=publish_at
+            )
+        except QuotaExhausted as e:
+            print(f"⏸️ {e}")
+            print(f"   남은 {len(metadata_files) - i + 1}개는 쿼터 재설정 후 다시 실행하면 이어서 업로드합니다.")
+            break
         
         if result:
             uploaded.append(result)
@@ -1278,6 +1252,7 @@ def main():
     print(f"✅ 업로드 완료: {len(uploaded)}/{len(metadata_files)}개")
     if skipped:
         print(f"⏭️ 건너뜀: {len(skipped)}개 (이미 업로드됨)")
+    print(uploader.quota.summary())
     print("=" * 60)
     print()
     
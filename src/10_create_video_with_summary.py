@@ -23,26 +23,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # 로깅 시스템 import
 from utils.logger import get_logger
 
-# 숫자로 시작하는 모듈은 importlib 사용
-import importlib.util
-
-# 08_generate_summary 모듈 로드
-spec1 = importlib.util.spec_from_file_location("generate_summary", Path(__file__).parent / "08_generate_summary.py")
-generate_summary_module = importlib.util.module_from_spec(spec1)
-spec1.loader.exec_module(generate_summary_module)
-SummaryGenerator = generate_summary_module.SummaryGenerator
-
-# 09_text_to_speech_multi 모듈 로드
-spec2 = importlib.util.spec_from_file_location("text_to_speech_multi", Path(__file__).parent / "09_text_to_speech_multi.py")
-text_to_speech_module = importlib.util.module_from_spec(spec2)
-spec2.loader.exec_module(text_to_speech_module)
-MultiTTSEngine = text_to_speech_module.MultiTTSEngine
-
-# 03_make_video 모듈 로드
-spec3 = importlib.util.spec_from_file_location("make_video", Path(__file__).parent / "03_make_video.py")
-make_video_module = importlib.util.module_from_spec(spec3)
-spec3.loader.exec_module(make_video_module)
-VideoMaker = make_video_module.VideoMaker
+# 숫자로 시작하는 모듈은 모듈 로더 사용 (처음 사용할 때 한 번만 로드)
+from utils.module_loader import lazy_script
+from utils.audio_master import master_path_for
+
+generate_summary_module = lazy_script("08_generate_summary.py")
+text_to_speech_module = lazy_script("09_text_to_speech_multi.py")
+make_video_module = lazy_script("03_make_video.py")
 
 load_dotenv()
 
@@ -52,10 +39,10 @@ class VideoWithSummaryPipeline:
 
     def __init__(self, tts_provider: str = "openai"):
         self.logger = get_logger(__name__)
-        self.summary_generator = SummaryGenerator()
+        self.summary_generator = generate_summary_module.SummaryGenerator()
         # TTS 엔진 (MultiTTSEngine)
-        self.tts_engine = MultiTTSEngine(provider=tts_provider)
-        self.video_maker = VideoMaker(
+        self.tts_engine = text_to_speech_module.MultiTTSEngine(provider=tts_provider)
+        self.video_maker = make_video_module.VideoMaker(
             resolution=(1920, 1080),
             fps=30,
             bitrate="5000k",
@@ -286,6 +273,10 @@ class VideoWithSummaryPipeline:
                 if "_longform_" in summary_audio_path:
                     new_path = summary_audio_path.replace("_longform_", "_summary_")
                     Path(summary_audio_path).rename(new_path)
+                    # 무손실 마스터도 함께 이름 변경
+                    master_path = master_path_for(summary_audio_path)
+                    if master_path.exists():
+                        master_path.rename(master_path_for(new_path))
                     summary_audio_path = new_path
                     print(f"   → {Path(summary_audio_path).name}로 이름 변경됨")
                 print()
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # 공통 유틸리티 import
 from src.utils.translations import translate_book_title, translate_author_name, translate_book_title_to_korean, is_english_title, translate_author_name_to_korean
 from src.utils.file_utils import safe_title, load_book_info
+from src.utils.image_loader import load_rgb
 
 load_dotenv()
 
@@ -291,7 +292,7 @@ clean background with space for text placement.
             
             # PIL Image로 변환
             from io import BytesIO
-            img = Image.open(BytesIO(img_response.content))
+            img = load_rgb(BytesIO(img_response.content), self.THUMBNAIL_SIZE)
             
             # 썸네일 크기에 맞게 리사이즈 및 크롭
             img = self._resize_and_crop(img, self.THUMBNAIL_SIZE)
@@ -368,12 +369,8 @@ clean background with space for text placement.
             image_dir = Path("assets/images") / safe_title_str
             
             # 이미지 다운로더 사용
-            import importlib.util
-            images_path = Path(__file__).parent / "02_get_images.py"
-            spec = importlib.util.spec_from_file_location("get_images", images_path)
-            images_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(images_module)
-            downloader = images_module.ImageDownloader()
+            from src.utils.module_loader import load_script
+            downloader = load_script("02_get_images.py").ImageDownloader()
             
             # 작가나 책 관련 이미지 검색 (저작권 없는 이미지)
             print(f"   🔍 작가/책 이미지 검색 중: {', '.join(search_keywords)}")
@@ -466,7 +463,7 @@ clean background with space for text placement.
         
         # 2순위: 제공된 배경 이미지 사용 (DALL-E가 실패하거나 사용하지 않는 경우)
         if not bg and background_image_path and os.path.exists(background_image_path):
-            bg = Image.open(background_image_path)
+            bg = load_rgb(background_image_path, self.THUMBNAIL_SIZE)
             # 썸네일 크기에 맞게 리사이즈 및 크롭
             bg = self._resize_and_crop(bg, self.THUMBNAIL_SIZE)
             # 약간 어둡게 (텍스트 가독성 향상)
@@ -479,7 +476,7 @@ clean background with space for text placement.
         if not bg and use_author_image:
             author_image_path = self._search_author_or_book_image(book_title, author, lang)
             if author_image_path and os.path.exists(author_image_path):
-                bg = Image.open(author_image_path)
+                bg = load_rgb(author_image_path, self.THUMBNAIL_SIZE)
                 # 썸네일 크기에 맞게 리사이즈 및 크롭
                 bg = self._resize_and_crop(bg, self.THUMBNAIL_SIZE)
                 # 약간 어둡게 (텍스트 가독성 향상)
@@ -928,16 +925,8 @@ clean background with space for text placement.
         """
         try:
             print(f"   📖 이미지 로드 중: {input_path.name}")
-            img = Image.open(input_path)
-            
-            # RGBA를 RGB로 변환 (PNG 투명도 처리)
-            if img.mode == 'RGBA':
-                # 흰색 배경에 합성
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])  # alpha 채널을 마스크로 사용
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
+            # RGB로 변환 (PNG 투명도는 흰색 배경에 합성)
+            img = load_rgb(input_path, self.THUMBNAIL_SIZE, background=(255, 255, 255))
             
             # 리사이즈 (비율 유지하며 크롭)
             print(f"   🔄 리사이즈 중: {img.size} -> {self.THUMBNAIL_SIZE}")
@@ -13,6 +13,7 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
+from src.utils.module_loader import load_script
 load_dotenv()
 
 
@@ -32,11 +33,8 @@ class FullPipeline:
         
         try:
             # NotebookLM URL 수집 모듈 import
-            import importlib.util
             collector_path = Path(__file__).parent.parent / "scripts" / "collect_urls_for_notebooklm.py"
-            spec = importlib.util.spec_from_file_location("collect_urls", collector_path)
-            collector_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(collector_module)
+            collector_module = load_script(collector_path)
             
             collector = collector_module.NotebookLMURLCollector()
             ko_urls, en_urls = collector.search_urls_bilingual(
@@ -72,11 +70,7 @@ class FullPipeline:
         
         try:
             # 이미지 다운로드 모듈 import
-            import importlib.util
-            images_path = Path(__file__).parent / "02_get_images.py"
-            spec = importlib.util.spec_from_file_location("get_images", images_path)
-            images_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(images_module)
+            images_module = load_script("02_get_images.py")
             
             downloader = images_module.ImageDownloader()
             result = downloader.download_all(
@@ -108,11 +102,7 @@ class FullPipeline:
         
         try:
             # 영상 생성 모듈 import
-            import importlib.util
-            video_path = Path(__file__).parent / "08_create_and_preview_videos.py"
-            spec = importlib.util.spec_from_file_location("create_videos", video_path)
-            video_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(video_module)
+            video_module = load_script("08_create_and_preview_videos.py")
             
             # 오디오 파일 찾기
             korean_audio, english_audio = video_module.find_audio_files()
@@ -228,11 +218,7 @@ class FullPipeline:
         """4단계: 썸네일 생성"""
         try:
             # 썸네일 생성 모듈 import
-            import importlib.util
-            thumbnail_path = Path(__file__).parent / "10_generate_thumbnail.py"
-            spec = importlib.util.spec_from_file_location("generate_thumbnail", thumbnail_path)
-            thumbnail_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(thumbnail_module)
+            thumbnail_module = load_script("10_generate_thumbnail.py")
             
             # 배경 이미지 찾기 (무드 이미지 중 하나)
             background_image = None
@@ -19,6 +19,11 @@ try:
 except ImportError:
     GOOGLE_API_AVAILABLE = False
 
+try:
+    from utils.channel_catalog import load_channel_videos
+except ImportError:
+    from src.utils.channel_catalog import load_channel_videos
+
 load_dotenv()
 
 SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
@@ -84,61 +89,19 @@ class YouTubeChannelUpdater:
             return None
     
     def get_channel_videos(self, channel_id: str, max_results: int = 50) -> List[Dict]:
-        """채널의 모든 비디오 가져오기"""
-        videos = []
-        next_page_token = None
-        
+        """채널의 비디오 가져오기 (로컬 카탈로그 동기화 후 최신순 조회)"""
         print(f"📹 채널의 비디오 목록 가져오는 중...")
         
-        while len(videos) < max_results:
-            try:
-                # 채널의 업로드 플레이리스트 ID 가져오기
-                if not hasattr(self, '_upload_playlist_id'):
-                    channel_response = self.youtube.channels().list(
-                        part='contentDetails',
-                        id=channel_id
-                    ).execute()
-                    
-                    if not channel_response.get('items'):
-                        print("❌ 채널을 찾을 수 없습니다.")
-                        break
-                    
-                    self._upload_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-                
-                # 플레이리스트에서 비디오 가져오기
-                request_params = {
-                    'part': 'snippet,contentDetails',
-                    'playlistId': self._upload_playlist_id,
-                    'maxResults': min(50, max_results - len(videos))
-                }
-                
-                if next_page_token:
-                    request_params['pageToken'] = next_page_token
-                
-                response = self.youtube.playlistItems().list(**request_params).execute()
-                
-                for item in response.get('items', []):
-                    video_info = {
-                        'video_id': item['contentDetails']['videoId'],
-                        'title': item['snippet']['title'],
-                        'published_at': item['snippet']['publishedAt'],
-                        'description': item['snippet'].get('description', ''),
-                        'url': f"https://www.youtube.com/watch?v={item['contentDetails']['videoId']}"
-                    }
-                    videos.append(video_info)
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
-                
-                print(f"   진행 중... {len(videos)}개 비디오 수집됨")
-                
-            except HttpError as e:
-                print(f"❌ 비디오 목록 가져오기 실패: {e}")
-                break
-            except Exception as e:
-                print(f"❌ 오류 발생: {e}")
-                break
+        try:
+            # CSV에 제목/설명/통계를 그대로 쓰므로 기존 영상도 다시 조회 (수정 반영, 삭제된 영상 제거)
+            # videos.list 50개 배치라 영상 수백 개도 몇 번의 요청으로 끝남
+            videos = load_channel_videos(self.youtube, channel_id, limit=max_results, refresh=True)
+        except HttpError as e:
+            print(f"❌ 비디오 목록 가져오기 실패: {e}")
+            return []
+        except Exception as e:
+            print(f"❌ 오류 발생: {e}")
+            return []
         
         print(f"✅ 총 {len(videos)}개의 비디오를 찾았습니다.\n")
         return videos
@@ -21,6 +21,8 @@ from bs4 import BeautifulSoup
 import requests
 from dotenv import load_dotenv
 
+from utils.http_client import get_http_client
+
 # YouTube API import
 try:
     from googleapiclient.discovery import build
@@ -85,10 +87,10 @@ class DeepURLCollector:
     ]
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.http = get_http_client()
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.ddgs = DDGS()
         
         # YouTube API 초기화
@@ -129,7 +131,7 @@ class DeepURLCollector:
             strict: 엄격한 검증 여부 (False면 더 관대하게 검증)
         """
         try:
-            response = self.session.get(url, timeout=10, allow_redirects=True)
+            response = self.http.get(url, headers=self.headers, timeout=10, retries=1)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
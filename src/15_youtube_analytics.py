@@ -28,6 +28,9 @@ except ImportError:
     GOOGLE_API_AVAILABLE = False
 
 from utils.logger import get_logger
+from utils.channel_catalog import ChannelCatalog, load_channel_videos
+from utils.analytics_reports import DEFAULT_METRICS, collect_video_reports
+from utils.metrics_store import DEFAULT_BACKFILL_DAYS, MetricsStore, backfill_days_for, sync_warehouse
 
 load_dotenv()
 
@@ -56,6 +59,7 @@ class YouTubeAnalytics:
         
         self.youtube = None
         self.youtube_analytics = None
+        self.store = MetricsStore()
         self._authenticate()
     
     def _authenticate(self):
@@ -145,9 +149,10 @@ class YouTubeAnalytics:
             ).execute()
             
             if response.get('items'):
-                channel_id = response['items'][0]['id']
-                self.logger.info(f"✅ 채널 ID: {channel_id}")
-                return channel_id
+                # 한 번 조회한 채널 ID는 재사용
+                self.channel_id = response['items'][0]['id']
+                self.logger.info(f"✅ 채널 ID: {self.channel_id}")
+                return self.channel_id
             return None
         except Exception as e:
             self.logger.error(f"❌ 채널 ID 가져오기 실패: {e}")
@@ -234,16 +239,19 @@ class YouTubeAnalytics:
         if end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
         if start_date is None:
-            # 영상 업로드 날짜 가져오기
+            # 영상 업로드 날짜 (로컬 카탈로그에 없을 때만 API 조회)
             try:
-                video_response = self.youtube.videos().list(
-                    part='snippet',
-                    id=video_id
-                ).execute()
+                video = ChannelCatalog(self.youtube, channel_id).get(video_id)
+                if video is None:
+                    video_response = self.youtube.videos().list(
+                        part='snippet',
+                        id=video_id
+                    ).execute()
+                    if video_response.get('items'):
+                        video = {'published_at': video_response['items'][0]['snippet']['publishedAt']}
                 
-                if video_response.get('items'):
-                    published_at = video_response['items'][0]['snippet']['publishedAt']
-                    start_date = published_at[:10]  # YYYY-MM-DD 형식으로 변환
+                if video and video.get('published_at'):
+                    start_date = video['published_at'][:10]  # YYYY-MM-DD 형식으로 변환
                 else:
                     start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
             except Exception as e:
@@ -251,7 +259,7 @@ class YouTubeAnalytics:
                 start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
         
         if metrics is None:
-            metrics = ['views', 'likes', 'comments', 'estimatedMinutesWatched', 'averageViewDuration']
+            metrics = list(DEFAULT_METRICS)
         
         if not self.youtube_analytics:
             self.logger.error("YouTube Analytics API가 사용할 수 없습니다. Analytics 스코프가 필요합니다.")
@@ -277,7 +285,7 @@ class YouTubeAnalytics:
     
     def get_channel_videos(self, max_results: int = 50) -> List[Dict]:
         """
-        채널의 모든 영상 목록 가져오기
+        채널의 모든 영상 목록 가져오기 (로컬 카탈로그, 통계는 50개 배치로 갱신)
         
         Args:
             max_results: 최대 결과 수
@@ -291,65 +299,10 @@ class YouTubeAnalytics:
             return []
         
         try:
-            videos = []
-            next_page_token = None
-            
-            # 채널의 업로드 플레이리스트 ID 가져오기
-            channel_response = self.youtube.channels().list(
-                part='contentDetails',
-                id=channel_id
-            ).execute()
-            
-            if not channel_response.get('items'):
-                self.logger.error("채널을 찾을 수 없습니다.")
-                return []
-            
-            upload_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # 플레이리스트에서 영상 목록 가져오기
-            while len(videos) < max_results:
-                request_params = {
-                    'part': 'contentDetails',
-                    'playlistId': upload_playlist_id,
-                    'maxResults': min(50, max_results - len(videos))
-                }
-                
-                if next_page_token:
-                    request_params['pageToken'] = next_page_token
-                
-                playlist_response = self.youtube.playlistItems().list(**request_params).execute()
-                
-                # 영상 ID 목록 수집
-                video_ids = []
-                for item in playlist_response.get('items', []):
-                    video_id = item['contentDetails']['videoId']
-                    video_ids.append(video_id)
-                
-                if not video_ids:
-                    break
-                
-                # 영상 상세 정보 일괄 가져오기
-                video_response = self.youtube.videos().list(
-                    part='id,snippet,statistics',
-                    id=','.join(video_ids)
-                ).execute()
-                
-                for video_info in video_response.get('items', []):
-                    video_id = video_info['id']
-                    videos.append({
-                        'video_id': video_id,
-                        'title': video_info['snippet']['title'],
-                        'published_at': video_info['snippet']['publishedAt'],
-                        'views': int(video_info['statistics'].get('viewCount', 0)),
-                        'likes': int(video_info['statistics'].get('likeCount', 0)),
-                        'comments': int(video_info['statistics'].get('commentCount', 0)),
-                        'url': f"https://www.youtube.com/watch?v={video_id}"
-                    })
-                
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-            
+            # 메트릭 수집용이므로 기존 영상 통계도 갱신
+            videos = load_channel_videos(
+                self.youtube, channel_id, limit=max_results, refresh=True, log=self.logger.info
+            )
             self.logger.info(f"✅ 채널 영상 목록 수집 완료 ({len(videos)}개)")
             return videos
         except Exception as e:
@@ -364,37 +317,80 @@ class YouTubeAnalytics:
         """
         채널의 모든 영상에 대한 메트릭 수집
         
+        영상별 reports.query 대신 `dimensions=video` 리포트를 영상 ID 목록 필터로 묶어
+        조회하고, 카탈로그 업로드 날짜와 로컬에서 결합합니다 (영상 수백 개도 몇 회 요청).
+        
         Args:
-            start_date: 시작 날짜 (YYYY-MM-DD 형식)
+            start_date: 시작 날짜 (YYYY-MM-DD 형식, 기본값: 영상별 업로드 날짜)
             end_date: 종료 날짜 (YYYY-MM-DD 형식)
         
         Returns:
             영상별 메트릭 데이터 리스트
         """
+        channel_id = self.get_channel_id()
+        if not channel_id:
+            self.logger.error("채널 ID를 가져올 수 없습니다.")
+            return []
+        
+        if not self.youtube_analytics:
+            self.logger.error("YouTube Analytics API가 사용할 수 없습니다. Analytics 스코프가 필요합니다.")
+            return []
+        
         videos = self.get_channel_videos()
-        all_metrics = []
+        if not videos:
+            return []
         
-        for video in videos:
-            video_id = video['video_id']
-            self.logger.info(f"영상 메트릭 수집 중: {video['title']}")
-            
-            metrics = self.get_video_metrics(
-                video_id=video_id,
+        self.logger.info(f"영상 메트릭 일괄 수집 중 ({len(videos)}개)")
+        try:
+            reports = collect_video_reports(
+                self.youtube_analytics,
+                channel_id,
+                videos,
                 start_date=start_date,
                 end_date=end_date
             )
-            
-            if metrics:
-                # 메트릭 데이터와 영상 정보 결합
-                video_metrics = {
-                    **video,
-                    'analytics': metrics
-                }
-                all_metrics.append(video_metrics)
+        except HttpError as e:
+            self.logger.error(f"❌ 영상 메트릭 수집 실패: {e}")
+            return []
+        
+        # 메트릭 데이터와 영상 정보 결합
+        all_metrics = [
+            {**video, 'analytics': reports[video['video_id']]}
+            for video in videos
+            if video['video_id'] in reports
+        ]
         
         self.logger.info(f"✅ 전체 영상 메트릭 수집 완료 ({len(all_metrics)}개)")
         return all_metrics
     
+    def sync_warehouse(self, days: int = DEFAULT_BACKFILL_DAYS) -> bool:
+        """
+        로컬 지표 저장소 증분 적재 (리포트/대시보드는 저장소만 읽음)
+        
+        Args:
+            days: 적재 기간 (일, 이전에 적재한 기간보다 길면 앞쪽 날짜도 적재)
+        
+        Returns:
+            적재 성공 여부
+        """
+        if not self.youtube_analytics:
+            self.logger.error("YouTube Analytics API가 사용할 수 없습니다. Analytics 스코프가 필요합니다.")
+            return False
+        
+        try:
+            sync_warehouse(
+                self.store,
+                self.youtube_analytics,
+                self.youtube,
+                self.get_channel_id(),
+                days=days,
+                log=self.logger.info
+            )
+            return True
+        except HttpError as e:
+            self.logger.error(f"❌ 지표 저장소 적재 실패: {e}")
+            return False
+    
     def save_metrics_to_json(self, metrics: Dict, output_path: str = "output/youtube_metrics.json"):
         """메트릭 데이터를 JSON 파일로 저장"""
         output_file = Path(output_path)
@@ -477,9 +473,10 @@ class YouTubeAnalytics:
         
         self.logger.info(f"📊 주간 리포트 생성 중 ({start_date} ~ {end_date})")
         
-        # 채널 메트릭 수집
-        channel_metrics = self.get_channel_metrics(start_date, end_date)
-        video_metrics = self.collect_all_video_metrics(start_date, end_date)
+        # 저장소 적재 후 기간 집계 (API 호출은 누락된 날짜만, 리포트 기간까지 거슬러 적재)
+        self.sync_warehouse(days=backfill_days_for(start_date))
+        channel_metrics = self.store.channel_report(start_date, end_date)
+        video_metrics = self.store.video_report(start_date, end_date)
         
         if not channel_metrics and not video_metrics:
             self.logger.warning("수집된 메트릭이 없습니다.")
@@ -537,9 +534,10 @@ class YouTubeAnalytics:
         
         self.logger.info(f"📊 월간 리포트 생성 중 ({year}년 {month}월)")
         
-        # 채널 메트릭 수집
-        channel_metrics = self.get_channel_metrics(start_date, end_date_str)
-        video_metrics = self.collect_all_video_metrics(start_date, end_date_str)
+        # 저장소 적재 후 기간 집계 (API 호출은 누락된 날짜만, 리포트 기간까지 거슬러 적재)
+        self.sync_warehouse(days=backfill_days_for(start_date))
+        channel_metrics = self.store.channel_report(start_date, end_date_str)
+        video_metrics = self.store.video_report(start_date, end_date_str)
         
         if not channel_metrics and not video_metrics:
             self.logger.warning("수집된 메트릭이 없습니다.")
@@ -703,13 +701,20 @@ def main():
     parser.add_argument('--year', type=int, help='월간 리포트용 연도')
     parser.add_argument('--month', type=int, help='월간 리포트용 월')
     parser.add_argument('--report-output', type=str, help='리포트 출력 파일 경로')
+    parser.add_argument('--sync-warehouse', action='store_true', help='로컬 지표 저장소만 증분 적재')
+    parser.add_argument('--days', type=int, default=DEFAULT_BACKFILL_DAYS, help='지표 저장소 최초 적재 기간 (일)')
     
     args = parser.parse_args()
     
     try:
         analytics = YouTubeAnalytics()
         
-        if args.channel:
+        if args.sync_warehouse:
+            # 로컬 지표 저장소 적재
+            if not analytics.sync_warehouse(days=args.days):
+                return 1
+        
+        elif args.channel:
             # 채널 전체 메트릭
             metrics = analytics.get_channel_metrics(
                 start_date=args.start_date,
@@ -12,8 +12,6 @@ from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
-import importlib.util
-
 # 프로젝트 루트를 경로에 추가
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
@@ -21,25 +19,23 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root / "src"))
 
 from utils.logger import get_logger
+from utils.module_loader import load_script
+from utils.metrics_store import MetricsStore
 
 load_dotenv()
 
 
 class DashboardGenerator:
-    """대시보드 생성 클래스"""
+    """대시보드 생성 클래스 (로컬 지표 저장소 기반, API 호출 없음)"""
     
-    def __init__(self):
+    def __init__(self, sync: bool = False):
+        """
+        Args:
+            sync: True면 생성 전에 YouTube Analytics API로 저장소 증분 적재
+        """
         self.logger = get_logger(__name__)
-        
-        # YouTube Analytics 모듈 로드
-        spec = importlib.util.spec_from_file_location(
-            "youtube_analytics",
-            project_root / "src" / "15_youtube_analytics.py"
-        )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        self.analytics = module.YouTubeAnalytics()
+        self.store = MetricsStore()
+        self.sync = sync
     
     def generate_dashboard(
         self,
@@ -65,77 +61,29 @@ class DashboardGenerator:
         
         self.logger.info(f"📊 대시보드 생성 중 ({start_date} ~ {end_date})")
         
-        # 채널 정보 가져오기
-        channel_id = self.analytics.get_channel_id()
-        channel_info = None
-        if channel_id:
-            try:
-                channel_response = self.analytics.youtube.channels().list(
-                    part='snippet,statistics',
-                    id=channel_id
-                ).execute()
-                if channel_response.get('items'):
-                    channel_info = channel_response['items'][0]
-            except Exception as e:
-                self.logger.warning(f"채널 정보 가져오기 실패: {e}")
+        if self.sync:
+            # YouTube Analytics 모듈 로드 (자격증명 필요)
+            analytics = load_script("15_youtube_analytics.py").YouTubeAnalytics()
+            analytics.sync_warehouse()
         
-        # 채널 메트릭 수집 (Analytics API 사용 가능한 경우)
-        channel_metrics = None
-        if self.analytics.youtube_analytics:
-            channel_metrics = self.analytics.get_channel_metrics(start_date, end_date)
+        # 채널 정보 / 기간 메트릭 / 영상별 메트릭 (로컬 저장소)
+        channel_info = self.store.channel_info()
+        channel_id = channel_info.get('id') if channel_info else None
+        channel_metrics = self.store.channel_report(start_date, end_date)
+        videos = self.store.video_report(start_date, end_date)
         
-        # 영상 목록 수집 (YouTube API에서 직접 가져오기)
-        videos = []
-        try:
-            videos = self.analytics.get_channel_videos(max_results=100)
-            self.logger.info(f"✅ YouTube API에서 {len(videos)}개 영상 정보 수집")
-        except Exception as e:
-            self.logger.warning(f"YouTube API에서 영상 목록 가져오기 실패: {e}")
-            # 실패 시 업로드 로그에서 가져오기 시도
+        if videos:
+            self.logger.info(f"✅ 지표 저장소에서 {len(videos)}개 영상 정보 로드")
+        else:
+            self.logger.warning("지표 저장소가 비어 있습니다. --sync 옵션으로 적재할 수 있습니다.")
+            # 저장소가 비어 있으면 업로드 로그에서 가져오기 시도
             videos = self._get_videos_from_upload_log()
         
-        # YouTube API로 최신 통계 업데이트 시도 (이미 가져온 경우 스킵)
-        if videos and not all(v.get('views', 0) > 0 for v in videos):
-            try:
-                video_ids = [v.get('video_id') for v in videos if v.get('video_id')]
-                if video_ids:
-                    # videos().list()는 업로드 스코프로도 작동할 수 있음
-                    video_response = self.analytics.youtube.videos().list(
-                        part='statistics,snippet',
-                        id=','.join(video_ids[:50])  # 최대 50개씩
-                    ).execute()
-                    
-                    # 통계 업데이트
-                    stats_map = {}
-                    for item in video_response.get('items', []):
-                        stats_map[item['id']] = {
-                            'views': int(item['statistics'].get('viewCount', 0)),
-                            'likes': int(item['statistics'].get('likeCount', 0)),
-                            'comments': int(item['statistics'].get('commentCount', 0)),
-                            'published_at': item['snippet'].get('publishedAt', '')
-                        }
-                    
-                    # 비디오 정보 업데이트
-                    for video in videos:
-                        video_id = video.get('video_id')
-                        if video_id and video_id in stats_map:
-                            video.update(stats_map[video_id])
-            except Exception as e:
-                self.logger.warning(f"최신 통계 업데이트 실패 (업로드 로그 데이터 사용): {e}")
-        
-        # 영상별 Analytics 메트릭 수집 (가능한 경우)
-        video_analytics = {}
-        if self.analytics.youtube_analytics and videos:
-            for video in videos[:20]:  # 최대 20개만 (시간 절약)
-                video_id = video.get('video_id')
-                if video_id:
-                    metrics = self.analytics.get_video_metrics(
-                        video_id=video_id,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                    if metrics:
-                        video_analytics[video_id] = metrics
+        video_analytics = {
+            video['video_id']: video['analytics']
+            for video in videos
+            if video.get('analytics', {}).get('rows')
+        }
         
         # 대시보드 HTML 생성
         html = self._generate_html_dashboard(
@@ -611,11 +559,12 @@ def main():
     parser.add_argument('--end-date', type=str, help='종료 날짜 (YYYY-MM-DD)')
     parser.add_argument('--output', type=str, default='output/dashboard.html', help='대시보드 출력 파일 경로')
     parser.add_argument('--open', action='store_true', help='생성 후 브라우저에서 자동 열기')
+    parser.add_argument('--sync', action='store_true', help='생성 전 YouTube Analytics API로 지표 저장소 증분 적재')
     
     args = parser.parse_args()
     
     try:
-        generator = DashboardGenerator()
+        generator = DashboardGenerator(sync=args.sync)
         dashboard_path = generator.generate_dashboard(
             start_date=args.start_date,
             end_date=args.end_date,
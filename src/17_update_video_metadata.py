@@ -1,23 +1,32 @@
 """
 기존 YouTube 영상의 메타데이터 업데이트 스크립트
 - 메타데이터 파일을 읽어서 YouTube에 업로드된 영상의 제목, 설명, 태그를 업데이트
+- 여러 파일을 한 번에 지정하면 현재 값을 배치로 조회해 바뀌는 영상만 병렬로 업데이트
 """
 
 import os
 import json
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from dotenv import load_dotenv
 
 try:
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
     GOOGLE_API_AVAILABLE = True
 except ImportError:
     GOOGLE_API_AVAILABLE = False
 
+try:
+    from utils.bulk_metadata import DEFAULT_WORKERS, BulkMetadataUpdater, BulkResult
+    from utils.quota_scheduler import PRIORITY_METADATA, QuotaScheduler, enable_quota_scheduler
+    from utils.youtube_cache import enable_etag_cache, log_cache_stats
+except ImportError:
+    from src.utils.bulk_metadata import DEFAULT_WORKERS, BulkMetadataUpdater, BulkResult
+    from src.utils.quota_scheduler import PRIORITY_METADATA, QuotaScheduler, enable_quota_scheduler
+    from src.utils.youtube_cache import enable_etag_cache, log_cache_stats
+
 load_dotenv()
 
 SCOPES = [
@@ -41,6 +50,13 @@ class YouTubeMetadataUpdater:
             raise ValueError("YouTube API 자격증명이 설정되지 않았습니다.")
         
         self.youtube = None
+        self.credentials = None
+        self.quota = QuotaScheduler(priority=PRIORITY_METADATA)
+        # 업로드 재생목록 항목 캐시 (여러 파일의 제목 검색에 재사용)
+        self._uploads: List[Dict] = []
+        self._uploads_playlist_id: Optional[str] = None
+        self._uploads_page_token: Optional[str] = None
+        self._uploads_pages = 0
         self._authenticate()
     
     def _authenticate(self):
@@ -56,11 +72,18 @@ class YouTubeMetadataUpdater:
             )
             
             credentials.refresh(Request())
-            self.youtube = build('youtube', 'v3', credentials=credentials)
+            self.credentials = credentials
+            self.youtube = self._build_service()
             print("✅ YouTube API 인증 성공")
         except Exception as e:
             print(f"❌ 인증 실패: {e}")
             raise
+
+    def _build_service(self):
+        """서비스 객체 생성 (병렬 업데이트 스레드도 같은 쿼터 스케줄러/ETag 캐시 사용)"""
+        # 채널/재생목록 페이지 조회는 ETag 재검증 (방금 업로드한 영상도 찾도록 항상 재검증)
+        service = enable_quota_scheduler(build('youtube', 'v3', credentials=self.credentials), scheduler=self.quota)
+        return enable_etag_cache(service)
     
     def _validate_and_clean_tags(self, tags: list) -> list:
         """태그 검증 및 정리 (YouTube 규칙 준수)"""
@@ -129,59 +152,95 @@ class YouTubeMetadataUpdater:
         
         return description
     
-    def find_video_id_by_title(self, title: str) -> Optional[str]:
-        """제목으로 video_id 찾기"""
-        try:
-            # 채널의 영상 목록 가져오기
+    def _iter_uploads(self, max_pages: int = 10):
+        """업로드 재생목록 항목 (이미 조회한 페이지는 재사용, 최대 max_pages페이지 = 500개)"""
+        yield from list(self._uploads)
+
+        if self._uploads_playlist_id is None:
             channel_id = os.getenv('YOUTUBE_CHANNEL_ID', 'UCxOcO_x_yW6sfg_FPUQVqYA')
-            
-            # 채널의 업로드 플레이리스트 ID 가져오기
             channel_response = self.youtube.channels().list(
                 part='contentDetails',
                 id=channel_id
             ).execute()
-            
+
             if not channel_response.get('items'):
                 print(f"❌ 채널을 찾을 수 없습니다: {channel_id}")
-                return None
-            
-            upload_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # 플레이리스트에서 영상 검색
-            next_page_token = None
-            max_pages = 10  # 최대 10페이지 검색 (500개 영상)
-            
-            for page in range(max_pages):
-                request_params = {
-                    'part': 'snippet',
-                    'playlistId': upload_playlist_id,
-                    'maxResults': 50
-                }
-                
-                if next_page_token:
-                    request_params['pageToken'] = next_page_token
-                
-                playlist_response = self.youtube.playlistItems().list(**request_params).execute()
-                
-                for item in playlist_response.get('items', []):
-                    video_title = item['snippet']['title']
-                    if title in video_title or video_title in title:
-                        video_id = item['snippet']['resourceId']['videoId']
-                        print(f"   ✅ 영상 찾음: {video_title}")
-                        print(f"   📺 Video ID: {video_id}")
-                        return video_id
-                
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-            
+                return
+
+            self._uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+
+        while self._uploads_pages < max_pages and (self._uploads_pages == 0 or self._uploads_page_token):
+            request_params = {
+                'part': 'snippet',
+                'playlistId': self._uploads_playlist_id,
+                'maxResults': 50
+            }
+            if self._uploads_page_token:
+                request_params['pageToken'] = self._uploads_page_token
+
+            playlist_response = self.youtube.playlistItems().list(**request_params).execute()
+            self._uploads_pages += 1
+            self._uploads_page_token = playlist_response.get('nextPageToken')
+
+            items = playlist_response.get('items', [])
+            self._uploads.extend(items)
+            yield from items
+
+    def find_video_id_by_title(self, title: str) -> Optional[str]:
+        """제목으로 video_id 찾기"""
+        try:
+            for item in self._iter_uploads():
+                video_title = item['snippet']['title']
+                if title in video_title or video_title in title:
+                    video_id = item['snippet']['resourceId']['videoId']
+                    print(f"   ✅ 영상 찾음: {video_title}")
+                    print(f"   📺 Video ID: {video_id}")
+                    return video_id
+
             print(f"   ⚠️ 제목으로 영상을 찾을 수 없습니다: {title[:50]}...")
             return None
-            
+
         except Exception as e:
             print(f"   ❌ 영상 검색 실패: {e}")
             return None
-    
+
+    def _metadata_changes(self, title: str, description: str, tags: list) -> Dict:
+        """메타데이터 파일 값 → 업데이트할 snippet 필드 (태그/설명 정리 포함)"""
+        original_tag_count = len(tags)
+        tags = self._validate_and_clean_tags(tags)
+        if len(tags) < original_tag_count:
+            print(f"   ⚠️ 태그 정리: {original_tag_count}개 → {len(tags)}개")
+
+        description = self._clean_description(description)
+
+        print(f"   📝 Description 길이: {len(description)}자")
+        print(f"   🏷️ 태그 개수: {len(tags)}개")
+
+        return {
+            'title': title,
+            'description': description,
+            'tags': tags,
+            'categoryId': '22'  # People & Blogs
+        }
+
+    def update_many(self, targets: Dict[str, Dict], workers: int = DEFAULT_WORKERS) -> BulkResult:
+        """
+        여러 영상 메타데이터 일괄 업데이트
+
+        현재 snippet을 50개 배치로 조회해 바뀌는 영상만 workers개씩 병렬로 업데이트합니다.
+
+        Args:
+            targets: {video_id: {"title": ..., "description": ..., "tags": [...]}}
+            workers: 동시 업데이트 요청 수
+        """
+        changes = {video_id: self._metadata_changes(**fields) for video_id, fields in targets.items()}
+        updater = BulkMetadataUpdater(
+            self.youtube,
+            service_factory=self._build_service if workers > 1 else None,
+            workers=workers,
+        )
+        return updater.run(list(changes), lambda video_id, snippet: changes[video_id])
+
     def update_video_metadata(
         self,
         video_id: str,
@@ -189,49 +248,28 @@ class YouTubeMetadataUpdater:
         description: str,
         tags: list
     ) -> bool:
-        """영상 메타데이터 업데이트"""
-        try:
-            # 태그 검증 및 정리
-            original_tag_count = len(tags)
-            tags = self._validate_and_clean_tags(tags)
-            if len(tags) < original_tag_count:
-                print(f"   ⚠️ 태그 정리: {original_tag_count}개 → {len(tags)}개")
-            
-            # Description 정리
-            description = self._clean_description(description)
-            
-            print(f"   📝 Description 길이: {len(description)}자")
-            print(f"   🏷️ 태그 개수: {len(tags)}개")
-            
-            # YouTube API 업데이트 요청
-            body = {
-                'id': video_id,
-                'snippet': {
-                    'title': title,
-                    'description': description,
-                    'tags': tags,
-                    'categoryId': '22'  # People & Blogs
-                }
-            }
-            
-            response = self.youtube.videos().update(
-                part='snippet',
-                body=body
-            ).execute()
-            
-            print(f"   ✅ 메타데이터 업데이트 완료!")
-            print(f"   🔗 URL: https://www.youtube.com/watch?v={video_id}")
-            return True
-            
-        except HttpError as e:
-            print(f"   ❌ YouTube API 오류: {e}")
-            if e.resp.status == 403:
-                print("   💡 권한이 없습니다. YouTube API 스코프를 확인하세요.")
+        """영상 메타데이터 업데이트 (현재 값과 같으면 요청 생략)"""
+        result = self.update_many(
+            {video_id: {'title': title, 'description': description, 'tags': tags}}, workers=1
+        )
+
+        if video_id in result.unchanged:
+            print("   ✅ 변경 사항 없음 (업데이트 생략)")
+        elif video_id in result.updated:
+            print("   ✅ 메타데이터 업데이트 완료!")
+        elif video_id in result.missing:
+            print(f"   ❌ 영상을 찾을 수 없습니다 (삭제되었거나 비공개): {video_id}")
             return False
-        except Exception as e:
-            print(f"   ❌ 업데이트 실패: {e}")
+        else:
+            error = result.failed.get(video_id, "쿼터 부족으로 보류")
+            print(f"   ❌ 업데이트 실패: {error}")
+            if "403" in error:
+                print("   💡 권한이 없습니다. YouTube API 스코프를 확인하세요.")
             return False
 
+        print(f"   🔗 URL: https://www.youtube.com/watch?v={video_id}")
+        return True
+
 
 def load_metadata(metadata_path: Path) -> Optional[Dict]:
     """메타데이터 파일 로드"""
@@ -247,8 +285,10 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='YouTube 영상 메타데이터 업데이트')
-    parser.add_argument('--metadata-file', type=str, required=True, help='메타데이터 JSON 파일 경로')
-    parser.add_argument('--video-id', type=str, help='YouTube Video ID (제목으로 자동 검색하지 않으려면 지정)')
+    parser.add_argument('--metadata-file', type=str, nargs='+', required=True,
+                        help='메타데이터 JSON 파일 경로 (여러 개 지정 시 일괄 업데이트)')
+    parser.add_argument('--video-id', type=str, help='YouTube Video ID (제목으로 자동 검색하지 않으려면 지정, 파일 1개일 때만)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help=f'동시 업데이트 요청 수 (기본값: {DEFAULT_WORKERS})')
     
     args = parser.parse_args()
     
@@ -256,52 +296,80 @@ def main():
         print("❌ google-api-python-client가 필요합니다.")
         return
     
+    if args.video_id and len(args.metadata_file) > 1:
+        print("❌ --video-id는 메타데이터 파일을 하나만 지정할 때 사용할 수 있습니다.")
+        return
+    
     print("=" * 60)
     print("🔄 YouTube 영상 메타데이터 업데이트")
     print("=" * 60)
     print()
     
     # 메타데이터 파일 로드
-    metadata_path = Path(args.metadata_file)
-    if not metadata_path.exists():
-        print(f"❌ 메타데이터 파일을 찾을 수 없습니다: {metadata_path}")
-        return
+    entries = []
+    for metadata_file in args.metadata_file:
+        metadata_path = Path(metadata_file)
+        if not metadata_path.exists():
+            print(f"❌ 메타데이터 파일을 찾을 수 없습니다: {metadata_path}")
+            continue
+        
+        metadata = load_metadata(metadata_path)
+        if not metadata:
+            print(f"❌ 메타데이터 로드 실패: {metadata_path}")
+            continue
+        
+        entry = {
+            'path': metadata_path,
+            'title': metadata.get('title', ''),
+            'description': metadata.get('description', ''),
+            'tags': metadata.get('tags', []),
+        }
+        entries.append(entry)
+        
+        print(f"📋 메타데이터 파일: {metadata_path.name}")
+        print(f"📌 제목: {entry['title']}")
+        print(f"📝 설명 길이: {len(entry['description'])}자")
+        print(f"🏷️ 태그 개수: {len(entry['tags'])}개")
+        print()
     
-    metadata = load_metadata(metadata_path)
-    if not metadata:
-        print(f"❌ 메타데이터 로드 실패: {metadata_path}")
+    if not entries:
         return
     
-    title = metadata.get('title', '')
-    description = metadata.get('description', '')
-    tags = metadata.get('tags', [])
-    
-    print(f"📋 메타데이터 파일: {metadata_path.name}")
-    print(f"📌 제목: {title}")
-    print(f"📝 설명 길이: {len(description)}자")
-    print(f"🏷️ 태그 개수: {len(tags)}개")
-    print()
-    
     try:
         updater = YouTubeMetadataUpdater()
     except Exception as e:
         print(f"❌ 초기화 실패: {e}")
         return
     
-    # Video ID 찾기
-    video_id = args.video_id
-    if not video_id:
-        print("🔍 제목으로 영상 검색 중...")
-        video_id = updater.find_video_id_by_title(title)
+    # Video ID 찾기 (업로드 재생목록 페이지는 파일 간 재사용)
+    targets = {}
+    for entry in entries:
+        video_id = args.video_id
         if not video_id:
-            print("❌ 영상을 찾을 수 없습니다.")
-            print("   💡 --video-id 옵션으로 직접 지정하세요.")
-            return
-        print()
+            print(f"🔍 제목으로 영상 검색 중... ({entry['path'].name})")
+            video_id = updater.find_video_id_by_title(entry['title'])
+            if not video_id:
+                print("❌ 영상을 찾을 수 없습니다.")
+                print("   💡 --video-id 옵션으로 직접 지정하세요.")
+                continue
+            print()
+        targets[video_id] = {key: entry[key] for key in ('title', 'description', 'tags')}
+    
+    if not targets:
+        return
     
     # 메타데이터 업데이트
     print("📤 메타데이터 업데이트 중...")
-    success = updater.update_video_metadata(video_id, title, description, tags)
+    if len(targets) == 1:
+        video_id, fields = next(iter(targets.items()))
+        success = updater.update_video_metadata(video_id, **fields)
+    else:
+        result = updater.update_many(targets, workers=args.workers)
+        print(f"   - 업데이트: {len(result.updated)}개, 변경 없음: {len(result.unchanged)}개, "
+              f"실패: {len(result.failed)}개, 보류: {len(result.deferred)}개, 조회 안 됨: {len(result.missing)}개")
+        success = not (result.failed or result.deferred or result.missing)
+    log_cache_stats(updater.youtube)
+    print(f"   {updater.quota.summary()}")
     
     if success:
         print()
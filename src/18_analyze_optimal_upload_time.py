@@ -1,8 +1,8 @@
 """
 최적 업로드 시간대 분석 스크립트
 
-업로드 로그와 YouTube Analytics 데이터를 결합하여
-최적의 업로드 시간대를 분석합니다.
+로컬 지표 저장소(영상별 일 지표 + 요일/시간 롤업)를 읽어
+최적의 업로드 시간대를 분석합니다 (API 호출 없음, --sync로 저장소 적재).
 
 분석 항목:
 - 요일별 업로드 성과
@@ -11,255 +11,76 @@
 - 최적 업로드 시간대 추천
 """
 
-import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+from typing import Dict
+from datetime import datetime
 from dotenv import load_dotenv
 
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("youtube_analytics", Path(__file__).parent / "15_youtube_analytics.py")
-    youtube_analytics_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(youtube_analytics_module)
-    YouTubeAnalytics = youtube_analytics_module.YouTubeAnalytics
+    from src.utils.module_loader import load_script
+    YouTubeAnalytics = load_script("15_youtube_analytics.py").YouTubeAnalytics
     ANALYTICS_AVAILABLE = True
 except Exception as e:
     ANALYTICS_AVAILABLE = False
     print(f"⚠️ YouTube Analytics 모듈 로드 실패: {e}")
 
 from utils.logger import get_logger
+from utils.metrics_store import DEFAULT_BACKFILL_DAYS, MetricsStore
 
 load_dotenv()
 
 
 class OptimalUploadTimeAnalyzer:
-    """최적 업로드 시간대 분석 클래스"""
+    """최적 업로드 시간대 분석 클래스 (로컬 지표 저장소의 요일/시간 롤업 사용)"""
     
-    def __init__(self):
-        self.logger = get_logger(__name__)
-        self.analytics = None
-        if ANALYTICS_AVAILABLE:
-            try:
-                self.analytics = YouTubeAnalytics()
-            except Exception as e:
-                self.logger.warning(f"YouTube Analytics 초기화 실패: {e}")
-    
-    def load_upload_log(self, log_path: str = "output/upload_log.json") -> List[Dict]:
-        """업로드 로그 로드"""
-        log_file = Path(log_path)
-        if not log_file.exists():
-            self.logger.warning(f"업로드 로그 파일을 찾을 수 없습니다: {log_path}")
-            self.logger.info("💡 업로드 로그 파일이 없습니다. 다음 방법으로 생성할 수 있습니다:")
-            self.logger.info("   1. YouTube에 영상을 업로드하면 자동으로 생성됩니다:")
-            self.logger.info("      python src/09_upload_from_metadata.py --privacy private --auto")
-            self.logger.info("   2. 또는 기존 업로드 로그 파일이 다른 위치에 있는 경우:")
-            self.logger.info("      python src/18_analyze_optimal_upload_time.py --upload-log <경로>")
-            return []
-        
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 리스트 형식인지 딕셔너리 형식인지 확인
-            if isinstance(data, list):
-                uploads = data
-            elif isinstance(data, dict) and 'uploads' in data:
-                uploads = data['uploads']
-            else:
-                uploads = []
-            
-            self.logger.info(f"✅ 업로드 로그 로드 완료: {len(uploads)}개 영상")
-            return uploads
-        except Exception as e:
-            self.logger.error(f"업로드 로그 로드 실패: {e}")
-            return []
+    WEEKDAY_NAMES = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
     
-    def parse_upload_time(self, upload_entry: Dict) -> Optional[Tuple[datetime, str, int]]:
+    def __init__(self, sync: bool = False, days: int = DEFAULT_BACKFILL_DAYS):
         """
-        업로드 시간 파싱
-        
-        Returns:
-            (datetime, video_id, weekday) 튜플
-            weekday: 0=월요일, 6=일요일
-        """
-        # 여러 필드에서 업로드 시간 찾기
-        upload_time_str = (
-            upload_entry.get('uploaded_at') or
-            upload_entry.get('published_at') or
-            upload_entry.get('publishedAt') or
-            upload_entry.get('timestamp')
-        )
-        
-        if not upload_time_str:
-            return None
-        
-        try:
-            # ISO 형식 파싱
-            if 'T' in upload_time_str:
-                upload_time = datetime.fromisoformat(upload_time_str.replace('Z', '+00:00'))
-            else:
-                upload_time = datetime.strptime(upload_time_str, '%Y-%m-%d %H:%M:%S')
-            
-            # 로컬 시간대로 변환 (UTC가 아닌 경우)
-            if upload_time.tzinfo is None:
-                # 타임존 정보가 없으면 그대로 사용
-                pass
-            
-            weekday = upload_time.weekday()  # 0=월요일, 6=일요일
-            video_id = upload_entry.get('video_id') or upload_entry.get('id', '')
-            
-            return (upload_time, video_id, weekday)
-        except Exception as e:
-            self.logger.warning(f"업로드 시간 파싱 실패: {upload_time_str}, {e}")
-            return None
-    
-    def get_video_early_metrics(
-        self,
-        video_id: str,
-        upload_time: datetime,
-        hours: int = 24
-    ) -> Optional[Dict]:
-        """
-        영상 업로드 후 초기 메트릭 가져오기
-        
         Args:
-            video_id: 영상 ID
-            upload_time: 업로드 시간
-            hours: 분석할 시간 (기본값: 24시간)
-        
-        Returns:
-            메트릭 딕셔너리 (views, likes, comments 등)
+            sync: True면 분석 전에 YouTube Analytics API로 저장소 증분 적재
+            days: 저장소 최초 적재 기간 (일)
         """
-        if not self.analytics:
-            return None
-        
-        try:
-            start_date = upload_time.strftime('%Y-%m-%d')
-            end_time = upload_time + timedelta(hours=hours)
-            end_date = end_time.strftime('%Y-%m-%d')
-            
-            metrics = self.analytics.get_video_metrics(
-                video_id=video_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            return metrics
-        except Exception as e:
-            self.logger.warning(f"영상 메트릭 가져오기 실패 ({video_id}): {e}")
-            return None
-    
-    def analyze_by_weekday(self, uploads: List[Dict]) -> Dict:
-        """요일별 업로드 성과 분석"""
-        weekday_stats = defaultdict(lambda: {
-            'count': 0,
-            'total_views_24h': 0,
-            'total_views_48h': 0,
-            'total_likes_24h': 0,
-            'avg_views_24h': 0,
-            'avg_views_48h': 0,
-            'avg_likes_24h': 0,
-            'videos': []
-        })
-        
-        weekday_names = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
-        
-        for upload in uploads:
-            parsed = self.parse_upload_time(upload)
-            if not parsed:
+        self.logger = get_logger(__name__)
+        self.store = MetricsStore()
+        if sync:
+            if not ANALYTICS_AVAILABLE:
+                self.logger.warning("YouTube Analytics 모듈을 사용할 수 없어 저장소 적재를 건너뜁니다.")
+            else:
+                try:
+                    YouTubeAnalytics().sync_warehouse(days=days)
+                except Exception as e:
+                    self.logger.warning(f"지표 저장소 적재 실패: {e}")
+    
+    def _early_stats(self, dimension: str) -> Dict[int, Dict]:
+        """롤업에서 업로드 후 24시간/48시간 성과 추출 (업로드일 지표가 있는 영상 기준)"""
+        stats = {}
+        for bucket, rollup in self.store.rollup(dimension).items():
+            if not rollup['early_count']:
                 continue
-            
-            upload_time, video_id, weekday = parsed
-            
-            # 초기 메트릭 가져오기
-            metrics_24h = self.get_video_early_metrics(video_id, upload_time, hours=24)
-            metrics_48h = self.get_video_early_metrics(video_id, upload_time, hours=48)
-            
-            stats = weekday_stats[weekday]
-            stats['count'] += 1
-            stats['videos'].append({
-                'video_id': video_id,
-                'title': upload.get('title', 'N/A'),
-                'upload_time': upload_time.isoformat()
-            })
-            
-            if metrics_24h:
-                views_24h = metrics_24h.get('views', 0)
-                likes_24h = metrics_24h.get('likes', 0)
-                stats['total_views_24h'] += views_24h
-                stats['total_likes_24h'] += likes_24h
-            
-            if metrics_48h:
-                views_48h = metrics_48h.get('views', 0)
-                stats['total_views_48h'] += views_48h
-        
-        # 평균 계산
+            stats[int(bucket)] = {
+                'count': rollup['early_count'],
+                'avg_views_24h': rollup['avg_views_24h'],
+                'avg_views_48h': rollup['avg_views_48h'],
+                'avg_likes_24h': rollup['avg_likes_24h'],
+                'avg_views': rollup['avg_views'],
+            }
+        return stats
+    
+    def analyze_by_weekday(self) -> Dict:
+        """요일별 업로드 성과 분석 (0=월요일, 6=일요일)"""
+        weekday_stats = self._early_stats('weekday')
         for weekday, stats in weekday_stats.items():
-            if stats['count'] > 0:
-                stats['avg_views_24h'] = stats['total_views_24h'] / stats['count']
-                stats['avg_views_48h'] = stats['total_views_48h'] / stats['count']
-                stats['avg_likes_24h'] = stats['total_likes_24h'] / stats['count']
-                stats['weekday_name'] = weekday_names[weekday]
-        
-        return dict(weekday_stats)
+            stats['weekday_name'] = self.WEEKDAY_NAMES[weekday]
+        return weekday_stats
     
-    def analyze_by_hour(self, uploads: List[Dict]) -> Dict:
-        """시간대별 업로드 성과 분석"""
-        hour_stats = defaultdict(lambda: {
-            'count': 0,
-            'total_views_24h': 0,
-            'total_views_48h': 0,
-            'total_likes_24h': 0,
-            'avg_views_24h': 0,
-            'avg_views_48h': 0,
-            'avg_likes_24h': 0,
-            'videos': []
-        })
-        
-        for upload in uploads:
-            parsed = self.parse_upload_time(upload)
-            if not parsed:
-                continue
-            
-            upload_time, video_id, weekday = parsed
-            hour = upload_time.hour
-            
-            # 초기 메트릭 가져오기
-            metrics_24h = self.get_video_early_metrics(video_id, upload_time, hours=24)
-            metrics_48h = self.get_video_early_metrics(video_id, upload_time, hours=48)
-            
-            stats = hour_stats[hour]
-            stats['count'] += 1
-            stats['videos'].append({
-                'video_id': video_id,
-                'title': upload.get('title', 'N/A'),
-                'upload_time': upload_time.isoformat()
-            })
-            
-            if metrics_24h:
-                views_24h = metrics_24h.get('views', 0)
-                likes_24h = metrics_24h.get('likes', 0)
-                stats['total_views_24h'] += views_24h
-                stats['total_likes_24h'] += likes_24h
-            
-            if metrics_48h:
-                views_48h = metrics_48h.get('views', 0)
-                stats['total_views_48h'] += views_48h
-        
-        # 평균 계산
-        for hour, stats in hour_stats.items():
-            if stats['count'] > 0:
-                stats['avg_views_24h'] = stats['total_views_24h'] / stats['count']
-                stats['avg_views_48h'] = stats['total_views_48h'] / stats['count']
-                stats['avg_likes_24h'] = stats['total_likes_24h'] / stats['count']
-        
-        return dict(hour_stats)
+    def analyze_by_hour(self) -> Dict:
+        """시간대별(KST) 업로드 성과 분석"""
+        return self._early_stats('hour')
     
     def generate_report(
         self,
@@ -355,29 +176,32 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='최적 업로드 시간대 분석')
-    parser.add_argument('--upload-log', type=str, default='output/upload_log.json', help='업로드 로그 파일 경로')
+    parser.add_argument('--sync', action='store_true', help='분석 전 YouTube Analytics API로 지표 저장소 증분 적재')
+    parser.add_argument('--days', type=int, default=DEFAULT_BACKFILL_DAYS, help='지표 저장소 최초 적재 기간 (일)')
     parser.add_argument('--output', type=str, default='output/optimal_upload_time_analysis.md', help='출력 리포트 파일 경로')
+    parser.add_argument('--upload-log', type=str, default=None,
+                        help='(사용 중단) 업로드 로그 대신 지표 저장소를 사용합니다. --sync로 적재하세요')
     
     args = parser.parse_args()
     
-    analyzer = OptimalUploadTimeAnalyzer()
+    if args.upload_log:
+        print("⚠️ --upload-log 옵션은 더 이상 사용되지 않습니다 (무시됨).")
+        print("   업로드 로그 대신 지표 저장소를 분석합니다. 저장소가 비어 있으면 --sync로 적재하세요.")
     
-    # 업로드 로그 로드
-    uploads = analyzer.load_upload_log(args.upload_log)
+    analyzer = OptimalUploadTimeAnalyzer(sync=args.sync, days=args.days)
     
-    if not uploads:
-        print("❌ 분석할 업로드 데이터가 없습니다.")
+    if not analyzer.store.has_data():
+        print("❌ 분석할 지표 데이터가 없습니다.")
+        print("💡 python src/18_analyze_optimal_upload_time.py --sync 로 지표 저장소를 먼저 적재하세요.")
         return
     
-    print(f"📊 {len(uploads)}개 영상 분석 시작...")
-    
     # 요일별 분석
     print("📅 요일별 성과 분석 중...")
-    weekday_stats = analyzer.analyze_by_weekday(uploads)
+    weekday_stats = analyzer.analyze_by_weekday()
     
     # 시간대별 분석
     print("⏰ 시간대별 성과 분석 중...")
-    hour_stats = analyzer.analyze_by_hour(uploads)
+    hour_stats = analyzer.analyze_by_hour()
     
     # 리포트 생성
     print("📝 리포트 생성 중...")
@@ -388,4 +212,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
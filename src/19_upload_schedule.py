@@ -38,7 +38,7 @@ class UploadScheduler:
         if not self.analysis_file.exists():
             self.logger.warning(f"분석 파일을 찾을 수 없습니다: {self.analysis_file}")
             self.logger.info("💡 먼저 최적 업로드 시간대 분석을 실행하세요:")
-            self.logger.info("   python src/18_analyze_optimal_upload_time.py")
+            self.logger.info("   python src/18_analyze_optimal_upload_time.py --sync")
             return None
         
         # Markdown 파일에서 최적 시간 추출 (간단한 파싱)
@@ -17,6 +17,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.file_utils import get_standard_safe_title
+from src.utils.media_probe import get_media_duration
 from src.utils.logger import setup_logger
 from src.utils.translations import translate_book_title, translate_author_name, translate_book_title_to_korean, translate_author_name_to_korean, is_english_title
 from src.utils.affiliate_links import generate_affiliate_section
@@ -453,10 +454,9 @@ def get_actual_part_durations(book_title: str, language: str = "ko", infographic
                 break
         
         try:
-            from moviepy.editor import VideoFileClip
-            clip = VideoFileClip(str(video_file))
-            video_duration = clip.duration
-            clip.close()
+            video_duration = get_media_duration(video_file)
+            if video_duration is None:
+                raise RuntimeError(f"미디어 정보를 읽을 수 없습니다: {video_file}")
             
             # 인포그래픽 파일 확인
             info_file = input_dir / f"part{part_num}_info_{lang_suffix}.png"
@@ -1169,14 +1169,9 @@ def create_episode_metadata(
     
     # 영상 길이 확인 (video_duration이 없으면)
     if video_duration is None and video_path_obj.exists():
-        try:
-            from moviepy.editor import VideoFileClip
-            clip = VideoFileClip(str(video_path_obj))
-            video_duration = clip.duration
-            clip.close()
-        except Exception as e:
-            logger.warning(f"⚠️ 영상 길이를 가져올 수 없습니다: {e}")
-            video_duration = None
+        video_duration = get_media_duration(video_path_obj)
+        if video_duration is None:
+            logger.warning(f"⚠️ 영상 길이를 가져올 수 없습니다: {video_path_obj}")
     
     # 책 정보 로드 (장르 감지용)
     book_info = None
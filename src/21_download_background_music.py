@@ -9,7 +9,6 @@ import os
 import sys
 import json
 import time
-import requests
 import argparse
 import webbrowser
 import urllib.parse
@@ -40,6 +39,7 @@ sys.path.insert(0, str(project_root))
 
 from src.utils.file_utils import get_standard_safe_title, load_book_info
 from src.utils.logger import setup_logger
+from src.utils.http_client import get_http_client
 from utils.translations import translate_book_title, is_english_title
 
 load_dotenv()
@@ -164,10 +164,7 @@ def search_freesound(keywords: List[str], api_key: Optional[str] = None) -> Opti
             'Authorization': f'Token {api_key}'
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = get_http_client().get_json(url, params=params, headers=headers, timeout=10)
         results = data.get('results', [])
         
         if results:
@@ -438,13 +435,7 @@ def download_mp3_from_pixabay(keywords: List[str], output_dir: Path, max_tracks:
                 # 다운로드
                 logger.info(f"다운로드 중: {title}")
                 try:
-                    response = requests.get(mp3_url, stream=True, timeout=30)
-                    response.raise_for_status()
-                    
-                    with open(output_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                    get_http_client().download(mp3_url, output_path, timeout=30)
                     
                     file_size = output_path.stat().st_size / (1024 * 1024)  # MB
                     logger.info(f"✅ 다운로드 완료: {filename} ({file_size:.2f}MB)")
@@ -509,15 +500,12 @@ def download_background_music(
             
             # 음악 다운로드
             preview_url = music_info['preview_url']
-            response = requests.get(preview_url, timeout=30)
-            response.raise_for_status()
             
             # 파일명 생성
             safe_title = get_standard_safe_title(book_title)
             output_file = output_dir / f"{safe_title}_background.mp3"
             
-            with open(output_file, 'wb') as f:
-                f.write(response.content)
+            get_http_client().download(preview_url, output_file, timeout=30)
             
             logger.info(f"   ✅ 다운로드 완료: {output_file.name}")
             return str(output_file)
@@ -24,32 +24,37 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("youtube_analytics", Path(__file__).parent / "15_youtube_analytics.py")
-    youtube_analytics_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(youtube_analytics_module)
-    YouTubeAnalytics = youtube_analytics_module.YouTubeAnalytics
+    from src.utils.module_loader import load_script
+    YouTubeAnalytics = load_script("15_youtube_analytics.py").YouTubeAnalytics
     ANALYTICS_AVAILABLE = True
 except Exception as e:
     ANALYTICS_AVAILABLE = False
     print(f"⚠️ YouTube Analytics 모듈 로드 실패: {e}")
 
 from utils.logger import get_logger
+from utils.metrics_store import MetricsStore
 
 load_dotenv()
 
 
 class AnalyticsRecommendations:
-    """Analytics 기반 개선 제안 클래스"""
+    """Analytics 기반 개선 제안 클래스 (로컬 지표 저장소 사용)"""
     
-    def __init__(self):
+    def __init__(self, sync: bool = False):
+        """
+        Args:
+            sync: True면 분석 전에 YouTube Analytics API로 저장소 증분 적재
+        """
         self.logger = get_logger(__name__)
-        self.analytics = None
-        if ANALYTICS_AVAILABLE:
-            try:
-                self.analytics = YouTubeAnalytics()
-            except Exception as e:
-                self.logger.warning(f"YouTube Analytics 초기화 실패: {e}")
+        self.store = MetricsStore()
+        if sync:
+            if not ANALYTICS_AVAILABLE:
+                self.logger.warning("YouTube Analytics 모듈을 사용할 수 없어 저장소 적재를 건너뜁니다.")
+            else:
+                try:
+                    YouTubeAnalytics().sync_warehouse()
+                except Exception as e:
+                    self.logger.warning(f"지표 저장소 적재 실패: {e}")
     
     def analyze_channel_performance(
         self,
@@ -66,51 +71,27 @@ class AnalyticsRecommendations:
         Returns:
             분석 결과 딕셔너리
         """
-        if not self.analytics:
-            self.logger.error("Analytics API를 사용할 수 없습니다.")
+        if not self.store.has_data():
+            self.logger.error("지표 저장소가 비어 있습니다. --sync 옵션으로 먼저 적재하세요.")
             return {}
         
         self.logger.info(f"📊 채널 성과 분석 시작 (최근 {days}일)")
         
-        # 채널 메트릭 수집
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        channel_metrics = self.analytics.get_channel_metrics(
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        # 영상 목록 및 메트릭 수집
-        videos = self.analytics.get_channel_videos(max_results=100)
-        
-        # 최근 N일 내 업로드된 영상만 필터링
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_videos = []
-        for video in videos:
-            published_at = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
-            if published_at.replace(tzinfo=None) >= cutoff_date:
-                recent_videos.append(video)
+        channel_metrics = self.store.channel_report(start_date, end_date)
         
+        # 최근 N일 내 업로드된 영상 + 기간 메트릭
+        recent_videos = self.store.video_report(start_date, end_date, published_since=start_date)
         self.logger.info(f"✅ 최근 {days}일 내 업로드된 영상: {len(recent_videos)}개")
         
-        # 영상별 상세 메트릭 수집
         video_metrics_list = []
         for video in recent_videos:
             if video['views'] < min_views:
                 continue
-            
-            metrics = self.analytics.get_video_metrics(
-                video_id=video['video_id'],
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            if metrics:
-                video_metrics_list.append({
-                    **video,
-                    'metrics': metrics
-                })
+            video['metrics'] = video.pop('analytics')
+            video_metrics_list.append(video)
         
         # 분석 결과 구성
         analysis = {
@@ -166,7 +147,7 @@ class AnalyticsRecommendations:
                 'category': 'data',
                 'title': '데이터 수집 필요',
                 'description': 'Analytics 데이터를 수집할 수 없습니다. 먼저 데이터를 수집해주세요.',
-                'action': 'python src/15_youtube_analytics.py --videos'
+                'action': 'python src/15_youtube_analytics.py --sync-warehouse'
             })
             return recommendations
         
@@ -407,18 +388,19 @@ def main():
     parser.add_argument('--days', type=int, default=30, help='분석 기간 (일, 기본값: 30)')
     parser.add_argument('--min-views', type=int, default=100, help='최소 조회수 (이하 영상 제외, 기본값: 100)')
     parser.add_argument('--output', type=str, default='output/analytics_recommendations.md', help='리포트 출력 파일 경로')
+    parser.add_argument('--sync', action='store_true', help='분석 전 YouTube Analytics API로 지표 저장소 증분 적재')
     
     args = parser.parse_args()
     
     try:
-        recommender = AnalyticsRecommendations()
+        recommender = AnalyticsRecommendations(sync=args.sync)
         
-        if not recommender.analytics:
-            print("❌ YouTube Analytics API를 사용할 수 없습니다.")
+        if not recommender.store.has_data():
+            print("❌ 지표 저장소에 데이터가 없습니다.")
             print("💡 다음을 확인해주세요:")
             print("   1. .env 파일에 YouTube API 자격증명이 설정되어 있는지")
             print("   2. YouTube Analytics API 스코프가 포함된 refresh token인지")
-            print("   3. python src/15_youtube_analytics.py --videos 로 데이터 수집이 가능한지")
+            print("   3. python src/22_analytics_recommendations.py --sync 로 저장소 적재가 가능한지")
             return
         
         # 분석 실행
@@ -29,6 +29,11 @@ except ImportError:
     YOUTUBE_API_AVAILABLE = False
     print("⚠️ googleapiclient이 설치되지 않았습니다. pip install google-api-python-client을 실행하세요.")
 
+try:
+    from utils.youtube_cache import DEFAULT_FRESH_SECONDS, enable_etag_cache, log_cache_stats
+except ImportError:
+    from src.utils.youtube_cache import DEFAULT_FRESH_SECONDS, enable_etag_cache, log_cache_stats
+
 try:
     from youtube_transcript_api import YouTubeTranscriptApi
     from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
@@ -93,7 +98,9 @@ class YouTubeVideoInfoExtractor:
         try:
             # API 키가 있으면 API 키 사용 (읽기 전용)
             if self.api_key:
-                self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+                self.youtube = enable_etag_cache(
+                    build('youtube', 'v3', developerKey=self.api_key), fresh_for=DEFAULT_FRESH_SECONDS
+                )
                 print("✅ YouTube API 인증 성공 (API Key)")
                 return
             
@@ -108,7 +115,9 @@ class YouTubeVideoInfoExtractor:
                     scopes=['https://www.googleapis.com/auth/youtube.readonly']
                 )
                 credentials.refresh(Request())
-                self.youtube = build('youtube', 'v3', credentials=credentials)
+                self.youtube = enable_etag_cache(
+                    build('youtube', 'v3', credentials=credentials), fresh_for=DEFAULT_FRESH_SECONDS
+                )
                 print("✅ YouTube API 인증 성공 (OAuth)")
                 return
             
@@ -578,6 +587,8 @@ def main():
             print("\n❌ 영상 정보를 가져올 수 없습니다.")
             return
         
+        log_cache_stats(extractor.youtube)
+        
         # 결과 저장
         save_results(video_infos, args.output)
         
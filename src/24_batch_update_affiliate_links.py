@@ -33,6 +33,9 @@ except ImportError:
     sys.exit(1)
 
 from src.utils.affiliate_links import generate_affiliate_section
+from src.utils.bulk_metadata import DEFAULT_WORKERS, BulkMetadataUpdater, UpdateJournal
+from src.utils.channel_catalog import load_channel_videos
+from src.utils.quota_scheduler import PRIORITY_METADATA, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler
 from src.utils.translations import translate_book_title, translate_author_name, is_english_title
 
 load_dotenv()
@@ -54,18 +57,28 @@ AFFILIATE_MARKERS = [
 class AffiliateLinksUpdater:
     """YouTube 영상에 제휴 링크를 일괄 업데이트하는 클래스"""
 
-    def __init__(self, dry_run: bool = True, delay: float = 1.0):
+    # 진행 저널 작업 이름 (.cache/journals/<job>.jsonl)
+    JOURNAL_JOB = "affiliate_links"
+
+    def __init__(self, dry_run: bool = True, delay: float = 0.2, workers: int = DEFAULT_WORKERS,
+                 restart: bool = False):
         """
         Args:
             dry_run: True면 미리보기만, False면 실제 업데이트
-            delay: API 호출 간 대기 시간 (초)
+            delay: API 호출 간 최소 간격 (초, 쿼터 스케줄러가 조절)
+            workers: 동시 수정 요청 수
+            restart: True면 진행 저널을 비우고 처음부터
         """
         if not GOOGLE_API_AVAILABLE:
             raise ImportError("google-api-python-client가 필요합니다.")
 
         self.dry_run = dry_run
         self.delay = delay
+        self.workers = workers
+        self.restart = restart
         self.youtube = None
+        self.quota = None
+        self.credentials = None
         self.channel_id = os.getenv("YOUTUBE_CHANNEL_ID")
 
         if not self.channel_id:
@@ -93,15 +106,24 @@ class AffiliateLinksUpdater:
             )
 
             credentials.refresh(Request())
-            self.youtube = build('youtube', 'v3', credentials=credentials)
+            self.credentials = credentials
+            self.youtube = enable_quota_scheduler(
+                build('youtube', 'v3', credentials=credentials),
+                priority=PRIORITY_METADATA, min_interval=self.delay,
+            )
+            self.quota = get_quota_scheduler(self.youtube)
             print("✅ YouTube API 인증 성공")
         except Exception as e:
             print(f"❌ 인증 실패: {e}")
             raise
 
+    def _build_service(self):
+        """병렬 수정 스레드용 서비스 객체 (쿼터 스케줄러는 공유)"""
+        return enable_quota_scheduler(build('youtube', 'v3', credentials=self.credentials), scheduler=self.quota)
+
     def get_channel_videos(self, max_results: Optional[int] = None) -> List[Dict]:
         """
-        채널의 모든 영상 목록 가져오기
+        채널의 모든 영상 목록 가져오기 (로컬 카탈로그 증분 동기화)
 
         Args:
             max_results: 최대 영상 개수 (None이면 전체)
@@ -111,64 +133,14 @@ class AffiliateLinksUpdater:
         """
         print(f"\n📋 채널 영상 목록 가져오는 중... (채널 ID: {self.channel_id})")
 
-        videos = []
-
         try:
-            # 1. 채널의 uploads 재생목록 ID 가져오기
-            channel_response = self.youtube.channels().list(
-                part='contentDetails',
-                id=self.channel_id
-            ).execute()
-
-            if not channel_response.get('items'):
-                print("❌ 채널을 찾을 수 없습니다.")
-                return videos
-
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            print(f"   📂 Uploads 재생목록 ID: {uploads_playlist_id}")
-
-            # 2. 재생목록의 모든 영상 가져오기
-            next_page_token = None
-            page = 1
-
-            while True:
-                playlist_response = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,  # 페이지당 최대 50개
-                    pageToken=next_page_token
-                ).execute()
-
-                items = playlist_response.get('items', [])
-                print(f"   📄 Page {page}: {len(items)}개 영상")
-
-                for item in items:
-                    video_id = item['snippet']['resourceId']['videoId']
-                    title = item['snippet']['title']
-                    videos.append({
-                        'video_id': video_id,
-                        'title': title
-                    })
-
-                    if max_results and len(videos) >= max_results:
-                        break
-
-                if max_results and len(videos) >= max_results:
-                    break
-
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-
-                page += 1
-                time.sleep(self.delay)  # API 호출 간 대기
-
+            videos = load_channel_videos(self.youtube, self.channel_id, limit=max_results, delay=self.delay)
             print(f"✅ 총 {len(videos)}개 영상 발견")
             return videos
 
-        except HttpError as e:
+        except (HttpError, QuotaExhausted) as e:
             print(f"❌ API 오류: {e}")
-            return videos
+            return []
 
     def has_affiliate_links(self, description: str) -> bool:
         """
@@ -304,48 +276,57 @@ class AffiliateLinksUpdater:
         new_description = description[:insert_pos] + affiliate_section + "\n" + description[insert_pos:]
         return new_description
 
-    def update_video_description(self, video_id: str, new_description: str, title: str, tags: List[str]) -> bool:
+    def affiliate_changes(self, video_id: str, snippet: Dict, force: bool = False) -> Optional[Dict]:
         """
-        YouTube 영상 description 업데이트
+        영상 snippet에서 제휴 링크를 넣은 description 계산 (일괄 수정 엔진의 변환 함수)
 
         Args:
             video_id: YouTube 영상 ID
-            new_description: 새 description
-            title: 영상 제목 (변경하지 않지만 API 요청에 필요)
-            tags: 영상 태그 (변경하지 않지만 API 요청에 필요)
+            snippet: 현재 snippet (videos.list 응답)
+            force: True면 기존 제휴 링크를 삭제하고 새로 추가
 
         Returns:
-            성공 여부
+            {"description": 새 description} 또는 대상이 아니면 None
         """
-        if self.dry_run:
-            print("   🔍 [DRY RUN] 실제로 업데이트하지 않습니다.")
-            return True
+        current_description = snippet.get('description', '')
+        current_title = snippet.get('title', '')
+        label = f"   [{video_id}] {current_title[:40]}"
+
+        # 1. 이미 제휴 링크가 있는지 확인 (force 모드가 아닐 때만)
+        if not force and self.has_affiliate_links(current_description):
+            return None
+
+        # 2. 책 정보 추출
+        book_info = self.extract_book_info_from_description(current_description, current_title)
+        if not book_info:
+            print(f"{label}: ⚠️ 책 정보를 추출할 수 없습니다. (건너뜀)")
+            return None
+
+        # 3. 언어 감지 (한글/영문)
+        if book_info.get("book_title_ko"):
+            language = "ko"
+        elif book_info.get("book_title_en"):
+            language = "en"
+        else:
+            print(f"{label}: ⚠️ 언어를 감지할 수 없습니다. (건너뜀)")
+            return None
 
-        try:
-            self.youtube.videos().update(
-                part='snippet',
-                body={
-                    'id': video_id,
-                    'snippet': {
-                        'title': title,
-                        'description': new_description,
-                        'tags': tags,
-                        'categoryId': '27'  # Education
-                    }
-                }
-            ).execute()
-
-            print("   ✅ 업데이트 완료")
-            return True
-
-        except HttpError as e:
-            print(f"   ❌ 업데이트 실패: {e}")
-            return False
+        # 4. 제휴 링크 삽입 (결과가 현재와 같으면 엔진이 update를 생략)
+        new_description = self.insert_affiliate_links(current_description, book_info, language, force=force)
+        if not force and new_description == current_description:
+            print(f"{label}: ⚠️ 제휴 링크 생성 실패 (제휴 ID 미설정?). (건너뜀)")
+            return None
+
+        return {'description': new_description}
 
     def process_videos(self, video_ids: Optional[List[str]] = None, limit: Optional[int] = None, force: bool = False):
         """
         영상들을 처리하여 제휴 링크 추가
 
+        현재 description을 50개 배치로 조회해 로컬에서 제휴 링크를 넣고,
+        실제로 바뀌는 영상만 병렬로 수정합니다. 진행 상황은 저널에 기록되어
+        중단(쿼터 부족 등) 후 다시 실행하면 이어서 처리합니다.
+
         Args:
             video_ids: 처리할 영상 ID 목록 (None이면 전체 채널)
             limit: 최대 처리 개수
@@ -353,107 +334,51 @@ class AffiliateLinksUpdater:
         """
         if video_ids:
             # 특정 영상만 처리
-            videos = [{"video_id": vid, "title": "Unknown"} for vid in video_ids]
+            target_ids = list(video_ids)
         else:
             # 채널 전체 영상 가져오기
-            videos = self.get_channel_videos(max_results=limit)
+            target_ids = [video['video_id'] for video in self.get_channel_videos(max_results=limit)]
 
-        if not videos:
+        if not target_ids:
             print("처리할 영상이 없습니다.")
             return
 
         print(f"\n{'='*60}")
         print(f"처리 모드: {'🔍 DRY RUN (미리보기)' if self.dry_run else '✏️ APPLY (실제 업데이트)'}")
-        print(f"처리 대상: {len(videos)}개 영상")
+        print(f"처리 대상: {len(target_ids)}개 영상 (동시 수정 {self.workers}개)")
         print(f"{'='*60}\n")
 
-        updated_count = 0
-        skipped_count = 0
-        error_count = 0
-
-        for idx, video in enumerate(videos, 1):
-            video_id = video['video_id']
-            video_title = video['title']
-
-            print(f"\n[{idx}/{len(videos)}] 🎬 {video_title}")
-            print(f"   📹 Video ID: {video_id}")
-
-            try:
-                # 영상 상세 정보 가져오기
-                video_response = self.youtube.videos().list(
-                    part='snippet',
-                    id=video_id
-                ).execute()
-
-                if not video_response.get('items'):
-                    print("   ⚠️ 영상을 찾을 수 없습니다. (삭제되었거나 비공개)")
-                    skipped_count += 1
-                    continue
-
-                snippet = video_response['items'][0]['snippet']
-                current_description = snippet.get('description', '')
-                current_title = snippet.get('title', video_title)
-                current_tags = snippet.get('tags', [])
-
-                # 1. 이미 제휴 링크가 있는지 확인 (force 모드가 아닐 때만)
-                if not force and self.has_affiliate_links(current_description):
-                    print("   ✅ 이미 제휴 링크가 있습니다. (건너뜀)")
-                    skipped_count += 1
-                    continue
-
-                # 2. 책 정보 추출
-                book_info = self.extract_book_info_from_description(current_description, current_title)
-                if not book_info:
-                    print("   ⚠️ 책 정보를 추출할 수 없습니다. (건너뜀)")
-                    skipped_count += 1
-                    continue
-
-                print(f"   📚 책 정보: {book_info}")
-
-                # 3. 언어 감지 (한글/영문)
-                if book_info.get("book_title_ko"):
-                    language = "ko"
-                elif book_info.get("book_title_en"):
-                    language = "en"
-                else:
-                    print("   ⚠️ 언어를 감지할 수 없습니다. (건너뜀)")
-                    skipped_count += 1
-                    continue
-
-                # 4. 제휴 링크 삽입
-                new_description = self.insert_affiliate_links(current_description, book_info, language, force=force)
-
-                if new_description == current_description:
-                    print("   ⚠️ 제휴 링크 생성 실패 (제휴 ID 미설정?). (건너뜀)")
-                    skipped_count += 1
-                    continue
-
-                print(f"   📝 새 description 길이: {len(new_description)}자 (기존: {len(current_description)}자)")
-
-                # 5. 업데이트
-                if self.update_video_description(video_id, new_description, current_title, current_tags):
-                    updated_count += 1
-                else:
-                    error_count += 1
-
-                # API 호출 간 대기
-                time.sleep(self.delay)
-
-            except HttpError as e:
-                print(f"   ❌ API 오류: {e}")
-                error_count += 1
-                time.sleep(self.delay)
-            except Exception as e:
-                print(f"   ❌ 예외 발생: {e}")
-                error_count += 1
-                time.sleep(self.delay)
+        # force 모드는 일반 모드와 별도 저널 (이미 링크가 있는 영상도 다시 수정하므로)
+        journal = None
+        if not self.dry_run:
+            journal = UpdateJournal.for_job(self.JOURNAL_JOB + ("_force" if force else ""))
+            if self.restart:
+                journal.reset()
+
+        updater = BulkMetadataUpdater(
+            self.youtube, service_factory=self._build_service, workers=self.workers, journal=journal,
+        )
+        result = updater.run(
+            target_ids, lambda video_id, snippet: self.affiliate_changes(video_id, snippet, force),
+            dry_run=self.dry_run,
+        )
 
         # 최종 결과
         print(f"\n{'='*60}")
         print(f"✅ 처리 완료:")
-        print(f"   - 업데이트: {updated_count}개")
-        print(f"   - 건너뜀: {skipped_count}개")
-        print(f"   - 오류: {error_count}개")
+        if self.dry_run:
+            print(f"   - 업데이트 예정: {len(result.planned)}개")
+        else:
+            print(f"   - 업데이트: {len(result.updated)}개")
+        print(f"   - 건너뜀: {len(result.skipped) + len(result.unchanged)}개 (이미 제휴 링크 있음/변경 없음/대상 아님)")
+        if result.resumed:
+            print(f"   - 이전 실행에서 완료: {len(result.resumed)}개")
+        if result.missing:
+            print(f"   - 조회 안 됨: {len(result.missing)}개 (삭제되었거나 비공개)")
+        print(f"   - 오류: {len(result.failed)}개")
+        if result.deferred:
+            print(f"   - 쿼터 부족으로 보류: {len(result.deferred)}개 (쿼터 재설정 후 다시 실행하면 이어서 처리)")
+        print(f"   {self.quota.summary()}")
         print(f"{'='*60}")
 
 
@@ -472,16 +397,24 @@ def main():
   # 특정 영상만 업데이트
   python src/24_batch_update_affiliate_links.py --video-id VIDEO_ID --apply
 
-  # API 호출 간격 조절 (초)
+  # API 호출 최소 간격 조절 (초)
   python src/24_batch_update_affiliate_links.py --apply --delay 2.0
 
   # 기존 제휴 링크 재업데이트 (force 모드)
   python src/24_batch_update_affiliate_links.py --apply --force
 
+  # 진행 저널을 비우고 처음부터 다시
+  python src/24_batch_update_affiliate_links.py --apply --restart
+
 주의사항:
   - YouTube API 일일 쿼터: videos.update 1건 = 50 units (일 10,000 units 제한 → 약 200건/일)
+  - 쿼터 사용량은 다른 스크립트와 공유 원장(.cache/)에 기록되며, 업로드 몫을 남기고
+    남은 쿼터로 끝낼 수 없는 영상은 시작하지 않고 보류합니다.
   - --apply 플래그 없이는 미리보기만 수행됩니다.
   - 이미 제휴 링크가 있는 영상은 건너뜁니다 (멱등성).
+  - description은 50개씩 한 번에 조회하고, 실제로 바뀌는 영상만 --workers개씩 병렬로 수정합니다.
+  - 진행 상황은 .cache/journals/affiliate_links.jsonl에 기록되어 중단 후 이어서 처리됩니다.
+    (보류/오류 없이 끝나면 저널을 비워 다음 실행은 처음부터 확인합니다)
   - --force 플래그를 사용하면 기존 제휴 링크를 삭제하고 새로 추가합니다.
         """
     )
@@ -509,8 +442,21 @@ def main():
     parser.add_argument(
         '--delay',
         type=float,
-        default=1.0,
-        help='API 호출 간 대기 시간 (초, 기본값: 1.0)'
+        default=0.2,
+        help='API 호출 간 최소 간격 (초, 기본값: 0.2)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'동시 수정 요청 수 (기본값: {DEFAULT_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='진행 저널을 비우고 처음부터 다시 처리'
     )
 
     parser.add_argument(
@@ -535,7 +481,8 @@ def main():
         time.sleep(5)
 
     try:
-        updater = AffiliateLinksUpdater(dry_run=dry_run, delay=args.delay)
+        updater = AffiliateLinksUpdater(dry_run=dry_run, delay=args.delay, workers=args.workers,
+                                        restart=args.restart)
         updater.process_videos(video_ids=args.video_id, limit=args.limit, force=args.force)
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
@@ -13,6 +13,8 @@ import argparse
 import re
 import json
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, Dict, List
 from dotenv import load_dotenv
@@ -29,7 +31,9 @@ from googleapiclient.errors import HttpError
 GOOGLE_API_AVAILABLE = True
 
 from src.utils.pinned_comment import generate_pinned_comment
-from src.utils.link_validator import audit_and_clean_comment
+from src.utils.link_validator import audit_and_clean_comment, extract_purchase_urls, validate_purchase_urls
+from src.utils.channel_catalog import load_channel_videos
+from src.utils.quota_scheduler import PRIORITY_COMMENT, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler
 
 load_dotenv()
 
@@ -39,6 +43,9 @@ SCOPES = [
     'https://www.googleapis.com/auth/youtube.force-ssl'
 ]
 
+# 고정 댓글 / 링크 동시 조회 기본 수
+DEFAULT_WORKERS = 4
+
 # 제휴 링크 마커 (고정 댓글에 이미 있는지 확인용)
 AFFILIATE_MARKERS = [
     "📖 이 책 구매하기:",
@@ -55,17 +62,18 @@ class PinnedCommentAdder:
     def __init__(self, dry_run: bool = True, delay: float = 1.0,
                  update_existing: bool = False, verify_books: bool = False,
                  validate_links: bool = False, fix_invalid_links: bool = False,
-                 recreate: bool = False, resume: bool = False):
+                 recreate: bool = False, resume: bool = False, workers: int = DEFAULT_WORKERS):
         """
         Args:
             dry_run: True면 미리보기만, False면 실제 추가
-            delay: API 호출 간 대기 시간 (초)
+            delay: API 호출 간 최소 간격 (초, 쿼터 스케줄러가 조절)
             update_existing: True면 기존 제휴 댓글도 업데이트
             verify_books: True면 Google Books API로 책 제목 검증
             validate_links: True면 새 댓글 추가 전 링크 유효성 검사 (무효 링크 제외)
             fix_invalid_links: True면 기존 댓글에서 유효하지 않은 링크 찾아 제거/업데이트
             recreate: True면 기존 채널 소유자 댓글을 삭제 후 새 댓글로 재등록
             resume: True면 이미 처리한 영상 건너뜀 (상태 파일 사용)
+            workers: 고정 댓글 동시 조회 수 (구매 링크는 도메인별 동시 검사 수)
         """
         if not GOOGLE_API_AVAILABLE:
             raise ImportError("google-api-python-client가 필요합니다.")
@@ -78,10 +86,16 @@ class PinnedCommentAdder:
         self.fix_invalid_links = fix_invalid_links
         self.recreate = recreate
         self.resume = resume
+        self.workers = workers
         self.google_books_api_key = os.getenv("GOOGLE_BOOKS_API_KEY", "")
         self.youtube: Any = None
+        self.quota: Any = None
+        self.credentials = None
         self.channel_id = os.getenv("YOUTUBE_CHANNEL_ID")
         self.processed_video_ids = set()
+        # prefetch_pinned_comments로 미리 조회한 고정 댓글 {video_id: 댓글 또는 None}
+        self.pinned_comments: Dict[str, Optional[Dict]] = {}
+        self._local = threading.local()
 
         if not self.channel_id:
             raise ValueError("YOUTUBE_CHANNEL_ID가 설정되지 않았습니다.")
@@ -139,15 +153,43 @@ class PinnedCommentAdder:
             )
 
             credentials.refresh(Request())
-            self.youtube = build('youtube', 'v3', credentials=credentials)
+            self.credentials = credentials
+            self.youtube = enable_quota_scheduler(
+                build('youtube', 'v3', credentials=credentials),
+                priority=PRIORITY_COMMENT, min_interval=self.delay,
+            )
+            self.quota = get_quota_scheduler(self.youtube)
             print("✅ YouTube API 인증 성공")
         except Exception as e:
             print(f"❌ 인증 실패: {e}")
             raise
 
+    def _service(self):
+        """작업 스레드별 서비스 객체 (googleapiclient 서비스는 스레드 간 공유 불가, 쿼터 스케줄러는 공유)"""
+        if not hasattr(self._local, "service"):
+            self._local.service = enable_quota_scheduler(
+                build('youtube', 'v3', credentials=self.credentials), scheduler=self.quota
+            )
+        return self._local.service
+
+    def _unit_methods(self) -> List[str]:
+        """영상 1개 처리에 필요한 최대 API 호출 (시작 전 쿼터 확인용)"""
+        methods = ["commentThreads.list"]
+        if self.dry_run:
+            return methods
+        if self.fix_invalid_links:
+            return methods + ["commentThreads.list", "comments.update"]
+        if self.recreate:
+            methods += ["commentThreads.list", "comments.delete"]
+        if self.update_existing:
+            methods += ["commentThreads.list", "comments.update"]
+        else:
+            methods.append("commentThreads.insert")
+        return methods
+
     def get_channel_videos(self, max_results: Optional[int] = None) -> List[Dict]:
         """
-        채널의 모든 영상 목록 가져오기
+        채널의 모든 영상 목록 가져오기 (로컬 카탈로그 증분 동기화)
 
         Args:
             max_results: 최대 영상 개수 (None이면 전체)
@@ -157,77 +199,29 @@ class PinnedCommentAdder:
         """
         print(f"\n📋 채널 영상 목록 가져오는 중... (채널 ID: {self.channel_id})")
 
-        videos = []
-
         try:
-            # 1. 채널의 uploads 재생목록 ID 가져오기
-            channel_response = self.youtube.channels().list(
-                part='contentDetails',
-                id=self.channel_id
-            ).execute()
-
-            if not channel_response.get('items'):
-                print("❌ 채널을 찾을 수 없습니다.")
-                return videos
-
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            print(f"   📂 Uploads 재생목록 ID: {uploads_playlist_id}")
-
-            # 2. 재생목록의 모든 영상 가져오기
-            next_page_token = None
-            page = 1
-
-            while True:
-                playlist_response = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,  # 페이지당 최대 50개
-                    pageToken=next_page_token
-                ).execute()
-
-                items = playlist_response.get('items', [])
-                print(f"   📄 Page {page}: {len(items)}개 영상")
-
-                for item in items:
-                    video_id = item['snippet']['resourceId']['videoId']
-                    title = item['snippet']['title']
-                    videos.append({
-                        'video_id': video_id,
-                        'title': title
-                    })
-
-                    if max_results and len(videos) >= max_results:
-                        break
-
-                if max_results and len(videos) >= max_results:
-                    break
-
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-
-                page += 1
-                time.sleep(self.delay)  # API 호출 간 대기
-
+            videos = load_channel_videos(self.youtube, self.channel_id, limit=max_results, delay=self.delay)
             print(f"✅ 총 {len(videos)}개 영상 발견")
             return videos
 
         except HttpError as e:
             print(f"❌ API 오류: {e}")
-            return videos
+            return []
 
-    def get_pinned_comment(self, video_id: str) -> Optional[Dict]:
+    def get_pinned_comment(self, video_id: str, youtube: Any = None) -> Optional[Dict]:
         """
         영상의 고정 댓글 가져오기
 
         Args:
             video_id: YouTube 영상 ID
+            youtube: 사용할 서비스 객체 (None이면 self.youtube)
 
         Returns:
             고정 댓글 정보 (없으면 None)
         """
+        youtube = youtube or self.youtube
         try:
-            response = self.youtube.commentThreads().list(
+            response = youtube.commentThreads().list(
                 part='snippet',
                 videoId=video_id,
                 maxResults=100,
@@ -257,6 +251,50 @@ class PinnedCommentAdder:
             print(f"   ⚠️ 댓글 조회 오류: {e}")
             return None
 
+    def prefetch_pinned_comments(self, video_ids: List[str]) -> None:
+        """
+        여러 영상의 고정 댓글을 동시에 미리 조회 (self.pinned_comments에 보관)
+
+        쿼터가 소진되면 남은 영상은 조회하지 않고, 처리 루프에서 개별 조회하며 중단됩니다.
+        """
+        video_ids = [vid for vid in video_ids if vid not in self.pinned_comments]
+        if not video_ids:
+            return
+        stop = threading.Event()
+
+        def fetch(video_id):
+            if stop.is_set():
+                return
+            try:
+                self.pinned_comments[video_id] = self.get_pinned_comment(video_id, youtube=self._service())
+            except QuotaExhausted:
+                stop.set()
+
+        print(f"\n💬 고정 댓글 {len(video_ids)}개 동시 조회 중... (동시 {self.workers}개)")
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+            list(executor.map(fetch, video_ids))
+
+    def _pinned(self, video_id: str) -> Optional[Dict]:
+        """미리 조회한 고정 댓글 (없으면 지금 조회)"""
+        if video_id in self.pinned_comments:
+            return self.pinned_comments.pop(video_id)
+        return self.get_pinned_comment(video_id)
+
+    def prevalidate_links(self) -> None:
+        """미리 조회한 댓글들의 구매 링크를 중복 제거 후 한 번에 검사 (결과는 링크 검사 캐시에 보관)"""
+        urls = [
+            url for comment in self.pinned_comments.values()
+            if comment and self.has_affiliate_links(comment['text'])
+            for url in extract_purchase_urls(comment['text'])
+        ]
+        if not urls:
+            return
+        unique = len(set(urls))
+        print(f"🔗 구매 링크 {len(urls)}개 중 고유 링크 {unique}개 검사 중...")
+        results = validate_purchase_urls(urls, max_per_domain=self.workers)
+        invalid = sum(1 for info in results.values() if not info['valid'])
+        print(f"   ✅ 유효 {unique - invalid}개, ❌ 무효 {invalid}개")
+
     def has_affiliate_links(self, comment_text: str) -> bool:
         """
         댓글에 이미 제휴 링크가 있는지 확인
@@ -279,7 +317,7 @@ class PinnedCommentAdder:
         Returns:
             'fixed' | 'no_comment' | 'no_affiliate' | 'all_valid' | 'error'
         """
-        existing = self.get_pinned_comment(video_id)
+        existing = self._pinned(video_id)
         if not existing:
             print("   ℹ️  채널 소유자 댓글 없음. (건너뜀)")
             return "no_comment"
@@ -289,9 +327,10 @@ class PinnedCommentAdder:
             print("   ℹ️  제휴 링크 없는 댓글. (건너뜀)")
             return "no_affiliate"
 
+        # prevalidate_links로 검사한 링크는 캐시에서 바로 반환
         print("   🔍 구매 링크 유효성 검사 중...")
         cleaned, validation, removed = audit_and_clean_comment(
-            comment_text, delay=0.5, verbose=True
+            comment_text, delay=0.0, verbose=True
         )
 
         if not removed:
@@ -581,6 +620,14 @@ class PinnedCommentAdder:
         skipped_count = 0
         error_count = 0
         fixed_count = 0
+        deferred_count = 0
+        unit_methods = self._unit_methods()
+
+        # 고정 댓글은 동시에 미리 조회, 구매 링크는 영상 간 중복을 제거해 한 번에 검사
+        targets = [v['video_id'] for v in videos if self.recreate or v['video_id'] not in self.processed_video_ids]
+        self.prefetch_pinned_comments(targets)
+        if self.fix_invalid_links:
+            self.prevalidate_links()
 
         for idx, video in enumerate(videos, 1):
             video_id = video['video_id']
@@ -592,6 +639,12 @@ class PinnedCommentAdder:
                 skipped_count += 1
                 continue
 
+            # 업로드/메타데이터 몫을 남기고 이 영상을 끝까지 처리할 쿼터가 있을 때만 시작
+            if not self.quota.can_afford(*unit_methods):
+                deferred_count = len(videos) - idx + 1
+                print(f"\n⏸️ 오늘 남은 댓글용 쿼터로는 다음 영상을 끝까지 처리할 수 없어 중단합니다. ({deferred_count}개 보류)")
+                break
+
             print(f"\n[{idx}/{len(videos)}] 🎬 {video_title}")
             print(f"   📹 Video ID: {video_id}")
 
@@ -605,13 +658,12 @@ class PinnedCommentAdder:
                         error_count += 1
                     else:
                         skipped_count += 1
-                    time.sleep(self.delay)
                     continue
 
                 # ── 일반 모드: 신규 댓글 추가 ──
 
                 # 1. 기존 채널 소유자 댓글 확인
-                existing_comment = self.get_pinned_comment(video_id)
+                existing_comment = self._pinned(video_id)
                 should_update = False
 
                 if existing_comment:
@@ -620,7 +672,6 @@ class PinnedCommentAdder:
                         print("   🗑  기존 댓글 삭제 후 재등록 모드")
                         if not self.delete_comment(existing_comment['comment_id']):
                             error_count += 1
-                            time.sleep(self.delay)
                             continue
                         # 삭제 후 existing_comment를 None으로 처리하여 신규 추가로 진행
                         existing_comment = None
@@ -680,17 +731,16 @@ class PinnedCommentAdder:
                 else:
                     error_count += 1
 
-                # API 호출 간 대기
-                time.sleep(self.delay)
-
+            except QuotaExhausted as e:
+                deferred_count = len(videos) - idx + 1
+                print(f"   ⏸️ {e}")
+                break
             except HttpError as e:
                 print(f"   ❌ API 오류: {e}")
                 error_count += 1
-                time.sleep(self.delay)
             except Exception as e:
                 print(f"   ❌ 예외 발생: {e}")
                 error_count += 1
-                time.sleep(self.delay)
 
         # 최종 결과
         print(f"\n{'='*60}")
@@ -701,6 +751,9 @@ class PinnedCommentAdder:
             print(f"   - 추가: {added_count}개")
         print(f"   - 건너뜀: {skipped_count}개")
         print(f"   - 오류: {error_count}개")
+        if deferred_count:
+            print(f"   - 쿼터 부족으로 보류: {deferred_count}개 (쿼터 재설정 후 다시 실행하면 이어서 처리)")
+        print(f"   {self.quota.summary()}")
         print(f"{'='*60}")
 
         # 상태 파일 저장 (새로 처리된 영상 추가)
@@ -727,7 +780,7 @@ def main():
   # 특정 영상만 처리
   python src/25_batch_add_pinned_comments.py --video-id VIDEO_ID --apply
 
-  # API 호출 간격 조절 (초)
+  # API 호출 최소 간격 조절 (초)
   python src/25_batch_add_pinned_comments.py --apply --delay 2.0
 
   # 기존 댓글도 새 형식으로 업데이트 (작가명 제거된 링크로)
@@ -745,8 +798,13 @@ def main():
   # 기존 댓글의 무효 링크 실제 제거 적용
   python src/25_batch_add_pinned_comments.py --fix-invalid-links --apply
 
+  # 채널 전체 링크 점검을 더 많이 동시에 (고정 댓글 8개씩, 링크는 도메인별 최대 8개씩)
+  python src/25_batch_add_pinned_comments.py --fix-invalid-links --workers 8
+
 주의사항:
   - YouTube API 일일 쿼터: commentThreads.insert 1건 = 50 units (일 10,000 units 제한 → 약 200건/일)
+  - 댓글 작업은 우선순위가 가장 낮아 업로드/메타데이터 몫을 남기고 쿼터를 씁니다.
+    남은 쿼터로 끝낼 수 없는 영상은 시작하지 않고 보류합니다.
   - --apply 플래그 없이는 미리보기만 수행됩니다.
   - 이미 제휴 링크가 있는 댓글은 건너뜁니다 (--update-existing 없으면).
   - --update-existing: 기존 제휴 댓글을 새 형식으로 교체합니다.
@@ -778,7 +836,7 @@ def main():
         '--delay',
         type=float,
         default=1.0,
-        help='API 호출 간 대기 시간 (초, 기본값: 1.0)'
+        help='API 호출 간 최소 간격 (초, 기본값: 1.0)'
     )
 
     parser.add_argument(
@@ -823,6 +881,13 @@ def main():
         help='이미 처리한 영상 건너뜀 (상태 파일 사용)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'고정 댓글 동시 조회 수, 구매 링크 도메인별 동시 검사 수 (기본값: {DEFAULT_WORKERS})'
+    )
+
     args = parser.parse_args()
 
     # --apply 플래그가 있으면 dry_run=False
@@ -848,6 +913,7 @@ def main():
             fix_invalid_links=args.fix_invalid_links,
             recreate=args.recreate,
             resume=args.resume,
+            workers=args.workers,
         )
         adder.process_videos(video_ids=args.video_id, limit=args.limit)
     except Exception as e:
@@ -4,11 +4,14 @@
 
 채널의 모든 영상을 순회하며 채널 소유자가 작성한 댓글을 찾아
 영상 제목, URL, 댓글 내용을 Excel 파일로 저장합니다.
+
+댓글 스레드는 로컬 저장소(.cache/comment_threads.sqlite3)에 증분 동기화하고
+(댓글 수가 그대로인 영상은 조회 생략, 여러 영상 동시 조회),
+기본적으로 지난 내보내기 이후 새로 생기거나 수정된 댓글만 내보냅니다.
 """
 
 import os
 import sys
-import time
 import argparse
 import json
 from pathlib import Path
@@ -33,6 +36,10 @@ except ImportError as e:
     print("pip install google-api-python-client pandas openpyxl")
     GOOGLE_API_AVAILABLE = False
 
+from src.utils.channel_catalog import load_channel_videos
+from src.utils.comment_store import DEFAULT_WORKERS, CommentStore, sync_comments
+from src.utils.quota_scheduler import PRIORITY_COMMENT, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler
+
 load_dotenv()
 
 # YouTube API 스코프
@@ -45,12 +52,16 @@ SCOPES = [
 class CommentExporter:
     """YouTube 채널의 댓글을 Excel로 내보내는 클래스"""
 
-    def __init__(self, output_file: str = None, limit: int = None, delay: float = 1.0):
+    def __init__(self, output_file: str = None, limit: int = None, delay: float = 0.2,
+                 workers: int = DEFAULT_WORKERS, full: bool = False, export_all: bool = False):
         """
         Args:
             output_file: 출력 Excel 파일 경로
             limit: 처리할 최대 영상 개수
-            delay: API 호출 간 대기 시간 (초)
+            delay: API 호출 간 최소 간격 (초, 쿼터 스케줄러가 조절)
+            workers: 동시에 댓글을 조회할 영상 수
+            full: True면 댓글 수 비교 없이 모든 영상의 댓글을 다시 조회
+            export_all: True면 이미 내보낸 댓글까지 전부 내보내기
         """
         if not GOOGLE_API_AVAILABLE:
             raise ImportError("google-api-python-client, pandas, openpyxl이 필요합니다.")
@@ -58,7 +69,12 @@ class CommentExporter:
         self.output_file = output_file or f"output/my_comments_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         self.limit = limit
         self.delay = delay
+        self.workers = workers
+        self.full = full
+        self.export_all = export_all
         self.youtube: Any = None
+        self.quota = None
+        self.credentials = None
         self.channel_id = os.getenv("YOUTUBE_CHANNEL_ID")
 
         if not self.channel_id:
@@ -86,141 +102,42 @@ class CommentExporter:
             )
 
             credentials.refresh(Request())
-            self.youtube = build('youtube', 'v3', credentials=credentials)
+            self.credentials = credentials
+            self.youtube = enable_quota_scheduler(
+                build('youtube', 'v3', credentials=credentials),
+                priority=PRIORITY_COMMENT, min_interval=self.delay,
+            )
+            self.quota = get_quota_scheduler(self.youtube)
             print("✅ YouTube API 인증 성공")
         except Exception as e:
             print(f"❌ 인증 실패: {e}")
             raise
 
+    def _build_service(self):
+        """동시 조회 스레드용 서비스 객체 (쿼터 스케줄러는 공유)"""
+        return enable_quota_scheduler(build('youtube', 'v3', credentials=self.credentials), scheduler=self.quota)
+
     def get_channel_videos(self) -> List[Dict]:
         """
-        채널의 모든 영상 목록 가져오기
+        채널의 모든 영상 목록 가져오기 (로컬 카탈로그 증분 동기화)
 
         Returns:
             영상 정보 목록 [{"video_id": "...", "title": "...", "published_at": "..."}, ...]
         """
         print(f"\n📋 채널 영상 목록 가져오는 중... (채널 ID: {self.channel_id})")
 
-        videos = []
-
         try:
-            # 1. 채널의 uploads 재생목록 ID 가져오기
-            channel_response = self.youtube.channels().list(
-                part='contentDetails,snippet',
-                id=self.channel_id
-            ).execute()
-
-            if not channel_response.get('items'):
-                print("❌ 채널을 찾을 수 없습니다.")
-                return videos
-
-            channel_title = channel_response['items'][0]['snippet'].get('title', 'Unknown')
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            print(f"   📺 채널명: {channel_title}")
-            print(f"   📂 Uploads 재생목록 ID: {uploads_playlist_id}")
-
-            # 2. 재생목록의 모든 영상 가져오기
-            next_page_token = None
-            page = 1
-
-            while True:
-                playlist_response = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-
-                items = playlist_response.get('items', [])
-
-                for item in items:
-                    video_id = item['snippet']['resourceId']['videoId']
-                    title = item['snippet']['title']
-                    published_at = item['snippet'].get('publishedAt', '')
-                    videos.append({
-                        'video_id': video_id,
-                        'title': title,
-                        'published_at': published_at
-                    })
-
-                    if self.limit and len(videos) >= self.limit:
-                        break
-
-                print(f"   📄 Page {page}: {len(items)}개 영상 누적 (총 {len(videos)}개)")
-
-                if self.limit and len(videos) >= self.limit:
-                    break
-
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-
-                page += 1
-                time.sleep(self.delay)
-
+            # 댓글 수(statistics.commentCount)로 조회할 영상을 고르므로 통계까지 갱신 (50개당 1유닛)
+            videos = load_channel_videos(self.youtube, self.channel_id, limit=self.limit, refresh=True)
             print(f"✅ 총 {len(videos)}개 영상 발견")
             return videos
 
-        except HttpError as e:
+        except (HttpError, QuotaExhausted) as e:
             print(f"❌ API 오류: {e}")
-            return videos
-
-    def get_my_comments(self, video_id: str) -> List[Dict]:
-        """
-        특정 영상에서 채널 소유자가 작성한 댓글 가져오기
-
-        Args:
-            video_id: YouTube 영상 ID
-
-        Returns:
-            댓글 목록 [{"comment_id": "...", "text": "...", "published_at": "..."}, ...]
-        """
-        comments = []
-
-        try:
-            response = self.youtube.commentThreads().list(
-                part='snippet',
-                videoId=video_id,
-                maxResults=100,
-                order='relevance'
-            ).execute()
-
-            for item in response.get('items', []):
-                snippet = item['snippet']
-                top_comment = snippet['topLevelComment']['snippet']
-
-                # 채널 소유자의 댓글인지 확인
-                author_channel_id = top_comment.get('authorChannelId', {})
-                if isinstance(author_channel_id, dict):
-                    author_id = author_channel_id.get('value', '')
-                else:
-                    author_id = author_channel_id
-
-                if author_id == self.channel_id:
-                    # textOriginal: 원본 텍스트 (HTML 엔티티 없음)
-                    # textDisplay: YouTube가 HTML로 변환한 형태 - 폴백용
-                    text = top_comment.get('textOriginal') or top_comment.get('textDisplay', '')
-                    published_at = top_comment.get('publishedAt', '')
-                    updated_at = top_comment.get('updatedAt', '')
-
-                    comments.append({
-                        'comment_id': item['id'],
-                        'text': text,
-                        'published_at': published_at,
-                        'updated_at': updated_at
-                    })
-
-            return comments
-
-        except HttpError as e:
-            if e.resp.status == 403:
-                # 댓글이 비활성화된 영상
-                return []
-            print(f"   ⚠️ 댓글 조회 오류: {e}")
             return []
 
     def export_to_excel(self):
-        """모든 영상의 내 댓글을 Excel로 내보내기"""
+        """내 댓글을 Excel로 내보내기 (기본: 지난 내보내기 이후 새로 생기거나 수정된 댓글만)"""
         # 영상 목록 가져오기
         videos = self.get_channel_videos()
 
@@ -229,51 +146,44 @@ class CommentExporter:
             return
 
         print(f"\n{'='*60}")
-        print(f"🔍 {len(videos)}개 영상에서 내 댓글 검색 중...")
+        print(f"🔍 {len(videos)}개 영상의 댓글 동기화 중...")
         print(f"{'='*60}\n")
 
-        # 결과 데이터 수집
+        store = CommentStore()
+        result = sync_comments(
+            store, self.youtube, videos, service_factory=self._build_service,
+            workers=self.workers, full=self.full,
+        )
+        if result.deferred:
+            print(f"   ⏸️ 쿼터 부족으로 {len(result.deferred)}개 영상은 다음 실행에 조회합니다.")
+
+        # 결과 데이터 수집 (카탈로그에 있는 영상의 내 댓글만)
+        video_map = {video['video_id']: video for video in videos}
+        comments = [
+            comment for comment in store.comments(self.channel_id, pending_only=not self.export_all)
+            if comment['video_id'] in video_map
+        ]
+
         results = []
-        videos_with_comments = 0
-        total_comments = 0
-
-        for idx, video in enumerate(videos, 1):
-            video_id = video['video_id']
-            video_title = video['title']
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            video_published = video.get('published_at', '')
-
-            print(f"[{idx}/{len(videos)}] 🎬 {video_title[:50]}...")
-
-            try:
-                # 내 댓글 찾기
-                my_comments = self.get_my_comments(video_id)
-
-                if my_comments:
-                    videos_with_comments += 1
-                    total_comments += len(my_comments)
-                    print(f"   ✅ 댓글 {len(my_comments)}개 발견")
-
-                    for comment in my_comments:
-                        results.append({
-                            '영상 제목': video_title,
-                            '영상 URL': video_url,
-                            '영상 ID': video_id,
-                            '영상 게시일': video_published,
-                            '댓글 내용': comment['text'],
-                            '댓글 ID': comment['comment_id'],
-                            '댓글 작성일': comment['published_at'],
-                            '댓글 수정일': comment['updated_at']
-                        })
-                else:
-                    print(f"   ℹ️ 내 댓글 없음")
-
-                # API 호출 간 대기
-                time.sleep(self.delay)
-
-            except Exception as e:
-                print(f"   ❌ 오류: {e}")
-                time.sleep(self.delay)
+        for comment in comments:
+            video = video_map[comment['video_id']]
+            if comment['exported_updated_at'] is None:
+                change = '신규'
+            elif comment['exported_updated_at'] != comment['updated_at']:
+                change = '수정'
+            else:
+                change = ''
+            results.append({
+                '영상 제목': video['title'],
+                '영상 URL': f"https://www.youtube.com/watch?v={comment['video_id']}",
+                '영상 ID': comment['video_id'],
+                '영상 게시일': video.get('published_at', ''),
+                '댓글 내용': comment['text'],
+                '댓글 ID': comment['thread_id'],
+                '댓글 작성일': comment['published_at'],
+                '댓글 수정일': comment['updated_at'],
+                '변경 유형': change,
+            })
 
         # Excel 파일로 저장
         if results:
@@ -285,16 +195,21 @@ class CommentExporter:
 
             # Excel 파일로 저장
             df.to_excel(output_path, index=False, engine='openpyxl')
+            store.mark_exported(comments)
 
             print(f"\n{'='*60}")
             print(f"✅ 내보내기 완료!")
-            print(f"   📊 총 영상 수: {len(videos)}개")
-            print(f"   💬 댓글 있는 영상: {videos_with_comments}개")
-            print(f"   📝 총 댓글 수: {total_comments}개")
+            print(f"   📊 총 영상 수: {len(videos)}개 (댓글 조회 {len(result.synced)}개, "
+                  f"변화 없음 {len(result.unchanged)}개)")
+            print(f"   💬 댓글 있는 영상: {len({comment['video_id'] for comment in comments})}개")
+            print(f"   📝 내보낸 댓글 수: {len(results)}개")
             print(f"   📁 저장 위치: {output_path.absolute()}")
+            print(f"   {self.quota.summary()}")
             print(f"{'='*60}")
-        else:
+        elif self.export_all:
             print("\n⚠️ 내 댓글이 없습니다.")
+        else:
+            print("\nℹ️ 지난 내보내기 이후 새로 생기거나 수정된 내 댓글이 없습니다. (전체: --all)")
 
 
 def main():
@@ -314,6 +229,12 @@ def main():
 
   # API 호출 간격 조절
   python src/26_export_comments_to_excel.py --delay 2.0
+
+  # 이미 내보낸 댓글까지 전부 내보내기
+  python src/26_export_comments_to_excel.py --all
+
+  # 모든 영상의 댓글 다시 조회 (오래된 댓글의 수정 내용까지 반영)
+  python src/26_export_comments_to_excel.py --full
         """
     )
 
@@ -334,8 +255,28 @@ def main():
     parser.add_argument(
         '--delay', '-d',
         type=float,
-        default=1.0,
-        help='API 호출 간 대기 시간 (초, 기본값: 1.0)'
+        default=0.2,
+        help='API 호출 간 최소 간격 (초, 기본값: 0.2)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'동시에 댓글을 조회할 영상 수 (기본값: {DEFAULT_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='댓글 수 비교 없이 모든 영상의 댓글 다시 조회'
+    )
+
+    parser.add_argument(
+        '--all',
+        dest='export_all',
+        action='store_true',
+        help='이미 내보낸 댓글까지 전부 내보내기'
     )
 
     args = parser.parse_args()
@@ -344,7 +285,10 @@ def main():
         exporter = CommentExporter(
             output_file=args.output,
             limit=args.limit,
-            delay=args.delay
+            delay=args.delay,
+            workers=args.workers,
+            full=args.full,
+            export_all=args.export_all
         )
         exporter.export_to_excel()
     except Exception as e:
@@ -42,6 +42,13 @@ try:
 except ImportError:
     from utils.file_utils import get_standard_safe_title
 
+try:
+    from src.utils.image_variants import load_render_variant, make_center_crop
+    from src.utils.image_loader import load_rgb
+except ImportError:
+    from utils.image_variants import load_render_variant, make_center_crop
+    from utils.image_loader import load_rgb
+
 try:
     from src.utils.translations import (
         translate_book_title,
@@ -134,14 +141,8 @@ def _find_mood_images(book_title: str, count: int = 5) -> List[Path]:
 def _generate_short_tts(text: str, language: str, output_path: Path, provider: str = "openai") -> bool:
     """Shorts용 TTS 오디오 생성"""
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "text_to_speech_multi",
-            Path(__file__).parent / "09_text_to_speech_multi.py"
-        )
-        tts_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(tts_module)
-        engine = tts_module.MultiTTSEngine(provider=provider)
+        from src.utils.module_loader import load_script
+        engine = load_script("09_text_to_speech_multi.py").MultiTTSEngine(provider=provider)
 
         voice = "nova" if language == "ko" else "alloy"
         result = engine.text_to_speech(
@@ -172,7 +173,6 @@ def _create_short_video(
             concatenate_videoclips, TextClip, ColorClip
         )
         import numpy as np
-        from PIL import Image as PILImage
 
         target_w, target_h = SHORTS_RESOLUTION
 
@@ -192,23 +192,15 @@ def _create_short_video(
             per_img = actual_duration / len(images)
             clips = []
             for img_path in images:
-                img = PILImage.open(img_path).convert("RGB")
-                # 9:16 크롭: 중앙 크롭
-                iw, ih = img.size
-                aspect = target_w / target_h
-                img_aspect = iw / ih
-                if img_aspect > aspect:
-                    # 이미지가 더 넓음 → 좌우 크롭
-                    new_w = int(ih * aspect)
-                    left = (iw - new_w) // 2
-                    img = img.crop((left, 0, left + new_w, ih))
+                # 다운로드 시 만든 Shorts 크롭이 있으면 그대로 사용
+                variant = load_render_variant(img_path, "shorts")
+                if variant is not None and variant[0].shape[:2] == (target_h, target_w):
+                    frame = variant[0]
                 else:
-                    # 이미지가 더 좁음 → 상하 크롭
-                    new_h = int(iw / aspect)
-                    top = (ih - new_h) // 2
-                    img = img.crop((0, top, iw, top + new_h))
-                img = img.resize((target_w, target_h), PILImage.Resampling.LANCZOS)
-                clip = ImageClip(np.array(img), duration=per_img)
+                    # 9:16 크롭: 중앙 크롭
+                    img = load_rgb(img_path, SHORTS_RESOLUTION, fit="cover")
+                    frame = np.array(make_center_crop(img, SHORTS_RESOLUTION))
+                clip = ImageClip(frame, duration=per_img)
                 clips.append(clip)
             video = concatenate_videoclips(clips, method="compose")
 
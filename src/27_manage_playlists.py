@@ -56,6 +56,17 @@ try:
 except ImportError:
     from utils.title_generator import generate_hashtags
 
+try:
+    from src.utils.channel_catalog import load_channel_videos
+    from src.utils.metrics_store import detect_genre
+    from src.utils.quota_scheduler import PRIORITY_METADATA, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler
+    from src.utils.youtube_cache import DEFAULT_FRESH_SECONDS, enable_etag_cache, log_cache_stats
+except ImportError:
+    from utils.channel_catalog import load_channel_videos
+    from utils.metrics_store import detect_genre
+    from utils.quota_scheduler import PRIORITY_METADATA, QuotaExhausted, enable_quota_scheduler, get_quota_scheduler
+    from utils.youtube_cache import DEFAULT_FRESH_SECONDS, enable_etag_cache, log_cache_stats
+
 FULL_SCOPES = [
     "https://www.googleapis.com/auth/youtube",
     "https://www.googleapis.com/auth/youtube.force-ssl",
@@ -109,40 +120,8 @@ PLAYLIST_DEFINITIONS = {
 
 
 def _detect_genre_from_title(title: str) -> str:
-    """영상 제목에서 장르 감지"""
-    title_lower = title.lower()
-
-    # 철학/인문학 키워드
-    phil_kw = ["철학", "인문", "아포리즘", "지혜", "philosophy", "humanit", "wisdom", "aphorism"]
-    if any(k in title_lower for k in phil_kw):
-        return "philosophy"
-
-    # 심리학/자기계발
-    psych_kw = ["심리", "자기계발", "습관", "마인드", "psychology", "self-help", "habit", "mindset", "growth"]
-    if any(k in title_lower for k in psych_kw):
-        return "psychology"
-
-    # 경제/경영
-    biz_kw = ["경제", "경영", "투자", "부자", "돈", "business", "economics", "investment", "wealth", "finance"]
-    if any(k in title_lower for k in biz_kw):
-        return "business"
-
-    # 역사/사회
-    hist_kw = ["역사", "사회", "문명", "전쟁", "history", "society", "civilization", "war"]
-    if any(k in title_lower for k in hist_kw):
-        return "history"
-
-    # 과학
-    sci_kw = ["과학", "우주", "물리", "생물", "science", "physics", "biology", "space"]
-    if any(k in title_lower for k in sci_kw):
-        return "science"
-
-    # 소설/문학 키워드
-    fic_kw = ["소설", "문학", "novel", "fiction", "literature"]
-    if any(k in title_lower for k in fic_kw):
-        return "fiction"
-
-    return "general"
+    """영상 제목에서 장르 감지 (지표 저장소 장르 롤업과 같은 규칙)"""
+    return detect_genre(title)
 
 
 class PlaylistManager:
@@ -152,6 +131,7 @@ class PlaylistManager:
         self.logger = get_logger(__name__)
         self.dry_run = dry_run
         self.youtube = None
+        self.quota = None
 
         if not dry_run:
             if not GOOGLE_API_AVAILABLE:
@@ -181,44 +161,21 @@ class PlaylistManager:
         if creds.expired and creds.refresh_token:
             creds.refresh(Request())
 
-        self.youtube = build("youtube", "v3", credentials=creds)
+        # 플레이리스트 목록 등 반복 조회는 ETag 캐시 (생성/추가 시 해당 리소스 무효화)
+        # 쿼터 스케줄러는 캐시 안쪽: 캐시로 생략된 요청은 쿼터에 집계하지 않음
+        service = enable_quota_scheduler(build("youtube", "v3", credentials=creds), priority=PRIORITY_METADATA)
+        self.youtube = enable_etag_cache(service, fresh_for=DEFAULT_FRESH_SECONDS)
+        self.quota = get_quota_scheduler(self.youtube)
         self.logger.info("✅ YouTube API 인증 성공")
 
     def get_channel_videos(self, max_results: int = 200) -> List[Dict]:
-        """채널의 모든 업로드 영상 목록 조회"""
+        """채널의 업로드 영상 목록 조회 (로컬 카탈로그 증분 동기화)"""
         if self.dry_run:
             self.logger.info("  (dry-run) 채널 영상 목록 조회 스킵")
             return []
 
         try:
-            # 채널 ID 조회
-            channel_resp = self.youtube.channels().list(part="contentDetails", mine=True).execute()
-            uploads_playlist_id = channel_resp["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-
-            videos = []
-            page_token = None
-
-            while True:
-                resp = self.youtube.playlistItems().list(
-                    part="snippet",
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,
-                    pageToken=page_token,
-                ).execute()
-
-                for item in resp.get("items", []):
-                    snippet = item["snippet"]
-                    videos.append({
-                        "video_id": snippet["resourceId"]["videoId"],
-                        "title": snippet["title"],
-                        "description": snippet.get("description", ""),
-                        "published_at": snippet.get("publishedAt", ""),
-                    })
-
-                page_token = resp.get("nextPageToken")
-                if not page_token or len(videos) >= max_results:
-                    break
-
+            videos = load_channel_videos(self.youtube, limit=max_results, log=self.logger.info)
             self.logger.info(f"  📹 채널 영상 {len(videos)}개 조회 완료")
             return videos
 
@@ -353,6 +310,9 @@ class PlaylistManager:
             if playlist_id:
                 self.logger.info(f"\n  📂 {playlist_title}: {len(video_ids)}개 영상")
                 for vid_id in video_ids:
+                    if self.quota and not self.quota.can_afford("playlistItems.insert"):
+                        self.logger.warning("⏸️ 오늘 남은 쿼터가 부족해 정리를 중단합니다. 쿼터 재설정 후 다시 실행하세요.")
+                        return genre_video_map
                     self.add_video_to_playlist(vid_id, playlist_id)
 
         return genre_video_map
@@ -447,19 +407,31 @@ def main():
         if not args.video_title:
             print("❌ --video-id와 함께 --video-title을 지정해야 합니다.")
             sys.exit(1)
-        manager.add_single_video(args.video_id, args.video_title, args.language)
+        try:
+            manager.add_single_video(args.video_id, args.video_title, args.language)
+        except QuotaExhausted as e:
+            manager.logger.warning(f"⏸️ {e}")
+        log_cache_stats(manager.youtube, manager.logger.info)
     else:
         # 전체 채널 정리
         if dry_run:
             print("🔍 Dry-run 모드: 실제 변경 없이 분류 결과만 표시합니다.")
             print("  실제 적용하려면 --apply 플래그를 추가하세요.\n")
-        genre_map = manager.organize_channel_videos(args.language)
+        try:
+            genre_map = manager.organize_channel_videos(args.language)
+        except QuotaExhausted as e:
+            manager.logger.warning(f"⏸️ {e}")
+            genre_map = {}
 
         print("\n📊 장르별 분류 결과:")
         for genre, video_ids in genre_map.items():
             if video_ids:
                 playlist_title = PLAYLIST_DEFINITIONS[genre]["ko"]["title"]
                 print(f"  {playlist_title}: {len(video_ids)}개 영상")
+        log_cache_stats(manager.youtube, manager.logger.info)
+
+    if manager.quota:
+        manager.logger.info(manager.quota.summary())
 
 
 if __name__ == "__main__":
@@ -54,8 +54,10 @@ except ImportError:
 
 try:
     from src.utils.logger import get_logger
+    from src.utils.metrics_store import MetricsStore
 except ImportError:
     from utils.logger import get_logger
+    from utils.metrics_store import MetricsStore
 
 AB_TEST_CSV = project_root / "data" / "thumbnail_ab_test.csv"
 AB_TEST_CSV_FIELDS = [
@@ -134,7 +136,12 @@ def _save_ab_tests(rows: List[Dict]):
 
 
 def _get_video_ctr(analytics, video_id: str, start_date: str, end_date: str) -> Optional[float]:
-    """YouTube Analytics에서 CTR 조회 (%)"""
+    """CTR 조회 (%) - 로컬 지표 저장소에 노출 데이터가 있으면 사용, 없으면 YouTube Analytics"""
+    ctr = MetricsStore().video_ctr(video_id, start_date, end_date)
+    if ctr is not None:
+        return ctr
+    if analytics is None:
+        return None
     try:
         response = analytics.reports().query(
             ids="channel==MINE",
@@ -243,9 +250,7 @@ def cmd_check(args):
         # A 변형 CTR 조회
         start_str = start.strftime("%Y-%m-%d")
         end_str = now.strftime("%Y-%m-%d")
-        ctr_a = None
-        if analytics:
-            ctr_a = _get_video_ctr(analytics, row["video_id"], start_str, end_str)
+        ctr_a = _get_video_ctr(analytics, row["video_id"], start_str, end_str)
 
         if ctr_a is None:
             print(f"  ⚠️ CTR 조회 실패 (Analytics API 확인 필요)")
@@ -7,15 +7,17 @@ Part 1과 Part 2의 인포그래픽과 영상을 순서대로 합쳐서 전체 
 
 import argparse
 import sys
-import importlib.util
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.file_utils import get_standard_safe_title, load_book_info
+from src.utils.asset_resolver import get_asset_resolver
+from src.utils.module_loader import load_script
+from src.utils.audio_mixer import AudioMixer
 from src.utils.logger import setup_logger
 
 # 로거 설정
@@ -27,8 +29,7 @@ try:
         VideoFileClip,
         CompositeVideoClip,
         concatenate_videoclips,
-        ColorClip,
-        AudioFileClip
+        ColorClip
     )
     from moviepy.video.fx.all import fadein, fadeout
     MOVIEPY_AVAILABLE = True
@@ -337,6 +338,78 @@ def resize_video_clip(
     return clip
 
 
+def build_episode_audio(
+    clip_durations: List[float],
+    clip_audio_sources: List[Optional[str]],
+    info_clip_indices: List[int],
+    output_audio_path: Path,
+    background_music_path: Optional[str] = None,
+    bgm_volume: float = 0.3,
+    audio_bitrate: str = '320k'
+) -> Path:
+    """
+    에피소드 전체 오디오 트랙을 PCM 믹서로 만들고 AAC로 한 번만 인코딩
+
+    - 영상 클립: 원본 영상의 오디오를 클립 시작 위치에 배치
+    - 인포그래픽 클립: 배경음악을 이어서(끝나면 처음부터 순환) 배치하고 끝부분 fadeout
+
+    Args:
+        clip_durations: 타임라인 순서의 클립 길이 (초)
+        clip_audio_sources: 클립별 오디오 소스 경로 (인포그래픽은 None)
+        info_clip_indices: 인포그래픽 클립 인덱스
+        output_audio_path: 인코딩된 오디오 저장 경로 (.m4a)
+
+    Returns:
+        인코딩된 오디오 경로
+
+    Raises:
+        Exception: 배경음악 디코딩/배치 또는 인코딩 실패 (배경음악 없이 조용히 진행하지 않음)
+    """
+    mixer = AudioMixer()
+    starts = [sum(clip_durations[:i]) for i in range(len(clip_durations))]
+
+    for index, source in enumerate(clip_audio_sources):
+        if source is None:
+            continue
+        try:
+            mixer.add(source, start=starts[index], duration=clip_durations[index])
+        except (RuntimeError, ValueError) as e:
+            # 오디오 트랙이 없는 영상은 무음으로 둠
+            logger.warning(f"   ⚠️ 오디오 트랙 없음, 무음 처리: {Path(source).name} ({e})")
+
+    if background_music_path and Path(background_music_path).exists() and info_clip_indices:
+        logger.info("🎵 배경음악 추가 중 (인포그래픽에만 적용)...")
+        logger.info(f"   파일: {Path(background_music_path).name}")
+        logger.info(f"   음량: {bgm_volume * 100:.0f}%")
+        # 배치 실패는 호출 측으로 전달 (배경음악이 조용히 빠진 영상을 만들지 않음)
+        bgm_duration = len(mixer.load(background_music_path)) / mixer.sample_rate
+        # 인포그래픽마다 이전 위치에서 이어서 재생 (버퍼 복사 없이 순환)
+        bgm_start_time = 0.0
+        for clip_index in info_clip_indices:
+            clip_duration = clip_durations[clip_index]
+            # fadeout 효과 (최대 2초 또는 클립 길이의 20%)
+            fadeout_duration = min(2.0, clip_duration * 0.2)
+            mixer.add(
+                background_music_path,
+                start=starts[clip_index],
+                offset=bgm_start_time,
+                duration=clip_duration,
+                gain=bgm_volume,
+                loop=True,
+                fade_out=fadeout_duration,
+            )
+            logger.info(f"   ✅ 인포그래픽 #{clip_index + 1}에 배경음악 추가 ({clip_duration:.2f}초, fadeout {fadeout_duration:.1f}초)")
+            bgm_start_time = (bgm_start_time + clip_duration) % bgm_duration
+    elif background_music_path:
+        logger.warning(f"   ⚠️ 배경음악 파일을 찾을 수 없습니다: {background_music_path}")
+        logger.warning("   배경음악 없이 진행합니다.")
+
+    # 마지막 클립이 무음이어도 영상 길이만큼 트랙 유지
+    mixer.extend_to(sum(clip_durations))
+
+    return mixer.export(output_audio_path, bitrate=audio_bitrate)
+
+
 def create_full_episode(
     book_title: str,
     output_path: Optional[str] = None,
@@ -370,18 +443,19 @@ def create_full_episode(
     dir_lang = "kr" if language in ["ko", "kr"] else "en"
     input_dir = Path("assets/notebooklm") / safe_title / dir_lang
     
-    # 동적으로 모든 Part 찾기
+    # 동적으로 모든 Part 찾기 (디렉토리 목록 인덱스로 조회)
+    resolver = get_asset_resolver()
     parts = []
     part_num = 1
     while True:
         video_file = input_dir / f"part{part_num}_video{lang_suffix}.mp4"
         info_file = input_dir / f"part{part_num}_info{lang_suffix}.png"
         
-        if video_file.exists():
+        if resolver.exists(video_file):
             parts.append({
                 "part_num": part_num,
                 "video": video_file,
-                "info": info_file if info_file.exists() else None
+                "info": info_file if resolver.exists(info_file) else None
             })
             part_num += 1
         else:
@@ -441,15 +515,12 @@ def create_full_episode(
                 # download_background_music 함수 동적 import (파일명이 숫자로 시작)
                 download_module_path = project_root / "src" / "21_download_background_music.py"
                 if download_module_path.exists():
-                    spec = importlib.util.spec_from_file_location("download_background_music", download_module_path)
-                    download_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(download_module)
-                    download_background_music = download_module.download_background_music
+                    download_background_music = load_script(download_module_path).download_background_music
                     
                     # 책 정보 로드 (있는 경우)
                     book_info_path = Path("assets/images") / safe_title / "book_info.json"
                     book_info = None
-                    if book_info_path.exists():
+                    if resolver.exists(book_info_path):
                         book_info = load_book_info(str(book_info_path))
                     
                     # 배경음악 다운로드
@@ -491,6 +562,7 @@ def create_full_episode(
     info_clip_indices = []  # 배경음악 처리를 위해 인포그래픽 클립의 인덱스 저장
     clip_durations = []  # 각 클립의 실제 duration 추적 (metadata용)
     part_clip_info = []  # 각 Part의 클립 정보 저장 (part_num, clip_type, duration)
+    clip_audio_sources = []  # 클립별 오디오 소스 (영상 파일, 인포그래픽은 None)
     
     for i, part in enumerate(parts, 1):
         # 영상 클립
@@ -512,6 +584,7 @@ def create_full_episode(
         logger.info("")
         
         video_clips.append(video_clip)
+        clip_audio_sources.append(str(part['video']))
         part_clip_info.append({
             'part_num': part['part_num'],
             'clip_type': 'video',
@@ -536,6 +609,7 @@ def create_full_episode(
             # 인포그래픽 클립의 인덱스 저장 (배경음악 추가용)
             info_clip_indices.append(len(video_clips))
             video_clips.append(info_clip)
+            clip_audio_sources.append(None)
             part_clip_info.append({
                 'part_num': part['part_num'],
                 'clip_type': 'infographic',
@@ -602,106 +676,6 @@ def create_full_episode(
     
     logger.info("")
     
-    # 배경음악을 인포그래픽에만 추가 (Crossfade 효과 적용 전에 처리)
-    if background_music_path and Path(background_music_path).exists() and info_clip_indices:
-        logger.info("🎵 배경음악 추가 중 (인포그래픽에만 적용)...")
-        logger.info(f"   파일: {Path(background_music_path).name}")
-        logger.info(f"   음량: {bgm_volume * 100:.0f}%")
-        
-        try:
-            # 배경음악 파일 로드
-            logger.info(f"   📂 배경음악 파일 로드 중: {Path(background_music_path).name}")
-            try:
-                bgm = AudioFileClip(background_music_path)
-                if bgm.reader is None:
-                    raise ValueError("AudioFileClip reader가 None입니다. 파일이 손상되었거나 지원되지 않는 형식일 수 있습니다.")
-            except Exception as load_error:
-                logger.error(f"   ❌ 배경음악 파일 로드 실패: {load_error}")
-                logger.warning("   배경음악 없이 진행합니다.")
-                bgm = None
-            
-            if bgm is not None:
-                bgm_duration = bgm.duration
-                
-                # 음량 조절
-                try:
-                    from moviepy.audio.fx.all import volumex
-                    bgm = bgm.fx(volumex, bgm_volume)
-                except ImportError:
-                    try:
-                        bgm = bgm.volumex(bgm_volume)
-                    except AttributeError:
-                        logger.warning("   ⚠️ 음량 조절 실패, 원본 음량 사용")
-                
-                # 각 인포그래픽 클립에 배경음악 추가 (인덱스로 직접 접근)
-                bgm_start_time = 0
-                for i, clip_index in enumerate(info_clip_indices):
-                    if clip_index < len(video_clips):
-                        info_clip = video_clips[clip_index]
-                        # 배경음악 세그먼트 생성 (인포그래픽 길이에 맞춤)
-                        clip_duration = info_clip.duration
-                        bgm_end_time = min(bgm_start_time + clip_duration, bgm_duration)
-                        
-                        # 배경음악이 부족하면 처음부터 반복
-                        if bgm_end_time <= bgm_start_time:
-                            bgm_start_time = 0
-                            bgm_end_time = min(clip_duration, bgm_duration)
-                        
-                        bgm_segment = bgm.subclip(bgm_start_time, bgm_end_time)
-                        
-                        # 오디오 길이를 정확히 클립 길이에 맞춤
-                        if bgm_segment.duration < clip_duration:
-                            # 배경음악이 짧으면 반복
-                            from moviepy.audio.AudioClip import concatenate_audioclips
-                            loops_needed = int(clip_duration / bgm_segment.duration) + 1
-                            bgm_segment = concatenate_audioclips([bgm_segment] * loops_needed)
-                            bgm_segment = bgm_segment.subclip(0, clip_duration)
-                        elif bgm_segment.duration > clip_duration:
-                            # 배경음악이 길면 자르기
-                            bgm_segment = bgm_segment.subclip(0, clip_duration)
-                        
-                        # fadeout 효과 추가 (마지막 2초)
-                        fadeout_duration = min(2.0, clip_duration * 0.2)  # 최대 2초 또는 클립 길이의 20%
-                        try:
-                            from moviepy.audio.fx.all import audio_fadeout
-                            bgm_segment = bgm_segment.fx(audio_fadeout, fadeout_duration)
-                        except (ImportError, AttributeError):
-                            try:
-                                import numpy as np
-                                def make_frame(t):
-                                    if t >= bgm_segment.duration - fadeout_duration:
-                                        fade_progress = (t - (bgm_segment.duration - fadeout_duration)) / fadeout_duration
-                                        volume_factor = 1.0 - fade_progress
-                                        return bgm_segment.get_frame(t) * volume_factor
-                                    return bgm_segment.get_frame(t)
-                                bgm_segment = bgm_segment.fl(make_frame, apply_to=['audio'])
-                            except:
-                                logger.warning("   ⚠️ fadeout 효과 적용 실패, 원본 음악 사용")
-                        
-                        # 인포그래픽 클립에 배경음악 추가
-                        info_clip_with_audio = info_clip.set_audio(bgm_segment)
-                        video_clips[clip_index] = info_clip_with_audio
-                        
-                        logger.info(f"   ✅ Part {parts[i]['part_num']} 인포그래픽에 배경음악 추가")
-                        logger.info(f"      - 오디오 길이: {bgm_segment.duration:.2f}초 (클립: {clip_duration:.2f}초)")
-                        logger.info(f"      - fadeout: {fadeout_duration:.1f}초")
-                        
-                        bgm_start_time = bgm_end_time
-                        # 배경음악이 끝나면 처음부터 다시 시작
-                        if bgm_start_time >= bgm_duration:
-                            bgm_start_time = 0
-                
-                # bgm.close()는 나중에 (렌더링 후) 호출
-                logger.info("   ✅ 배경음악 추가 완료 (인포그래픽에만)")
-        except Exception as e:
-            logger.warning(f"   ⚠️ 배경음악 추가 실패: {e}")
-            logger.warning("   배경음악 없이 진행합니다.")
-    elif background_music_path:
-        logger.warning(f"   ⚠️ 배경음악 파일을 찾을 수 없습니다: {background_music_path}")
-        logger.warning("   배경음악 없이 진행합니다.")
-    
-    logger.info("")
-    
     # 모든 클립 연결
     logger.info("🔗 모든 클립 연결 중...")
     
@@ -745,23 +719,51 @@ def create_full_episode(
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
     
-    # 렌더링
-    logger.info("🎞️ 영상 렌더링 중...")
-    logger.info(f"   해상도: {resolution[0]}x{resolution[1]}")
-    logger.info(f"   프레임레이트: {fps}fps")
-    logger.info(f"   총 길이: {final_video.duration:.2f}초 ({final_video.duration/60:.2f}분)")
-    logger.info(f"   출력 파일: {output_path}")
-    logger.info("")
-    
-    final_video.write_videofile(
-        output_path,
-        fps=fps,
-        codec='libx264',
-        audio_codec='aac',
-        bitrate='5000k',
-        audio_bitrate='320k',
-        preset='medium'
-    )
+    # 오디오 트랙 사전 믹싱 (영상 프레임 렌더링과 분리, AAC 1회 인코딩 후 그대로 mux)
+    logger.info("🎚️ 오디오 트랙 믹싱 중...")
+    mix_path = output_path_obj.with_suffix('.mix.m4a')
+    bgm_requested = bool(background_music_path and info_clip_indices)
+    mixed_audio_path = None
+    try:
+        try:
+            mixed_audio_path = build_episode_audio(
+                clip_durations=[clip.duration for clip in video_clips],
+                clip_audio_sources=clip_audio_sources,
+                info_clip_indices=info_clip_indices,
+                output_audio_path=mix_path,
+                background_music_path=background_music_path,
+                bgm_volume=bgm_volume,
+            )
+            logger.info(f"   ✅ 오디오 트랙 준비 완료: {mixed_audio_path.name}")
+        except Exception as e:
+            # 클립 오디오로 렌더링하면 인포그래픽 배경음악이 빠지므로, 배경음악이 필요하면 중단
+            if bgm_requested:
+                logger.error(f"   ❌ 오디오 믹싱 실패 (배경음악 포함 트랙을 만들 수 없음): {e}")
+                raise RuntimeError(f"오디오 트랙 믹싱 실패: {e}") from e
+            logger.warning(f"   ⚠️ 오디오 믹싱 실패, 클립 오디오로 렌더링합니다: {e}")
+        logger.info("")
+        
+        # 렌더링
+        logger.info("🎞️ 영상 렌더링 중...")
+        logger.info(f"   해상도: {resolution[0]}x{resolution[1]}")
+        logger.info(f"   프레임레이트: {fps}fps")
+        logger.info(f"   총 길이: {final_video.duration:.2f}초 ({final_video.duration/60:.2f}분)")
+        logger.info(f"   출력 파일: {output_path}")
+        logger.info("")
+        
+        final_video.write_videofile(
+            output_path,
+            fps=fps,
+            codec='libx264',
+            audio=str(mixed_audio_path) if mixed_audio_path else True,
+            audio_codec='aac',
+            bitrate='5000k',
+            audio_bitrate='320k',
+            preset='medium'
+        )
+    finally:
+        # 믹싱/렌더링 도중 실패해도 중간 오디오 파일은 남기지 않음
+        mix_path.unlink(missing_ok=True)
     
     logger.info("=" * 60)
     logger.info("✅ 전체 에피소드 영상 생성 완료!")
@@ -0,0 +1,112 @@
+"""
+YouTube Analytics 영상 단위 일괄 리포트
+
+영상마다 reports.query를 보내면(채널 ID·업로드 날짜 조회까지 포함해 영상당 2~3회)
+영상 수백 개 채널에서 수백~천 회 호출이 됩니다. 여기서는 `dimensions=video` 리포트를
+영상 ID 목록 필터(`filters=video==id1,id2,...`)로 묶어 채널 단위로 조회하고,
+결과를 카탈로그의 업로드 날짜와 로컬에서 결합합니다.
+
+- 영상 목록을 VIDEO_FILTER_LIMIT개씩 나눠 필터 (배치당 1회 + 페이지 수)
+- startIndex/maxResults 페이지네이션
+- 시작 날짜를 지정하지 않으면 배치 내 가장 이른 업로드 날짜부터 조회
+  (업로드 전에는 지표가 없으므로 영상별 "업로드일~종료일" 합계와 동일)
+- 결과는 기존 단건 응답과 같은 모양({"columnHeaders", "rows"})으로 영상별 분배
+
+사용 예:
+    reports = collect_video_reports(youtube_analytics, channel_id, videos, end_date="2026-01-31")
+    reports["abc123"]["rows"]  # [[views, likes, ...]]
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_METRICS = ['views', 'likes', 'comments', 'estimatedMinutesWatched', 'averageViewDuration']
+
+# 한 번에 필터할 영상 ID 수 / dimensions=video 리포트의 maxResults 상한
+VIDEO_FILTER_LIMIT = 200
+PAGE_SIZE = 200
+
+
+def _metric_headers(metrics: Sequence[str]) -> List[Dict]:
+    return [{'name': name, 'columnType': 'METRIC', 'dataType': 'INTEGER'} for name in metrics]
+
+
+def _earliest_publish_date(videos: Sequence[Dict], fallback: str) -> str:
+    dates = [video.get('published_at', '')[:10] for video in videos if video.get('published_at')]
+    return min(dates) if dates else fallback
+
+
+def _query_pages(analytics, **params) -> List[Dict]:
+    """startIndex 기반 페이지네이션으로 리포트 응답 전체 수집"""
+    responses = []
+    start_index = 1
+    while True:
+        response = analytics.reports().query(startIndex=start_index, maxResults=PAGE_SIZE, **params).execute()
+        responses.append(response)
+        rows = response.get('rows') or []
+        if len(rows) < PAGE_SIZE:
+            return responses
+        start_index += len(rows)
+
+
+def collect_video_reports(
+    analytics,
+    channel_id: str,
+    videos: Sequence[Dict],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    metrics: Optional[Sequence[str]] = None,
+) -> Dict[str, Dict]:
+    """
+    영상 목록의 Analytics 지표를 배치 리포트로 수집
+
+    Args:
+        analytics: youtubeAnalytics v2 서비스 객체
+        channel_id: 채널 ID
+        videos: 카탈로그 영상 목록 (video_id, published_at 필요)
+        start_date: 시작 날짜 (YYYY-MM-DD, None이면 업로드 날짜부터)
+        end_date: 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+        metrics: 지표 목록
+
+    Returns:
+        {video_id: {"columnHeaders", "rows", "startDate", "endDate"}} (지표가 없는 영상은 rows가 빈 리스트)
+    """
+    metrics = list(metrics or DEFAULT_METRICS)
+    end_date = end_date or datetime.now().strftime('%Y-%m-%d')
+    sort = '-views' if 'views' in metrics else f'-{metrics[0]}'
+    reports: Dict[str, Dict] = {}
+
+    for offset in range(0, len(videos), VIDEO_FILTER_LIMIT):
+        batch = videos[offset:offset + VIDEO_FILTER_LIMIT]
+        batch_ids = [video['video_id'] for video in batch]
+        batch_start = start_date or _earliest_publish_date(batch, end_date)
+        responses = _query_pages(
+            analytics,
+            ids=f'channel=={channel_id}',
+            startDate=batch_start,
+            endDate=end_date,
+            metrics=','.join(metrics),
+            dimensions='video',
+            filters=f"video=={','.join(batch_ids)}",
+            sort=sort,
+        )
+
+        rows_by_video: Dict[str, List] = {}
+        for response in responses:
+            names = [header.get('name') for header in response.get('columnHeaders', [])]
+            video_column = names.index('video') if 'video' in names else 0
+            for row in response.get('rows') or []:
+                rows_by_video[row[video_column]] = [value for i, value in enumerate(row) if i != video_column]
+
+        for video in batch:
+            video_id = video['video_id']
+            published = (video.get('published_at') or '')[:10]
+            row = rows_by_video.get(video_id)
+            reports[video_id] = {
+                'columnHeaders': _metric_headers(metrics),
+                'rows': [row] if row else [],
+                'startDate': max(batch_start, published) if published else batch_start,
+                'endDate': end_date,
+            }
+
+    return reports
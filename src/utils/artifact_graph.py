@@ -0,0 +1,329 @@
+"""
+콘텐츠 해시 기반 산출물 그래프 (make 방식 증분 재빌드)
+
+각 단계(요약 텍스트, TTS 오디오, 이미지 세트, 렌더링 영상, 메타데이터, 썸네일, 업로드)가
+입력 파일/상위 단계/파라미터와 출력 파일을 선언하면, 입력 내용 해시와 파라미터로
+fingerprint를 만들어 매니페스트(JSON)에 기록합니다. 같은 책을 다시 실행할 때
+fingerprint가 같고 출력이 남아 있으면 해당 단계를 건너뜁니다.
+
+- 파일 해시는 (경로, 크기, mtime) 키로 캐시하여 큰 영상도 한 번만 읽음
+- 디렉토리 입력(이미지 세트)은 하위 파일 경로+해시를 합쳐 하나의 해시로 계산
+- 상위 단계(deps)의 출력 해시가 하위 단계 fingerprint에 포함되므로,
+  상위 단계가 다시 실행돼도 출력 내용이 같으면 하위 단계는 그대로 유지
+
+단계 실행 순서는 호출하는 쪽(파이프라인)이 정합니다. 상위 단계를 먼저 실행한 뒤
+하위 단계를 확인해야 합니다.
+
+사용 예:
+    graph = ArtifactGraph(".pipeline_state/Sapiens_artifacts.json", root=PROJECT_ROOT)
+    graph.stage("images", outputs=["assets/images/Sapiens"], params={"num_mood": 100})
+    graph.stage("video_ko", inputs=["input/Sapiens_video_kr.mp4"], deps=["images"],
+                outputs=["output/Sapiens_kr.mp4"], params={"summary_duration": 5.0})
+    if graph.stale_reason("video_ko") is not None:
+        render()
+        graph.record("video_ko")
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+CACHE_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "file_hashes.json"
+
+PathLike = Union[str, Path]
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class FileHasher:
+    """(경로, 크기, mtime) 키로 SHA1을 캐시하는 파일/디렉토리 해시 계산기"""
+
+    def __init__(self, cache_path: Optional[PathLike] = CACHE_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    self._entries = {}
+        return self._entries
+
+    def save(self) -> None:
+        """변경된 해시 캐시를 디스크에 저장"""
+        with self._lock:
+            if not self.cache_path or not self._dirty:
+                return
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+
+    def hash_file(self, path: PathLike) -> Optional[str]:
+        """파일 SHA1 (파일이 없으면 None)"""
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._load().get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                self.hits += 1
+                return entry["sha1"]
+
+        digest = hashlib.sha1()
+        with open(key, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha1 = digest.hexdigest()
+
+        with self._lock:
+            self.misses += 1
+            self._load()[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": sha1}
+            self._dirty = True
+        return sha1
+
+    def hash_path(self, path: PathLike) -> Optional[str]:
+        """파일 또는 디렉토리 해시 (디렉토리는 숨김 파일 제외 하위 파일 전체)"""
+        path = Path(path)
+        if path.is_file():
+            return self.hash_file(path)
+        if not path.is_dir():
+            return None
+
+        digest = hashlib.sha1()
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(files):
+                if name.startswith("."):
+                    continue
+                file_path = Path(root) / name
+                file_hash = self.hash_file(file_path)
+                if file_hash is None:
+                    continue
+                digest.update(file_path.relative_to(path).as_posix().encode("utf-8"))
+                digest.update(b"\0")
+                digest.update(file_hash.encode("ascii"))
+                digest.update(b"\n")
+        return "dir:" + digest.hexdigest()
+
+
+@dataclass
+class Stage:
+    """산출물 그래프의 한 단계"""
+    name: str
+    inputs: List[Path] = field(default_factory=list)
+    outputs: List[Path] = field(default_factory=list)
+    params: Dict[str, Any] = field(default_factory=dict)
+    deps: List[str] = field(default_factory=list)
+
+
+class ArtifactGraph:
+    """
+    단계별 입력 해시/파라미터를 매니페스트에 기록하고 변경 여부를 판단하는 그래프
+
+    Args:
+        manifest_path: 단계 기록을 저장할 JSON 경로 (None이면 메모리에만 유지)
+        root: 매니페스트에 상대 경로로 기록할 기준 디렉토리
+        hasher: 파일 해시 계산기 (기본: 프로세스 공유 FileHasher)
+    """
+
+    def __init__(self, manifest_path: Optional[PathLike], root: Optional[PathLike] = None,
+                 hasher: Optional[FileHasher] = None):
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.root = Path(root).resolve() if root else None
+        self.hasher = hasher or get_file_hasher()
+        self.stages: Dict[str, Stage] = {}
+        self._records: Dict[str, Dict] = {}
+        if self.manifest_path and self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self._records = json.load(f).get("stages", {})
+            except (OSError, json.JSONDecodeError):
+                self._records = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.stages
+
+    def _abs(self, path: PathLike) -> Path:
+        path = Path(path)
+        if not path.is_absolute() and self.root:
+            path = self.root / path
+        return path
+
+    def _key(self, path: Path) -> str:
+        if self.root:
+            try:
+                return path.resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return str(path)
+
+    def stage(self, name: str, inputs: Optional[List[PathLike]] = None,
+              outputs: Optional[List[PathLike]] = None, params: Optional[Dict[str, Any]] = None,
+              deps: Optional[List[str]] = None) -> Stage:
+        """단계 선언 (같은 이름으로 다시 선언하면 덮어씀)"""
+        for dep in deps or []:
+            if dep not in self.stages:
+                raise ValueError(f"알 수 없는 상위 단계: {dep} (단계 '{name}' 선언 전에 먼저 선언하세요)")
+        stage = Stage(
+            name=name,
+            inputs=[self._abs(p) for p in inputs or []],
+            outputs=[self._abs(p) for p in outputs or []],
+            params=dict(params or {}),
+            deps=list(deps or []),
+        )
+        self.stages[name] = stage
+        return stage
+
+    def _hash_paths(self, paths: List[Path]) -> Dict[str, Optional[str]]:
+        return {self._key(p): self.hasher.hash_path(p) for p in paths}
+
+    def _fingerprint_parts(self, name: str) -> Dict[str, Any]:
+        stage = self.stages[name]
+        return {
+            "params": stage.params,
+            "inputs": self._hash_paths(stage.inputs),
+            "deps": {dep: self._hash_paths(self.stages[dep].outputs) for dep in stage.deps},
+        }
+
+    def fingerprint(self, name: str) -> str:
+        """파라미터 + 입력 해시 + 상위 단계 출력 해시로 만든 단계 fingerprint"""
+        payload = json.dumps(self._fingerprint_parts(name), sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def has_record(self, name: str) -> bool:
+        return name in self._records
+
+    def get_record(self, name: str) -> Optional[Dict]:
+        return self._records.get(name)
+
+    def stale_reason(self, name: str) -> Optional[str]:
+        """
+        단계를 다시 실행해야 하는 이유 (최신 상태면 None)
+        """
+        stage = self.stages[name]
+        record = self._records.get(name)
+        if record is None:
+            return "기록 없음"
+        for path in stage.outputs:
+            if not path.exists():
+                return f"출력 없음: {self._key(path)}"
+        if record.get("fingerprint") == self.fingerprint(name):
+            return None
+
+        previous = record.get("parts", {})
+        current = self._fingerprint_parts(name)
+        if previous.get("params") != current["params"]:
+            changed = sorted(
+                k for k in set(previous.get("params", {})) | set(current["params"])
+                if previous.get("params", {}).get(k) != current["params"].get(k)
+            )
+            return f"파라미터 변경: {', '.join(changed)}"
+        for key, value in current["inputs"].items():
+            if previous.get("inputs", {}).get(key) != value:
+                return f"입력 변경: {key}"
+        for dep, hashes in current["deps"].items():
+            if previous.get("deps", {}).get(dep) != hashes:
+                return f"상위 단계 변경: {dep}"
+        return "입력 변경"
+
+    def is_up_to_date(self, name: str) -> bool:
+        return self.stale_reason(name) is None
+
+    def record(self, name: str, result: Any = None) -> str:
+        """
+        단계 실행 결과 기록 (현재 입력/출력 해시 기준)
+
+        Returns:
+            기록된 fingerprint
+        """
+        stage = self.stages[name]
+        parts = self._fingerprint_parts(name)
+        fingerprint = self.fingerprint(name)
+        self._records[name] = {
+            "fingerprint": fingerprint,
+            "parts": parts,
+            "outputs": self._hash_paths(stage.outputs),
+            "result": result,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        self.save()
+        return fingerprint
+
+    def invalidate(self, name: str) -> None:
+        """단계 기록 삭제 (다음 실행 때 다시 빌드)"""
+        if self._records.pop(name, None) is not None:
+            self.save()
+
+    def clean(self, name: str) -> List[Path]:
+        """단계 출력 파일 삭제 + 기록 삭제 (파생 산출물을 다시 생성시키기 위함)"""
+        removed = []
+        for path in self.stages[name].outputs:
+            if path.is_file():
+                path.unlink()
+                removed.append(path)
+        self.invalidate(name)
+        return removed
+
+    def plan(self) -> List[Tuple[str, str]]:
+        """다시 실행해야 할 (단계, 이유) 목록 (선언 순서)"""
+        plan = []
+        for name in self.stages:
+            reason = self.stale_reason(name)
+            if reason is not None:
+                plan.append((name, reason))
+        return plan
+
+    def run(self, name: str, build: Callable[[], Any], force: bool = False) -> Tuple[bool, Any]:
+        """
+        단계가 최신이 아니면 build()를 실행하고 기록
+
+        Returns:
+            (실제로 실행했는지, 결과) — 건너뛴 경우 이전에 기록된 결과
+        """
+        if not force and self.is_up_to_date(name):
+            return False, self._records[name].get("result")
+        result = build()
+        self.record(name, result)
+        return True, result
+
+    def save(self) -> None:
+        self.hasher.save()
+        if not self.manifest_path:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"stages": self._records}, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+
+_default_hasher: Optional[FileHasher] = None
+_default_hasher_lock = threading.Lock()
+
+
+def get_file_hasher() -> FileHasher:
+    """기본 FileHasher 인스턴스 반환 (프로세스 내 캐시 공유)"""
+    global _default_hasher
+    with _default_hasher_lock:
+        if _default_hasher is None:
+            _default_hasher = FileHasher()
+        return _default_hasher
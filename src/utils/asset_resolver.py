@@ -0,0 +1,194 @@
+"""
+에셋 경로 해석기 (캐시)
+
+요약 오디오 / NotebookLM 영상 / 리뷰 오디오 / 썸네일을 찾을 때 후보 경로마다
+`Path.exists()`를 호출하는 대신, 디렉토리 목록을 한 번 읽어 인덱스로 만들어 둡니다.
+
+- 디렉토리별 목록 캐시: 디렉토리 mtime이 바뀌면(파일 추가/삭제/이름 변경) 다시 읽음
+- `{제목}_{종류}_{언어}.{확장자}` 파일명은 (제목, 종류, 언어) 키로 바로 조회
+- 언어 접미사 kr/ko 호환, 영문/한글 Safe Title 모두 조회
+
+사용 예:
+    from utils.asset_resolver import get_asset_resolver
+    resolver = get_asset_resolver()
+    audio = resolver.summary_audio("사피엔스", "ko")
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from utils.file_utils import get_standard_safe_title, safe_title
+except ImportError:
+    from src.utils.file_utils import get_standard_safe_title, safe_title
+
+ASSET_NAME_RE = re.compile(
+    r"^(?P<title>.+)_(?P<kind>summary|longform|review|notebooklm|thumbnail)_(?P<lang>kr|ko|en)\.(?P<ext>[A-Za-z0-9]+)$"
+)
+
+AUDIO_DIR = Path("assets/audio")
+VIDEO_DIR = Path("assets/video")
+
+
+def lang_suffixes(lang: str) -> Tuple[str, ...]:
+    """파일명 언어 접미사 후보 (한국어는 kr 우선, 호환용 ko)"""
+    return ("kr", "ko") if lang in ("ko", "kr") else ("en",)
+
+
+class _DirectoryListing:
+    """디렉토리 한 개의 파일 목록 스냅샷"""
+
+    __slots__ = ("mtime_ns", "names", "assets")
+
+    def __init__(self, path: str, mtime_ns: int):
+        self.mtime_ns = mtime_ns
+        with os.scandir(path) as it:
+            self.names = frozenset(entry.name for entry in it)
+        self.assets: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        for name in self.names:
+            match = ASSET_NAME_RE.match(name)
+            if match:
+                key = (match["title"], match["kind"], match["lang"])
+                self.assets.setdefault(key, {})["." + match["ext"].lower()] = name
+
+
+class AssetResolver:
+    """디렉토리 목록 인덱스 기반 에셋 조회"""
+
+    def __init__(self):
+        self._listings: Dict[str, _DirectoryListing] = {}
+        self._lock = threading.Lock()
+
+    def _listing(self, directory: Path) -> Optional[_DirectoryListing]:
+        key = os.path.abspath(directory)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is None or listing.mtime_ns != mtime_ns:
+                try:
+                    listing = _DirectoryListing(key, mtime_ns)
+                except OSError:
+                    return None
+                self._listings[key] = listing
+            return listing
+
+    def invalidate(self, directory: Optional[Path] = None) -> None:
+        """캐시 무효화 (directory가 None이면 전체)"""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(os.path.abspath(directory), None)
+
+    # ------------------------------------------------------------------
+    # 일반 조회
+    # ------------------------------------------------------------------
+
+    def exists(self, path: Path) -> bool:
+        """경로 존재 여부 (부모 디렉토리 인덱스 사용)"""
+        path = Path(path)
+        listing = self._listing(path.parent)
+        return listing is not None and path.name in listing.names
+
+    def first_existing(self, paths: Iterable[Path]) -> Optional[Path]:
+        """후보 중 처음으로 존재하는 경로"""
+        for path in paths:
+            if self.exists(path):
+                return Path(path)
+        return None
+
+    def find(
+        self,
+        directory: Path,
+        titles: Sequence[str],
+        kinds: Sequence[str],
+        langs: Sequence[str],
+        exts: Sequence[str],
+    ) -> Optional[Path]:
+        """
+        `{제목}_{종류}_{언어}{확장자}` 에셋 조회
+
+        우선순위: 확장자 → 언어 → 제목 → 종류 순서대로 앞쪽 후보 우선
+        """
+        listing = self._listing(directory)
+        if listing is None:
+            return None
+        titles = list(dict.fromkeys(t for t in titles if t))
+        for ext in exts:
+            for lang in langs:
+                for title in titles:
+                    for kind in kinds:
+                        name = listing.assets.get((title, kind, lang), {}).get(ext)
+                        if name:
+                            return Path(directory) / name
+        return None
+
+    # ------------------------------------------------------------------
+    # 책 단위 조회
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def title_candidates(book_title: Optional[str] = None, safe_title_str: Optional[str] = None) -> List[str]:
+        """조회할 Safe Title 후보 (표준 영문 → 원제목 기반)"""
+        candidates = []
+        if safe_title_str:
+            candidates.append(safe_title_str)
+        if book_title:
+            candidates.append(get_standard_safe_title(book_title))
+            candidates.append(safe_title(book_title))
+        return list(dict.fromkeys(candidates))
+
+    def summary_audio(self, book_title: Optional[str], lang: str, safe_title_str: Optional[str] = None) -> Optional[Path]:
+        """요약 오디오 (summary 우선, longform 호환)"""
+        return self.find(
+            AUDIO_DIR, self.title_candidates(book_title, safe_title_str),
+            ("summary", "longform"), lang_suffixes(lang), (".mp3",),
+        )
+
+    def review_audio(self, book_title: Optional[str], lang: str, safe_title_str: Optional[str] = None) -> Optional[Path]:
+        """리뷰 오디오 (m4a 우선, mp3/wav 호환)"""
+        return self.find(
+            AUDIO_DIR, self.title_candidates(book_title, safe_title_str),
+            ("review",), lang_suffixes(lang), (".m4a", ".mp3", ".wav"),
+        )
+
+    def notebooklm_video(self, book_title: Optional[str], lang: str, safe_title_str: Optional[str] = None) -> Optional[Path]:
+        """NotebookLM 영상"""
+        return self.find(
+            VIDEO_DIR, self.title_candidates(book_title, safe_title_str),
+            ("notebooklm",), lang_suffixes(lang), (".mp4",),
+        )
+
+    def thumbnail(self, directory: Path, titles: Sequence[str], lang: str) -> Optional[Path]:
+        """
+        썸네일 조회
+
+        우선순위: 제목 후보 순서대로 `{제목}_thumbnail_{언어}` (jpg → png)
+        → 첫 번째 제목의 언어 구분 없는 `{제목}_thumbnail`
+        """
+        for title in titles:
+            found = self.find(directory, [title], ("thumbnail",), lang_suffixes(lang), (".jpg", ".png"))
+            if found:
+                return found
+        return self.first_existing(
+            Path(directory) / f"{title}_thumbnail{ext}" for title in titles[:1] for ext in (".jpg", ".png")
+        )
+
+
+_default_resolver: Optional[AssetResolver] = None
+_default_resolver_lock = threading.Lock()
+
+
+def get_asset_resolver() -> AssetResolver:
+    """기본 AssetResolver 인스턴스 반환 (프로세스 내 디렉토리 인덱스 공유)"""
+    global _default_resolver
+    with _default_resolver_lock:
+        if _default_resolver is None:
+            _default_resolver = AssetResolver()
+        return _default_resolver
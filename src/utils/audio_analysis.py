@@ -0,0 +1,223 @@
+"""
+스트리밍 오디오 분석 (RMS/피크 envelope)
+
+`AudioFileClip.to_soundarray()`는 트랙 전체를 float64 스테레오로 메모리에 올립니다
+(20분 요약이면 수백 MB). 여기서는 ffmpeg 파이프로 모노 float32 PCM을 청크 단위로 받아
+한 번의 패스로 프레임별 RMS/피크 envelope을 계산하고, 오디오 파일 옆에
+작은 `.npy` 파일로 캐시합니다 (memmap으로 로드).
+
+파형 시각화, BGM 더킹, 음량 분석은 원본 PCM 대신 envelope을 사용합니다.
+
+사용 예:
+    from utils.audio_analysis import load_envelope
+    env = load_envelope("assets/audio/Sapiens_summary_kr.mp3")
+    rms, peak = env.window(10.0, 10.5)
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from utils.media_probe import get_ffmpeg_binary
+except ImportError:
+    from src.utils.media_probe import get_ffmpeg_binary
+
+PathLike = Union[str, Path]
+
+# 분석용 디코딩 샘플레이트 (envelope 해상도에는 충분하고 디코딩/메모리 부담은 절반)
+ANALYSIS_SAMPLE_RATE = 22050
+# envelope 프레임레이트 (10ms 단위, 20분 트랙 ≈ 120,000프레임 × 2 × float32 ≈ 1MB)
+ENVELOPE_FRAME_RATE = 100
+# 파이프에서 한 번에 읽을 길이 (초)
+CHUNK_SECONDS = 10.0
+# 무음 취급 dBFS 하한
+SILENCE_DB = -90.0
+
+
+def decode_mono_chunks(
+    audio_path: PathLike,
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    chunk_seconds: float = CHUNK_SECONDS,
+) -> Iterator[np.ndarray]:
+    """
+    ffmpeg 파이프로 모노 float32 PCM을 청크 단위로 디코딩
+
+    Yields:
+        float32 1차원 배열 (마지막 청크는 더 짧을 수 있음)
+
+    Raises:
+        FileNotFoundError: 오디오 파일이나 ffmpeg가 없을 때
+        RuntimeError: ffmpeg 디코딩 실패
+    """
+    if not Path(audio_path).exists():
+        raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {audio_path}")
+    ffmpeg = get_ffmpeg_binary()
+    if not ffmpeg:
+        raise FileNotFoundError("ffmpeg를 찾을 수 없습니다 (pip install imageio-ffmpeg)")
+
+    chunk_bytes = max(1, int(sample_rate * chunk_seconds)) * 4
+    process = subprocess.Popen(
+        [ffmpeg, "-v", "error", "-nostdin", "-i", str(audio_path), "-vn",
+         "-ac", "1", "-ar", str(sample_rate), "-f", "f32le", "pipe:1"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    try:
+        pending = b""
+        while True:
+            data = process.stdout.read(chunk_bytes)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % 4
+            pending = data[usable:]
+            if usable:
+                yield np.frombuffer(data[:usable], dtype=np.float32)
+        stderr = process.stderr.read()
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg 디코딩 실패 ({audio_path}): {stderr.decode(errors='ignore').strip()[:200]}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
+
+
+@dataclass
+class AudioEnvelope:
+    """프레임별 RMS/피크 envelope (값 범위 0..1, float32)"""
+    rms: np.ndarray
+    peak: np.ndarray
+    frame_rate: float = ENVELOPE_FRAME_RATE
+
+    @property
+    def num_frames(self) -> int:
+        return len(self.rms)
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / self.frame_rate
+
+    def frame_index(self, t: float) -> int:
+        """시각(초) → 프레임 인덱스 (범위 내로 제한)"""
+        return int(min(max(t * self.frame_rate, 0), max(self.num_frames - 1, 0)))
+
+    def window(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """[start, end) 구간의 (rms, peak) 프레임 (최소 1프레임)"""
+        i0 = self.frame_index(start)
+        i1 = max(i0 + 1, int(np.ceil(end * self.frame_rate)))
+        return self.rms[i0:i1], self.peak[i0:i1]
+
+    def loudness_db(self, start: float = 0.0, end: Optional[float] = None) -> float:
+        """구간 평균 RMS 음량 (dBFS)"""
+        rms, _ = self.window(start, self.duration if end is None else end)
+        power = float(np.mean(np.square(rms, dtype=np.float64))) if len(rms) else 0.0
+        return max(SILENCE_DB, 10.0 * np.log10(power)) if power > 0 else SILENCE_DB
+
+    def rms_db(self) -> np.ndarray:
+        """프레임별 RMS (dBFS)"""
+        with np.errstate(divide="ignore"):
+            return np.maximum(20.0 * np.log10(np.asarray(self.rms, dtype=np.float32)), SILENCE_DB)
+
+    def ducking_gain(
+        self,
+        threshold_db: float = -40.0,
+        duck_db: float = -12.0,
+        attack: float = 0.05,
+        release: float = 0.4,
+    ) -> np.ndarray:
+        """
+        내레이션 envelope 기반 BGM 더킹 게인 (프레임별 선형 배율)
+
+        내레이션이 threshold_db를 넘는 프레임에서 duck_db만큼 줄이고,
+        attack/release(초) 동안 부드럽게 변하도록 1차 평활화합니다.
+        """
+        active = self.rms_db() > threshold_db
+        target = np.where(active, 10.0 ** (duck_db / 20.0), 1.0).astype(np.float32)
+        attack_coef = float(np.exp(-1.0 / max(attack * self.frame_rate, 1e-6)))
+        release_coef = float(np.exp(-1.0 / max(release * self.frame_rate, 1e-6)))
+
+        gain = np.empty_like(target)
+        current = 1.0
+        for i, value in enumerate(target):
+            coef = attack_coef if value < current else release_coef
+            current = value + (current - value) * coef
+            gain[i] = current
+        return gain
+
+
+def compute_envelope(
+    audio_path: PathLike,
+    frame_rate: float = ENVELOPE_FRAME_RATE,
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    chunk_seconds: float = CHUNK_SECONDS,
+) -> AudioEnvelope:
+    """스트리밍 한 패스로 RMS/피크 envelope 계산 (전체 PCM을 메모리에 올리지 않음)"""
+    hop = max(1, int(round(sample_rate / frame_rate)))
+    rms_parts, peak_parts = [], []
+    carry = np.empty(0, dtype=np.float32)
+
+    for chunk in decode_mono_chunks(audio_path, sample_rate, chunk_seconds):
+        if len(carry):
+            chunk = np.concatenate([carry, chunk])
+        usable = len(chunk) - len(chunk) % hop
+        if usable:
+            frames = chunk[:usable].reshape(-1, hop)
+            rms_parts.append(np.sqrt(np.mean(np.square(frames), axis=1)))
+            peak_parts.append(np.max(np.abs(frames), axis=1))
+        carry = chunk[usable:]
+
+    if len(carry):
+        rms_parts.append(np.array([np.sqrt(np.mean(np.square(carry)))], dtype=np.float32))
+        peak_parts.append(np.array([np.max(np.abs(carry))], dtype=np.float32))
+
+    if not rms_parts:
+        return AudioEnvelope(np.zeros(0, np.float32), np.zeros(0, np.float32), sample_rate / hop)
+    return AudioEnvelope(
+        rms=np.concatenate(rms_parts).astype(np.float32, copy=False),
+        peak=np.concatenate(peak_parts).astype(np.float32, copy=False),
+        frame_rate=sample_rate / hop,
+    )
+
+
+def envelope_cache_path(audio_path: PathLike, frame_rate: float = ENVELOPE_FRAME_RATE) -> Path:
+    """오디오 파일 옆 envelope 캐시 경로 (예: Sapiens_summary_kr.mp3.env100.npy)"""
+    audio_path = Path(audio_path)
+    return audio_path.with_name(f"{audio_path.name}.env{int(frame_rate)}.npy")
+
+
+def load_envelope(
+    audio_path: PathLike,
+    frame_rate: float = ENVELOPE_FRAME_RATE,
+    use_cache: bool = True,
+) -> AudioEnvelope:
+    """
+    envelope 조회 (오디오보다 새로운 캐시가 있으면 memmap으로 로드, 없으면 계산 후 저장)
+
+    캐시 파일은 shape (2, N) float32 배열: [rms, peak]
+    """
+    audio_path = Path(audio_path)
+    cache_path = envelope_cache_path(audio_path, frame_rate)
+    if use_cache:
+        try:
+            if cache_path.stat().st_mtime_ns >= audio_path.stat().st_mtime_ns:
+                data = np.load(cache_path, mmap_mode="r")
+                hop = max(1, int(round(ANALYSIS_SAMPLE_RATE / frame_rate)))
+                return AudioEnvelope(rms=data[0], peak=data[1], frame_rate=ANALYSIS_SAMPLE_RATE / hop)
+        except (OSError, ValueError):
+            pass
+
+    envelope = compute_envelope(audio_path, frame_rate=frame_rate)
+    if use_cache:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp.npy")
+        try:
+            np.save(tmp_path, np.stack([envelope.rms, envelope.peak]))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    return envelope
@@ -0,0 +1,122 @@
+"""
+무손실 오디오 마스터 관리
+
+TTS 결과를 MP3로 저장하면 청크 연결 시 다시 MP3로 재인코딩되고, 이후 길이 조회·Whisper·
+파형 분석·최종 mux(AAC 재인코딩)까지 매번 MP3를 디코딩하며 MP3→AAC 세대 손실이 생깁니다.
+여기서는 책/언어별 요약 오디오의 기준본을 무손실 FLAC 마스터(`{이름}.flac`)로 두고,
+MP3/AAC는 마스터에서 한 번만 인코딩하는 배포용 출력으로만 만듭니다.
+
+- master_path_for: 배포 경로(예: Sapiens_summary_kr.mp3) → 마스터 경로(Sapiens_summary_kr.flac)
+- resolve_master: 분석/렌더링 입력으로 쓸 경로 (최신 마스터가 있으면 마스터)
+- build_master: 청크 오디오들을 샘플 단위로 이어 붙여 FLAC 마스터 저장
+- export_delivery: 마스터에서 배포용 MP3/AAC 한 번 인코딩
+
+사용 예:
+    master = build_master(chunk_paths, master_path_for("assets/audio/Sapiens_summary_kr.mp3"))
+    export_delivery(master, "assets/audio/Sapiens_summary_kr.mp3")
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Sequence, Union
+
+try:
+    from utils.audio_mixer import CODECS_BY_SUFFIX, AudioMixer
+    from utils.media_probe import get_ffmpeg_binary
+except ImportError:
+    from src.utils.audio_mixer import CODECS_BY_SUFFIX, AudioMixer
+    from src.utils.media_probe import get_ffmpeg_binary
+
+PathLike = Union[str, Path]
+
+MASTER_SUFFIX = ".flac"
+# TTS 제공자(OpenAI/Google Neural2/xtts) 출력이 24kHz 모노 → 리샘플링 없이 보관
+MASTER_SAMPLE_RATE = 24000
+MASTER_CHANNELS = 1
+# 마스터 대신 배포용으로만 만드는 손실 포맷
+LOSSY_SUFFIXES = (".mp3", ".m4a", ".aac")
+
+
+def master_path_for(audio_path: PathLike) -> Path:
+    """배포용 오디오 경로에 대응하는 마스터 경로 (이미 무손실이면 그대로)"""
+    audio_path = Path(audio_path)
+    if audio_path.suffix.lower() in LOSSY_SUFFIXES:
+        return audio_path.with_suffix(MASTER_SUFFIX)
+    return audio_path
+
+
+def resolve_master(audio_path: PathLike) -> Path:
+    """
+    디코딩 입력으로 사용할 경로
+
+    배포본보다 오래되지 않은 마스터가 있으면 마스터, 아니면 원래 경로
+    (마스터 없이 직접 준비한 MP3도 그대로 동작)
+    """
+    audio_path = Path(audio_path)
+    master = master_path_for(audio_path)
+    if master == audio_path:
+        return audio_path
+    try:
+        master_mtime = master.stat().st_mtime_ns
+    except OSError:
+        return audio_path
+    try:
+        if audio_path.stat().st_mtime_ns > master_mtime:
+            return audio_path
+    except OSError:
+        pass
+    return master
+
+
+def build_master(chunk_paths: Sequence[PathLike], master_path: PathLike, remove_chunks: bool = True) -> Path:
+    """
+    청크 오디오들을 순서대로 이어 붙여 무손실 마스터로 저장 (원자적 교체)
+
+    Args:
+        chunk_paths: TTS 청크 파일 (FLAC/WAV 등 무손실 권장)
+        master_path: 저장 경로 (.flac, .wav)
+        remove_chunks: 저장 후 청크 파일 삭제
+    """
+    if not chunk_paths:
+        raise ValueError("마스터로 만들 오디오 청크가 없습니다.")
+    master_path = Path(master_path)
+    mixer = AudioMixer(sample_rate=MASTER_SAMPLE_RATE, channels=MASTER_CHANNELS)
+    cursor = 0
+    for chunk in chunk_paths:
+        track = mixer.add(chunk, start=cursor / mixer.sample_rate)
+        cursor = track.end
+
+    tmp_path = master_path.with_name(f"{master_path.stem}.{os.getpid()}.tmp{master_path.suffix}")
+    try:
+        mixer.export(tmp_path)
+        os.replace(tmp_path, master_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    if remove_chunks:
+        for chunk in chunk_paths:
+            if Path(chunk) != master_path:
+                Path(chunk).unlink(missing_ok=True)
+    return master_path
+
+
+def export_delivery(master_path: PathLike, output_path: PathLike, bitrate: str = "192k") -> Path:
+    """마스터에서 배포용 오디오(MP3/AAC) 인코딩"""
+    ffmpeg = get_ffmpeg_binary()
+    if not ffmpeg:
+        raise FileNotFoundError("ffmpeg를 찾을 수 없습니다 (pip install imageio-ffmpeg)")
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    codec = CODECS_BY_SUFFIX.get(output_path.suffix.lower(), "aac")
+    result = subprocess.run(
+        [ffmpeg, "-y", "-v", "error", "-nostdin", "-i", str(master_path), "-vn",
+         "-c:a", codec, "-b:a", bitrate, str(output_path)],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"배포용 오디오 인코딩 실패 ({output_path}): {result.stderr.decode(errors='ignore').strip()[:200]}")
+    # 배포본 mtime을 마스터에 맞춤 → 이후 배포본만 직접 교체된 경우에만 resolve_master가 배포본을 선택
+    master_stat = Path(master_path).stat()
+    os.utime(output_path, ns=(master_stat.st_atime_ns, master_stat.st_mtime_ns))
+    return output_path
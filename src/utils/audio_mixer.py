@@ -0,0 +1,317 @@
+"""
+NumPy PCM 오디오 믹서
+
+MoviePy 오디오 합성은 프레임마다 파이썬 콜백(get_frame/volumex/fade)을 거치고,
+무음/반복 구간도 AudioArrayClip·concatenate_audioclips로 복사본을 만듭니다.
+여기서는 디코딩된 PCM 버퍼(float32)를 타임라인에 샘플 단위로 배치하고,
+블록 단위로 섞어서 ffmpeg에 한 번만 인코딩(AAC 등)합니다.
+
+- 샘플 단위 배치 (start/offset/duration → 샘플 인덱스)
+- 반복(loop)은 원본 버퍼를 인덱스로 순환 참조 (복사 없음)
+- 트랙별 게인, 페이드 인/아웃, 내레이션 envelope 기반 BGM 더킹
+- 결과는 블록 단위로 ffmpeg stdin에 흘려보내 한 번만 인코딩
+
+사용 예:
+    mixer = AudioMixer()
+    voice = mixer.add("assets/audio/Sapiens_summary_kr.mp3", start=0.0)
+    bgm = mixer.add("input/bgm.mp3", start=0.0, duration=mixer.duration, gain=0.3, loop=True)
+    mixer.duck(bgm, under=[voice])
+    mixer.export("output/Sapiens_mix.m4a", bitrate="320k")
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from utils.audio_analysis import AudioEnvelope
+    from utils.media_probe import get_ffmpeg_binary
+except ImportError:
+    from src.utils.audio_analysis import AudioEnvelope
+    from src.utils.media_probe import get_ffmpeg_binary
+
+PathLike = Union[str, Path]
+
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_CHANNELS = 2
+# 렌더링/인코딩 블록 길이 (초)
+BLOCK_SECONDS = 5.0
+# 더킹 envelope 프레임레이트 (audio_analysis와 동일한 10ms 단위)
+DUCK_FRAME_RATE = 100
+
+# 출력 확장자별 ffmpeg 오디오 코덱
+CODECS_BY_SUFFIX = {
+    ".mp3": "libmp3lame",
+    ".wav": "pcm_s16le",
+    ".flac": "flac",
+    ".m4a": "aac",
+    ".aac": "aac",
+    ".mp4": "aac",
+}
+
+
+def decode_pcm(audio_path: PathLike, sample_rate: int = DEFAULT_SAMPLE_RATE,
+               channels: int = DEFAULT_CHANNELS) -> np.ndarray:
+    """
+    오디오(또는 영상의 오디오 트랙)를 float32 PCM으로 디코딩
+
+    Returns:
+        shape (samples, channels) float32 배열
+
+    Raises:
+        FileNotFoundError: 파일이나 ffmpeg가 없을 때
+        RuntimeError: 디코딩 실패 (오디오 트랙 없음 포함)
+    """
+    if not Path(audio_path).exists():
+        raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {audio_path}")
+    ffmpeg = get_ffmpeg_binary()
+    if not ffmpeg:
+        raise FileNotFoundError("ffmpeg를 찾을 수 없습니다 (pip install imageio-ffmpeg)")
+
+    result = subprocess.run(
+        [ffmpeg, "-v", "error", "-nostdin", "-i", str(audio_path), "-vn",
+         "-ac", str(channels), "-ar", str(sample_rate), "-f", "f32le", "pipe:1"],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"오디오 디코딩 실패 ({audio_path}): {result.stderr.decode(errors='ignore').strip()[:200]}")
+    data = np.frombuffer(result.stdout, dtype=np.float32)
+    return data[: len(data) - len(data) % channels].reshape(-1, channels)
+
+
+@dataclass
+class Track:
+    """타임라인에 배치된 오디오 소스"""
+    data: np.ndarray            # (samples, channels) 원본 버퍼 (view)
+    start: int                  # 타임라인 시작 샘플
+    length: int                 # 재생 샘플 수
+    offset: int = 0             # 소스 내 시작 샘플 (loop일 때 순환 기준)
+    gain: float = 1.0
+    loop: bool = False
+    fade_in: int = 0            # 샘플 수
+    fade_out: int = 0
+    gain_curve: Optional[Tuple[float, np.ndarray]] = None  # (frame_rate, 타임라인 기준 게인)
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+    def samples(self, begin: int, end: int) -> np.ndarray:
+        """타임라인 [begin, end) 구간에 해당하는 게인 적용 전 샘플"""
+        src_begin = begin - self.start + self.offset
+        src_end = end - self.start + self.offset
+        if not self.loop or (src_begin < len(self.data) and src_end <= len(self.data)):
+            return self.data[src_begin:src_end]
+        indices = np.arange(src_begin, src_end) % len(self.data)
+        return self.data[indices]
+
+    def gains(self, begin: int, end: int, sample_rate: int) -> Union[float, np.ndarray]:
+        """타임라인 [begin, end) 구간의 샘플별 게인 (변화가 없으면 스칼라)"""
+        local = None
+        gain: Union[float, np.ndarray] = self.gain
+        if self.fade_in or self.fade_out or self.gain_curve is not None:
+            local = np.arange(begin - self.start, end - self.start, dtype=np.float64)
+            curve = np.ones(len(local), dtype=np.float32)
+            if self.fade_in:
+                curve *= np.clip(local / self.fade_in, 0.0, 1.0)
+            if self.fade_out:
+                curve *= np.clip((self.length - local) / self.fade_out, 0.0, 1.0)
+            if self.gain_curve is not None:
+                frame_rate, values = self.gain_curve
+                times = (local + self.start) / sample_rate
+                frame_times = np.arange(len(values)) / frame_rate
+                curve *= np.interp(times, frame_times, values).astype(np.float32)
+            gain = curve * self.gain
+        return gain
+
+
+class AudioMixer:
+    """디코딩된 PCM 버퍼를 타임라인에 배치해 섞는 믹서"""
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = DEFAULT_CHANNELS):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.tracks: List[Track] = []
+        self._min_length = 0
+        self._sources: Dict[str, np.ndarray] = {}
+
+    def to_samples(self, seconds: float) -> int:
+        return int(round(seconds * self.sample_rate))
+
+    @property
+    def length(self) -> int:
+        """타임라인 길이 (샘플)"""
+        return max(max((t.end for t in self.tracks), default=0), self._min_length)
+
+    @property
+    def duration(self) -> float:
+        return self.length / self.sample_rate
+
+    def extend_to(self, seconds: float) -> None:
+        """타임라인을 최소 seconds 길이로 확장 (뒤쪽은 무음)"""
+        self._min_length = max(self._min_length, self.to_samples(seconds))
+
+    def load(self, source: Union[PathLike, np.ndarray]) -> np.ndarray:
+        """소스 PCM 반환 (파일은 경로별 1회만 디코딩)"""
+        if isinstance(source, np.ndarray):
+            data = source.astype(np.float32, copy=False)
+            if data.ndim == 1:
+                data = data[:, None]
+            if data.shape[1] != self.channels:
+                data = np.repeat(data[:, :1], self.channels, axis=1) if data.shape[1] == 1 else data[:, :self.channels]
+            return data
+        key = os.path.abspath(source)
+        if key not in self._sources:
+            self._sources[key] = decode_pcm(source, self.sample_rate, self.channels)
+        return self._sources[key]
+
+    def add(
+        self,
+        source: Union[PathLike, np.ndarray],
+        start: float = 0.0,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+        gain: float = 1.0,
+        loop: bool = False,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0,
+    ) -> Track:
+        """
+        소스를 타임라인에 배치
+
+        Args:
+            source: 파일 경로 또는 PCM 배열 (samples[, channels])
+            start: 타임라인 시작 시각 (초)
+            offset: 소스 내 시작 위치 (초, loop이면 소스 길이로 순환)
+            duration: 재생 길이 (초, None이면 소스 끝까지)
+            gain: 선형 게인
+            loop: duration이 남으면 소스를 처음부터 반복 (복사 없이 인덱스 순환)
+            fade_in / fade_out: 페이드 길이 (초)
+        """
+        data = self.load(source)
+        if len(data) == 0:
+            raise ValueError("빈 오디오 소스는 배치할 수 없습니다")
+        offset_samples = self.to_samples(offset)
+        if loop:
+            # 원본 버퍼는 그대로 두고 offset부터 인덱스를 순환
+            offset_samples %= len(data)
+        else:
+            data = data[offset_samples:]
+            offset_samples = 0
+
+        if duration is None:
+            length = len(data) - offset_samples
+        else:
+            length = self.to_samples(duration)
+            if not loop:
+                length = min(length, len(data))
+
+        track = Track(
+            data=data,
+            start=self.to_samples(start),
+            length=length,
+            offset=offset_samples,
+            gain=gain,
+            loop=loop,
+            fade_in=min(self.to_samples(fade_in), length),
+            fade_out=min(self.to_samples(fade_out), length),
+        )
+        self.tracks.append(track)
+        return track
+
+    def duck(
+        self,
+        track: Track,
+        under: Sequence[Track],
+        threshold_db: float = -40.0,
+        duck_db: float = -12.0,
+        attack: float = 0.05,
+        release: float = 0.4,
+    ) -> None:
+        """
+        under 트랙(내레이션)이 들릴 때 track(BGM) 게인을 낮춤
+
+        내레이션 RMS envelope(10ms)을 타임라인 기준으로 만들어
+        AudioEnvelope.ducking_gain으로 부드러운 게인 곡선을 계산합니다.
+        """
+        hop = max(1, self.sample_rate // DUCK_FRAME_RATE)
+        frame_rate = self.sample_rate / hop
+        num_frames = self.length // hop + 1
+        rms = np.zeros(num_frames, dtype=np.float32)
+        for voice in under:
+            begin = voice.start - voice.start % hop
+            for block_start in range(begin, voice.end, hop * 1000):
+                block_end = min(voice.end, block_start + hop * 1000)
+                lo = max(block_start, voice.start)
+                mono = np.zeros(block_end - block_start, dtype=np.float32)
+                mono[lo - block_start:] = voice.samples(lo, block_end).mean(axis=1) * voice.gain
+                usable = len(mono) - len(mono) % hop
+                frames = mono[:usable].reshape(-1, hop)
+                first = block_start // hop
+                values = np.sqrt(np.mean(np.square(frames), axis=1))
+                rms[first:first + len(values)] = np.maximum(rms[first:first + len(values)], values)
+
+        envelope = AudioEnvelope(rms=rms, peak=rms, frame_rate=frame_rate)
+        gain = envelope.ducking_gain(threshold_db=threshold_db, duck_db=duck_db, attack=attack, release=release)
+        track.gain_curve = (frame_rate, gain)
+
+    def render(self, begin: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """타임라인 [begin, end) 샘플 구간 믹스 (float32, 클리핑 전)"""
+        end = self.length if end is None else end
+        out = np.zeros((max(0, end - begin), self.channels), dtype=np.float32)
+        for track in self.tracks:
+            lo, hi = max(begin, track.start), min(end, track.end)
+            if lo >= hi:
+                continue
+            gains = track.gains(lo, hi, self.sample_rate)
+            samples = track.samples(lo, hi)
+            if np.isscalar(gains):
+                out[lo - begin:hi - begin] += samples * np.float32(gains)
+            else:
+                out[lo - begin:hi - begin] += samples * gains[:, None]
+        return out
+
+    def iter_blocks(self, block_seconds: float = BLOCK_SECONDS) -> Iterator[np.ndarray]:
+        """타임라인 전체를 블록 단위로 렌더링 (클리핑 적용)"""
+        block = max(1, self.to_samples(block_seconds))
+        for begin in range(0, self.length, block):
+            yield np.clip(self.render(begin, min(self.length, begin + block)), -1.0, 1.0)
+
+    def export(self, output_path: PathLike, bitrate: str = "192k", codec: Optional[str] = None) -> Path:
+        """
+        믹스를 한 번만 인코딩해 저장 (블록 단위로 ffmpeg stdin에 전달)
+
+        Args:
+            output_path: 출력 경로 (확장자로 코덱 결정: .m4a/.mp4→AAC, .mp3, .flac, .wav)
+            bitrate: 손실 코덱 비트레이트
+            codec: ffmpeg 오디오 코덱 직접 지정 (선택)
+        """
+        ffmpeg = get_ffmpeg_binary()
+        if not ffmpeg:
+            raise FileNotFoundError("ffmpeg를 찾을 수 없습니다 (pip install imageio-ffmpeg)")
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        codec = codec or CODECS_BY_SUFFIX.get(output_path.suffix.lower(), "aac")
+
+        cmd = [ffmpeg, "-y", "-v", "error", "-f", "f32le", "-ar", str(self.sample_rate),
+               "-ac", str(self.channels), "-i", "pipe:0", "-c:a", codec]
+        if codec not in ("flac", "pcm_s16le"):
+            cmd += ["-b:a", bitrate]
+        cmd.append(str(output_path))
+
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for block in self.iter_blocks():
+                process.stdin.write(block.tobytes())
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = process.stderr.read()
+        process.stderr.close()
+        if process.wait() != 0:
+            raise RuntimeError(f"오디오 인코딩 실패 ({output_path}): {stderr.decode(errors='ignore').strip()[:200]}")
+        return output_path
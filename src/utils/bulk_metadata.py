@@ -0,0 +1,267 @@
+"""
+영상 메타데이터 일괄 수정 엔진
+
+제휴 링크 추가(24)와 메타데이터 수정(17)은 영상마다 videos.list → 문자열 수정 → videos.update를
+고정 sleep과 함께 순서대로 실행해, 채널 전체 설명 변경이 밤새 걸렸습니다. 여기서는
+
+- 현재 snippet을 videos.list 50개 배치로 한 번에 조회
+- 변환 함수로 원하는 값을 계산하고 로컬에서 비교해 바뀌는 게 없으면 update 생략
+- 실제 수정만 스레드별 서비스 객체로 병렬 제출 (동시 수는 workers, 간격/쿼터는 쿼터 스케줄러)
+- 진행 상황을 `.cache/journals/<job>.jsonl`에 한 줄씩 기록 → 중단 후 다시 실행하면
+  이미 수정한 영상은 조회도 하지 않고 이어서 진행 (보류/실패 없이 끝난 실행은 저널을 비워
+  다음 실행이 이전 완료 기록에 막히지 않음)
+
+googleapiclient 서비스 객체는 스레드 간 공유할 수 없어 병렬 제출에는 service_factory가 필요하고,
+없으면 하나씩 순서대로 제출합니다.
+
+사용 예:
+    updater = BulkMetadataUpdater(youtube, service_factory=build_service, workers=4,
+                                  journal=UpdateJournal.for_job("affiliate_links"))
+    result = updater.run(video_ids, lambda video_id, snippet: {"description": ...})
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    from utils.channel_catalog import BATCH_SIZE
+    from utils.quota_scheduler import QuotaExhausted, get_quota_scheduler, method_cost
+except ImportError:
+    from src.utils.channel_catalog import BATCH_SIZE
+    from src.utils.quota_scheduler import QuotaExhausted, get_quota_scheduler, method_cost
+
+JOURNAL_DIR = Path(__file__).resolve().parent.parent.parent / ".cache" / "journals"
+
+DEFAULT_WORKERS = 4
+
+# videos.update(part=snippet)로 보낼 수 있는 필드 (나머지는 읽기 전용)
+WRITABLE_SNIPPET_FIELDS = ("title", "description", "tags", "categoryId", "defaultLanguage", "defaultAudioLanguage")
+
+PathLike = Union[str, Path]
+# (video_id, 현재 snippet) → 바꿀 필드 딕셔너리 (None이면 대상 아님)
+Transform = Callable[[str, Dict], Optional[Dict]]
+
+
+@dataclass
+class SnippetUpdate:
+    """영상 하나의 수정 계획"""
+    video_id: str
+    snippet: Dict                 # 수정 후 전체 snippet (쓰기 가능한 필드만)
+    changed: List[str]            # 바뀌는 필드 이름
+
+    @property
+    def fingerprint(self) -> str:
+        payload = json.dumps(self.snippet, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class BulkResult:
+    """일괄 수정 결과"""
+    planned: List[str] = field(default_factory=list)       # 수정이 필요한 영상
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)     # 계산 결과가 현재와 같음 (update 생략)
+    skipped: List[str] = field(default_factory=list)       # 변환 대상 아님
+    missing: List[str] = field(default_factory=list)       # 삭제/비공개 등으로 조회 안 됨
+    resumed: List[str] = field(default_factory=list)       # 저널에 이미 수정 완료로 기록됨
+    failed: Dict[str, str] = field(default_factory=dict)
+    deferred: List[str] = field(default_factory=list)      # 쿼터 부족으로 보류
+
+
+def writable_snippet(snippet: Dict) -> Dict:
+    """update 요청에 실을 수 있는 snippet 필드만 추출"""
+    return {key: snippet[key] for key in WRITABLE_SNIPPET_FIELDS if key in snippet}
+
+
+def diff_snippet(current: Dict, desired: Dict) -> List[str]:
+    """값이 달라지는 필드 이름 (tags는 None과 빈 목록을 같게 취급)"""
+    changed = []
+    for key, value in desired.items():
+        before = current.get(key)
+        if key == "tags":
+            before, value = before or [], value or []
+        if before != value:
+            changed.append(key)
+    return changed
+
+
+def fetch_snippets(youtube, video_ids: Sequence[str]) -> Dict[str, Dict]:
+    """현재 snippet을 videos.list 50개 배치로 조회 ({video_id: snippet}, 없는 영상은 빠짐)"""
+    snippets: Dict[str, Dict] = {}
+    for start in range(0, len(video_ids), BATCH_SIZE):
+        batch = video_ids[start:start + BATCH_SIZE]
+        response = youtube.videos().list(part="snippet", id=",".join(batch), maxResults=BATCH_SIZE).execute()
+        for item in response.get("items", []):
+            snippets[item["id"]] = item.get("snippet", {})
+    return snippets
+
+
+class UpdateJournal:
+    """수정 진행 저널 (JSONL, 한 줄에 영상 하나의 결과, 스레드 안전)"""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 기록 도중 끊긴 마지막 줄
+                    self.entries[entry["video_id"]] = entry
+
+    @classmethod
+    def for_job(cls, job: str, journal_dir: PathLike = JOURNAL_DIR) -> "UpdateJournal":
+        return cls(Path(journal_dir) / f"{job}.jsonl")
+
+    def completed(self) -> set:
+        """이미 수정 완료로 기록된 영상 ID"""
+        return {video_id for video_id, entry in self.entries.items() if entry.get("status") == "updated"}
+
+    def record(self, video_id: str, status: str, fingerprint: str = "", error: str = "") -> None:
+        entry = {"video_id": video_id, "status": status, "fingerprint": fingerprint}
+        if error:
+            entry["error"] = error[:300]
+        with self._lock:
+            self.entries[video_id] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self) -> None:
+        """저널 비우기 (처음부터 다시)"""
+        with self._lock:
+            self.entries.clear()
+            self.path.unlink(missing_ok=True)
+
+
+class BulkMetadataUpdater:
+    """배치 조회 → 로컬 비교 → 병렬 수정"""
+
+    def __init__(self, youtube, service_factory: Optional[Callable[[], object]] = None,
+                 workers: int = DEFAULT_WORKERS, journal: Optional[UpdateJournal] = None, log=print):
+        """
+        Args:
+            youtube: 조회에 쓸 서비스 객체
+            service_factory: 작업 스레드별 서비스 객체 생성 함수 (없으면 순차 제출)
+            workers: 동시 수정 요청 수
+            journal: 진행 저널 (None이면 기록/재개 안 함)
+            log: 진행 메시지 출력 함수 (print 또는 logger.info)
+        """
+        self.youtube = youtube
+        self.service_factory = service_factory
+        self.workers = max(1, workers) if service_factory else 1
+        self.journal = journal
+        self.log = log
+        self._local = threading.local()
+
+    def plan(self, snippets: Dict[str, Dict], transform: Transform, result: BulkResult) -> List[SnippetUpdate]:
+        """변환 결과를 현재 snippet과 비교해 실제로 바뀌는 영상만 수정 계획으로"""
+        updates = []
+        for video_id, snippet in snippets.items():
+            changes = transform(video_id, snippet)
+            if changes is None:
+                result.skipped.append(video_id)
+                continue
+            current = writable_snippet(snippet)
+            changed = diff_snippet(current, changes)
+            if not changed:
+                result.unchanged.append(video_id)
+                if self.journal:
+                    self.journal.record(video_id, "unchanged")
+                continue
+            updates.append(SnippetUpdate(video_id, {**current, **changes}, changed))
+        return updates
+
+    def _service(self):
+        if self.service_factory is None:
+            return self.youtube
+        if not hasattr(self._local, "service"):
+            self._local.service = self.service_factory()
+        return self._local.service
+
+    def _submit(self, update: SnippetUpdate, stop: threading.Event, result: BulkResult) -> None:
+        if stop.is_set():
+            result.deferred.append(update.video_id)
+            return
+        try:
+            self._service().videos().update(
+                part="snippet", body={"id": update.video_id, "snippet": update.snippet}
+            ).execute()
+        except QuotaExhausted:
+            stop.set()
+            result.deferred.append(update.video_id)
+            return
+        except Exception as e:
+            result.failed[update.video_id] = str(e)
+            if self.journal:
+                self.journal.record(update.video_id, "failed", update.fingerprint, str(e))
+            self.log(f"   ❌ {update.video_id} 수정 실패: {e}")
+            return
+        result.updated.append(update.video_id)
+        if self.journal:
+            self.journal.record(update.video_id, "updated", update.fingerprint)
+        self.log(f"   ✅ {update.video_id} 수정 완료 ({', '.join(update.changed)})")
+
+    def apply(self, updates: List[SnippetUpdate], result: BulkResult) -> None:
+        """수정 계획 제출 (남은 쿼터로 가능한 만큼만, 나머지는 보류)"""
+        scheduler = get_quota_scheduler(self.youtube)
+        if scheduler is not None:
+            affordable = scheduler.remaining() // method_cost("videos.update")
+            if affordable < len(updates):
+                result.deferred.extend(update.video_id for update in updates[affordable:])
+                updates = updates[:affordable]
+
+        stop = threading.Event()
+        if self.workers == 1:
+            for update in updates:
+                self._submit(update, stop, result)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for update in updates:
+                executor.submit(self._submit, update, stop, result)
+
+    def run(self, video_ids: Iterable[str], transform: Transform, dry_run: bool = False) -> BulkResult:
+        """조회 → 비교 → 수정 (dry_run이면 계획만 출력)"""
+        result = BulkResult()
+        video_ids = list(dict.fromkeys(video_ids))
+        if self.journal:
+            done = self.journal.completed()
+            result.resumed = [video_id for video_id in video_ids if video_id in done]
+            video_ids = [video_id for video_id in video_ids if video_id not in done]
+            if result.resumed:
+                self.log(f"   📒 저널: {len(result.resumed)}개 영상은 이미 수정 완료 (건너뜀)")
+
+        try:
+            snippets = fetch_snippets(self.youtube, video_ids)
+        except QuotaExhausted as e:
+            self.log(f"   ⏸️ {e}")
+            result.deferred = video_ids
+            return result
+        result.missing = [video_id for video_id in video_ids if video_id not in snippets]
+
+        updates = self.plan(snippets, transform, result)
+        result.planned = [update.video_id for update in updates]
+        self.log(f"   🔍 조회 {len(snippets)}개 → 수정 필요 {len(updates)}개, 변경 없음 {len(result.unchanged)}개")
+        for update in updates:
+            title = update.snippet.get("title", "")[:40]
+            self.log(f"   ✏️ {update.video_id} {title}: {', '.join(update.changed)}")
+
+        if updates and not dry_run:
+            self.apply(updates, result)
+
+        # 이어서 할 일이 없으면 저널을 비움 (남겨 두면 다음 실행이 이 영상들을 영영 건너뜀)
+        if self.journal and not dry_run and not result.deferred and not result.failed:
+            self.journal.reset()
+            self.log("   📒 저널: 모든 영상 처리 완료 (저널 비움)")
+        return result
@@ -0,0 +1,294 @@
+"""
+로컬 채널 영상 카탈로그 (SQLite)
+
+채널 관리 스크립트(13/15/24/25/26/27)가 실행될 때마다 uploads 재생목록 전체를 페이지 단위로
+다시 읽으면 영상이 수백 개일 때 목록 조회만으로 몇 분과 쿼터를 씁니다.
+여기서는 영상 목록과 상세 정보(snippet/status/statistics/contentDetails)를
+`.cache/channel_catalog.sqlite3`에 보관하고 증분 동기화합니다.
+
+- uploads 재생목록은 최신순 → 이미 알고 있는 영상 ID를 만나면 페이지 조회 중단
+- 새 영상(또는 refresh=True면 전체)의 상세 정보는 videos.list 50개 배치로 조회
+- 배치 응답에 없는 영상은 삭제/비공개 전환으로 보고 카탈로그에서 제거
+- 중간에 끊긴 최초 동기화는 다음 실행에서 전체 페이지를 다시 훑음
+
+사용 예:
+    catalog = ChannelCatalog(youtube, channel_id)
+    catalog.sync()
+    videos = catalog.videos(limit=100)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "channel_catalog.sqlite3"
+
+# videos.list 최대 ID 수
+BATCH_SIZE = 50
+VIDEO_PARTS = "snippet,status,statistics,contentDetails"
+
+PathLike = Union[str, Path]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    published_at TEXT,
+    title TEXT,
+    description TEXT,
+    tags TEXT,
+    privacy_status TEXT,
+    duration TEXT,
+    view_count INTEGER,
+    like_count INTEGER,
+    comment_count INTEGER,
+    raw TEXT,
+    refreshed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel_published ON videos (channel_id, published_at DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    """동기화 결과"""
+    new_ids: List[str] = field(default_factory=list)
+    refreshed: int = 0
+    removed: List[str] = field(default_factory=list)
+    pages: int = 0
+    full_scan: bool = False
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ChannelCatalog:
+    """채널 업로드 영상 로컬 카탈로그"""
+
+    def __init__(self, youtube, channel_id: Optional[str] = None, db_path: PathLike = CATALOG_PATH,
+                 delay: float = 0.0):
+        """
+        Args:
+            youtube: 인증된 YouTube Data API 서비스 객체
+            channel_id: 채널 ID (None이면 인증된 계정의 채널)
+            db_path: SQLite 파일 경로
+            delay: 재생목록 페이지 조회 간 대기 (초)
+        """
+        self.youtube = youtube
+        self.channel_id = channel_id
+        self.db_path = Path(db_path)
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 연결 (정상 종료 시 commit, 예외 시 rollback 후 닫기)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------ meta
+
+    def _get_meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _resolve_channel(self, conn: sqlite3.Connection) -> str:
+        """채널 ID와 uploads 재생목록 ID 확인 (한 번 조회 후 meta에 보관)"""
+        if self.channel_id:
+            uploads = self._get_meta(conn, f"uploads:{self.channel_id}")
+            if uploads:
+                return uploads
+            response = self.youtube.channels().list(part="contentDetails", id=self.channel_id).execute()
+        else:
+            response = self.youtube.channels().list(part="id,contentDetails", mine=True).execute()
+        items = response.get("items") or []
+        if not items:
+            raise ValueError("채널을 찾을 수 없습니다.")
+        self.channel_id = self.channel_id or items[0]["id"]
+        uploads = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+        self._set_meta(conn, f"uploads:{self.channel_id}", uploads)
+        return uploads
+
+    # ------------------------------------------------------------------ sync
+
+    def sync(self, refresh: bool = False, full: bool = False) -> SyncResult:
+        """
+        카탈로그 증분 동기화
+
+        Args:
+            refresh: True면 알고 있는 모든 영상의 상세 정보(조회수 등)도 다시 조회
+            full: True면 알고 있는 영상을 만나도 재생목록 끝까지 조회
+
+        Returns:
+            SyncResult (새 영상 ID, 갱신 수, 제거된 ID, 조회한 페이지 수)
+        """
+        result = SyncResult()
+        with self._lock, self._connect() as conn:
+            uploads_playlist_id = self._resolve_channel(conn)
+            complete_key = f"complete:{self.channel_id}"
+            known = {row["video_id"] for row in conn.execute(
+                "SELECT video_id FROM videos WHERE channel_id = ?", (self.channel_id,))}
+            result.full_scan = full or self._get_meta(conn, complete_key) != "1"
+
+            page_token = None
+            while True:
+                params = {"part": "contentDetails", "playlistId": uploads_playlist_id, "maxResults": BATCH_SIZE}
+                if page_token:
+                    params["pageToken"] = page_token
+                response = self.youtube.playlistItems().list(**params).execute()
+                result.pages += 1
+
+                reached_known = False
+                for item in response.get("items", []):
+                    video_id = item["contentDetails"]["videoId"]
+                    if video_id in known:
+                        reached_known = True
+                    elif video_id not in result.new_ids:
+                        result.new_ids.append(video_id)
+
+                page_token = response.get("nextPageToken")
+                if not page_token or (reached_known and not result.full_scan):
+                    break
+                if self.delay:
+                    time.sleep(self.delay)
+
+            targets = list(result.new_ids) + (sorted(known) if refresh else [])
+            fetched = self._fetch_details(targets)
+            now = datetime.now(timezone.utc).isoformat()
+            for video_id, item in fetched.items():
+                self._upsert(conn, item, now)
+            result.refreshed = len(fetched)
+
+            # 상세 조회 응답에 없는 기존 영상 = 삭제/접근 불가
+            result.removed = [vid for vid in targets if vid in known and vid not in fetched]
+            conn.executemany("DELETE FROM videos WHERE video_id = ?", [(vid,) for vid in result.removed])
+
+            if not page_token:
+                self._set_meta(conn, complete_key, "1")
+            self._set_meta(conn, f"synced_at:{self.channel_id}", now)
+        return result
+
+    def _fetch_details(self, video_ids: Sequence[str]) -> Dict[str, Dict]:
+        """videos.list 50개 배치 조회"""
+        fetched: Dict[str, Dict] = {}
+        for start in range(0, len(video_ids), BATCH_SIZE):
+            batch = video_ids[start:start + BATCH_SIZE]
+            response = self.youtube.videos().list(part=VIDEO_PARTS, id=",".join(batch)).execute()
+            for item in response.get("items", []):
+                fetched[item["id"]] = item
+        return fetched
+
+    def _upsert(self, conn: sqlite3.Connection, item: Dict, refreshed_at: str) -> None:
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO videos (
+                video_id, channel_id, published_at, title, description, tags, privacy_status,
+                duration, view_count, like_count, comment_count, raw, refreshed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                item["id"],
+                self.channel_id,
+                snippet.get("publishedAt", ""),
+                snippet.get("title", ""),
+                snippet.get("description", ""),
+                json.dumps(snippet.get("tags", []), ensure_ascii=False),
+                item.get("status", {}).get("privacyStatus"),
+                item.get("contentDetails", {}).get("duration"),
+                _to_int(statistics.get("viewCount")),
+                _to_int(statistics.get("likeCount")),
+                _to_int(statistics.get("commentCount")),
+                json.dumps(item, ensure_ascii=False),
+                refreshed_at,
+            ),
+        )
+
+    # ------------------------------------------------------------------ read
+
+    @staticmethod
+    def _row_to_video(row: sqlite3.Row) -> Dict:
+        video_id = row["video_id"]
+        return {
+            "video_id": video_id,
+            "title": row["title"] or "",
+            "description": row["description"] or "",
+            "published_at": row["published_at"] or "",
+            "tags": json.loads(row["tags"] or "[]"),
+            "privacy_status": row["privacy_status"],
+            "duration": row["duration"],
+            "views": row["view_count"] or 0,
+            "likes": row["like_count"] or 0,
+            "comments": row["comment_count"] or 0,
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+        }
+
+    def videos(self, limit: Optional[int] = None) -> List[Dict]:
+        """카탈로그 영상 목록 (최신 게시순)"""
+        query = "SELECT * FROM videos WHERE channel_id = ? ORDER BY published_at DESC"
+        params: tuple = (self.channel_id,)
+        if limit:
+            query += " LIMIT ?"
+            params += (int(limit),)
+        with self._connect() as conn:
+            return [self._row_to_video(row) for row in conn.execute(query, params)]
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """영상 하나 조회 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+        return self._row_to_video(row) if row else None
+
+    def raw(self, video_id: str) -> Optional[Dict]:
+        """videos.list 원본 응답 (snippet/status/statistics/contentDetails)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT raw FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+        return json.loads(row["raw"]) if row and row["raw"] else None
+
+
+def load_channel_videos(youtube, channel_id: Optional[str] = None, limit: Optional[int] = None,
+                        refresh: bool = False, delay: float = 0.0, log=print,
+                        db_path: PathLike = CATALOG_PATH) -> List[Dict]:
+    """
+    스크립트 공용: 카탈로그 증분 동기화 후 영상 목록 반환
+
+    Args:
+        youtube: 인증된 YouTube Data API 서비스 객체
+        channel_id: 채널 ID (None이면 인증된 계정)
+        limit: 최대 영상 수 (최신순)
+        refresh: 기존 영상 통계/설명까지 다시 조회
+        delay: 재생목록 페이지 간 대기 (초)
+        log: 진행 메시지 출력 함수 (print 또는 logger.info)
+        db_path: SQLite 파일 경로
+    """
+    catalog = ChannelCatalog(youtube, channel_id, db_path=db_path, delay=delay)
+    result = catalog.sync(refresh=refresh)
+    log(f"   🗂️ 채널 카탈로그 동기화: 신규 {len(result.new_ids)}개, 갱신 {result.refreshed}개, "
+        f"제거 {len(result.removed)}개 (재생목록 {result.pages}페이지)")
+    return catalog.videos(limit=limit)
@@ -0,0 +1,312 @@
+"""
+로컬 댓글 스레드 저장소 (SQLite) + 증분 동기화
+
+댓글 내보내기(26)는 실행할 때마다 모든 영상의 commentThreads.list를 순서대로 호출하고
+엑셀 파일 전체를 다시 만들었습니다. 여기서는 최상위 댓글 스레드를
+`.cache/comment_threads.sqlite3`에 보관하고 영상별로 마지막으로 본 updatedAt을 기록해
+
+- 카탈로그의 댓글 수(statistics.commentCount)가 지난 동기화와 같은 영상은 조회 생략
+- 조회하는 영상은 최신순(order=time) 페이지를 읽다가 지난 기준점 이전 댓글이 나오면 중단
+- 댓글 수가 줄어든 영상은 전체를 다시 읽고 사라진 스레드 삭제
+- 여러 영상을 스레드별 서비스 객체로 동시에 조회 (간격/쿼터는 쿼터 스케줄러)
+- 내보내기는 지난번 이후 새로 생기거나 수정된 댓글만 (exported_updated_at 비교)
+
+사용 예:
+    store = CommentStore()
+    sync_comments(store, youtube, videos, service_factory=build_service, workers=4)
+    rows = store.comments(author_channel_id=channel_id, pending_only=True)
+    ...
+    store.mark_exported(rows)
+"""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from utils.quota_scheduler import QuotaExhausted
+    from utils.retry_utils import get_http_status
+except ImportError:
+    from src.utils.quota_scheduler import QuotaExhausted
+    from src.utils.retry_utils import get_http_status
+
+COMMENTS_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "comment_threads.sqlite3"
+
+# commentThreads.list 최대 페이지 크기 / 기본 동시 조회 영상 수
+PAGE_SIZE = 100
+DEFAULT_WORKERS = 4
+
+PathLike = Union[str, Path]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    author_channel_id TEXT,
+    author_name TEXT,
+    text TEXT,
+    published_at TEXT,
+    updated_at TEXT,
+    like_count INTEGER,
+    reply_count INTEGER,
+    exported_updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_threads_video ON threads (video_id);
+CREATE INDEX IF NOT EXISTS idx_threads_author ON threads (author_channel_id);
+CREATE TABLE IF NOT EXISTS video_sync (
+    video_id TEXT PRIMARY KEY,
+    last_updated_at TEXT,
+    comment_count INTEGER,
+    synced_at TEXT
+);
+"""
+
+
+@dataclass
+class CommentSyncResult:
+    """동기화 결과"""
+    synced: List[str] = field(default_factory=list)       # 조회한 영상
+    unchanged: List[str] = field(default_factory=list)    # 댓글 수가 같아 조회 생략
+    deferred: List[str] = field(default_factory=list)     # 쿼터 부족으로 다음 실행에 조회
+    failed: Dict[str, str] = field(default_factory=dict)
+    new_threads: int = 0
+    changed_threads: int = 0
+    removed_threads: int = 0
+    pages: int = 0
+
+
+def _thread_row(item: Dict) -> Tuple:
+    snippet = item.get("snippet", {})
+    top = snippet.get("topLevelComment", {}).get("snippet", {})
+    author = top.get("authorChannelId", "")
+    if isinstance(author, dict):
+        author = author.get("value", "")
+    # textOriginal: 원본 텍스트 (채널 소유자만 접근 가능), textDisplay: HTML 변환본 - 폴백용
+    text = top.get("textOriginal") or top.get("textDisplay", "")
+    return (
+        item["id"],
+        snippet.get("videoId") or top.get("videoId", ""),
+        author,
+        top.get("authorDisplayName", ""),
+        text,
+        top.get("publishedAt", ""),
+        top.get("updatedAt") or top.get("publishedAt", ""),
+        top.get("likeCount", 0),
+        snippet.get("totalReplyCount", 0),
+    )
+
+
+class CommentStore:
+    """댓글 스레드 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: PathLike = COMMENTS_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 연결 (동시 조회 스레드의 저장은 잠금으로 순서대로)"""
+        with self._lock:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def video_state(self, video_id: str) -> Optional[Dict]:
+        """영상의 마지막 동기화 상태 {last_updated_at, comment_count, synced_at} (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM video_sync WHERE video_id = ?", (video_id,)).fetchone()
+        return dict(row) if row else None
+
+    def save_video(self, video_id: str, items: Sequence[Dict], comment_count: Optional[int],
+                   complete: bool) -> Tuple[int, int, int]:
+        """
+        조회한 스레드 저장 → (새 스레드 수, 수정된 스레드 수, 삭제한 스레드 수)
+
+        complete=True(영상의 모든 페이지를 읽음)면 응답에 없는 기존 스레드는 삭제된 것으로 보고 제거.
+        """
+        rows = [_thread_row(item) for item in items]
+        new = changed = removed = 0
+        with self._connect() as conn:
+            known = dict(conn.execute("SELECT thread_id, updated_at FROM threads WHERE video_id = ?", (video_id,)))
+            for row in rows:
+                if row[0] not in known:
+                    new += 1
+                elif known[row[0]] != row[6]:
+                    changed += 1
+                conn.execute(
+                    """INSERT INTO threads (thread_id, video_id, author_channel_id, author_name, text,
+                                            published_at, updated_at, like_count, reply_count)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (thread_id) DO UPDATE SET
+                           author_name = excluded.author_name, text = excluded.text,
+                           updated_at = excluded.updated_at, like_count = excluded.like_count,
+                           reply_count = excluded.reply_count""",
+                    row,
+                )
+            if complete:
+                seen = {row[0] for row in rows}
+                gone = [thread_id for thread_id in known if thread_id not in seen]
+                conn.executemany("DELETE FROM threads WHERE thread_id = ?", [(thread_id,) for thread_id in gone])
+                removed = len(gone)
+
+            last_updated_at = conn.execute(
+                "SELECT MAX(updated_at) FROM threads WHERE video_id = ?", (video_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO video_sync VALUES (?, ?, ?, ?)",
+                (video_id, last_updated_at, comment_count, datetime.now(timezone.utc).isoformat()),
+            )
+        return new, changed, removed
+
+    def comments(self, author_channel_id: Optional[str] = None, pending_only: bool = False) -> List[Dict]:
+        """
+        저장된 댓글 (영상별, 작성순)
+
+        Args:
+            author_channel_id: 이 채널이 작성한 댓글만
+            pending_only: 지난 내보내기 이후 새로 생기거나 수정된 댓글만
+        """
+        query = "SELECT * FROM threads WHERE 1 = 1"
+        params: list = []
+        if author_channel_id:
+            query += " AND author_channel_id = ?"
+            params.append(author_channel_id)
+        if pending_only:
+            query += " AND (exported_updated_at IS NULL OR exported_updated_at != updated_at)"
+        query += " ORDER BY video_id, published_at"
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def mark_exported(self, rows: Sequence[Dict]) -> None:
+        """내보낸 댓글 기록 (다음 pending_only 조회에서 제외)"""
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE threads SET exported_updated_at = ? WHERE thread_id = ?",
+                [(row["updated_at"], row["thread_id"]) for row in rows],
+            )
+
+
+def _fetch_threads(youtube, video_id: str, since: Optional[str]) -> Tuple[List[Dict], bool, int]:
+    """
+    영상의 댓글 스레드 최신순 조회 → (스레드, 전체를 읽었는지, 페이지 수)
+
+    since가 있으면 페이지의 가장 오래된 스레드가 since 이전일 때 중단 (그 뒤는 이미 저장됨).
+    """
+    items: List[Dict] = []
+    page_token = None
+    pages = 0
+    while True:
+        params = {"part": "snippet", "videoId": video_id, "maxResults": PAGE_SIZE, "order": "time"}
+        if page_token:
+            params["pageToken"] = page_token
+        try:
+            response = youtube.commentThreads().list(**params).execute()
+        except QuotaExhausted:
+            raise
+        except Exception as e:
+            # 댓글 사용 중지(403) / 삭제된 영상(404)은 댓글 없음으로 처리
+            if get_http_status(e) in (403, 404) and pages == 0:
+                return [], True, pages
+            raise
+        pages += 1
+        page = response.get("items", [])
+        items.extend(page)
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return items, True, pages
+        if since and page:
+            oldest = page[-1].get("snippet", {}).get("topLevelComment", {}).get("snippet", {}).get("publishedAt", "")
+            if oldest and oldest <= since:
+                return items, False, pages
+
+
+def sync_comments(store: CommentStore, youtube, videos: Sequence[Dict],
+                  service_factory: Optional[Callable[[], object]] = None, workers: int = DEFAULT_WORKERS,
+                  full: bool = False, log=print) -> CommentSyncResult:
+    """
+    영상들의 댓글 스레드를 저장소에 증분 동기화
+
+    Args:
+        store: 댓글 저장소
+        youtube: 서비스 객체 (service_factory가 없으면 이것 하나로 순차 조회)
+        videos: 카탈로그 영상 목록 ({"video_id", "comments"(댓글 수)} 포함)
+        service_factory: 작업 스레드별 서비스 객체 생성 함수
+        workers: 동시 조회 영상 수
+        full: True면 댓글 수와 기준점을 무시하고 전체 다시 조회
+        log: 진행 메시지 출력 함수 (print 또는 logger.info)
+    """
+    result = CommentSyncResult()
+    jobs = []
+    for video in videos:
+        video_id = video["video_id"]
+        count = video.get("comments")
+        state = store.video_state(video_id)
+        if not full and state and state["comment_count"] == count:
+            result.unchanged.append(video_id)
+            continue
+        # 댓글 수가 줄었으면 삭제 반영을 위해 전체 조회
+        shrunk = state and state["comment_count"] is not None and count is not None and count < state["comment_count"]
+        since = None if (full or not state or shrunk) else state["last_updated_at"]
+        jobs.append((video_id, count, since))
+
+    log(f"   💬 댓글 동기화: 조회 {len(jobs)}개 영상, 댓글 수 변화 없음 {len(result.unchanged)}개")
+    if not jobs:
+        return result
+
+    local = threading.local()
+    stop = threading.Event()
+    lock = threading.Lock()
+
+    def service():
+        if service_factory is None:
+            return youtube
+        if not hasattr(local, "service"):
+            local.service = service_factory()
+        return local.service
+
+    def sync_one(job):
+        video_id, count, since = job
+        if stop.is_set():
+            result.deferred.append(video_id)
+            return
+        try:
+            items, complete, pages = _fetch_threads(service(), video_id, since)
+            new, changed, removed = store.save_video(video_id, items, count, complete)
+        except QuotaExhausted as e:
+            if not stop.is_set():
+                log(f"   ⏸️ {e}")
+            stop.set()
+            result.deferred.append(video_id)
+            return
+        except Exception as e:
+            result.failed[video_id] = str(e)
+            log(f"   ⚠️ {video_id} 댓글 조회 오류: {e}")
+            return
+        with lock:
+            result.synced.append(video_id)
+            result.new_threads += new
+            result.changed_threads += changed
+            result.removed_threads += removed
+            result.pages += pages
+        if new or changed or removed:
+            log(f"   ✅ {video_id}: 새 댓글 {new}개, 수정 {changed}개, 삭제 {removed}개 ({pages}페이지)")
+
+    if service_factory is None or workers <= 1:
+        for job in jobs:
+            sync_one(job)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(sync_one, jobs))
+    return result
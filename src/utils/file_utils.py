@@ -3,6 +3,7 @@
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -26,10 +27,12 @@ def safe_title(title: str) -> str:
     return safe
 
 
+@lru_cache(maxsize=1024)
 def get_standard_safe_title(title: str) -> str:
     """
     책 제목을 표준 영문 Safe Title로 변환.
     한글 제목이 오더라도 영문 제목으로 변환하여 반환함.
+    (같은 제목은 반복 호출되므로 결과를 캐시)
     
     Args:
         title: 책 제목 (한글 또는 영문)
@@ -74,11 +77,11 @@ def load_book_info(book_title: str, author: str = None) -> Optional[Dict]:
         print(f"📖 책 소개가 없어서 Google Books API에서 다시 가져오는 중...")
         try:
             # ImageDownloader를 사용하여 Google Books API에서 정보 가져오기
-            import importlib.util
-            # __file__은 utils/file_utils.py이므로 parent.parent는 src/ 폴더
-            images_spec = importlib.util.spec_from_file_location("get_images", Path(__file__).parent.parent / "02_get_images.py")
-            images_module = importlib.util.module_from_spec(images_spec)
-            images_spec.loader.exec_module(images_module)
+            try:
+                from src.utils.module_loader import load_script
+            except ImportError:
+                from .module_loader import load_script
+            images_module = load_script("02_get_images.py")
             
             downloader = images_module.ImageDownloader()
             # download_book_cover를 호출하면 book_info.json이 업데이트됨
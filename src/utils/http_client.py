@@ -0,0 +1,361 @@
+"""
+공통 HTTP 클라이언트 모듈
+
+이미지 다운로드, 링크 검사, URL 수집, 배경음악 다운로드 등에서 흩어져 있던
+`requests.get` 호출을 한 곳으로 모읍니다.
+
+- 호스트별 커넥션 풀 재사용 (requests.Session + HTTPAdapter)
+- 호스트별 동시 요청 수 제한
+- Retry-After 헤더를 따르는 재시도 + 지수 백오프 (5xx/타임아웃 재시도는 멱등 메서드만)
+- 호스트별 서킷 브레이커 (연속 실패 시 일정 시간 즉시 실패)
+- 요청 수 / 지연 시간 / 전송 바이트 카운터
+- 동기(HttpClient)와 비동기(AsyncHttpClient) 인터페이스
+
+사용 예:
+    from utils.http_client import get_http_client
+    http = get_http_client()
+    resp = http.get(url, timeout=10)
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from utils.retry_utils import CircuitBreaker, CircuitOpenError as _CircuitOpenError, compute_backoff, parse_retry_after
+except ImportError:
+    from src.utils.retry_utils import CircuitBreaker, CircuitOpenError as _CircuitOpenError, compute_backoff, parse_retry_after
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+# 다시 보내도 결과가 같은 메서드 — 그 밖의 메서드(POST 등)는 서버가 처리하지 않았음이 확실할 때만
+# (429, 연결 타임아웃) 재시도
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+class CircuitOpenError(_CircuitOpenError, requests.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않고 즉시 실패 (requests 예외로도 잡힘)"""
+
+
+@dataclass
+class HostMetrics:
+    """호스트별 요청 통계"""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    short_circuited: int = 0
+    bytes_received: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class _HostState:
+    """호스트별 동시성 제한 + 서킷 브레이커 상태"""
+
+    def __init__(self, host: str, max_concurrency: int, failure_threshold: int, reset_timeout: float):
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.lock = threading.Lock()
+        self.metrics = HostMetrics()
+        self.breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+
+
+class HttpClient:
+    """
+    호스트별 커넥션 풀과 재시도/서킷 브레이커/통계를 갖춘 동기 HTTP 클라이언트
+
+    Args:
+        timeout: 기본 타임아웃 (초)
+        retries: 재시도 횟수 (재시도 대상: 연결 오류, 타임아웃, 429/5xx)
+        backoff: 초기 백오프 (초)
+        max_backoff: 최대 백오프 (Retry-After도 이 값으로 제한)
+        max_per_host: 호스트별 최대 동시 요청 수
+        host_limits: 특정 호스트의 동시 요청 수 재정의 {호스트: 개수}
+        failure_threshold: 서킷을 여는 연속 실패 횟수
+        reset_timeout: 서킷이 열린 뒤 다시 시도하기까지의 시간 (초)
+        headers: 기본 요청 헤더
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        max_per_host: int = 6,
+        host_limits: Optional[Dict[str, int]] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_per_host = max_per_host
+        self.host_limits = dict(host_limits or {})
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # urllib3는 호스트마다 별도 풀을 유지 — 풀 크기를 동시성 한도에 맞춤
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(max_per_host, *self.host_limits.values(), 1))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._hosts: Dict[str, _HostState] = {}
+        self._hosts_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 호스트 상태
+    # ------------------------------------------------------------------
+
+    def _host(self, url: str) -> Tuple[str, _HostState]:
+        host = urlparse(url).netloc.lower()
+        with self._hosts_lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _HostState(
+                    host, self.host_limits.get(host, self.max_per_host),
+                    self.failure_threshold, self.reset_timeout,
+                )
+                self._hosts[host] = state
+        return host, state
+
+    def _check_circuit(self, host: str, state: _HostState) -> bool:
+        """서킷 확인 (열려 있으면 CircuitOpenError). half-open 시험 요청이면 True"""
+        try:
+            return state.breaker.before_call()
+        except _CircuitOpenError as e:
+            with state.lock:
+                state.metrics.short_circuited += 1
+            raise CircuitOpenError(host, e.retry_in) from None
+
+    def _record(self, state: _HostState, ok: bool, latency: float, nbytes: int = 0) -> None:
+        with state.lock:
+            state.metrics.requests += 1
+            state.metrics.total_latency += latency
+            state.metrics.bytes_received += nbytes
+            if not ok:
+                state.metrics.errors += 1
+        if ok:
+            state.breaker.record_success()
+        else:
+            state.breaker.record_failure()
+
+    def _sleep_time(self, attempt: int, response: Optional[requests.Response]) -> float:
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(self.max_backoff, retry_after)
+        return compute_backoff(attempt, self.backoff, self.max_backoff, jitter="equal")
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+
+    def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        HTTP 요청 (재시도/서킷 브레이커/통계 적용)
+
+        상태 코드 검사는 호출자가 합니다(raise_for_status). 재시도 후에도 429/5xx면
+        마지막 응답을 그대로 반환합니다. POST 등 멱등이 아닌 메서드는 5xx/읽기 타임아웃에
+        재시도하지 않습니다 (요청이 이미 처리되었을 수 있음).
+
+        Raises:
+            CircuitOpenError: 해당 호스트의 서킷이 열려 있을 때
+            requests.RequestException: 재시도 후에도 연결 오류/타임아웃일 때
+        """
+        host, state = self._host(url)
+        return self._request(host, state, method, url, retries, keep_slot=False, **kwargs)
+
+    def _request(self, host: str, state: _HostState, method: str, url: str, retries: Optional[int],
+                 keep_slot: bool, **kwargs) -> requests.Response:
+        """
+        request 본체
+
+        호스트 동시성 슬롯은 시도마다 잡고, 재시도 대기 전에 놓습니다 (실패 중인 요청이
+        백오프 동안 같은 호스트의 다른 요청을 막지 않도록). keep_slot=True면 반환한 응답의
+        슬롯을 잡은 채로 돌려주며, 본문을 다 읽은 뒤 호출자가 state.semaphore를 해제합니다.
+        """
+        retries = self.retries if retries is None else retries
+        kwargs.setdefault("timeout", self.timeout)
+        stream = kwargs.get("stream", False)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            trial = self._check_circuit(host, state)
+            response = None
+            state.semaphore.acquire()
+            slot_held = True
+            start = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+                if not keep_slot:
+                    state.semaphore.release()
+                    slot_held = False
+                latency = time.monotonic() - start
+                nbytes = 0 if stream else len(response.content)
+                ok = response.status_code not in RETRY_STATUS
+                self._record(state, ok, latency, nbytes)
+                retryable = idempotent or response.status_code == 429
+                if ok or not retryable or attempt >= retries:
+                    slot_held = False  # keep_slot이면 호출자에게 넘김
+                    return response
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(state, False, time.monotonic() - start)
+                # 연결 자체가 안 된 경우만 요청이 서버에 닿지 않았음이 확실함
+                if attempt >= retries or not (idempotent or isinstance(e, requests.ConnectTimeout)):
+                    raise
+            finally:
+                if slot_held:
+                    state.semaphore.release()
+                # 판정 없이 끝난 시험 요청(잘못된 URL, 리디렉션 초과 등)은 중립으로 해제
+                if trial:
+                    state.breaker.release_trial()
+
+            with state.lock:
+                state.metrics.retries += 1
+            delay = self._sleep_time(attempt, response)
+            if response is not None:
+                # 버리는 응답의 커넥션을 풀에 돌려줌 (stream=True면 본문을 읽지 않은 채 열려 있음)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_json(self, url: str, **kwargs) -> Dict:
+        """GET 후 상태 코드 확인 및 JSON 파싱"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def download(self, url: str, output_path: Path, chunk_size: int = 1 << 16, **kwargs) -> Path:
+        """
+        파일 스트리밍 다운로드 (임시 파일에 쓴 뒤 이름 변경)
+
+        Returns:
+            저장된 파일 경로
+        """
+        output_path = Path(output_path)
+        host, state = self._host(url)
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        # 본문을 다 받을 때까지 호스트 동시성 슬롯을 잡고 있음 (헤더만 받고 놓으면 제한이 무의미)
+        response = self._request(host, state, "GET", url, None, keep_slot=True, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            nbytes = 0
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        nbytes += len(chunk)
+            tmp_path.replace(output_path)
+        finally:
+            response.close()
+            state.semaphore.release()
+            tmp_path.unlink(missing_ok=True)
+        with state.lock:
+            state.metrics.bytes_received += nbytes
+        return output_path
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Dict]:
+        """호스트별 통계 스냅샷 {호스트: {...}}"""
+        with self._hosts_lock:
+            hosts = dict(self._hosts)
+        snapshot = {}
+        for host, state in hosts.items():
+            with state.lock:
+                data = asdict(state.metrics)
+                data["avg_latency"] = state.metrics.avg_latency
+            data["circuit_open"] = state.breaker.state == "open"
+            snapshot[host] = data
+        return snapshot
+
+    def log_metrics(self, logger) -> None:
+        """호스트별 통계를 로거로 출력"""
+        for host, m in sorted(self.metrics().items()):
+            logger.info(
+                f"🌐 {host}: {m['requests']}회 요청, 오류 {m['errors']}, 재시도 {m['retries']}, "
+                f"평균 {m['avg_latency'] * 1000:.0f}ms, {m['bytes_received'] / 1024:.0f}KB"
+            )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """
+    HttpClient의 비동기 인터페이스
+
+    요청은 스레드 풀에서 동기 클라이언트로 실행되므로 커넥션 풀, 호스트별 동시성 제한,
+    서킷 브레이커, 통계를 동기 호출자와 공유합니다.
+    """
+
+    def __init__(self, client: Optional[HttpClient] = None):
+        self.client = client or get_http_client()
+
+    async def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return await asyncio.to_thread(self.client.request, method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", True)
+        return await self.request("HEAD", url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> Dict:
+        return await asyncio.to_thread(self.client.get_json, url, **kwargs)
+
+    async def download(self, url: str, output_path: Path, **kwargs) -> Path:
+        return await asyncio.to_thread(self.client.download, url, output_path, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict]:
+        return self.client.metrics()
+
+
+# 전역 클라이언트 인스턴스 (프로세스 내 커넥션 풀/통계 공유)
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """기본 HttpClient 인스턴스 반환"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,103 @@
+"""
+공통 이미지 로딩 유틸리티
+
+대용량 원본(Unsplash/Pexels 원본 등)을 전체 해상도로 디코딩한 뒤 줄이는 대신,
+libjpeg DCT 스케일링(Pillow `draft`)으로 목표 크기를 덮는 가장 작은 크기로 바로 디코딩합니다.
+모드 정규화(RGBA/LA/P/L/CMYK → RGB)도 여기서 한 번만 수행합니다.
+
+- fit="cover": 결과가 목표 크기를 가로·세로 모두 덮도록 (중앙 크롭/Ken Burns 캔버스용)
+- fit="contain": 결과가 목표 크기 안에 들어가도록 (letterbox용)
+"""
+
+import math
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple, Union
+
+from PIL import Image
+
+ImageSource = Union[str, Path, BinaryIO]
+
+
+def image_size(image_path: ImageSource) -> Tuple[int, int]:
+    """헤더만 읽어 원본 이미지 크기 반환 (픽셀 디코딩 없음)"""
+    with Image.open(image_path) as img:
+        return img.size
+
+
+def scaled_size(
+    image_size: Tuple[int, int],
+    target_size: Tuple[int, int],
+    fit: str = "cover",
+) -> Tuple[int, int]:
+    """
+    종횡비를 유지하며 목표 크기에 맞춘 크기 계산
+
+    Args:
+        image_size: 원본 (width, height)
+        target_size: 목표 (width, height)
+        fit: "cover" (목표를 덮음) 또는 "contain" (목표 안에 들어감)
+    """
+    iw, ih = image_size
+    tw, th = target_size
+    pick = max if fit == "cover" else min
+    scale = pick(tw / iw, th / ih)
+    return max(1, math.ceil(iw * scale)), max(1, math.ceil(ih * scale))
+
+
+def _normalize_mode(img: Image.Image, background: Optional[Tuple[int, int, int]]) -> Image.Image:
+    """RGB로 모드 정규화 (투명도가 있고 background가 주어지면 배경에 합성)"""
+    if img.mode == 'RGB':
+        return img
+    has_alpha = img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+    if has_alpha and background is not None:
+        rgba = img.convert('RGBA')
+        canvas = Image.new('RGB', rgba.size, background)
+        canvas.paste(rgba, mask=rgba.getchannel('A'))
+        return canvas
+    return img.convert('RGB')
+
+
+def load_rgb(
+    image_path: ImageSource,
+    target_size: Optional[Tuple[int, int]] = None,
+    fit: str = "cover",
+    background: Optional[Tuple[int, int, int]] = None,
+) -> Image.Image:
+    """
+    이미지를 RGB로 로드 (JPEG는 목표 크기를 덮는 최소 해상도로 축소 디코딩)
+
+    반환 이미지는 목표 크기 이상일 수 있으므로 최종 리사이즈/크롭은 호출자가 수행합니다.
+    DCT 스케일은 1/2, 1/4, 1/8 단위라 종횡비는 1픽셀 이내로 유지됩니다.
+
+    Args:
+        image_path: 이미지 경로 또는 파일 객체
+        target_size: 최종적으로 리사이즈할 (width, height). None이면 전체 해상도
+        fit: target_size 해석 방식 ("cover" 또는 "contain")
+        background: 투명 이미지를 합성할 배경색. None이면 알파 채널을 버림
+
+    Returns:
+        디코딩이 끝난 RGB PIL 이미지 (파일 핸들은 닫힘)
+    """
+    with Image.open(image_path) as img:
+        if target_size is not None:
+            needed = scaled_size(img.size, target_size, fit)
+            if needed[0] < img.size[0] and needed[1] < img.size[1]:
+                # JPEG 외 포맷에서는 아무 일도 하지 않음
+                img.draft(None, needed)
+        img.load()
+        return _normalize_mode(img, background)
+
+
+def load_rgb_resized(
+    image_path: ImageSource,
+    target_size: Tuple[int, int],
+    fit: str = "cover",
+    background: Optional[Tuple[int, int, int]] = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> Image.Image:
+    """축소 디코딩 후 종횡비를 유지하며 fit 방식 크기로 리사이즈"""
+    img = load_rgb(image_path, target_size, fit=fit, background=background)
+    size = scaled_size(img.size, target_size, fit)
+    if img.size != size:
+        img = img.resize(size, resample)
+    return img
@@ -0,0 +1,196 @@
+"""
+이미지 품질 사전 평가 모듈
+
+GPT-4o Vision 검증(`validate_images_with_ai`) 전에 로컬에서 저렴하게
+무드 이미지 품질을 점수화하여, 명백히 쓸 수 없는 이미지는 버리고
+상위 후보만 AI 검증으로 보냅니다.
+
+- 해상도 / 16:9 종횡비 적합도
+- 선명도 (Laplacian 분산)
+- 노출 (평균 밝기, 클리핑 비율)
+- 색상 히스토그램 다양성 (엔트로피)
+- 중복 거리 (difference hash 해밍 거리)
+
+모든 계산은 축소 디코딩(JPEG draft)된 이미지 위에서 NumPy 벡터 연산으로 수행합니다.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+try:
+    from utils.image_loader import image_size, load_rgb
+except ImportError:
+    from src.utils.image_loader import image_size, load_rgb
+
+TARGET_ASPECT = 16 / 9
+
+# 분석용 축소 디코딩 크기 (긴 변 기준)
+ANALYSIS_SIZE = 256
+
+# 사용 불가 판정 기준 (Pexels 'large'가 940px 폭이므로 너무 높게 잡지 않음)
+MIN_WIDTH = 640
+MIN_HEIGHT = 400
+MIN_SHARPNESS = 15.0
+MIN_BRIGHTNESS = 0.08
+MAX_BRIGHTNESS = 0.92
+MAX_CLIPPED_RATIO = 0.5
+MIN_COLOR_ENTROPY = 2.5
+# dHash 해밍 거리가 이 값 이하면 중복으로 간주 (64비트 기준)
+DUPLICATE_DISTANCE = 6
+
+
+@dataclass
+class ImageQuality:
+    """단일 이미지 품질 측정 결과"""
+    path: Path
+    width: int = 0
+    height: int = 0
+    aspect_fit: float = 0.0
+    sharpness: float = 0.0
+    brightness: float = 0.0
+    clipped_ratio: float = 0.0
+    color_entropy: float = 0.0
+    dhash: Optional[np.ndarray] = field(default=None, repr=False)
+    duplicate_of: Optional[Path] = None
+    reasons: List[str] = field(default_factory=list)
+    score: float = 0.0
+
+    @property
+    def usable(self) -> bool:
+        return not self.reasons
+
+
+def _load_reduced(image_path: Path, size: int = ANALYSIS_SIZE) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    분석용 축소 이미지 로드 (원본 크기도 함께 반환)
+
+    JPEG는 draft 모드로 DCT 스케일링하여 전체 해상도 디코딩을 피합니다.
+    """
+    original_size = image_size(image_path)
+    img = load_rgb(image_path, (size, size), fit="contain")
+    img.thumbnail((size, size), Image.Resampling.BILINEAR)
+    return np.asarray(img, dtype=np.float32) / 255.0, original_size
+
+
+def _to_gray(rgb: np.ndarray) -> np.ndarray:
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def laplacian_variance(gray: np.ndarray) -> float:
+    """4-이웃 Laplacian 응답의 분산 (0~255 스케일)"""
+    if gray.shape[0] < 3 or gray.shape[1] < 3:
+        return 0.0
+    g = gray * 255.0
+    lap = (
+        g[:-2, 1:-1] + g[2:, 1:-1] + g[1:-1, :-2] + g[1:-1, 2:]
+        - 4.0 * g[1:-1, 1:-1]
+    )
+    return float(lap.var())
+
+
+def color_entropy(rgb: np.ndarray, bins: int = 8) -> float:
+    """양자화된 RGB 3차원 히스토그램의 엔트로피 (비트, 최대 log2(bins^3))"""
+    q = np.clip((rgb * bins).astype(np.int32), 0, bins - 1)
+    idx = (q[..., 0] * bins + q[..., 1]) * bins + q[..., 2]
+    counts = np.bincount(idx.ravel(), minlength=bins ** 3).astype(np.float64)
+    p = counts[counts > 0] / counts.sum()
+    return float(-(p * np.log2(p)).sum())
+
+
+def difference_hash(gray: np.ndarray, hash_size: int = 8) -> np.ndarray:
+    """difference hash (hash_size x hash_size 비트 bool 배열)"""
+    img = Image.fromarray(np.clip(gray * 255.0, 0, 255).astype(np.uint8))
+    small = np.asarray(img.resize((hash_size + 1, hash_size), Image.Resampling.BOX), dtype=np.int16)
+    return (small[:, 1:] > small[:, :-1]).ravel()
+
+
+def measure_image(image_path: Path) -> ImageQuality:
+    """이미지 하나의 품질 지표 측정 (사용 불가 사유는 reasons에 기록)"""
+    image_path = Path(image_path)
+    quality = ImageQuality(path=image_path)
+    try:
+        rgb, (width, height) = _load_reduced(image_path)
+    except Exception as e:
+        quality.reasons.append(f"decode failed: {e}")
+        return quality
+
+    gray = _to_gray(rgb)
+    quality.width, quality.height = width, height
+    aspect = width / height if height else 0.0
+    # 16:9와의 로그 비율 차이 → 0~1 (1이 완벽)
+    quality.aspect_fit = float(np.exp(-abs(np.log(aspect / TARGET_ASPECT)))) if aspect > 0 else 0.0
+    quality.sharpness = laplacian_variance(gray)
+    quality.brightness = float(gray.mean())
+    quality.clipped_ratio = float(((gray < 0.02) | (gray > 0.98)).mean())
+    quality.color_entropy = color_entropy(rgb)
+    quality.dhash = difference_hash(gray)
+
+    if width < MIN_WIDTH or height < MIN_HEIGHT:
+        quality.reasons.append(f"low resolution {width}x{height}")
+    if quality.sharpness < MIN_SHARPNESS:
+        quality.reasons.append(f"blurry ({quality.sharpness:.1f})")
+    if not MIN_BRIGHTNESS <= quality.brightness <= MAX_BRIGHTNESS:
+        quality.reasons.append(f"bad exposure ({quality.brightness:.2f})")
+    if quality.clipped_ratio > MAX_CLIPPED_RATIO:
+        quality.reasons.append(f"clipped ({quality.clipped_ratio:.0%})")
+    if quality.color_entropy < MIN_COLOR_ENTROPY:
+        quality.reasons.append(f"flat colors ({quality.color_entropy:.2f})")
+
+    quality.score = _composite_score(quality)
+    return quality
+
+
+def _composite_score(q: ImageQuality) -> float:
+    """0~1 종합 점수 (각 지표를 포화 함수로 정규화한 가중 합)"""
+    resolution = min(1.0, (q.width * q.height) / (1280 * 720))
+    sharpness = 1.0 - np.exp(-q.sharpness / 200.0)
+    exposure = 1.0 - min(1.0, abs(q.brightness - 0.5) * 2.0)
+    entropy = min(1.0, q.color_entropy / 7.0)
+    return float(
+        0.20 * resolution
+        + 0.25 * q.aspect_fit
+        + 0.25 * sharpness
+        + 0.15 * exposure
+        + 0.15 * entropy
+    )
+
+
+def _mark_duplicates(qualities: List[ImageQuality]) -> None:
+    """dHash 해밍 거리로 중복 이미지 표시 (사용 가능한 것 중 점수가 높은 쪽을 남김)"""
+    candidates = [q for q in qualities if q.usable and q.dhash is not None]
+    if len(candidates) < 2:
+        return
+    candidates.sort(key=lambda q: q.score, reverse=True)
+    hashes = np.stack([q.dhash for q in candidates])
+    # 모든 쌍의 해밍 거리 (N x N)
+    distances = (hashes[:, None, :] != hashes[None, :, :]).sum(axis=2)
+    for i, q in enumerate(candidates):
+        if q.duplicate_of is not None:
+            continue
+        dup_idx = np.nonzero(distances[i, i + 1:] <= DUPLICATE_DISTANCE)[0] + i + 1
+        for j in dup_idx:
+            dup = candidates[j]
+            if dup.duplicate_of is None:
+                dup.duplicate_of = q.path
+                dup.reasons.append(f"duplicate of {q.path.name}")
+
+
+def prerank_images(image_paths: List[Path]) -> Tuple[List[ImageQuality], List[ImageQuality]]:
+    """
+    이미지 목록을 로컬 품질 점수로 정렬
+
+    Args:
+        image_paths: 평가할 이미지 경로 목록
+
+    Returns:
+        (사용 가능 이미지 점수 내림차순, 사용 불가 이미지) 튜플
+    """
+    qualities = [measure_image(p) for p in image_paths]
+    _mark_duplicates(qualities)
+    usable = sorted((q for q in qualities if q.usable), key=lambda q: q.score, reverse=True)
+    rejected = [q for q in qualities if not q.usable]
+    return usable, rejected
@@ -0,0 +1,285 @@
+"""
+렌더용 이미지 변형(variant) 사전 생성 모듈
+
+다운로드 직후 무드 이미지마다 렌더에 바로 쓸 수 있는 크기의 파생 이미지를 만들어 둡니다.
+렌더 시에는 원본 JPEG를 다시 열어 변환/리사이즈할 필요 없이 변형 파일만 읽습니다.
+
+- kenburns: 1920x1080 Ken Burns 줌/패닝용 확대 캔버스 (가로형 이미지)
+- letterbox: 1920x1080 검은 여백 세로형 프레임 (16:9보다 좁은 이미지)
+- shorts: 1080x1920 Shorts용 중앙 크롭
+
+변형 파일은 `{이미지 디렉토리}/.render/` 아래에 원본 내용 해시를 키로 저장합니다.
+디스크 사용량을 감안해 정확한 출력 크기의 고품질 JPEG(4:4:4)로 저장하므로,
+렌더 시에는 리사이즈 없이 디코딩만 하면 됩니다.
+"""
+
+import hashlib
+import json
+import os
+import concurrent.futures
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+try:
+    from utils.image_loader import image_size, load_rgb, scaled_size
+except ImportError:
+    from src.utils.image_loader import image_size, load_rgb, scaled_size
+
+RENDER_DIR_NAME = ".render"
+INDEX_FILE_NAME = "index.json"
+
+VIDEO_RESOLUTION = (1920, 1080)
+SHORTS_RESOLUTION = (1080, 1920)
+# VideoMaker.create_image_sequence의 end_scale(1.15) * 패닝 여유(1.2)
+KEN_BURNS_MAX_SCALE = 1.15 * 1.2
+
+_JPEG_OPTIONS = {"quality": 95, "subsampling": 0}
+
+
+def source_hash(image_path: Path) -> str:
+    """원본 이미지 내용 해시 (변형 파일 키)"""
+    h = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def kenburns_canvas_size(
+    image_size: Tuple[int, int],
+    resolution: Tuple[int, int] = VIDEO_RESOLUTION,
+    max_scale: float = KEN_BURNS_MAX_SCALE,
+) -> Tuple[int, int]:
+    """Ken Burns 캔버스 크기 (create_image_clip_with_ken_burns와 동일한 계산)"""
+    target_width, target_height = resolution
+    img_aspect = image_size[0] / image_size[1]
+    scaled_width = int(target_width * max_scale)
+    scaled_height = int(target_height * max_scale)
+    if img_aspect > target_width / target_height:
+        scaled_height = int(scaled_width / img_aspect)
+    else:
+        scaled_width = int(scaled_height * img_aspect)
+    return scaled_width, scaled_height
+
+
+def is_portrait(image_size: Tuple[int, int], resolution: Tuple[int, int] = VIDEO_RESOLUTION) -> bool:
+    """16:9 프레임보다 좁은 이미지인지 (렌더 시 letterbox 처리 대상)"""
+    return image_size[0] / image_size[1] < resolution[0] / resolution[1]
+
+
+def make_letterbox_frame(img: Image.Image, resolution: Tuple[int, int] = VIDEO_RESOLUTION) -> Image.Image:
+    """높이에 맞춰 리사이즈하고 검은 배경 중앙에 배치한 프레임"""
+    target_width, target_height = resolution
+    display_height = target_height
+    display_width = int(display_height * img.width / img.height)
+    resized = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+    frame = Image.new('RGB', (target_width, target_height), (0, 0, 0))
+    frame.paste(resized, ((target_width - display_width) // 2, 0))
+    return frame
+
+
+def make_center_crop(img: Image.Image, resolution: Tuple[int, int] = SHORTS_RESOLUTION) -> Image.Image:
+    """목표 비율로 중앙 크롭 후 리사이즈"""
+    target_w, target_h = resolution
+    aspect = target_w / target_h
+    iw, ih = img.size
+    if iw / ih > aspect:
+        new_w = int(ih * aspect)
+        left = (iw - new_w) // 2
+        img = img.crop((left, 0, left + new_w, ih))
+    else:
+        new_h = int(iw / aspect)
+        top = (ih - new_h) // 2
+        img = img.crop((0, top, iw, top + new_h))
+    return img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+
+
+def _variant_path(render_dir: Path, digest: str, variant: str, size: Tuple[int, int]) -> Path:
+    return render_dir / f"{digest}_{variant}_{size[0]}x{size[1]}.jpg"
+
+
+def _load_index(render_dir: Path) -> Dict:
+    index_path = render_dir / INDEX_FILE_NAME
+    if index_path.exists():
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {}
+
+
+def _save_index(render_dir: Path, index: Dict) -> None:
+    index_path = render_dir / INDEX_FILE_NAME
+    tmp_path = index_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, index_path)
+
+
+def build_render_variants(
+    image_path: Path,
+    resolution: Tuple[int, int] = VIDEO_RESOLUTION,
+    shorts_resolution: Tuple[int, int] = SHORTS_RESOLUTION,
+    max_scale: float = KEN_BURNS_MAX_SCALE,
+) -> Dict:
+    """
+    이미지 하나의 렌더용 변형 생성 (이미 있으면 건너뜀)
+
+    Returns:
+        인덱스 항목 {'hash', 'size', 'mtime', 'width', 'height', 'variants': {이름: 파일명}}
+    """
+    image_path = Path(image_path)
+    render_dir = image_path.parent / RENDER_DIR_NAME
+    render_dir.mkdir(exist_ok=True)
+    stat = image_path.stat()
+    digest = source_hash(image_path)
+
+    width, height = image_size(image_path)
+    portrait = is_portrait((width, height), resolution)
+    canvas = kenburns_canvas_size((width, height), resolution, max_scale)
+
+    # 모든 변형을 덮는 최소 크기로 한 번만 축소 디코딩
+    needed = [scaled_size((width, height), shorts_resolution, "cover")]
+    needed.append((width * resolution[1] // height, resolution[1]) if portrait else canvas)
+    cover = (max(n[0] for n in needed), max(n[1] for n in needed))
+    src = load_rgb(image_path, cover, fit="cover")
+
+    targets = {'shorts': (shorts_resolution, lambda: make_center_crop(src, shorts_resolution))}
+    if portrait:
+        targets['letterbox'] = (resolution, lambda: make_letterbox_frame(src, resolution))
+    else:
+        targets['kenburns'] = (canvas, lambda: src.resize(canvas, Image.Resampling.LANCZOS))
+
+    variants = {}
+    for name, (size, render) in targets.items():
+        out_path = _variant_path(render_dir, digest, name, size)
+        if not out_path.exists():
+            render().save(out_path, 'JPEG', **_JPEG_OPTIONS)
+        variants[name] = out_path.name
+
+    return {
+        'hash': digest,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'width': width,
+        'height': height,
+        'variants': variants,
+    }
+
+
+def build_variants_for_dir(
+    image_dir: Path,
+    pattern: str = "mood_*.jpg",
+    max_workers: int = 4,
+    logger=None,
+) -> int:
+    """
+    디렉토리의 모든 이미지에 대해 렌더용 변형 생성 (다운로드 후처리 단계)
+
+    Returns:
+        변형이 준비된 이미지 수
+    """
+    image_dir = Path(image_dir)
+    images = sorted(image_dir.glob(pattern))
+    if not images:
+        return 0
+
+    render_dir = image_dir / RENDER_DIR_NAME
+    render_dir.mkdir(exist_ok=True)
+    index = _load_index(render_dir)
+
+    def _up_to_date(path: Path) -> bool:
+        entry = index.get(path.name)
+        if not entry:
+            return False
+        stat = path.stat()
+        return (
+            entry.get('size') == stat.st_size
+            and entry.get('mtime') == stat.st_mtime
+            and all((render_dir / name).exists() for name in entry.get('variants', {}).values())
+        )
+
+    pending = [p for p in images if not _up_to_date(p)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(build_render_variants, p): p for p in pending}
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+            try:
+                index[path.name] = future.result()
+            except Exception as e:
+                if logger:
+                    logger.warning(f"렌더용 변형 생성 실패 ({path.name}): {e}")
+
+    # 삭제된 원본의 인덱스 항목과 변형 파일 정리
+    names = {p.name for p in images}
+    index = {k: v for k, v in index.items() if k in names}
+    referenced = {name for entry in index.values() for name in entry.get('variants', {}).values()}
+    for stale in render_dir.glob("*.jpg"):
+        if stale.name not in referenced:
+            stale.unlink(missing_ok=True)
+    _save_index(render_dir, index)
+
+    return sum(1 for p in images if p.name in index)
+
+
+_index_cache: Dict[Path, Tuple[float, Dict]] = {}
+
+
+def _cached_index(render_dir: Path) -> Dict:
+    """렌더 중 반복 조회를 위해 index.json을 mtime 기준으로 캐시"""
+    index_path = render_dir / INDEX_FILE_NAME
+    try:
+        mtime = index_path.stat().st_mtime
+    except OSError:
+        return {}
+    cached = _index_cache.get(render_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    index = _load_index(render_dir)
+    _index_cache[render_dir] = (mtime, index)
+    return index
+
+
+def find_render_variant(image_path: Path, variant: str) -> Optional[Tuple[Path, Tuple[int, int]]]:
+    """
+    원본 이미지의 렌더용 변형 파일 조회
+
+    원본이 인덱스 생성 이후 변경되었으면(크기/mtime 불일치) None을 반환합니다.
+
+    Returns:
+        (변형 파일 경로, 원본 (width, height)) 또는 None
+    """
+    image_path = Path(image_path)
+    render_dir = image_path.parent / RENDER_DIR_NAME
+    entry = _cached_index(render_dir).get(image_path.name)
+    if not entry or variant not in entry.get('variants', {}):
+        return None
+    try:
+        stat = image_path.stat()
+    except OSError:
+        return None
+    if entry.get('size') != stat.st_size or entry.get('mtime') != stat.st_mtime:
+        return None
+    path = render_dir / entry['variants'][variant]
+    if not path.exists():
+        return None
+    return path, (entry['width'], entry['height'])
+
+
+def load_render_variant(image_path: Path, variant: str) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+    """
+    렌더용 변형을 RGB 배열로 로드
+
+    Returns:
+        (H x W x 3 uint8 배열, 원본 (width, height)) 또는 None
+    """
+    found = find_render_variant(image_path, variant)
+    if found is None:
+        return None
+    path, original_size = found
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGB')), original_size
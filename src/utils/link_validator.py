@@ -5,15 +5,37 @@
 - 알라딘 ISBN URL: 실제 책 존재 여부 확인 (리디렉션 체인 분석)
 - Amazon URL: HTTP 접근 가능 여부 확인
 - 검색 URL: 기본 접근 가능 여부 확인
+
+같은 알라딘/Amazon URL이 여러 영상의 댓글과 여러 스크립트(24/25)에 반복되므로
+- 검사 결과는 `.cache/link_validation.sqlite3`에 보관 (유효 결과는 길게, 무효 결과는 짧게,
+  타임아웃/5xx 같은 일시 오류는 보관하지 않음)
+- 페이지 전체를 받지 않도록 HEAD로 확인하고, HEAD를 거부하는 서버만 1바이트 Range GET
+- 여러 URL은 AsyncLinkValidator / validate_purchase_urls()로 중복 제거 후 동시에 검사
+  (도메인별 동시 검사 수 제한 + 호스트별 최소 요청 간격)
+
+사용 예:
+    results = validate_purchase_urls(urls)            # {url: {'valid': bool, 'reason': str}}
+    results = await AsyncLinkValidator().validate_many(urls)
 """
 
 import re
 import time
+import asyncio
 import logging
-from typing import Dict, List, Tuple
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import requests
 
+try:
+    from utils.http_client import get_http_client
+except ImportError:
+    from src.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 _HEADERS = {
@@ -28,6 +50,21 @@ _HEADERS = {
 
 _URL_RE = re.compile(r"https?://[^\s\n\)\"\'>< ]+")
 
+LINK_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "link_validation.sqlite3"
+
+# 검사 결과 보관 시간 (초) — 무효 판정은 알라딘 등록 지연 등으로 바뀔 수 있어 짧게
+VALID_TTL = 7 * 24 * 3600
+INVALID_TTL = 12 * 3600
+# 같은 호스트에 보내는 검사 요청 간 최소 간격 (초)
+HOST_INTERVAL = 0.5
+# 도메인별 동시 검사 수 (기본값 / 도메인별 재정의)
+DEFAULT_DOMAIN_CONCURRENCY = 4
+DOMAIN_LIMITS = {"www.aladin.co.kr": 2}
+# HEAD를 거부하는 서버의 응답 → Range GET으로 다시 확인
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+
+PathLike = Union[str, Path]
+
 # 구매 섹션 패턴 — 링크 줄이 하나도 없는 경우(헤더 바로 뒤 푸터)만 매치하여 제거
 _EMPTY_SECTION_KO = re.compile(
     r"📖 이 책 구매하기:\n\(위 링크를 통해 구매하시면 채널 운영에 도움이 됩니다\)\n?",
@@ -37,6 +74,158 @@ _EMPTY_SECTION_EN = re.compile(
 )
 
 
+# ---------------------------------------------------------------------------
+# 결과 캐시 / 호스트별 간격
+# ---------------------------------------------------------------------------
+
+class LinkValidationCache:
+    """URL 검사 결과 영구 캐시 (SQLite, 유효/무효 결과별 TTL)"""
+
+    def __init__(self, db_path: PathLike = LINK_CACHE_PATH, valid_ttl: float = VALID_TTL,
+                 invalid_ttl: float = INVALID_TTL, clock=time.time):
+        self.db_path = Path(db_path)
+        self.valid_ttl = valid_ttl
+        self.invalid_ttl = invalid_ttl
+        self.clock = clock
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS links ("
+                "url TEXT PRIMARY KEY, valid INTEGER NOT NULL, reason TEXT, checked_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 연결 (정상 종료 시 commit, 예외 시 rollback 후 닫기)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Tuple[bool, str]]:
+        """만료되지 않은 결과 {url: (유효 여부, 사유)} (없는 URL은 빠짐)"""
+        urls = list(urls)
+        now = self.clock()
+        found: Dict[str, Tuple[bool, str]] = {}
+        with self._connect() as conn:
+            for start in range(0, len(urls), 500):
+                batch = urls[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT url, valid, reason, checked_at FROM links WHERE url IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for url, valid, reason, checked_at in rows:
+                    ttl = self.valid_ttl if valid else self.invalid_ttl
+                    if checked_at + ttl > now:
+                        found[url] = (bool(valid), reason)
+        return found
+
+    def get(self, url: str) -> Optional[Tuple[bool, str]]:
+        return self.get_many([url]).get(url)
+
+    def put(self, url: str, is_valid: bool, reason: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO links (url, valid, reason, checked_at) VALUES (?, ?, ?, ?)",
+                (url, int(is_valid), reason, self.clock()),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM links")
+
+
+class _HostPacer:
+    """호스트별 요청 시작 간격 유지 (다른 호스트는 서로 기다리지 않음)"""
+
+    def __init__(self, interval: float = HOST_INTERVAL, clock=time.monotonic, sleep=time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._next: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._next.get(host, now))
+            self._next[host] = start + self.interval
+        if start > now:
+            self.sleep(start - now)
+
+
+_cache: Optional[LinkValidationCache] = None
+_pacer = _HostPacer()
+
+
+def _get_cache() -> LinkValidationCache:
+    """공용 결과 캐시 (처음 쓸 때 생성)"""
+    global _cache
+    if _cache is None:
+        _cache = LinkValidationCache()
+    return _cache
+
+
+def clear_validation_cache() -> None:
+    """보관 중인 검사 결과 비우기"""
+    _get_cache().clear()
+
+
+# 검사 결과: (유효 여부, 사유, 일시 오류 여부) — 일시 오류는 캐시에 보관하지 않음
+CheckResult = Tuple[bool, str, bool]
+
+# 재시도해도 결과가 같은 요청 예외 (URL 자체가 잘못됨) — 그 밖의 예외는 일시 오류로 취급
+_PERMANENT_ERRORS = (
+    requests.exceptions.InvalidURL,
+    requests.exceptions.MissingSchema,
+    requests.exceptions.InvalidSchema,
+)
+
+
+def _status_result(status_code: int) -> CheckResult:
+    """HTTP 상태 코드 → 검사 결과 (429/5xx는 일시 오류)"""
+    transient = status_code == 429 or status_code >= 500
+    return status_code < 400, f"HTTP {status_code}", transient
+
+
+def _error_result(error: Exception) -> CheckResult:
+    """
+    검사 중 예외 → 검사 결과
+
+    타임아웃, 연결 오류, 서킷 열림(CircuitOpenError) 등 요청 예외와 예상하지 못한 예외는
+    모두 일시 오류로 표시해 무효 결과로 보관되지 않게 합니다.
+    """
+    if isinstance(error, _PERMANENT_ERRORS):
+        return False, str(error), False
+    if isinstance(error, requests.Timeout):
+        return False, "Timeout", True
+    if isinstance(error, requests.ConnectionError):
+        return False, "Connection error", True
+    return False, str(error) or type(error).__name__, True
+
+
+def _probe(url: str, timeout: float):
+    """
+    본문 없이 URL 확인: HEAD (리디렉션 추적) → 서버가 HEAD를 거부하면 1바이트 Range GET
+
+    Returns:
+        최종 응답 (status_code, url 사용)
+    """
+    http = get_http_client()
+    _pacer.wait(url)
+    resp = http.head(url, headers=_HEADERS, timeout=timeout, allow_redirects=True, retries=1)
+    if resp.status_code not in _HEAD_UNSUPPORTED:
+        return resp
+    _pacer.wait(url)
+    resp = http.get(url, headers={**_HEADERS, "Range": "bytes=0-0"}, timeout=timeout,
+                    allow_redirects=True, retries=1, stream=True)
+    resp.close()
+    return resp
+
+
 # ---------------------------------------------------------------------------
 # 개별 URL 검사
 # ---------------------------------------------------------------------------
@@ -50,30 +239,29 @@ def validate_aladin_url(url: str, timeout: int = 10) -> Tuple[bool, str]:
       * `wsearchresult` 등으로 리디렉션 → 책 없음 (무효)
     - 검색 URL(`wsearchresult`): 접근 가능 여부만 확인
     """
+    return _check_aladin(url, timeout)[:2]
+
+
+def _check_aladin(url: str, timeout: float = 10) -> CheckResult:
     is_isbn_direct = "wproduct.aspx" in url and "ISBN=" in url
 
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=timeout, allow_redirects=True)
-    except requests.Timeout:
-        return False, "Timeout"
-    except requests.ConnectionError:
-        return False, "Connection error"
+        resp = _probe(url, timeout)
     except Exception as e:  # noqa: BLE001
-        return False, str(e)
+        return _error_result(e)
 
     if resp.status_code >= 400:
-        return False, f"HTTP {resp.status_code}"
+        return _status_result(resp.status_code)
 
     if is_isbn_direct:
         final = resp.url
         if "wproduct.aspx" in final:
-            return True, "Book page found"
+            return True, "Book page found", False
         if "wsearchresult" in final or "/search/" in final.lower():
-            return False, "Book not found on Aladin (redirected to search)"
-        # 기타 리디렉션 - 상태 코드 기준
-        return True, f"HTTP {resp.status_code}"
+            return False, "Book not found on Aladin (redirected to search)", False
 
-    return True, f"HTTP {resp.status_code}"
+    # 검색 URL 또는 기타 리디렉션 - 상태 코드 기준
+    return _status_result(resp.status_code)
 
 
 def validate_amazon_url(url: str, timeout: int = 8) -> Tuple[bool, str]:
@@ -97,25 +285,121 @@ def validate_purchase_url(url: str, delay: float = 0.0) -> Tuple[bool, str]:
     단일 구매 링크 유효성 검사.
 
     알라딘/Amazon URL 여부에 따라 적합한 검사기를 선택합니다.
+    캐시에 결과가 있으면 요청 없이(대기도 없이) 이전 결과를 반환합니다.
     """
     url = url.rstrip(".,;)\"'")
     if not url.startswith(("http://", "https://")):
         return False, "Invalid URL format"
 
+    cache = _get_cache()
+    cached = cache.get(url)
+    if cached is not None:
+        return cached
+
     if delay > 0:
         time.sleep(delay)
 
+    is_valid, reason, transient = _check_url(url)
+    if not transient:
+        cache.put(url, is_valid, reason)
+    return is_valid, reason
+
+
+def _check_url(url: str) -> CheckResult:
     if "aladin.co.kr" in url:
-        return validate_aladin_url(url)
+        return _check_aladin(url)
     if "amazon.com" in url:
-        return validate_amazon_url(url)
+        return (*validate_amazon_url(url), False)
 
-    # 기타 URL - HEAD로 간단 확인
+    # 기타 URL - HEAD(또는 Range GET)로 간단 확인
     try:
-        resp = requests.head(url, headers=_HEADERS, timeout=8, allow_redirects=True)
-        return resp.status_code < 400, f"HTTP {resp.status_code}"
+        resp = _probe(url, timeout=8)
     except Exception as e:  # noqa: BLE001
-        return False, str(e)
+        return _error_result(e)
+    return _status_result(resp.status_code)
+
+
+class AsyncLinkValidator:
+    """
+    비동기 일괄 검사 서비스
+
+    검사 자체는 스레드에서 실행되어 공용 HTTP 클라이언트의 커넥션 풀/서킷 브레이커를 공유하고,
+    도메인별 세마포어로 동시 검사 수를, 호스트별 간격으로 요청 속도를 제한합니다.
+    """
+
+    def __init__(self, cache: Optional[LinkValidationCache] = None,
+                 max_per_domain: int = DEFAULT_DOMAIN_CONCURRENCY,
+                 domain_limits: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            cache: 결과 캐시 (None이면 공용 캐시)
+            max_per_domain: 도메인별 동시 검사 수
+            domain_limits: 특정 도메인의 동시 검사 수 재정의 {도메인: 개수}
+        """
+        self.cache = cache or _get_cache()
+        self.max_per_domain = max(1, max_per_domain)
+        self.domain_limits = {**DOMAIN_LIMITS, **(domain_limits or {})}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        domain = urlparse(url).netloc.lower()
+        if domain not in self._semaphores:
+            limit = min(self.domain_limits.get(domain, self.max_per_domain), self.max_per_domain)
+            self._semaphores[domain] = asyncio.Semaphore(limit)
+        return self._semaphores[domain]
+
+    async def _check(self, url: str) -> Tuple[bool, str]:
+        async with self._semaphore(url):
+            is_valid, reason, transient = await asyncio.to_thread(_check_url, url)
+        if not transient:
+            self.cache.put(url, is_valid, reason)
+        return is_valid, reason
+
+    async def validate(self, url: str) -> Tuple[bool, str]:
+        """단일 URL 검사 (캐시 우선)"""
+        info = (await self.validate_many([url]))[url.rstrip(".,;)\"'")]
+        return info["valid"], info["reason"]
+
+    async def validate_many(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 URL을 중복 제거 후 동시에 검사
+
+        Returns:
+            {url: {'valid': bool, 'reason': str}}
+        """
+        unique = list(dict.fromkeys(url.rstrip(".,;)\"'") for url in urls))
+        results: Dict[str, Tuple[bool, str]] = {
+            url: (False, "Invalid URL format") for url in unique if not url.startswith(("http://", "https://"))
+        }
+        pending = [url for url in unique if url not in results]
+        results.update(self.cache.get_many(pending))
+        pending = [url for url in pending if url not in results]
+        if pending:
+            logger.debug("링크 검사: %d개 중 %d개 요청 (나머지 캐시)", len(unique), len(pending))
+            checked = await asyncio.gather(*(self._check(url) for url in pending))
+            results.update(zip(pending, checked))
+        return {url: {"valid": results[url][0], "reason": results[url][1]} for url in unique}
+
+
+def validate_purchase_urls(urls: Iterable[str], max_per_domain: int = DEFAULT_DOMAIN_CONCURRENCY) -> Dict[str, Dict]:
+    """
+    여러 구매 링크를 중복 제거 후 동시에 검사 (AsyncLinkValidator의 동기 진입점).
+
+    캐시에 있는 URL은 요청하지 않고, 도메인별 동시 검사 수와 호스트별 간격을 지킵니다.
+
+    Returns:
+        {url: {'valid': bool, 'reason': str}}
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+    return asyncio.run(AsyncLinkValidator(max_per_domain=max_per_domain).validate_many(urls))
+
+
+def extract_purchase_urls(comment_text: str) -> List[str]:
+    """댓글 텍스트의 알라딘·Amazon 구매 링크 (등장 순서, 중복 제거)"""
+    urls = (raw.rstrip(".,;)\"'") for raw in _URL_RE.findall(comment_text))
+    return list(dict.fromkeys(url for url in urls if "aladin.co.kr" in url or "amazon.com" in url))
 
 
 # ---------------------------------------------------------------------------
@@ -132,16 +416,9 @@ def validate_purchase_links_in_comment(
     Returns:
         {url: {'valid': bool, 'reason': str}}
     """
-    raw_urls = _URL_RE.findall(comment_text)
     results: Dict[str, Dict] = {}
 
-    for raw in raw_urls:
-        url = raw.rstrip(".,;)\"'")
-        if "aladin.co.kr" not in url and "amazon.com" not in url:
-            continue
-        if url in results:
-            continue
-
+    for url in extract_purchase_urls(comment_text):
         is_valid, reason = validate_purchase_url(url, delay=delay)
         results[url] = {"valid": is_valid, "reason": reason}
         logger.debug("  URL %s → %s (%s)", url, "OK" if is_valid else "INVALID", reason)
@@ -0,0 +1,244 @@
+"""
+미디어 정보(probe) 캐시 모듈
+
+영상/오디오 길이를 알기 위해 VideoFileClip/AudioFileClip을 열면 파일마다 ffmpeg 리더
+프로세스가 뜹니다. 여기서는 파일당 한 번만 `ffprobe -show_format -show_streams`를 실행하고,
+결과를 (경로, 크기, mtime) 키로 로컬 JSON 저장소에 캐시합니다.
+
+- 길이, 코덱, 해상도, fps, 오디오 샘플레이트/채널 수
+- ffprobe가 없으면 MoviePy의 ffmpeg 정보 파서(ffmpeg -i)로 대체
+- 파일이 바뀌면(크기/mtime 변경) 자동으로 다시 probe
+
+사용 예:
+    from utils.media_probe import get_media_duration
+    duration = get_media_duration("assets/audio/Sapiens_summary_kr.mp3")
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass, asdict
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+CACHE_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "media_probe.json"
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class MediaInfo:
+    """probe 결과 요약"""
+    duration: float = 0.0
+    format_name: Optional[str] = None
+    bit_rate: Optional[int] = None
+    video_codec: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @property
+    def has_video(self) -> bool:
+        return self.video_codec is not None or self.width is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None or self.sample_rate is not None
+
+    @property
+    def resolution(self) -> Optional[tuple]:
+        return (self.width, self.height) if self.width and self.height else None
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_rate(value: Optional[str]) -> Optional[float]:
+    """'30000/1001' 형식 프레임레이트 → float"""
+    if not value or value in ("0/0", "0"):
+        return None
+    try:
+        return round(float(Fraction(value)), 3)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def get_ffmpeg_binary() -> Optional[str]:
+    """ffmpeg 실행 파일 경로 (PATH 우선, 없으면 MoviePy가 쓰는 imageio-ffmpeg 번들)"""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def parse_ffprobe_output(data: Dict) -> MediaInfo:
+    """`ffprobe -print_format json -show_format -show_streams` 출력 → MediaInfo"""
+    fmt = data.get("format", {})
+    info = MediaInfo(
+        duration=_to_float(fmt.get("duration")) or 0.0,
+        format_name=fmt.get("format_name"),
+        bit_rate=_to_int(fmt.get("bit_rate")),
+    )
+    for stream in data.get("streams", []):
+        codec_type = stream.get("codec_type")
+        if codec_type == "video" and info.video_codec is None:
+            # 앨범 아트(attached_pic)는 영상 스트림으로 치지 않음
+            if stream.get("disposition", {}).get("attached_pic"):
+                continue
+            info.video_codec = stream.get("codec_name")
+            info.width = _to_int(stream.get("width"))
+            info.height = _to_int(stream.get("height"))
+            info.fps = _parse_rate(stream.get("avg_frame_rate")) or _parse_rate(stream.get("r_frame_rate"))
+        elif codec_type == "audio" and info.audio_codec is None:
+            info.audio_codec = stream.get("codec_name")
+            info.sample_rate = _to_int(stream.get("sample_rate"))
+            info.channels = _to_int(stream.get("channels"))
+        if not info.duration:
+            info.duration = _to_float(stream.get("duration")) or 0.0
+    return info
+
+
+def _probe_with_ffprobe(path: str, ffprobe: str) -> MediaInfo:
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-print_format", "json", "-show_format", "-show_streams", path],
+        capture_output=True, text=True, timeout=30,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe 실패 ({path}): {result.stderr.strip()[:200]}")
+    return parse_ffprobe_output(json.loads(result.stdout or "{}"))
+
+
+def _probe_with_moviepy(path: str) -> MediaInfo:
+    """ffprobe가 없는 환경용: ffmpeg -i 출력 파싱 (디코딩 없음)"""
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+    infos = ffmpeg_parse_infos(path)
+    bitrate = _to_int(infos.get("bitrate"))
+    info = MediaInfo(
+        duration=float(infos.get("duration") or 0.0),
+        bit_rate=bitrate * 1000 if bitrate else None,
+    )
+    streams = [s for inp in infos.get("inputs", []) for s in inp.get("streams", [])]
+    for stream in streams:
+        if stream.get("stream_type") == "video" and info.width is None:
+            info.video_codec = stream.get("codec_name") or "unknown"
+            size = stream.get("size") or (None, None)
+            info.width, info.height = size[0], size[1]
+            info.fps = _to_float(stream.get("fps"))
+        elif stream.get("stream_type") == "audio" and info.sample_rate is None:
+            info.audio_codec = stream.get("codec_name") or "unknown"
+            info.sample_rate = _to_int(stream.get("fps"))
+    return info
+
+
+class MediaProbe:
+    """(경로, 크기, mtime) 키로 probe 결과를 캐시하는 미디어 정보 조회기"""
+
+    def __init__(self, cache_path: Optional[PathLike] = CACHE_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ffprobe = shutil.which("ffprobe")
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
+    def probe(self, path: PathLike) -> Optional[MediaInfo]:
+        """
+        미디어 정보 조회 (캐시 우선)
+
+        Returns:
+            MediaInfo 또는 None (파일 없음/probe 실패)
+        """
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._load().get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                self.hits += 1
+                return MediaInfo(**entry["info"])
+
+        try:
+            info = _probe_with_ffprobe(key, self.ffprobe) if self.ffprobe else _probe_with_moviepy(key)
+        except Exception:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            self._load()[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "info": asdict(info)}
+            try:
+                self._save()
+            except OSError:
+                pass
+        return info
+
+    def duration(self, path: PathLike) -> Optional[float]:
+        """미디어 길이(초) 또는 None"""
+        info = self.probe(path)
+        return info.duration if info else None
+
+
+_default_probe: Optional[MediaProbe] = None
+_default_probe_lock = threading.Lock()
+
+
+def get_media_probe() -> MediaProbe:
+    """기본 MediaProbe 인스턴스 반환 (프로세스 내 캐시 공유)"""
+    global _default_probe
+    with _default_probe_lock:
+        if _default_probe is None:
+            _default_probe = MediaProbe()
+        return _default_probe
+
+
+def probe_media(path: PathLike) -> Optional[MediaInfo]:
+    """기본 MediaProbe로 미디어 정보 조회"""
+    return get_media_probe().probe(path)
+
+
+def get_media_duration(path: PathLike) -> Optional[float]:
+    """기본 MediaProbe로 미디어 길이(초) 조회"""
+    return get_media_probe().duration(path)
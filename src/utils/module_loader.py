@@ -0,0 +1,130 @@
+"""
+모듈 로더 (숫자로 시작하는 파이프라인 스크립트 + 무거운 의존성 지연 import)
+
+`src/03_make_video.py`처럼 숫자로 시작하는 스크립트는 일반 import가 안 되어
+곳곳에서 `importlib.util.spec_from_file_location`으로 모듈 전체를 매번 다시 실행했습니다.
+여기서는 경로별로 한 번만 실행하고 결과를 재사용합니다.
+
+- load_script: 스크립트 모듈을 한 번만 로드 (프로세스 내 캐시)
+- lazy_script: 속성에 처음 접근할 때 로드하는 프록시
+- lazy_import: whisper/torch, moviepy, openai, google 클라이언트 등 무거운 패키지를
+  실제로 사용할 때 import하는 프록시
+- is_available: import 없이 설치 여부만 확인
+
+사용 예:
+    from utils.module_loader import lazy_import, load_script
+    whisper = lazy_import("whisper")
+    VideoMaker = load_script("03_make_video.py").VideoMaker
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, Union
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+_scripts: Dict[Path, ModuleType] = {}
+_lock = threading.RLock()
+
+
+def _resolve_script(script: Union[str, Path]) -> Path:
+    path = Path(script)
+    if not path.suffix:
+        path = path.with_suffix(".py")
+    if not path.is_absolute() and not path.exists():
+        path = SRC_DIR / path
+    return path.resolve()
+
+
+def load_script(script: Union[str, Path]) -> ModuleType:
+    """
+    파이프라인 스크립트를 모듈로 로드 (경로별 1회 실행 후 캐시)
+
+    Args:
+        script: `src/` 기준 파일명("03_make_video.py") 또는 경로
+
+    Returns:
+        로드된 모듈
+
+    Raises:
+        FileNotFoundError: 스크립트가 없을 때
+        Exception: 스크립트 실행 중 발생한 예외 (실패한 모듈은 캐시하지 않음)
+    """
+    path = _resolve_script(script)
+    with _lock:
+        module = _scripts.get(path)
+        if module is not None:
+            return module
+        if not path.exists():
+            raise FileNotFoundError(f"스크립트를 찾을 수 없습니다: {path}")
+
+        # 숫자로 시작하는 이름이라 일반 import와 충돌하지 않음 (로거 이름으로도 사용됨)
+        module_name = path.stem
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        # dataclass/pickle 등이 sys.modules에서 모듈을 찾을 수 있도록 등록
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        _scripts[path] = module
+        return module
+
+
+def is_available(name: str) -> bool:
+    """패키지 설치 여부 (import하지 않고 확인)"""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule(ModuleType):
+    """속성에 처음 접근할 때 실제 모듈을 로드하는 프록시"""
+
+    def __init__(self, name: str, loader: Callable[[], ModuleType]):
+        super().__init__(name)
+        self.__dict__["_lazy_loader"] = loader
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = self.__dict__["_lazy_loader"]()
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """일반 패키지 지연 import (예: lazy_import("whisper"))"""
+    return LazyModule(name, lambda: importlib.import_module(name))
+
+
+def lazy_script(script: Union[str, Path]) -> LazyModule:
+    """파이프라인 스크립트 지연 로드 (예: lazy_script("03_make_video.py"))"""
+    return LazyModule(Path(script).stem, lambda: load_script(script))
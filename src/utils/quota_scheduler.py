@@ -0,0 +1,340 @@
+"""
+YouTube Data API 쿼터 스케줄러
+
+업로드(09), 제휴 링크(24), 고정 댓글(25), 플레이리스트(27) 배치는 고정 delay만 두고 호출하다가
+일일 쿼터(기본 10,000단위)를 넘기면 중간에 403 quotaExceeded로 실패했습니다.
+googleapiclient 서비스 객체의 http 계층을 감싸 모든 요청을
+
+- 메서드별 쿼터 비용(METHOD_COSTS)으로 `.cache/youtube_quota_ledger.sqlite3` 원장에 기록
+  (여러 프로세스가 공유, 쿼터 일자는 YouTube 기준인 태평양 시간 자정으로 바뀜)
+- 우선순위(업로드 > 메타데이터 수정 > 댓글)별로 상위 작업 몫(PRIORITY_RESERVES)을 남기고 집행
+- 남은 쿼터가 모자라면 요청을 보내지 않고 QuotaExhausted
+- 403 quotaExceeded를 받으면 그날 원장을 소진으로 표시 (다른 프로세스도 바로 중단)
+- 요청 간 최소 간격(min_interval)만큼만 대기 (고정 sleep과 달리 이미 지난 시간은 차감)
+
+배치 스크립트는 영상 1개 같은 작업 단위를 시작하기 전에 can_afford()로 필요한 쿼터를 확인해
+반쯤 처리한 채 멈추지 않게 합니다. ETag 캐시와 함께 쓸 때는 캐시가 바깥이 되도록
+`enable_etag_cache(enable_quota_scheduler(service))` 순서로 감쌉니다 (캐시 적중은 집계 안 함).
+
+사용 예:
+    youtube = enable_quota_scheduler(build('youtube', 'v3', credentials=credentials),
+                                     priority=PRIORITY_METADATA, min_interval=1.0)
+    scheduler = get_quota_scheduler(youtube)
+    if not scheduler.can_afford("videos.list", "videos.update"):
+        ...
+    with scheduler.priority(PRIORITY_COMMENT):
+        youtube.commentThreads().insert(...).execute()
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata가 없는 환경 (Windows 등)
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+LEDGER_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "youtube_quota_ledger.sqlite3"
+
+# 프로젝트 기본 일일 쿼터 (환경 변수 YOUTUBE_DAILY_QUOTA로 변경)
+DEFAULT_DAILY_QUOTA = 10000
+
+# 메서드별 쿼터 비용 (목록 조회 1, 그 외 쓰기 50이 기본)
+LIST_COST = 1
+WRITE_COST = 50
+METHOD_COSTS = {
+    "search.list": 100,
+    "captions.list": 50,
+    "captions.insert": 400,
+    "captions.update": 450,
+    "captions.download": 200,
+    "videos.insert": 1600,
+}
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_UPLOAD = 0
+PRIORITY_METADATA = 1
+PRIORITY_COMMENT = 2
+PRIORITY_NAMES = {PRIORITY_UPLOAD: "업로드", PRIORITY_METADATA: "메타데이터", PRIORITY_COMMENT: "댓글"}
+
+# 우선순위별로 남겨 둘 쿼터: 메타데이터는 업로드 1건(+썸네일/다국어) 몫, 댓글은 업로드 2건 몫
+PRIORITY_RESERVES = {
+    PRIORITY_UPLOAD: 0,
+    PRIORITY_METADATA: 1700,
+    PRIORITY_COMMENT: 3400,
+}
+
+# googleapiclient 요청 HTTP 메서드 → API 메서드 이름
+HTTP_VERBS = {"GET": "list", "POST": "insert", "PUT": "update", "DELETE": "delete"}
+
+PathLike = Union[str, Path]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    day TEXT NOT NULL,
+    method TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    units INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, method)
+);
+CREATE TABLE IF NOT EXISTS exhausted (
+    day TEXT PRIMARY KEY,
+    marked_at REAL NOT NULL
+);
+"""
+
+
+class QuotaExhausted(RuntimeError):
+    """남은 쿼터로 요청을 보낼 수 없음 (재시도하지 않는 오류)"""
+
+    status = 403  # retry_utils.is_transient_error가 재시도 대상에서 제외
+
+    def __init__(self, method: str, needed: int, remaining: int, resets_at: datetime):
+        super().__init__(
+            f"YouTube API 쿼터 부족: {method} {needed}단위 필요, 남은 쿼터 {remaining}단위 "
+            f"(재설정: {resets_at.astimezone().strftime('%m-%d %H:%M')})"
+        )
+        self.method = method
+        self.needed = needed
+        self.remaining = remaining
+        self.resets_at = resets_at
+
+
+def method_cost(method: str, http_method: Optional[str] = None) -> int:
+    """
+    API 메서드의 쿼터 비용 (videos.update → 50)
+
+    METHOD_COSTS에 없는 메서드는 .list이거나 GET 요청(videos.getRating 같은 읽기 전용
+    하위 리소스)이면 조회 비용, 그 밖에는 쓰기 비용.
+    """
+    if method in METHOD_COSTS:
+        return METHOD_COSTS[method]
+    if method.endswith(".list") or (http_method or "").upper() == "GET":
+        return LIST_COST
+    return WRITE_COST
+
+
+def request_method(uri: str, http_method: str = "GET") -> Optional[str]:
+    """
+    요청 URI에서 API 메서드 이름 추출
+
+    /youtube/v3/videos (PUT) → videos.update, /upload/youtube/v3/thumbnails/set → thumbnails.set.
+    재개 업로드의 청크 전송(upload_id)과 YouTube Data API가 아닌 요청은 None (집계 안 함).
+    """
+    parts = urlsplit(uri)
+    marker = "/youtube/v3/"
+    if marker not in parts.path or "upload_id" in parse_qs(parts.query):
+        return None
+    segments = parts.path.split(marker, 1)[1].strip("/").split("/")
+    if len(segments) > 1:
+        return f"{segments[0]}.{segments[1]}"
+    return f"{segments[0]}.{HTTP_VERBS.get(http_method.upper(), 'list')}"
+
+
+def quota_day(now: Optional[float] = None) -> str:
+    """쿼터 일자 (태평양 시간 기준 YYYY-MM-DD)"""
+    return datetime.fromtimestamp(time.time() if now is None else now, QUOTA_TIMEZONE).date().isoformat()
+
+
+def next_reset(now: Optional[float] = None) -> datetime:
+    """다음 쿼터 재설정 시각 (태평양 시간 자정)"""
+    current = datetime.fromtimestamp(time.time() if now is None else now, QUOTA_TIMEZONE)
+    return datetime.combine(current.date() + timedelta(days=1), datetime.min.time(), QUOTA_TIMEZONE)
+
+
+def _is_quota_error(content) -> bool:
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="ignore")
+    return isinstance(content, str) and ("quotaExceeded" in content or "dailyLimitExceeded" in content)
+
+
+class QuotaLedger:
+    """일자별 쿼터 사용 원장 (SQLite, 프로세스 간 공유)"""
+
+    def __init__(self, db_path: PathLike = LEDGER_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _used(conn: sqlite3.Connection, day: str) -> int:
+        return conn.execute("SELECT COALESCE(SUM(units), 0) FROM usage WHERE day = ?", (day,)).fetchone()[0]
+
+    @staticmethod
+    def _is_exhausted(conn: sqlite3.Connection, day: str) -> bool:
+        return conn.execute("SELECT 1 FROM exhausted WHERE day = ?", (day,)).fetchone() is not None
+
+    def remaining(self, day: str, limit: int) -> int:
+        """그날 남은 쿼터 (소진 표시된 날은 0)"""
+        with self._connect() as conn:
+            if self._is_exhausted(conn, day):
+                return 0
+            return max(0, limit - self._used(conn, day))
+
+    def reserve(self, day: str, method: str, units: int, limit: int) -> bool:
+        """남은 쿼터(limit 기준)에 units가 들어가면 기록하고 True (확인과 기록을 한 트랜잭션으로)"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")  # 다른 프로세스의 동시 예약 차단
+            if self._is_exhausted(conn, day) or self._used(conn, day) + units > limit:
+                return False
+            conn.execute(
+                """INSERT INTO usage (day, method, calls, units) VALUES (?, ?, 1, ?)
+                   ON CONFLICT (day, method) DO UPDATE SET calls = calls + 1, units = units + excluded.units""",
+                (day, method, units),
+            )
+            return True
+
+    def mark_exhausted(self, day: str) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO exhausted VALUES (?, ?)", (day, time.time()))
+
+    def usage(self, day: str) -> Dict[str, Tuple[int, int]]:
+        """{메서드: (호출 수, 단위)}"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT method, calls, units FROM usage WHERE day = ? ORDER BY units DESC", (day,))
+            return {method: (calls, units) for method, calls, units in rows}
+
+
+class QuotaScheduler:
+    """원장 기반 쿼터 예약 + 요청 간격 조절 (스레드 안전)"""
+
+    def __init__(self, ledger: Optional[QuotaLedger] = None, daily_limit: Optional[int] = None,
+                 priority: int = PRIORITY_METADATA, min_interval: float = 0.0,
+                 clock=time.time, sleep=time.sleep):
+        """
+        Args:
+            ledger: 사용 원장 (기본: LEDGER_PATH)
+            daily_limit: 일일 쿼터 (기본: YOUTUBE_DAILY_QUOTA 또는 10,000)
+            priority: 기본 우선순위 (PRIORITY_UPLOAD/METADATA/COMMENT)
+            min_interval: 요청 간 최소 간격 (초)
+        """
+        self.ledger = ledger or QuotaLedger()
+        self.daily_limit = daily_limit or int(os.getenv("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_QUOTA))
+        self.default_priority = priority
+        self.min_interval = min_interval
+        self.clock = clock
+        self.sleep = sleep
+        self.units_spent = 0
+        self.calls = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @property
+    def current_priority(self) -> int:
+        return getattr(self._local, "priority", self.default_priority)
+
+    @contextmanager
+    def priority(self, priority: int) -> Iterator[None]:
+        """이 블록 안의 요청을 다른 우선순위로 집행 (스레드별)"""
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            if previous is None:
+                del self._local.priority
+            else:
+                self._local.priority = previous
+
+    def _limit(self, priority: Optional[int]) -> int:
+        priority = self.current_priority if priority is None else priority
+        return self.daily_limit - PRIORITY_RESERVES.get(priority, 0)
+
+    def remaining(self, priority: Optional[int] = None) -> int:
+        """현재(또는 지정) 우선순위로 쓸 수 있는 남은 쿼터"""
+        return max(0, self.ledger.remaining(quota_day(self.clock()), self._limit(priority)))
+
+    def can_afford(self, *methods: str, priority: Optional[int] = None) -> bool:
+        """작업 단위 하나(methods 전체)를 끝낼 쿼터가 남았는지"""
+        return sum(method_cost(method) for method in methods) <= self.remaining(priority)
+
+    def require(self, *methods: str) -> None:
+        """작업 단위 시작 전 확인: can_afford가 아니면 요청 없이 QuotaExhausted"""
+        needed = sum(method_cost(method) for method in methods)
+        remaining = self.remaining()
+        if needed > remaining:
+            raise QuotaExhausted("+".join(methods), needed, remaining, next_reset(self.clock()))
+
+    def acquire(self, method: str, http_method: Optional[str] = None) -> None:
+        """요청 한 건 예약 (부족하면 QuotaExhausted) 후 min_interval 간격 맞추기"""
+        now = self.clock()
+        cost = method_cost(method, http_method)
+        if not self.ledger.reserve(quota_day(now), method, cost, self._limit(None)):
+            raise QuotaExhausted(method, cost, self.remaining(), next_reset(now))
+
+        with self._lock:
+            self.calls += 1
+            self.units_spent += cost
+            start = max(now, self._next_slot)
+            self._next_slot = start + self.min_interval
+        if start > now:
+            self.sleep(start - now)
+
+    def mark_exhausted(self) -> None:
+        """API가 quotaExceeded를 돌려줌 → 그날은 모든 프로세스 중단"""
+        self.ledger.mark_exhausted(quota_day(self.clock()))
+
+    def summary(self) -> str:
+        return (f"📊 YouTube 쿼터: 이번 실행 {self.units_spent}단위({self.calls}회), "
+                f"오늘 남은 쿼터 {self.remaining(PRIORITY_UPLOAD)}/{self.daily_limit}단위")
+
+
+class QuotaHttp:
+    """httplib2.Http 호환 래퍼: 요청마다 쿼터 예약, quotaExceeded 응답은 QuotaExhausted로 변환"""
+
+    def __init__(self, http, scheduler: QuotaScheduler):
+        self.http = http
+        self.scheduler = scheduler
+
+    def __getattr__(self, name):
+        # credentials, timeout, close 등은 원래 http 객체로 위임
+        return getattr(self.http, name)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        api_method = request_method(uri, method)
+        if api_method:
+            self.scheduler.acquire(api_method, method)
+        resp, content = self.http.request(uri, method, body=body, headers=headers, **kwargs)
+        if resp.status == 403 and _is_quota_error(content):
+            self.scheduler.mark_exhausted()
+            raise QuotaExhausted(api_method or uri, method_cost(api_method or "", method), 0,
+                                 next_reset(self.scheduler.clock()))
+        return resp, content
+
+
+def enable_quota_scheduler(service, scheduler: Optional[QuotaScheduler] = None, **kwargs):
+    """
+    googleapiclient 서비스 객체에 쿼터 스케줄러 적용 (같은 객체 반환)
+
+    kwargs는 QuotaScheduler 인자 (priority, min_interval 등). 이미 적용된 서비스는 그대로 반환.
+    """
+    http = getattr(service, "_http", None)
+    if http is None or get_quota_scheduler(service) is not None:
+        return service
+    service._http = QuotaHttp(http, scheduler or QuotaScheduler(**kwargs))
+    return service
+
+
+def get_quota_scheduler(service) -> Optional[QuotaScheduler]:
+    """서비스 객체의 스케줄러 (ETag 캐시로 감싼 경우도 위임으로 찾음, 미적용이면 None)"""
+    scheduler = getattr(getattr(service, "_http", None), "scheduler", None)
+    return scheduler if isinstance(scheduler, QuotaScheduler) else None
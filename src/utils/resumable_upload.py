@@ -0,0 +1,284 @@
+"""
+중단 후 이어 올리기가 가능한 YouTube 재개 업로드
+
+영상 업로드(09)는 `chunksize=-1`로 파일 전체를 한 요청에 보내고 next_chunk 재시도는
+프로세스 안에서만 이루어져, 수 GB 영상을 올리다 프로세스가 죽으면 처음부터 다시 보냈습니다.
+여기서는
+
+- 청크 크기를 업로드 회선 속도에 맞춰 지정 (256KiB 배수, 청크 하나가 약 CHUNK_SECONDS초)
+- 청크가 서버에 확인될 때마다 재개 세션 URI와 확인된 바이트 오프셋을
+  `.cache/upload_sessions.json`에 기록 (원자적 교체 + fsync)
+- 다시 실행하면 같은 파일/메타데이터의 세션을 찾아 서버에 실제 오프셋을 조회하고
+  그 위치부터 이어서 전송 (세션이 만료되었으면 새로 시작)
+
+세션 URI는 첫 청크 요청에서 만들어지므로, 첫 청크 전송 중 중단되면 그 청크만큼은 다시 보냅니다.
+
+사용 예:
+    media = MediaFileUpload(path, chunksize=resolve_chunk_size(), resumable=True, mimetype="video/*")
+    request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
+    response = resumable_upload(request, journal=UploadJournal(), key=upload_key(path, body))
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from googleapiclient.errors import HttpError
+
+try:
+    from utils.retry_utils import compute_backoff, get_circuit_breaker, is_transient_error
+except ImportError:
+    from src.utils.retry_utils import compute_backoff, get_circuit_breaker, is_transient_error
+
+UPLOAD_JOURNAL_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "upload_sessions.json"
+
+# 재개 세션 URI 유효 기간은 약 1주일 → 여유를 두고 6일 지난 기록은 버림
+SESSION_TTL = 6 * 24 * 3600
+
+# 청크 크기는 256KiB 배수여야 함 (마지막 청크 제외)
+CHUNK_ALIGN = 256 * 1024
+MIN_CHUNK = 8 * 1024 * 1024
+MAX_CHUNK = 256 * 1024 * 1024
+DEFAULT_CHUNK_MB = 32
+# 청크 하나를 보내는 목표 시간 (초): 중단 시 잃는 양과 요청 수의 균형
+CHUNK_SECONDS = 30
+
+PathLike = Union[str, Path]
+
+
+def chunk_size_for(upload_mbps: float, seconds: float = CHUNK_SECONDS) -> int:
+    """업로드 회선 속도(Mbps)에서 청크 하나를 약 seconds초에 보내는 크기 (256KiB 배수, 8~256MiB)"""
+    size = int(upload_mbps * 1_000_000 / 8 * seconds)
+    size = max(MIN_CHUNK, min(MAX_CHUNK, size))
+    return size // CHUNK_ALIGN * CHUNK_ALIGN
+
+
+def resolve_chunk_size(chunk_mb: Optional[float] = None, upload_mbps: Optional[float] = None) -> int:
+    """
+    업로드 청크 크기 결정 (바이트)
+
+    우선순위: chunk_mb → upload_mbps → 환경 변수 YOUTUBE_UPLOAD_CHUNK_MB → YOUTUBE_UPLOAD_MBPS
+    → DEFAULT_CHUNK_MB
+    """
+    # 명시한 인자가 환경 변수보다 우선 (--upload-mbps가 YOUTUBE_UPLOAD_CHUNK_MB에 가려지지 않도록)
+    if not chunk_mb and not upload_mbps:
+        chunk_mb = float(os.getenv("YOUTUBE_UPLOAD_CHUNK_MB", 0) or 0)
+        upload_mbps = float(os.getenv("YOUTUBE_UPLOAD_MBPS", 0) or 0)
+    if chunk_mb:
+        return max(CHUNK_ALIGN, int(chunk_mb * 1024 * 1024) // CHUNK_ALIGN * CHUNK_ALIGN)
+    if upload_mbps:
+        return chunk_size_for(upload_mbps)
+    return DEFAULT_CHUNK_MB * 1024 * 1024
+
+
+def upload_key(video_path: PathLike, body: Dict) -> str:
+    """업로드 식별 키: 같은 파일(경로/크기/수정 시각) + 같은 메타데이터일 때만 세션 재사용"""
+    stat = Path(video_path).stat()
+    payload = json.dumps(
+        [str(Path(video_path).resolve()), stat.st_size, stat.st_mtime_ns, body],
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+class UploadJournal:
+    """재개 세션 기록 (JSON 파일 하나, 스레드 안전, 기록마다 원자적 교체)"""
+
+    def __init__(self, path: PathLike = UPLOAD_JOURNAL_PATH, ttl: float = SESSION_TTL, clock=time.time):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Dict]) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """유효 기간 안의 세션 기록 (없으면 None)"""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry["created_at"] + self.ttl > self.clock():
+            return entry
+        return None
+
+    def save(self, key: str, session_uri: str, offset: int, size: int, video_path: str = "") -> None:
+        with self._lock:
+            entries = self._load()
+            now = self.clock()
+            # 만료된 기록 정리
+            entries = {k: v for k, v in entries.items() if v["created_at"] + self.ttl > now}
+            previous = entries.get(key)
+            created_at = previous["created_at"] if previous and previous["session_uri"] == session_uri else now
+            entries[key] = {
+                "session_uri": session_uri,
+                "offset": offset,
+                "size": size,
+                "video_path": video_path,
+                "created_at": created_at,
+                "updated_at": now,
+            }
+            self._write(entries)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._write(entries)
+
+
+def query_upload_offset(http, session_uri: str, size: int) -> Tuple[Optional[int], Optional[Dict]]:
+    """
+    재개 세션의 서버 확인 오프셋 조회 (빈 PUT + `Content-Range: bytes */크기`)
+
+    Returns:
+        (다음에 보낼 바이트 오프셋, 완료 응답)
+        - 이미 완료된 업로드: (size, 응답 본문)
+        - 만료/없는 세션: (None, None)
+
+    Raises:
+        HttpError: 그 밖의 오류 응답
+    """
+    resp, content = http.request(
+        session_uri, "PUT", body=b"", headers={"Content-Range": f"bytes */{size}", "Content-Length": "0"}
+    )
+    status = int(resp.status)
+    if status in (200, 201):
+        return size, json.loads(content)
+    if status == 308:
+        received = resp.get("range")
+        return (int(received.split("-")[1]) + 1 if received else 0), None
+    if status in (404, 410):
+        return None, None
+    raise HttpError(resp, content, uri=session_uri)
+
+
+def resumable_upload(request, journal: Optional[UploadJournal] = None, key: Optional[str] = None,
+                     video_path: str = "", max_retries: int = 5, retry_delay: float = 2.0,
+                     sleep=time.sleep) -> Dict:
+    """
+    재개 업로드 실행 (일시적 오류 재시도, YouTube 서킷 브레이커 공유, 세션 기록/이어 올리기)
+
+    Args:
+        request: 재개 가능한 미디어를 실은 HttpRequest (videos().insert(...))
+        journal: 세션 기록 (None이면 프로세스 안에서만 재시도)
+        key: 업로드 식별 키 (upload_key)
+        video_path: 기록에 남길 영상 경로 (확인용)
+        max_retries: 연속 재시도 최대 횟수
+        retry_delay: 첫 재시도 대기 (초)
+
+    Returns:
+        완료 응답 본문
+    """
+    size = request.resumable.size()
+    if journal and key:
+        entry = journal.get(key)
+        if entry and entry["size"] == size:
+            try:
+                offset, done = query_upload_offset(request.http, entry["session_uri"], size)
+            except Exception as e:
+                if not is_transient_error(e):
+                    raise
+                # 일시적 오류 → 세션은 그대로 두고 업로드 루프에 넘김
+                # (첫 next_chunk가 같은 재시도/서킷 경로로 서버 오프셋을 다시 조회)
+                print(f"   ⚠️ 업로드 위치 조회 실패, 재시도하며 이어서 진행: {e}")
+                request._in_error_state = True
+                offset, done = entry["offset"], None
+            if done is not None:
+                print("   ✅ 이전 실행에서 이미 업로드가 끝났습니다.")
+                journal.remove(key)
+                return done
+            if offset is None:
+                print("   ⚠️ 이전 업로드 세션이 만료되어 처음부터 다시 업로드합니다.")
+                journal.remove(key)
+            else:
+                request.resumable_uri = entry["session_uri"]
+                request.resumable_progress = offset
+                print(f"   ⏯️ 이전 업로드 이어서 진행: {offset / (1024 * 1024):.1f}MB / "
+                      f"{size / (1024 * 1024):.1f}MB ({int(offset / size * 100) if size else 0}%)")
+
+    response = None
+    retry = 0
+    wait_time = None
+    breaker = get_circuit_breaker("youtube")
+
+    while response is None:
+        # YouTube API가 연속 실패 중이면 청크 전송 없이 즉시 실패
+        trial = breaker.before_call()
+        pause = None
+        try:
+            status, response = request.next_chunk()
+            breaker.record_success()
+            retry = 0
+            if status:
+                print(f"   진행 중... {int(status.progress() * 100)}%", end='\r')
+                if journal and key and request.resumable_uri:
+                    journal.save(key, request.resumable_uri, request.resumable_progress, size, video_path)
+
+        except HttpError as e:
+            error_status = e.resp.status if hasattr(e.resp, 'status') else None
+
+            # 재시도 불가능한 오류 (인증 오류, 권한 오류 등) → 세션 기록도 버림
+            if error_status not in (500, 502, 503, 504) and error_status is not None:
+                print(f"\n   ❌ 업로드 실패: {e}")
+                if error_status == 403:
+                    print("   권한이 없습니다. OAuth2 토큰을 확인하세요.")
+                elif error_status == 401:
+                    print("   인증이 만료되었습니다. 토큰을 갱신하세요.")
+                if journal and key:
+                    journal.remove(key)
+                raise
+
+            # 서버 오류 → 재시도 (다음 next_chunk가 서버에 오프셋을 조회한 뒤 이어서 전송)
+            breaker.record_failure()
+            retry += 1
+            if retry > max_retries:
+                print(f"\n   ❌ 최대 재시도 횟수({max_retries}) 초과 (다음 실행에서 이어서 업로드)")
+                raise
+            wait_time = compute_backoff(retry - 1, retry_delay, 60, "decorrelated", wait_time)
+            print(f"\n   ⚠️ 서버 오류 발생 (재시도 {retry}/{max_retries})")
+            print(f"   {wait_time:.1f}초 후 재시도...")
+            pause = wait_time
+
+        except Exception as e:
+            # 네트워크 오류만 재시도 (파일 없음, 잘못된 인자 등은 즉시 실패)
+            if not is_transient_error(e):
+                print(f"\n   ❌ 업로드 실패: {e}")
+                raise
+            breaker.record_failure()
+            retry += 1
+            if retry > max_retries:
+                print(f"\n   ❌ 최대 재시도 횟수({max_retries}) 초과: {e} (다음 실행에서 이어서 업로드)")
+                raise
+            wait_time = compute_backoff(retry - 1, retry_delay, 60, "decorrelated", wait_time)
+            print(f"\n   ⚠️ 오류 발생: {e} (재시도 {retry}/{max_retries})")
+            print(f"   {wait_time:.1f}초 후 재시도...")
+            pause = wait_time
+
+        finally:
+            # 재시도 불가능한 오류로 끝난 시험 호출은 판정 없이 해제 (서킷이 영영 막히지 않도록)
+            if trial:
+                breaker.release_trial()
+        if pause is not None:
+            sleep(pause)
+
+    print("   완료!      ")
+    if journal and key:
+        journal.remove(key)
+    return response
@@ -1,41 +1,470 @@
-import time
-import random
+"""
+재시도 / 회로 차단(resilience) 유틸리티
+
+- retry_with_backoff: 동기·비동기 함수 모두 지원하는 재시도 데코레이터
+- 지터 전략: none / full / equal / decorrelated
+- 일시적 오류만 재시도 (is_transient_error: 연결 오류, 타임아웃, 429/5xx)
+- Retry-After 헤더 존중
+- 제공자별 서킷 브레이커 (Pexels, OpenAI TTS, YouTube 등): 죽은 API는 즉시 실패
+- 스레드 간 공유되는 재시도 예산 (RetryBudget): 장애 시 재시도 폭주 방지
+- 구조화된 이벤트 (add_retry_listener): 계측/로깅 계층에서 구독
+"""
+
+import asyncio
+import contextlib
 import functools
-from typing import Type, Tuple, Union
+import inspect
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Type, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ProviderSpec = Union[str, Callable[..., str], None]
+
+
+# ---------------------------------------------------------------------------
+# Retry-After
+# ---------------------------------------------------------------------------
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환.
+
+    Args:
+        value: 헤더 값 (초 단위 정수 또는 HTTP-date)
+        now: 기준 시각 (epoch 초, 테스트용)
+
+    Returns:
+        대기 시간(초) 또는 None (헤더 없음/해석 불가)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """예외에 연결된 HTTP 응답(requests.HTTPError.response 등)의 Retry-After 값(초)"""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+# ---------------------------------------------------------------------------
+# 오류 분류
+# ---------------------------------------------------------------------------
+
+# 재시도해도 결과가 바뀌지 않는 예외
+_PERMANENT_ERRORS = (
+    ValueError, TypeError, KeyError, AttributeError, AssertionError,
+    FileNotFoundError, PermissionError, NotImplementedError, ImportError,
+)
+_TRANSIENT_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def get_http_status(exc: BaseException) -> Optional[int]:
+    """requests / googleapiclient / openai 예외에서 HTTP 상태 코드 추출"""
+    for attr in ("status_code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    for holder in ("response", "resp"):
+        response = getattr(exc, holder, None)
+        for attr in ("status_code", "status"):
+            value = getattr(response, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    재시도할 가치가 있는 일시적 오류인지 판단.
+
+    - HTTP 상태 코드가 있으면 408/429/5xx만 재시도
+    - 서킷 차단, 잘못된 인자/설정, 파일 없음 등은 재시도하지 않음
+    - 그 외(연결 오류, 타임아웃 등 상태 코드 없는 I/O 오류)는 재시도
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    status = get_http_status(exc)
+    if status is not None:
+        return status in _TRANSIENT_STATUS
+    return not isinstance(exc, _PERMANENT_ERRORS)
+
+
+# ---------------------------------------------------------------------------
+# 지터 전략
+# ---------------------------------------------------------------------------
+
+JITTER_STRATEGIES = ("none", "full", "equal", "decorrelated")
+
+
+def compute_backoff(
+    attempt: int,
+    base: float,
+    cap: float,
+    jitter: str = "full",
+    previous: Optional[float] = None,
+) -> float:
+    """
+    재시도 대기 시간 계산.
+
+    Args:
+        attempt: 0부터 시작하는 재시도 순번
+        base: 초기 백오프 (초)
+        cap: 최대 백오프 (초)
+        jitter: "none" | "full" | "equal" | "decorrelated"
+        previous: 직전 대기 시간 (decorrelated 전략용)
+    """
+    exp = min(cap, base * (2 ** attempt))
+    if jitter == "none":
+        return exp
+    if jitter == "full":
+        return random.uniform(0, exp)
+    if jitter == "equal":
+        return exp / 2 + random.uniform(0, exp / 2)
+    if jitter == "decorrelated":
+        prev = base if previous is None else previous
+        return min(cap, random.uniform(base, max(base, prev * 3)))
+    raise ValueError(f"Unknown jitter strategy: {jitter} (choose from {JITTER_STRATEGIES})")
+
+
+# ---------------------------------------------------------------------------
+# 이벤트
+# ---------------------------------------------------------------------------
+
+_listeners: List[Callable[[Dict], None]] = []
+
+
+def add_retry_listener(callback: Callable[[Dict], None]) -> None:
+    """
+    재시도/서킷 이벤트 구독.
+
+    이벤트 dict 키: event ("retry" | "giveup" | "recovered" | "circuit_open" |
+    "circuit_closed" | "short_circuit" | "budget_exhausted"), provider, func,
+    attempt, delay, error, ts
+    """
+    _listeners.append(callback)
+
+
+def remove_retry_listener(callback: Callable[[Dict], None]) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def emit_event(event: str, **fields) -> None:
+    payload = {"event": event, "ts": time.time(), **fields}
+    for callback in list(_listeners):
+        try:
+            callback(payload)
+        except Exception:  # noqa: BLE001 - 계측 오류가 본 작업을 막지 않도록
+            logger.debug("retry listener failed", exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# 서킷 브레이커
+# ---------------------------------------------------------------------------
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit open for {name} (retry in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커 (closed → open → half-open)
+
+    failure_threshold번 연속 실패하면 reset_timeout 동안 열려서 즉시 실패하고,
+    이후 한 번의 시험 호출(half-open)이 성공하면 다시 닫힙니다.
+    시험 호출이 일시적이지 않은 오류(잘못된 인자, 4xx 등)로 끝나면 판정 없이 해제되어
+    다음 호출이 다시 시험합니다 (guard 사용).
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """호출 전 확인 (열려 있으면 CircuitOpenError). half-open 시험 호출이면 True"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return False
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        emit_event("short_circuit", provider=self.name)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def release_trial(self) -> None:
+        """시험 호출을 성공/실패 판정 없이 해제 (서킷은 half-open 유지)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    @contextlib.contextmanager
+    def guard(self):
+        """
+        before_call + 시험 호출 해제 보장
+
+        블록 안에서 record_success/record_failure로 판정하고, 판정 없이 끝나면
+        (일시적이지 않은 오류, 호출자가 잡지 않는 예외 등) 시험 호출을 중립으로 해제합니다.
+        그러지 않으면 half-open 상태에서 시험 호출이 영영 끝나지 않아 이후 호출이 모두
+        CircuitOpenError로 막힙니다.
+        """
+        trial = self.before_call()
+        try:
+            yield
+        finally:
+            if trial:
+                self.release_trial()
+
+    def record_success(self) -> None:
+        with self._lock:
+            was_open = self._opened_at is not None
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+        if was_open:
+            emit_event("circuit_closed", provider=self.name)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            trial_failed = self._trial_in_flight
+            self._trial_in_flight = False
+            opened = trial_failed or (self._opened_at is None and self._failures >= self.failure_threshold)
+            if opened:
+                self._opened_at = time.monotonic()
+        if opened:
+            logger.warning("Circuit opened for %s after %d failures", self.name, self._failures)
+            emit_event("circuit_open", provider=self.name, failures=self._failures)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, failure_threshold: int = 5, reset_timeout: float = 60.0) -> CircuitBreaker:
+    """제공자별 서킷 브레이커 (프로세스 내 공유)"""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(provider, failure_threshold, reset_timeout)
+            _breakers[provider] = breaker
+        return breaker
+
+
+# ---------------------------------------------------------------------------
+# 재시도 예산
+# ---------------------------------------------------------------------------
+
+class RetryBudget:
+    """
+    스레드 간 공유되는 재시도 예산 (토큰 버킷)
+
+    재시도 한 번에 토큰 하나를 쓰고, 토큰은 초당 refill_per_second개씩 max_tokens까지 채워집니다.
+    장애 상황에서 배치 전체가 재시도로 폭주하는 것을 막습니다.
+    """
+
+    def __init__(self, max_tokens: float = 20.0, refill_per_second: float = 0.5):
+        self.max_tokens = max_tokens
+        self.refill_per_second = refill_per_second
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_spend(self, amount: float = 1.0) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+
+_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(provider: str, max_tokens: float = 20.0, refill_per_second: float = 0.5) -> RetryBudget:
+    """제공자별 재시도 예산 (프로세스 내 공유)"""
+    with _breakers_lock:
+        budget = _budgets.get(provider)
+        if budget is None:
+            budget = RetryBudget(max_tokens, refill_per_second)
+            _budgets[provider] = budget
+        return budget
+
+
+# ---------------------------------------------------------------------------
+# 데코레이터
+# ---------------------------------------------------------------------------
 
 def retry_with_backoff(
     retries: int = 3,
     backoff_in_seconds: float = 1.0,
     max_backoff_in_seconds: float = 10.0,
-    exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception
+    exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+    jitter: str = "full",
+    retry_if: Optional[Callable[[BaseException], bool]] = is_transient_error,
+    provider: ProviderSpec = None,
+    budget: Optional[RetryBudget] = None,
 ):
     """
-    Exponential backoff retry decorator.
-    
+    Exponential backoff retry decorator for sync and async functions.
+
+    If the raised exception carries a Retry-After hint (an HTTP response with
+    a Retry-After header, or a ``retry_after`` attribute), that delay is used
+    instead of the exponential backoff, still capped by max_backoff_in_seconds.
+
     Args:
         retries: Maximum number of retries.
         backoff_in_seconds: Initial backoff time in seconds.
         max_backoff_in_seconds: Maximum backoff time in seconds.
-        exceptions: Exception types to catch and retry.
+        exceptions: Exception types to catch.
+        jitter: Jitter strategy ("none", "full", "equal", "decorrelated").
+        retry_if: Predicate deciding whether a caught exception is retried
+            (default: is_transient_error). None retries every caught exception.
+        provider: Provider name (or callable receiving the call arguments and
+            returning one). Enables the provider's shared circuit breaker and
+            retry budget, and tags emitted events.
+        budget: Explicit retry budget (defaults to the provider's budget).
     """
+    if jitter not in JITTER_STRATEGIES:
+        raise ValueError(f"Unknown jitter strategy: {jitter} (choose from {JITTER_STRATEGIES})")
+
     def decorator(func):
+        def _setup(args, kwargs):
+            name = provider(*args, **kwargs) if callable(provider) else provider
+            breaker = get_circuit_breaker(name) if name else None
+            spend = budget or (get_retry_budget(name) if name else None)
+            return name, breaker, spend
+
+        def _next_delay(attempt, error, name, spend, previous):
+            """재시도 여부 판단 후 대기 시간 반환 (None이면 포기)"""
+            fields = dict(provider=name, func=func.__name__, attempt=attempt + 1, error=repr(error))
+            if retry_if is not None and not retry_if(error):
+                return None
+            if attempt >= retries:
+                logger.error("All %d retries failed for %s: %s", retries, func.__name__, error)
+                emit_event("giveup", **fields)
+                return None
+            if spend is not None and not spend.try_spend():
+                logger.warning("Retry budget exhausted for %s; not retrying %s", name, func.__name__)
+                emit_event("budget_exhausted", **fields)
+                return None
+            retry_after = get_retry_after(error)
+            if retry_after is not None:
+                delay = min(max_backoff_in_seconds, retry_after)
+            else:
+                delay = compute_backoff(attempt, backoff_in_seconds, max_backoff_in_seconds, jitter, previous)
+            logger.warning(
+                "Error in %s: %s. Retrying in %.2fs... (%d/%d)",
+                func.__name__, error, delay, attempt + 1, retries,
+            )
+            emit_event("retry", delay=delay, **fields)
+            return delay
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                name, breaker, spend = _setup(args, kwargs)
+                attempt, delay = 0, None
+                while True:
+                    error = None
+                    with breaker.guard() if breaker else contextlib.nullcontext():
+                        try:
+                            result = await func(*args, **kwargs)
+                        except exceptions as e:
+                            if breaker and is_transient_error(e):
+                                breaker.record_failure()
+                            error = e
+                        else:
+                            if breaker:
+                                breaker.record_success()
+                    if error is not None:
+                        delay = _next_delay(attempt, error, name, spend, delay)
+                        if delay is None:
+                            raise error
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                        continue
+                    if attempt:
+                        emit_event("recovered", provider=name, func=func.__name__, attempt=attempt)
+                    return result
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            x = 0
+            name, breaker, spend = _setup(args, kwargs)
+            attempt, delay = 0, None
             while True:
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    if x == retries:
-                        print(f"❌ All {retries} retries failed for {func.__name__}: {e}")
-                        raise
-                    
-                    sleep_time = min(
-                        max_backoff_in_seconds,
-                        backoff_in_seconds * (2 ** x) + random.uniform(0, 1)
-                    )
-                    print(f"⚠️ Error in {func.__name__}: {e}. Retrying in {sleep_time:.2f}s... ({x+1}/{retries})")
-                    time.sleep(sleep_time)
-                    x += 1
+                error = None
+                with breaker.guard() if breaker else contextlib.nullcontext():
+                    try:
+                        result = func(*args, **kwargs)
+                    except exceptions as e:
+                        if breaker and is_transient_error(e):
+                            breaker.record_failure()
+                        error = e
+                    else:
+                        if breaker:
+                            breaker.record_success()
+                if error is not None:
+                    delay = _next_delay(attempt, error, name, spend, delay)
+                    if delay is None:
+                        raise error
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                if attempt:
+                    emit_event("recovered", provider=name, func=func.__name__, attempt=attempt)
+                return result
         return wrapper
     return decorator
@@ -0,0 +1,163 @@
+"""
+렌더링 구간(segment) 캐시
+
+Summary 슬라이드쇼(요약 오디오 + 이미지 Ken Burns + 파형/동적 자막 + 자막)는 몇 분씩
+렌더링되지만, 입력은 요약 오디오·이미지 세트·요약 텍스트·시각 설정뿐입니다.
+이 입력들의 내용 해시로 키를 만들어 렌더링된 구간 파일을 `.cache/segments/`에 보관하고,
+NotebookLM 영상이나 CTA만 바뀐 재렌더링에서는 캐시된 구간을 그대로 이어 붙입니다.
+
+- segment_key: 입력 파일 내용 해시 + 파라미터로 캐시 키 생성
+- SegmentCache: 키별 구간 파일 조회/저장 (오래된 항목은 개수 제한으로 정리)
+- concat_segments: 같은 인코딩 설정의 mp4들을 ffmpeg concat으로 재인코딩 없이 연결
+
+사용 예:
+    cache = get_segment_cache()
+    key = segment_key("summary", files={"audio": audio_path, "images": image_paths}, params={...})
+    cached = cache.get(key)
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    from utils.artifact_graph import get_file_hasher
+    from utils.media_probe import get_ffmpeg_binary
+except ImportError:
+    from src.utils.artifact_graph import get_file_hasher
+    from src.utils.media_probe import get_ffmpeg_binary
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache" / "segments"
+
+PathLike = Union[str, Path]
+
+
+def segment_key(kind: str, files: Optional[Dict[str, Union[PathLike, Sequence[PathLike], None]]] = None,
+                params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    구간 캐시 키 생성
+
+    Args:
+        kind: 구간 종류 (예: "summary")
+        files: 이름 → 파일 경로 또는 경로 목록 (내용 해시로 비교, 순서 유지)
+        params: 렌더링 결과에 영향을 주는 설정값
+
+    Returns:
+        "{kind}_{sha1 앞 16자}"
+    """
+    hasher = get_file_hasher()
+    hashed_files = {}
+    for name, value in (files or {}).items():
+        if value is None:
+            hashed_files[name] = None
+        elif isinstance(value, (str, Path)):
+            hashed_files[name] = hasher.hash_path(value)
+        else:
+            hashed_files[name] = [hasher.hash_path(p) for p in value]
+    hasher.save()
+
+    payload = json.dumps({"kind": kind, "files": hashed_files, "params": params or {}},
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return f"{kind}_{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]}"
+
+
+def text_digest(text: Optional[str]) -> Optional[str]:
+    """캐시 키용 텍스트 해시"""
+    if text is None:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class SegmentCache:
+    """키별 렌더링 구간 파일 저장소"""
+
+    def __init__(self, cache_dir: PathLike = CACHE_DIR, max_entries: int = 8, suffix: str = ".mp4"):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.suffix = suffix
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """캐시된 구간 경로 (없으면 None). 조회된 항목은 정리 대상에서 뒤로 밀림"""
+        path = self.path_for(key)
+        try:
+            if path.stat().st_size == 0:
+                return None
+        except OSError:
+            return None
+        os.utime(path)
+        return path
+
+    def put(self, key: str, rendered_path: PathLike) -> Path:
+        """렌더링이 끝난 파일을 캐시로 이동 (원자적 교체)"""
+        target = self.path_for(key)
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(rendered_path, target)
+            self._prune()
+        return target
+
+    def temp_path(self, key: str) -> Path:
+        """렌더링 중 사용할 임시 경로 (캐시와 같은 디렉토리 → put 시 rename만 발생)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self.cache_dir / f"{key}.{os.getpid()}.tmp{self.suffix}"
+
+    def _prune(self) -> None:
+        entries = sorted(
+            (p for p in self.cache_dir.glob(f"*{self.suffix}") if ".tmp" not in p.name),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for old in entries[self.max_entries:]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def concat_segments(segment_paths: List[PathLike], output_path: PathLike) -> bool:
+    """
+    같은 코덱/해상도/fps로 인코딩된 mp4들을 재인코딩 없이 연결 (ffmpeg concat demuxer)
+
+    Returns:
+        성공 여부 (실패 시 호출 측에서 전체 렌더링으로 대체)
+    """
+    ffmpeg = get_ffmpeg_binary()
+    if not ffmpeg:
+        return False
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        for path in segment_paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+        list_path = f.name
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", "-movflags", "+faststart", str(output_path)],
+            capture_output=True, text=True,
+        )
+        return result.returncode == 0 and Path(output_path).exists()
+    finally:
+        os.unlink(list_path)
+
+
+_default_cache: Optional[SegmentCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_segment_cache() -> SegmentCache:
+    """기본 SegmentCache 인스턴스 반환"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SegmentCache(max_entries=int(os.getenv("SEGMENT_CACHE_MAX_ENTRIES", "8")))
+        return _default_cache
@@ -0,0 +1,242 @@
+"""
+원본 텍스트 ↔ Whisper 전사 정렬 (banded DP)
+
+Summary 자막은 원본 문장 텍스트를 쓰고 타이밍만 Whisper에서 가져옵니다.
+원본 토큰열과 전사 토큰열을 정규화한 뒤 편집 거리 DP를 대각선 주변 band 안에서만 계산해
+O(n·band)로 전체를 한 번에 정렬합니다 (단어 쌍마다 SequenceMatcher를 돌리지 않음).
+전역 정렬이므로 중간에 몇 단어를 놓쳐도 이후 문장이 밀리지 않습니다.
+
+- normalize_token: 소문자/구두점 제거, 한국어는 조사·어미를 떼어 어간 비교
+- align_tokens: banded Needleman-Wunsch (일치/부분일치/치환/삽입/삭제)
+- align_sentences: 문장 목록 + 타임스탬프 단어 → 문장별 자막 (start/end/text)
+- segments_to_words: 단어 타임스탬프가 없을 때 세그먼트를 글자 수 비례 단어로 분해
+
+사용 예:
+    subtitles = align_sentences(sentences, whisper_words, language="ko")
+"""
+
+import math
+import re
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 대각선 기준 좌우 탐색 폭 (토큰 수)
+DEFAULT_BAND = 48
+
+# 정렬 비용
+MATCH_COST = 0.0
+PARTIAL_COST = 0.4
+SUBSTITUTE_COST = 1.2  # 치환 2번보다 삽입+일치+삭제를 선호 (삽입+삭제 2.0보다는 작게)
+GAP_COST = 1.0
+
+# 한국어 조사/어미 (긴 것부터 비교)
+KOREAN_SUFFIXES = tuple(sorted((
+    "에서는", "으로는", "에게서", "이라는", "이라고", "입니다", "습니다", "합니다",
+    "니다", "에서", "에게", "한테", "께서", "으로", "까지", "부터", "처럼", "보다",
+    "라는", "라고", "이다", "이고", "하고", "이며", "지만", "해서", "했다", "한다",
+    "은", "는", "이", "가", "을", "를", "에", "의", "로", "와", "과", "도", "만", "요", "다",
+), key=len, reverse=True))
+
+HANGUL_RE = re.compile(r"[가-힣]")
+NON_WORD_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_token(token: str, language: str = "ko") -> str:
+    """
+    비교용 토큰 정규화
+
+    NFC 정규화 → 소문자 → 구두점 제거, 한국어 어절은 조사/어미를 떼어 어간만 남김
+    (예: "인류는" → "인류", "사피엔스가" → "사피엔스"). 어간이 1글자가 되면 떼지 않음.
+    """
+    token = NON_WORD_RE.sub("", unicodedata.normalize("NFC", token).lower())
+    if language == "ko" and HANGUL_RE.search(token):
+        for suffix in KOREAN_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str, language: str = "ko") -> List[str]:
+    """공백 단위 토큰화 + 정규화 (빈 토큰 제외)"""
+    tokens = (normalize_token(word, language) for word in text.split())
+    return [token for token in tokens if token]
+
+
+def _pair_cost(a: str, b: str) -> Tuple[float, int]:
+    """토큰 쌍 비용과 종류 (0: 일치, 1: 부분일치, 2: 치환)"""
+    if a == b:
+        return MATCH_COST, 0
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    if len(shorter) >= 2 and (longer.startswith(shorter) or longer.endswith(shorter)):
+        return PARTIAL_COST, 1
+    return SUBSTITUTE_COST, 2
+
+
+def align_tokens(
+    reference: Sequence[str],
+    hypothesis: Sequence[str],
+    band: int = DEFAULT_BAND,
+) -> List[Optional[Tuple[int, int]]]:
+    """
+    banded DP 전역 정렬
+
+    행 i(원본)마다 전사 쪽은 대각선 중심 round(i·m/n) ± band 열만 계산하므로 비용은 O(n·band).
+
+    Returns:
+        원본 토큰별 (전사 인덱스, 종류) 또는 None(삭제). 종류 0: 일치, 1: 부분일치, 2: 치환
+    """
+    n, m = len(reference), len(hypothesis)
+    if not n or not m:
+        return [None] * n
+    # 행 간 중심 이동량보다 band가 좁으면 경로가 끊기므로 최소 폭 보장
+    band = max(band, math.ceil(m / n) + 1, math.ceil(n / m) + 1)
+
+    def bounds(i: int) -> Tuple[int, int]:
+        center = round(i * m / n)
+        return max(0, center - band), min(m, center + band)
+
+    inf = float("inf")
+    # 0행(중심 0 → 시작 열 0)은 왼쪽 이동(삽입)만 가능
+    _, hi0 = bounds(0)
+    prev_lo, prev = 0, [j * GAP_COST for j in range(hi0 + 1)]
+    rows_lo = [0]
+    backs = [bytes([2] * (hi0 + 1))]
+    kinds: List[bytearray] = [bytearray(hi0 + 1)]
+
+    for i in range(1, n + 1):
+        lo, hi = bounds(i)
+        width = hi - lo + 1
+        row = [inf] * width
+        back = bytearray(width)
+        kind = bytearray(width)
+        ref_token = reference[i - 1]
+        prev_hi = prev_lo + len(prev) - 1
+        for k in range(width):
+            j = lo + k
+            best, move, pair_kind = inf, 1, 0
+            # 위(원본 토큰 삭제)
+            if prev_lo <= j <= prev_hi:
+                best = prev[j - prev_lo] + GAP_COST
+            # 대각선(일치/치환)
+            if j >= 1 and prev_lo <= j - 1 <= prev_hi:
+                cost, pair_kind_candidate = _pair_cost(ref_token, hypothesis[j - 1])
+                value = prev[j - 1 - prev_lo] + cost
+                if value <= best:
+                    best, move, pair_kind = value, 0, pair_kind_candidate
+            # 왼쪽(전사 토큰 삽입)
+            if k >= 1 and row[k - 1] + GAP_COST < best:
+                best, move = row[k - 1] + GAP_COST, 2
+            row[k] = best
+            back[k] = move
+            kind[k] = pair_kind
+        rows_lo.append(lo)
+        backs.append(bytes(back))
+        kinds.append(kind)
+        prev_lo, prev = lo, row
+
+    # 역추적
+    result: List[Optional[Tuple[int, int]]] = [None] * n
+    i, j = n, m
+    while i > 0:
+        k = j - rows_lo[i]
+        move = backs[i][k]
+        if move == 0:
+            result[i - 1] = (j - 1, kinds[i][k])
+            i, j = i - 1, j - 1
+        elif move == 1:
+            i -= 1
+        else:
+            j -= 1
+    return result
+
+
+def segments_to_words(segments: Sequence[Dict]) -> List[Dict]:
+    """세그먼트 텍스트를 공백 단위 단어로 나누고 글자 수 비례로 시간 배분"""
+    words = []
+    for segment in segments:
+        parts = segment.get("text", "").split()
+        if not parts:
+            continue
+        start, end = float(segment["start"]), float(segment["end"])
+        total = sum(len(p) for p in parts)
+        cursor = start
+        for part in parts:
+            span = (end - start) * len(part) / total
+            words.append({"word": part, "start": cursor, "end": cursor + span})
+            cursor += span
+    return words
+
+
+def align_sentences(
+    sentences: Sequence[str],
+    words: Sequence[Dict],
+    language: str = "ko",
+    band: int = DEFAULT_BAND,
+    min_match_ratio: float = 0.0,
+) -> Optional[List[Dict]]:
+    """
+    원본 문장별 자막 타이밍 계산
+
+    Args:
+        sentences: 원본 문장 목록 (자막 텍스트로 그대로 사용)
+        words: Whisper 단어 [{"word", "start", "end"}, ...]
+        language: 언어 코드 (정규화 규칙 선택)
+        band: DP band 폭
+        min_match_ratio: 일치/부분일치 원본 토큰 비율이 이보다 낮으면 None
+
+    Returns:
+        [{"start", "end", "text"}, ...] 또는 None (정렬 실패)
+    """
+    if not sentences or not words:
+        return None
+
+    reference: List[str] = []
+    owners: List[int] = []
+    for index, sentence in enumerate(sentences):
+        tokens = tokenize(sentence, language)
+        reference.extend(tokens)
+        owners.extend([index] * len(tokens))
+
+    hypothesis: List[str] = []
+    word_of_token: List[int] = []
+    for index, word in enumerate(words):
+        for token in tokenize(word.get("word", ""), language):
+            hypothesis.append(token)
+            word_of_token.append(index)
+
+    alignment = align_tokens(reference, hypothesis, band=band)
+    matched = sum(1 for pair in alignment if pair is not None and pair[1] < 2)
+    if not reference or matched == 0 or matched / len(reference) < min_match_ratio:
+        return None
+
+    # 문장별 정렬된 단어 범위
+    spans: List[Optional[List[int]]] = [None] * len(sentences)
+    for ref_index, pair in enumerate(alignment):
+        if pair is None:
+            continue
+        word_index = word_of_token[pair[0]]
+        span = spans[owners[ref_index]]
+        if span is None:
+            spans[owners[ref_index]] = [word_index, word_index]
+        else:
+            span[0] = min(span[0], word_index)
+            span[1] = max(span[1], word_index)
+
+    # 정렬 결과가 없는 문장은 앞뒤 문장 사이 단어 구간으로 보간
+    subtitles = []
+    for index, sentence in enumerate(sentences):
+        span = spans[index]
+        if span is None:
+            prev_end = next((spans[k][1] for k in range(index - 1, -1, -1) if spans[k]), -1)
+            next_start = next((spans[k][0] for k in range(index + 1, len(spans)) if spans[k]), len(words))
+            first = prev_end + 1
+            last = min(next_start - 1, len(words) - 1)
+            if first > last:
+                continue
+            span = [first, last]
+        subtitles.append({
+            "start": words[span[0]]["start"],
+            "end": words[span[1]]["end"],
+            "text": sentence,
+        })
+    return subtitles or None
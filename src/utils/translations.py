@@ -1,1011 +1,155 @@
 """
 번역 관련 유틸리티 함수
+
+책 제목/작가 이름 매핑은 data/translations.json에 있으며, 처음 사용할 때 한 번만
+조회 인덱스로 컴파일됩니다.
+
+- 대소문자/공백/언더스코어 차이를 무시하는 정규화 조회
+- 양방향 조회: 한→영 매핑에 없으면 영→한 매핑을 뒤집어 찾음 (반대도 동일)
+- 선택적 퍼지 조회: 트라이그램 인덱스로 오타/띄어쓰기가 다른 제목 매칭
 """
 
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def translate_book_title(book_title: str) -> str:
-    """책 제목을 영어로 변환"""
-    # 알려진 책 제목 매핑 (한글 -> 영어)
-    title_map = {
-        "한국 현대시": "Modern Korean Poetry",
-        "한국_현대시": "Modern Korean Poetry",
-        "사마천의 사기": "Records of the Grand Historian",
-        "사마천의_사기": "Records of the Grand Historian",
-        "습관의 힘": "The Power of Habit",
-        "습관의_힘": "The Power of Habit",
-        "넛지": "Nudge",
-        "클루지": "Kluge",
-        "틸팅": "Tilting",
-        "흰": "The White Book",
-        "살인자의 기억법": "The Killer's Memorandum",
-        "파이프 이야기": "The Pipe Stories",
-        "북 오브 러브": "The Book of Love",
-        "조선왕조실록": "The Annals of the Joseon Dynasty",
-        "조선왕조실록": "The Annals of the Joseon Dynasty",
-        "마담 보바리": "Madame Bovary",
-        "마담_보바리": "Madame Bovary",
-        "관부연락선": "The Busan-Shimonoseki Ferry",
-        "그리스 로마 신화": "Greek and Roman Mythology",
-        "그리스_로마_신화": "Greek and Roman Mythology",
-        "생각의 탄생": "Sparks of Genius",
-        "생각의_탄생": "Sparks of Genius",
-        "언어 본능": "The Language Instinct",
-        "언어_본능": "The Language Instinct",
-        "모리와 함께한 화요일": "Tuesdays with Morrie",
-        "모리와_함께한_화요일": "Tuesdays with Morrie",
-        "멈출 수 없는 사람들": "Can't Stop Us Now",
-        "멈출_수_없는_사람들": "Can't Stop Us Now",
-        "아무도 말하지 않는 미국 현대사": "The Untold History of the United States",
-        "아무도_말하지_않는_미국_현대사": "The Untold History of the United States",
-        "서양의 지혜": "Wisdom of the West",
-        "서양의_지혜": "Wisdom of the West",
-        "변신": "The Metamorphosis",
-        "블랙 스완": "The Black Swan",
-        "블랙_스완": "The Black Swan",
-        "나는 왜 너를 사랑하는가": "Why We Love",
-        "나는_왜_너를_사랑하는가": "Why We Love",
-        "언어의 온도": "The Temperature of Language",
-        "언어의_온도": "The Temperature of Language",
-        "물질문명과 자본주의": "Civilization and Capitalism",
-        "물질문명과_자본주의": "Civilization and Capitalism",
-        "바보 이반등 단편선": "Ivan the Fool and Other Stories",
-        "바보 이반 등 단편선": "Ivan the Fool and Other Stories",
-        "바보_이반_등_단편선": "Ivan the Fool and Other Stories",
-        "바보_이반등_단편선": "Ivan the Fool and Other Stories",
-        "세 죽음 이반 일리치의 죽음": "Three Deaths and The Death of Ivan Ilyich",
-        "세_죽음_이반_일리치의_죽음": "Three Deaths and The Death of Ivan Ilyich",
-        "뜻으로 본 한국역사": "The Meaning of Korean History",
-        "뜻으로_본_한국역사": "The Meaning of Korean History",
-        "백범일지": "Baekbeom Ilji",
-        "백범 일지": "Baekbeom Ilji",
-        "나미야 잡화점의 기적": "The Miracles of the Namiya General Store",
-        "나미야_잡화점의_기적": "The Miracles of the Namiya General Store",
-        "몰입": "Flow",
-        "몰입의 즐거움": "Flow",
-        "지적 대화를 위한 넓고 얕은 지식": "Broad and Shallow Knowledge for Intellectual Conversations",
-        "지적_대화를_위한_넓고_얕은_지식": "Broad and Shallow Knowledge for Intellectual Conversations",
-        "린치핀": "Linchpin",
-        "보이지 않는 여자들": "Invisible Women",
-        "보이지_않는_여자들": "Invisible Women",
-        "소크라테스 익스프레스": "The Socrates Express",
-        "소크라테스_익스프레스": "The Socrates Express",
-        "게으름에 대한 찬양": "In Praise of Idleness",
-        "게으름에_대한_찬양": "In Praise of Idleness",
-        "무제": "Essays on Life",
-        "무제 에세이": "Essays on Life",
-        "삶의 에세이": "Essays on Life",
-        "오리엔탈리즘": "Orientalism",
-        "빅콘게임": "The Big Con",
-        "빅콘게임_데이비드_모러": "The Big Con",
-        "역행자": "The Contrarian",
-        "유토피아": "Utopia",
-        "원씽": "The ONE Thing",
-        "정부론": "Two Treatises of Government",
-        "정부론_존_로크": "Two Treatises of Government",
-        "미움받을 용기": "The Courage to Be Disliked",
-        "미움받을_용기": "The Courage to Be Disliked",
-        "순교자": "The Martyred",
-        "순교자_김은국": "The Martyred",
-        "국화와 칼": "The Chrysanthemum and the Sword",
-        "국화와_칼": "The Chrysanthemum and the Sword",
-        "괴테는 모든 것을 말했다": "Goethe Said It All",
-        "괴테는_모든_것을_말했다": "Goethe Said It All",
-        "마법 같은 언어": "The Magical Language of Others",
-        "마법_같은_언어": "The Magical Language of Others",
-        "백년 동안의 고독": "One Hundred Years of Solitude",
-        "앵무새 죽이기": "To Kill a Mockingbird",
-        "앵무새_죽이기": "To Kill a Mockingbird",
-        "카렌 하오의 저서": "The AI Empire: Power, Capital, and Labor",
-        "백년_동안의_고독": "One Hundred Years of Solitude",
-        "노르웨이의 숲": "Norwegian Wood",
-        "노르웨이의_숲": "Norwegian Wood",
-        "상실의 시대": "Norwegian Wood",
-        "상실의_시대": "Norwegian Wood",
-        "종의 기원": "The Good Son",
-        "종의_기원": "The Good Son",
-        "이처럼 사소한 것들": "Small Things Like These",
-        "이처럼_사소한_것들": "Small Things Like These",
-        "쇼펜하우어의 아포리즘 (소품과 부록)": "Aphorisms on the Wisdom of Life (Parerga and Paralipomena)",
-        "쇼펜하우어의_아포리즘_(소품과_부록)": "Aphorisms on the Wisdom of Life (Parerga and Paralipomena)",
-        "쇼펜하우어의 아포리즘": "Aphorisms on the Wisdom of Life",
-        "쇼펜하우어의_아포리즘": "Aphorisms on the Wisdom of Life",
-        "아포리즘 (소품과 부록)": "Aphorisms on the Wisdom of Life (Parerga and Paralipomena)",
-        "아포리즘_(소품과_부록)": "Aphorisms on the Wisdom of Life (Parerga and Paralipomena)",
-        "세일즈맨의 죽음": "Death of a Salesman",
-        "세일즈맨의_죽음": "Death of a Salesman",
-        "삼미 슈퍼스타즈의 마지막 팬클럽": "The Last Fan Club of Sammi Superstars",
-        "삼미_슈퍼스타즈의_마지막_팬클럽": "The Last Fan Club of Sammi Superstars",
-        "파친코": "Pachinko",
-        "파친코_": "Pachinko",
-        "불교의 성전": "Buddhist Scriptures",
-        "불교의_성전": "Buddhist Scriptures",
-        "원시불교": "Early Buddhism",
-        "원시불교": "Early Buddhism",
-        "오만과 편견": "Pride and Prejudice",
-        "오만과_편견": "Pride and Prejudice",
-        "Pride and Prejudice": "Pride and Prejudice",
-        "문명의 충돌": "The Clash of Civilizations",
-        "문명의_충돌": "The Clash of Civilizations",
-        "The Clash of Civilizations": "The Clash of Civilizations",
-        "4000주": "Four Thousand Weeks",
-        "4000_주": "Four Thousand Weeks",
-        "Four Thousand Weeks": "Four Thousand Weeks",
-        "이키가이": "Ikigai",
-        "Ikigai": "Ikigai",
-        "불안의 서": "The Book of Disquiet",
-        "불안의_서": "The Book of Disquiet",
-        "The Book of Disquiet": "The Book of Disquiet",
-        "안데르센,그림 형제,페로 동화": "Andersen, Grimm Brothers, Perrault Fairy Tales",
-        "안데르센그림_형제페로_동화": "Andersen, Grimm Brothers, Perrault Fairy Tales",
-        "Andersen, Grimm Brothers, Perrault Fairy Tales": "Andersen, Grimm Brothers, Perrault Fairy Tales",
-        "1984": "1984",
-        "생각의 지도": "The Geography of Thought",
-        "생각의_지도": "The Geography of Thought",
-        "The Geography of Thought": "The Geography of Thought",
-        "아메리칸 프로메테우스": "American Prometheus",
-        "아메리칸_프로메테우스": "American Prometheus",
-        "American Prometheus": "American Prometheus",
-        "사피엔스": "Sapiens",
-        "사피엔스의 미래": "Future of Sapiens",
-        "사피엔스의_미래": "Future of Sapiens",
-        "Future of Sapiens": "Future of Sapiens",
-        "The Shift": "The Shift",
-        "더 시프트": "The Shift",
-        "억척어멈과 그 자식들": "Mother Courage and Her Children",
-        "억척어멈과_그_자식들": "Mother Courage and Her Children",
-        "살아남은 자의 슬픔, 억척어멈과 그 자식들": "Mother Courage and Her Children",
-        "Mother Courage and Her Children": "Mother Courage and Her Children",
-        "21세기를 위한 21가지 제언": "21 Lessons for the 21st Century",
-        "호모 데우스": "Homo Deus",
-        "나는 왜 이 일을 하는가": "Start With Why",
-        "죽음이란 무엇인가": "Death What It Is Why It Matters",
-        "국가는 왜 실패하는가": "Why Nations Fail",
-        "국가는_왜_실패하는가": "Why Nations Fail",
-        "숨결이 바람이 될 때": "When Breath Becomes Air",
-        "숨결이_바람이_될_때": "When Breath Becomes Air",
-        "불안 세대": "The Anxious Generation",
-        "불안_세대": "The Anxious Generation",
-        "마인드셋": "Mindset",
-        "아웃라이브": "Outlive",
-        "레슨 인 케미스트리": "Lessons in Chemistry",
-        "레슨_인_케미스트리": "Lessons in Chemistry",
-        "세임 애즈 에버": "Same as Ever",
-        "세임_애즈_에버": "Same as Ever",
-        "데미안": "Demian",
-        "군주론": "The Prince",
-        "마키아벨리 군주론: 깨어있는 시민을 위한 필요악": "The Prince: A Necessary Evil for Awakened Citizens",
-        "마키아벨리_군주론_깨어있는_시민을_위한_필요악": "The Prince: A Necessary Evil for Awakened Citizens",
-        "The Prince: A Necessary Evil for Awakened Citizens": "The Prince: A Necessary Evil for Awakened Citizens",
-        "채식주의자": "The Vegetarian",
-        "아몬드": "Almond",
-        "불편한 편의점": "The Uncomfortable Convenience Store",
-        "작별하지 않는다": "We Do Not Part",
-        "지구 끝의 온실": "The Greenhouse at the End of the Earth",
-        "공정하다는 착각": "The Tyranny of Merit",
-        "정의란 무엇인가": "Justice: What's the Right Thing to Do?",
-        "총, 균, 쇠": "Guns, Germs, and Steel",
-        "총균쇠": "Guns, Germs, and Steel",
-        "그리스인 조르바": "Zorba the Greek",
-        "조르바": "Zorba the Greek",
-        "이솝우화": "Aesop's Fables",
-        "이솝 우화": "Aesop's Fables",
-        "감시와 처벌": "Discipline and Punish",
-        "고민하는 힘": "The Power of Contemplation",
-        "영속패전론": "The Regime of Permanent Defeat",
-        "날개": "Wings",
-        "날개 오감도": "Wings and Crow's Eye View",
-        "오감도": "Crow's Eye View",
-        "남산의 부장들": "The Man Standing Next",
-        "세계사를 바꾼 전염병들": "Plagues That Changed History",
-        "세계사를 바꾼 전염병들/문명과 질병": "Plagues That Changed History",
-        "문명과 질병": "Plagues and Peoples",
-        "참을 수 없는 존재의 가벼움": "The Unbearable Lightness of Being",
-        "종교의 기원": "The Origin of Religion",
-        "프로이트 종교의 기원": "The Origin of Religion",
-        "채털리 부인의 연인": "Lady Chatterley's Lover",
-        "채털리 부인": "Lady Chatterley's Lover",
-        "페스트": "The Plague",
-        "알베르 카뮈 페스트": "The Plague",
-        "울릉도 오딧세이": "Ulleungdo Odyssey",
-        "음식문화의 수수께끼": "Good to Eat",
-        "변신 이야기": "Metamorphoses",
-        "죄와 벌": "Crime and Punishment",
-        "죄와벌": "Crime and Punishment",
-        "까르마조프가의 형제": "The Brothers Karamazov",
-        "까르마조프가의_형제": "The_Brothers_Karamazov",
-        "The Brothers Karamazov": "The Brothers Karamazov",
-        "The_Brothers_Karamazov": "The_Brothers_Karamazov",
-        "금병매": "Jin Ping Mei",
-        "금병매_": "Jin_Ping_Mei",
-        "Jin Ping Mei": "Jin Ping Mei",
-        "Jin_Ping_Mei": "Jin_Ping_Mei",
-        "목민심서": "Mokminsimseo",
-        "목민심서_": "Mokminsimseo",
-        "Mokminsimseo": "Mokminsimseo",
-        "모비딕": "Moby-Dick",
-        "모비딕_": "Moby_Dick",
-        "Moby-Dick": "Moby-Dick",
-        "Moby_Dick": "Moby_Dick",
-        "미드나잇 라이브러리": "The Midnight Library",
-        "미드나잇_라이브러리": "The_Midnight_Library",
-        "The Midnight Library": "The Midnight Library",
-        "The_Midnight_Library": "The_Midnight_Library",
-        "사일런트 페이션트": "The Silent Patient",
-        "사일런트_페이션트": "The_Silent_Patient",
-        "The Silent Patient": "The Silent Patient",
-        "The_Silent_Patient": "The_Silent_Patient",
-        "소년이 온다": "Human Acts",
-        "Human Acts": "Human Acts",  # 영어 제목은 그대로 반환
-        "The Boy is Coming": "Human Acts",  # 구버전 호환성
-        "단 한 번의 삶": "One Life",
-        "단_한_번의_삶": "One_Life",
-        "One Life": "One Life",
-        "작별인사": "Farewell",
-        "Farewell": "Farewell",  # 영어 제목은 그대로 반환
-        "호밀밭의 파수꾼": "The Catcher in the Rye",
-        "The Catcher in the Rye": "The Catcher in the Rye",
-        "벅아이": "Buckeye",
-        "동물농장": "Animal Farm",
-        "햄릿": "Hamlet",
-        "Hamlet": "Hamlet",
-        "로미오와 줄리엣": "Romeo and Juliet",
-        "로미오와줄리엣": "Romeo and Juliet",
-        "Romeo and Juliet": "Romeo and Juliet",
-        "원칙": "Principles",
-        "Principles": "Principles",
-        "슬픈 열대": "Tristes Tropiques",
-        "슬픈_열대": "Tristes Tropiques",
-        "Tristes Tropiques": "Tristes Tropiques",
-        "레비스트로스 - 슬픈 열대": "Tristes Tropiques",
-        "선라이즈 온 더 리핑": "Sunrise on the Reaping",
-        "헝거 게임: 선라이즈 온 더 리핑": "Sunrise on the Reaping",
-        "불안 세대": "The Anxious Generation",
-        "불안_세대": "The Anxious Generation",
-        "소니아와 써니의 고독": "The Loneliness of Sonia and Sunny",
-        "The Loneliness of Sonia and Sunny": "The Loneliness of Sonia and Sunny",
-        "The Loneliness of Sonia and Sunny (소니아와 써니의 고독)": "The Loneliness of Sonia and Sunny",
-        "연금술사": "The Alchemist",
-        "The Alchemist": "The Alchemist",
-        "죽음의 수용소에서": "Man's Search for Meaning",
-        "죽음의_수용소에서": "Man's Search for Meaning",
-        "Man's Search for Meaning": "Man's Search for Meaning",
-        "듀얼 브레인": "Co-Intelligence",
-        "듀얼_브레인": "Co-Intelligence",
-        "Co-Intelligence": "Co-Intelligence",
-        "아토믹 해빗": "Atomic Habits",
-        "아토믹_해빗": "Atomic Habits",
-        "Atomic Habits": "Atomic Habits",
-        "아주 작은 습관의 힘": "Atomic Habits",
-        "아주_작은_습관의_힘": "Atomic Habits",
-        "이기적 유전자": "The Selfish Gene",
-        "이기적_유전자": "The Selfish Gene",
-        "The Selfish Gene": "The Selfish Gene",
-        "스티브 잡스": "Steve Jobs",
-        "스티브_잡스": "Steve Jobs",
-        "Steve Jobs": "Steve Jobs",
-        "어린왕자": "The Little Prince",
-        "어린_왕자": "The Little Prince",
-        "The Little Prince": "The Little Prince",
-        "소호강호": "The Smiling Proud Wanderer",
-        "소호_강호": "The Smiling Proud Wanderer",
-        "The Smiling Proud Wanderer": "The Smiling Proud Wanderer",
-        "내 이름은 빨강": "My Name is Red",
-        "내_이름은_빨강": "My Name is Red",
-        "My Name is Red": "My Name is Red",
-        "돈의 심리학": "The Psychology of Money",
-        "돈의_심리학": "The Psychology of Money",
-        "The Psychology of Money": "The Psychology of Money",
-        "작은 아씨들": "Little Women",
-        "작은_아씨들": "Little Women",
-        "Little Women": "Little Women",
-        "인간관계론": "How to Win Friends and Influence People",
-        "인간_관계론": "How to Win Friends and Influence People",
-        "How to Win Friends and Influence People": "How to Win Friends and Influence People",
-        "사기": "Records of the Grand Historian",
-        "사기(史記)": "Records of the Grand Historian",
-        "Records of the Grand Historian": "Records of the Grand Historian",
-        "Shiji": "Records of the Grand Historian",
-        "솔로몬의 반지": "King Solomon's Ring",
-        "솔로몬의_반지": "King Solomon's Ring",
-        "도파민네이션": "Dopamine Nation",
-        "편안함의 습격": "The Comfort Crisis",
-        "편안함의_습격": "The Comfort Crisis",
-        "The Comfort Crisis": "The Comfort Crisis",
-        "역사는 어떻게 진보하고 왜 퇴보하는가": "The Age of Revolutions",
-        "역사는_어떻게_진보하고_왜_퇴보하는가": "The Age of Revolutions",
-        "The Age of Revolutions": "The Age of Revolutions",
-        "도파민_네이션": "Dopamine Nation",
-        "Dopamine Nation": "Dopamine Nation",
-        "특이점이 온다": "The Singularity Is Near",
-        "특이점이_온다": "The Singularity Is Near",
-        "The Singularity Is Near": "The Singularity Is Near",
-        "King Solomon's Ring": "King Solomon's Ring",
-        "톰 소여의 모험": "The Adventures of Tom Sawyer",
-        "톰_소여의_모험": "The Adventures of Tom Sawyer",
-        "The Adventures of Tom Sawyer": "The Adventures of Tom Sawyer",
-        "두 개의 한국": "The Two Koreas",
-        "두_개의_한국": "The Two Koreas",
-        "The Two Koreas": "The Two Koreas",
-        "아라비안 나이트": "Arabian Nights",
-        "아라비안_나이트": "Arabian Nights",
-        "Arabian Nights": "Arabian Nights",
-        "손자병법": "The Art of War",
-        "손자_병법": "The Art of War",
-        "The Art of War": "The Art of War",
-        "Sun Tzu": "The Art of War",
-        "제4차산업혁명": "The Fourth Industrial Revolution",
-        "제4차_산업혁명": "The Fourth Industrial Revolution",
-        "The Fourth Industrial Revolution": "The Fourth Industrial Revolution",
-        "신경 끄기의 기술": "The Subtle Art of Not Giving a F*ck",
-        "신경_끄기의_기술": "The Subtle Art of Not Giving a F*ck",
-        "The Subtle Art of Not Giving a F*ck": "The Subtle Art of Not Giving a F*ck",
-        "The Subtle Art of Not Giving a Fuck": "The Subtle Art of Not Giving a F*ck",
-        "부에 대한 연감": "The Almanack of Naval Ravikant",
-        "부에_대한_연감": "The Almanack of Naval Ravikant",
-        "네이벌 라비칸트 연감": "The Almanack of Naval Ravikant",
-        "네이벌_라비칸트_연감": "The Almanack of Naval Ravikant",
-        "The Almanack of Naval Ravikant": "The Almanack of Naval Ravikant",
-        "부의 추월차선": "The Millionaire Fastlane",
-        "부의_추월차선": "The Millionaire Fastlane",
-        "The Millionaire Fastlane": "The Millionaire Fastlane",
-        "나는 오늘도 경제적 자유를 꿈꾼다": "I Will Teach You to Be Rich",
-        "나는_오늘도_경제적_자유를_꿈꾼다": "I Will Teach You to Be Rich",
-        "I Will Teach You to Be Rich": "I Will Teach You to Be Rich",
-        "일론 머스크": "Elon Musk",
-        "일론_머스크": "Elon Musk",
-        "Elon Musk": "Elon Musk",
-        "남아 있는 나날": "The Remains of the Day",
-        "남아_있는_나날": "The Remains of the Day",
-        "남아있는 나날": "The Remains of the Day",
-        "남아있는_나날": "The Remains of the Day",
-        "The Remains of the Day": "The Remains of the Day",
-        "인간의 위대한 여정": "The Life Cycle Completed",
-        "인간의_위대한_여정": "The Life Cycle Completed",
-        "The Life Cycle Completed": "The Life Cycle Completed",
-        "오베라는 남자": "A Man Called Ove",
-        "오베라는_남자": "A Man Called Ove",
-        "A Man Called Ove": "A Man Called Ove",
-        "크리스마스 선물": "The Gift of the Magi",
-        "크리스마스_선물": "The Gift of the Magi",
-        "The Gift of the Magi": "The Gift of the Magi",
-        "호두까기 인형": "The Nutcracker",
-        "호두까기_인형": "The Nutcracker",
-        "The Nutcracker": "The Nutcracker",
-        "스노우맨": "The Snowman",
-        "스노우_맨": "The Snowman",
-        "The Snowman": "The Snowman",
-        "에센셜리즘": "Essentialism",
-        "에센셜_리즘": "Essentialism",
-        "Essentialism": "Essentialism",
-        "팩트풀니스": "Factfulness",
-        "팩트_풀니스": "Factfulness",
-        "Factfulness": "Factfulness",
-        "21세기 자본": "Capital in the Twenty-First Century",
-        "21세기_자본": "Capital in the Twenty-First Century",
-        "Capital in the Twenty-First Century": "Capital in the Twenty-First Century",
-        "유전자": "The Gene",
-        "유전자_": "The Gene",
-        "The Gene": "The Gene",
-        "은하수를 여행하는 히치하이커를 위한 안내서": "Hitchhiker's Guide to the Galaxy",
-        "은하수를_여행하는_히치하이커를_위한_안내서": "Hitchhiker's Guide to the Galaxy",
-        "Hitchhiker's Guide to the Galaxy": "Hitchhiker's Guide to the Galaxy",
-        "The Hitchhiker's Guide to the Galaxy": "Hitchhiker's Guide to the Galaxy",
-        "괴델, 에셔, 바흐": "Gödel, Escher, Bach: An Eternal Golden Braid",
-        "괴델_에셔_바흐": "Gödel, Escher, Bach: An Eternal Golden Braid",
-        "Gödel, Escher, Bach: An Eternal Golden Braid": "Gödel, Escher, Bach: An Eternal Golden Braid",
-        "Gödel Escher Bach": "Gödel, Escher, Bach: An Eternal Golden Braid",
-        "여섯 번째 대멸종": "The Sixth Extinction",
-        "여섯_번째_대멸종": "The Sixth Extinction",
-        "6번째 대멸종": "The Sixth Extinction",
-        "6번째_대멸종": "The Sixth Extinction",
-        "The Sixth Extinction": "The Sixth Extinction",
-        "현명한 투자자": "The Intelligent Investor",
-        "현명한_투자자": "The Intelligent Investor",
-        "The Intelligent Investor": "The Intelligent Investor",
-        "부자 아빠 가난한 아빠": "Rich Dad Poor Dad",
-        "부자_아빠_가난한_아빠": "Rich Dad Poor Dad",
-        "Rich Dad Poor Dad": "Rich Dad Poor Dad",
-        "딥 워크": "Deep Work",
-        "딥_워크": "Deep Work",
-        "Deep Work": "Deep Work",
-        "생각에 관한 생각": "Thinking, Fast and Slow",
-        "생각에_관한_생각": "Thinking, Fast and Slow",
-        "Thinking, Fast and Slow": "Thinking, Fast and Slow",
-        "명상록": "Meditations",
-        "명상록_": "Meditations",
-        "Meditations": "Meditations",
-        "랜덤워크에 속지 마라": "Fooled by Randomness",
-        "랜덤워크에_속지_마라": "Fooled by Randomness",
-        "Fooled by Randomness": "Fooled by Randomness",
-        "행동하지 않으면 인생은 바뀌지 않는다": "No Excuses!: The Power of Self-Discipline",
-        "행동하지_않으면_인생은_바뀌지_않는다": "No Excuses!: The Power of Self-Discipline",
-        "No Excuses!: The Power of Self-Discipline": "No Excuses!: The Power of Self-Discipline",
-        "No Excuses": "No Excuses!: The Power of Self-Discipline",
-        "설국": "Snow Country",
-        "설국_": "Snow Country",
-        "Snow Country": "Snow Country",
-        "프랑켄슈타인": "Frankenstein",
-        "프랑켄슈타인_": "Frankenstein",
-        "Frankenstein": "Frankenstein",
-        "젊은 베르테르의 슬픔": "The Sorrows of Young Werther",
-        "젊은_베르테르의_슬픔": "The Sorrows of Young Werther",
-        "The Sorrows of Young Werther": "The Sorrows of Young Werther",
-        "차라투스트라는 이렇게 말했다": "Thus Spoke Zarathustra",
-        "차라투스트라는_이렇게_말했다": "Thus Spoke Zarathustra",
-        "Thus Spoke Zarathustra": "Thus Spoke Zarathustra",
-        "노인과 바다": "The Old Man and the Sea",
-        "노인과_바다": "The Old Man and the Sea",
-        "The Old Man and the Sea": "The Old Man and the Sea",
-        "무기여 잘 있거라": "A Farewell to Arms",
-        "무기여_잘_있거라": "A Farewell to Arms",
-        "A Farewell to Arms": "A Farewell to Arms",
-        "이방인": "The Stranger",
-        "이방인_": "The Stranger",
-        "The Stranger": "The Stranger",
-        "걸리버 여행기": "Gulliver's Travels",
-        "걸리버_여행기": "Gulliver's Travels",
-        "Gulliver's Travels": "Gulliver's Travels",
-        "변신": "The Metamorphosis",
-        "변신_": "The Metamorphosis",
-        "The Metamorphosis": "The Metamorphosis",
-        "제인 에어": "Jane Eyre",
-        "제인_에어": "Jane Eyre",
-        "Jane Eyre": "Jane Eyre",
-        "만들어진 신": "The God Delusion",
-        "만들어진_신": "The God Delusion",
-        "만들어진 신 : 그래서 인간은 종교를 창조했다": "The God Delusion",
-        "만들어진_신_그래서_인간은_종교를_창조했다": "The God Delusion",
-        "The God Delusion": "The God Delusion",
-        "난장이가 쏘아올린 작은 공": "A Small Ball Shot Up by a Dwarf",
-        "난장이가_쏘아올린_작은_공": "A Small Ball Shot Up by a Dwarf",
-        "난장이가 쏘아올린 작은 공 : 사라져버린 집을 위한 진혼곡": "A Small Ball Shot Up by a Dwarf",
-        "난장이가_쏘아올린_작은_공_사라져버린_집을_위한_진혼곡": "A Small Ball Shot Up by a Dwarf",
-        "A Small Ball Shot Up by a Dwarf": "A Small Ball Shot Up by a Dwarf",
-        "플라톤 대화편": "Plato's Dialogues",
-        "플라톤_대화편": "Plato's Dialogues",
-        "플라톤 대화편 : 철학은 사랑이다": "Plato's Dialogues: Philosophy is Love",
-        "플라톤_대화편_철학은_사랑이다": "Plato's Dialogues: Philosophy is Love",
-        "Plato's Dialogues": "Plato's Dialogues",
-        "Plato's Dialogues: Philosophy is Love": "Plato's Dialogues: Philosophy is Love",
-        "위대한 개츠비": "The Great Gatsby",
-        "위대한_개츠비": "The Great Gatsby",
-        "위대한 개츠비 : 가난한 청년은 부잣집 딸과 결혼할 수 없는가?": "The Great Gatsby",
-        "위대한_개츠비_가난한_청년은_부잣집_딸과_결혼할_수_없는가": "The Great Gatsby",
-        "The Great Gatsby": "The Great Gatsby",
-        "자본론": "Das Kapital",
-        "자본론_": "Das Kapital",
-        "카를 마르크스 자본론": "Das Kapital",
-        "카를_마르크스_자본론": "Das Kapital",
-        "카를 마르크스 자본론 : 뭉치면 살고 흩어지면 죽는다": "Das Kapital",
-        "카를_마르크스_자본론_뭉치면_살고_흩어지면_죽는다": "Das Kapital",
-        "Das Kapital": "Das Kapital",
-        "시의 본질과 거장들": "The Essence of Poetry and Masters",
-        "시의_본질과_거장들": "The Essence of Poetry and Masters",
-        "시의 본질과 거장들: 한국시에 대하여": "The Essence of Poetry and Masters: On Korean Poetry",
-        "시의_본질과_거장들_한국시에_대하여": "The Essence of Poetry and Masters: On Korean Poetry",
-        "The Essence of Poetry and Masters": "The Essence of Poetry and Masters",
-        "The Essence of Poetry and Masters: On Korean Poetry": "The Essence of Poetry and Masters: On Korean Poetry",
-        "미시마 유키오 우국, 금각사": "Yukio Mishima: Patriotism and The Temple of the Golden Pavilion",
-        "미시마_유키오_우국_금각사": "Yukio_Mishima_Patriotism_and_The_Temple_of_the_Golden_Pavilion",
-        "미시마 유키오 우국, 금각사 : 아름답게 죽어라는 일본, 어떻게든 살아라는 한국": "Yukio Mishima: Patriotism and The Temple of the Golden Pavilion",
-        "미시마_유키오_우국_금각사_아름답게_죽어라는_일본_어떻게든_살아라는_한국": "Yukio_Mishima_Patriotism_and_The_Temple_of_the_Golden_Pavilion",
-        "Yukio Mishima: Patriotism and The Temple of the Golden Pavilion": "Yukio Mishima: Patriotism and The Temple of the Golden Pavilion",
-        "세르반테스 돈키호테": "Don Quixote",
-        "세르반테스_돈키호테": "Don_Quixote",
-        "세르반테스 돈키호테 : 세상의 모든 소설들은 무릎꿇고 경의를 표하시오!!": "Don Quixote",
-        "세르반테스_돈키호테_세상의_모든_소설들은_무릎꿇고_경의를_표하시오": "Don_Quixote",
-        "Don Quixote": "Don Quixote",
-        "국부론": "Wealth of Nations",
-        "국부론_": "Wealth of Nations",
-        "애덤 스미스 국부론": "Wealth of Nations",
-        "애덤_스미스_국부론": "Wealth of Nations",
-        "Wealth of Nations": "Wealth of Nations",
-        "The Wealth of Nations": "Wealth of Nations",
-        "시몬 드 보부아르 제2의 성": "The Second Sex",
-        "시몬_드_보부아르_제2의_성": "The_Second_Sex",
-        "시몬 드 보부아르 제2의 성 : 여성은 태어나지 않고 만들어진다": "The Second Sex",
-        "시몬_드_보부아르_제2의_성_여성은_태어나지_않고_만들어진다": "The_Second_Sex",
-        "The Second Sex": "The Second Sex",
-        "몽테뉴 수상록": "Essays",
-        "몽테뉴_수상록": "Essays",
-        "수상록": "Essays",
-        "수상록_": "Essays",
-        "Essays": "Essays",
-        "The Essays of Montaigne": "Essays",
-        "공자 논어": "The Analects",
-        "공자_논어": "The_Analects",
-        "논어": "The Analects",
-        "논어_": "The_Analects",
-        "공자 논어(論語)": "The Analects",
-        "공자_논어論語": "The_Analects",
-        "공자 논어(論語) : 세상에서 가장 오래된 베스트셀러 겸 스테디셀러": "The Analects",
-        "공자_논어論語_세상에서_가장_오래된_베스트셀러_겸_스테디셀러": "The_Analects",
-        "The Analects": "The Analects",
-        "Analects of Confucius": "The Analects",
-        "스토너": "Stoner",
-        "스토너_": "Stoner",
-        "Stoner": "Stoner",
-        "푸틴-권력의 논리": "Putin: The Logic of Power",
-        "푸틴_권력의_논리": "Putin_The_Logic_of_Power",
-        "권력의 논리": "The Logic of Power",
-        "화염과 분노-트럼프 백악관의 내부": "Fire and Fury: Inside the Trump White House",
-        "화염과_분노_트럼프_백악관의_내부": "Fire_and_Fury_Inside_the_Trump_White_House",
-        "화염과 분노": "Fire and Fury",
-        "싯다르타": "Siddhartha",
-        "싯다르타_": "Siddhartha",
-        "Siddhartha": "Siddhartha",
-        "칼 세이건 코스모스": "Cosmos",
-        "칼_세이건_코스모스": "Cosmos",
-        "코스모스": "Cosmos",
-        "코스모스 : 광활한 우주에서 나는 어떤 존재인가?": "Cosmos: What Am I in the Vast Universe?",
-        "코스모스_광활한_우주에서_나는_어떤_존재인가": "Cosmos_What_Am_I_in_the_Vast_Universe",
-        "Cosmos": "Cosmos",
-        "Cosmos: What Am I in the Vast Universe?": "Cosmos: What Am I in the Vast Universe?",
-        "굿모닝 미드나잇": "Good Morning, Midnight",
-        "굿모닝_미드나잇": "Good_Morning_Midnight",
-        "Good Morning, Midnight": "Good Morning, Midnight",
-        "Good Morning Midnight": "Good Morning, Midnight",
-        "생각하는 게임": "The Thinking Game",
-        "생각하는_게임": "The_Thinking_Game",
-        "The Thinking Game": "The Thinking Game",
-        "The_Thinking_Game": "The_Thinking_Game",
-        "나는 고양이로소이다": "I Am a Cat",
-        "나는_고양이로소이다": "I_Am_a_Cat",
-        "I Am a Cat": "I Am a Cat",
-        "I_Am_a_Cat": "I_Am_a_Cat",
-        "파리대왕": "Lord of the Flies",
-        "파리_대왕": "Lord of the Flies",
-        "Lord of the Flies": "Lord of the Flies",
-        "광장": "The Square",
-        "광장_": "The Square",
-        "최인훈 광장": "The Square",
-        "최인훈_광장": "The Square",
-        "The Square": "The Square",
-        "이반 일리치의 죽음": "The Death of Ivan Ilyich",
-        "이반_일리치의_죽음": "The_Death_of_Ivan_Ilyich",
-        "The Death of Ivan Ilyich": "The Death of Ivan Ilyich",
-        "과학혁명의 구조": "The Structure of Scientific Revolutions",
-        "과학혁명의_구조": "The_Structure_of_Scientific_Revolutions",
-        "The Structure of Scientific Revolutions": "The Structure of Scientific Revolutions",
-        "퓨처 셀프": "Future Self",
-        "퓨처_셀프": "Future Self",
-        "Future Self": "Future Self",
-        "신경증 환자를 위한 깨달음 회피 가이드": "The Neurotic's Guide to Avoiding Enlightenment",
-        "신경증_환자를_위한_깨달음_회피_가이드": "The Neurotic's Guide to Avoiding Enlightenment",
-        "뇌는 어떻게 나를 조종하는가": "The Neurotic's Guide to Avoiding Enlightenment",
-        "뇌는_어떻게_나를_조종하는가": "The Neurotic's Guide to Avoiding Enlightenment",
-        "The Neurotic's Guide to Avoiding Enlightenment": "The Neurotic's Guide to Avoiding Enlightenment",
-        "오다세이아": "The Odyssey",
-        "오다세이아_": "The Odyssey",
-        "The Odyssey": "The Odyssey",
-        "슈베르트의 겨울 나그네": "Winterreise",
-        "슈베르트의_겨울_나그네": "Winterreise",
-        "겨울 나그네": "Winterreise",
-        "겨울_나그네": "Winterreise",
-        "Winterreise": "Winterreise",
-        "프로테스탄티즘의 윤리와 자본주의 정신": "The Protestant Ethic and the Spirit of Capitalism",
-        "프로테스탄티즘의_윤리와_자본주의_정신": "The Protestant Ethic and the Spirit of Capitalism",
-        "The Protestant Ethic and the Spirit of Capitalism": "The Protestant Ethic and the Spirit of Capitalism",
-        "멋진 신세계": "Brave New World",
-        "멋진_신세계": "Brave New World",
-        "Brave New World": "Brave New World",
-        "그릿": "Grit",
-        "그릿_": "Grit",
-        "Grit": "Grit",
-        "넥서스": "Nexus",
-        "넥서스_": "Nexus",
-        "Nexus": "Nexus",
-        "권력의 법칙": "The 48 Laws of Power",
-        "권력의_법칙": "The 48 Laws of Power",
-        "The 48 Laws of Power": "The 48 Laws of Power",
-        "물고기는 존재하지 않는다": "Why Fish Don't Exist",
-        "물고기는_존재하지_않는다": "Why Fish Don't Exist",
-        "Why Fish Don't Exist": "Why Fish Don't Exist",
-        "프로젝트 헤일메리": "Project Hail Mary",
-        "프로젝트_헤일메리": "Project Hail Mary",
-        "Project Hail Mary": "Project Hail Mary",
-        "인간 실격": "No Longer Human",
-        "인간_실격": "No Longer Human",
-        "No Longer Human": "No Longer Human",
-        "도둑맞은 집중력": "Stolen Focus",
-        "도둑맞은_집중력": "Stolen Focus",
-        "Stolen Focus": "Stolen Focus",
-        "열하일기": "Yolha Ilgi",
-        "열하_일기": "Yolha Ilgi",
-        "Yolha Ilgi": "Yolha Ilgi",
-        "예루살렘의 아이히만": "Eichmann in Jerusalem",
-        "예루살렘의_아이히만": "Eichmann in Jerusalem",
-        "Eichmann in Jerusalem": "Eichmann in Jerusalem",
-        "불변의 법칙": "Same as Ever",
-        "불변의_법칙": "Same as Ever",
-        "Same as Ever": "Same as Ever",
-        "한국전쟁": "The Korean War",
-        "한국전쟁의 기원": "The Origins of the Korean War",
-        "The Korean War": "The Korean War",
-        "The Origins of the Korean War": "The Origins of the Korean War",
-        "자사의 중용": "The Doctrine of the Mean",
-        "자사의_중용": "The Doctrine of the Mean",
-        "중용": "The Doctrine of the Mean",
-        "중용_": "The Doctrine of the Mean",
-        "The Doctrine of the Mean": "The Doctrine of the Mean",
-        "요네하라 마리 에세이집": "Yonehara Mari Essays",
-        "요네하라_마리_에세이집": "Yonehara Mari Essays",
-        "Yonehara Mari Essays": "Yonehara Mari Essays",
-        "예수 하버드에 오다": "When Jesus Came to Harvard",
-        "예수_하버드에_오다": "When Jesus Came to Harvard",
-        "When Jesus Came to Harvard": "When Jesus Came to Harvard",
-        "When Jesus Came to Harvard: Making Moral Choices Today": "When Jesus Came to Harvard",
-        "예수라는 사나이": "A Man Called Jesus",
-        "예수라는_사나이": "A Man Called Jesus",
-        "A Man Called Jesus": "A Man Called Jesus",
-        "신부님 우리들의 신부님": "Don Camillo",
-        "신부님_우리들의_신부님": "Don Camillo",
-        "Don Camillo": "Don Camillo",
-        "청춘의 독서": "Youth and Reading",
-        "청춘의_독서": "Youth and Reading",
-        "Youth and Reading": "Youth and Reading",
-        "몸의 일기": "Journal d'un corps",
-        "몸의_일기": "Journal d'un corps",
-        "Journal d'un corps": "Journal d'un corps",
-        "파우스트": "Faust",
-        "파우스트_": "Faust",
-        "괴테의 파우스트": "Faust",
-        "괴테의_파우스트": "Faust",
-        "Faust": "Faust",
-        "한국의 수필": "Korean Essays",
-        "한국의_수필": "Korean Essays",
-        "Korean Essays": "Korean Essays",
-        "침팬지 폴리틱스": "Chimpanzee Politics",
-        "침팬지_폴리틱스": "Chimpanzee Politics",
-        "Chimpanzee Politics": "Chimpanzee Politics",
-        "한국의 명칼럼니스트": "Famous Korean Columnists",
-        "한국의_명칼럼니스트": "Famous Korean Columnists",
-        "Famous Korean Columnists": "Famous Korean Columnists",
-        "세이노의 가르침": "Seinos Teachings",
-        "세이노의_가르침": "Seinos Teachings",
-        "Seinos Teachings": "Seinos Teachings",
-        "세이노": "Seino",
-        "다윈의 종의 기원": "On the Origin of Species",
-        "다윈의_종의_기원": "On the Origin of Species",
-        "On the Origin of Species": "On the Origin of Species",
-        "On_the_Origin_of_Species": "On the Origin of Species",
-        "THE 2028 GLOBAL INTELLIGENCE CRISIS": "The 2028 Global Intelligence Crisis",
-        "The 2028 Global Intelligence Crisis": "The 2028 Global Intelligence Crisis",
-        "우리는 무엇을 타고나는가": "Innate",
-        "우리는_무엇을_타고나는가": "Innate",
-        "Innate": "Innate",
-        "빅 히스토리": "Big History",
-        "빅_히스토리": "Big History",
-        "Big History": "Big History",
-        "The_2028_Global_Intelligence_Crisis": "The 2028 Global Intelligence Crisis",
-        "2028 글로벌 인텔리전스 위기": "The 2028 Global Intelligence Crisis",
-        "2028_글로벌_인텔리전스_위기": "The 2028 Global Intelligence Crisis",
-        "꿈의 해석": "The Interpretation of Dreams",
-        "꿈의_해석": "The Interpretation of Dreams",
-        "The Interpretation of Dreams": "The Interpretation of Dreams",
-        "장자": "Zhuangzi",
-        "장자경": "Zhuangzi",
-        "Zhuangzi": "Zhuangzi",
-        "에밀": "Emile",
-        "Emile": "Emile",
-        "Émile": "Emile",
-        "더 리더": "The Reader",
-        "더_리더": "The Reader",
-        "The Reader": "The Reader",
-        "춘향전 토끼전 심청전": "Korean Classic Tales",
-        "춘향전_토끼전_심청전": "Korean Classic Tales",
-        "춘향전": "Tale of Chunhyang",
-        "토끼전": "Tale of the Rabbit",
-        "심청전": "Tale of Simcheong",
-        "Korean Classic Tales": "Korean Classic Tales",
-        "복종": "Submission",
-        "Submission": "Submission",
-        "갈매기": "The Seagull",
-        "The Seagull": "The Seagull",
-        "타인의 고통": "Regarding the Pain of Others",
-        "타인의_고통": "Regarding the Pain of Others",
-        "Regarding the Pain of Others": "Regarding the Pain of Others",
-        "레버리지": "Leverage",
-        "레버리지_": "Leverage",
-        "Leverage": "Leverage",
-        "타이탄의 도구들": "Tools of Titans",
-        "타이탄의_도구들": "Tools of Titans",
-        "Tools of Titans": "Tools of Titans",
-        "일류의 조건": "Condition of the First-Class",
-        "일류의_조건": "Condition of the First-Class",
-        "Condition of the First-Class": "Condition of the First-Class",
-        "The Condition of the First-Class": "Condition of the First-Class",
-        "사람을 얻는 지혜": "The Art of Worldly Wisdom",
-        "사람을_얻는_지혜": "The Art of Worldly Wisdom",
-        "The Art of Worldly Wisdom": "The Art of Worldly Wisdom",
-        "Art of Worldly Wisdom": "The Art of Worldly Wisdom",
-        "폰더 씨의 위대한 하루": "The Traveler's Gift",
-        "폰더_씨의_위대한_하루": "The Traveler's Gift",
-        "The Traveler's Gift": "The Traveler's Gift",
-        "Traveler's Gift": "The Traveler's Gift",
-        "왜 일하는가": "Why Work",
-        "왜_일하는가": "Why Work",
-        "Why Work": "Why Work",
-        "달과 6펜스": "The Moon and Sixpence",
-        "달과_6펜스": "The Moon and Sixpence",
-        "The Moon and Sixpence": "The Moon and Sixpence",
-        "Moon and Sixpence": "The Moon and Sixpence",
-        "임사체험": "Near Death Experiences",
-        "임사_체험": "Near Death Experiences",
-        "Near Death Experiences": "Near Death Experiences",
-        "Near-Death Experiences": "Near Death Experiences",
-        # 일당백 시즌2 18~23화
-        "소용돌이의 한국정치": "Korea: The Politics of the Vortex",
-        "소용돌이의_한국정치": "Korea: The Politics of the Vortex",
-        "Korea: The Politics of the Vortex": "Korea: The Politics of the Vortex",
-        "분노의 포도": "The Grapes of Wrath",
-        "분노의_포도": "The Grapes of Wrath",
-        "The Grapes of Wrath": "The Grapes of Wrath",
-        "Grapes of Wrath": "The Grapes of Wrath",
-        "기나긴 이별": "The Long Goodbye",
-        "기나긴_이별": "The Long Goodbye",
-        "The Long Goodbye": "The Long Goodbye",
-        "Long Goodbye": "The Long Goodbye",
-        "조직의 성쇠": "The Knowledge-Value Revolution",
-        "조직의_성쇠": "The Knowledge-Value Revolution",
-        "The Knowledge-Value Revolution": "The Knowledge-Value Revolution",
-        "Knowledge-Value Revolution": "The Knowledge-Value Revolution",
-        "오즈의 마법사": "The Wizard of Oz",
-        "오즈의_마법사": "The Wizard of Oz",
-        "The Wizard of Oz": "The Wizard of Oz",
-        "Wizard of Oz": "The Wizard of Oz",
-        "한국의 베스트셀러": "Korean Bestsellers",
-        "한국의_베스트셀러": "Korean Bestsellers",
-        "Korean Bestsellers": "Korean Bestsellers",
-    }
-    
-    # 공백을 언더스코어로 변환한 버전도 확인
-    book_title_underscore = book_title.replace(' ', '_')
-    if book_title_underscore in title_map:
-        return title_map[book_title_underscore]
-    
-    return title_map.get(book_title, book_title)
+TRANSLATIONS_FILE = Path(__file__).resolve().parent.parent.parent / "data" / "translations.json"
 
+# 퍼지 조회 최소 유사도 (트라이그램 Jaccard)
+FUZZY_MIN_SIMILARITY = 0.6
+
+
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def _fold(text: str) -> str:
+    """조회용 정규화: 대소문자 무시, 공백/언더스코어 통일"""
+    return re.sub(r"[\s_]+", " ", text).strip().casefold()
 
-def translate_book_title_to_korean(book_title: str) -> str:
-    """책 제목을 한글로 변환 (역방향)"""
-    # 영어 -> 한글 매핑
-    reverse_title_map = {
-        "Tilting": "틸팅",
-        "The White Book": "흰",
-        "The Killer's Memorandum": "살인자의 기억법",
-        "The Pipe Stories": "파이프 이야기",
-        "The Book of Love": "북 오브 러브",
-        "The Black Swan": "블랙 스완",
-        "Why We Love": "나는 왜 너를 사랑하는가",
-        "The Temperature of Language": "언어의 온도",
-        "Civilization and Capitalism": "물질문명과 자본주의",
-        "Ivan the Fool and Other Stories": "바보 이반 등 단편선",
-        "Three Deaths and The Death of Ivan Ilyich": "세 죽음 이반 일리치의 죽음",
-        "The Meaning of Korean History": "뜻으로 본 한국역사",
-        "Baekbeom Ilji": "백범일지",
-        "In Praise of Idleness": "게으름에 대한 찬양",
-        "Essays on Life": "삶의 에세이",
-        "The Miracles of the Namiya General Store": "나미야 잡화점의 기적",
-        "Flow": "몰입",
-        "Broad and Shallow Knowledge for Intellectual Conversations": "지적 대화를 위한 넓고 얕은 지식",
-        "Linchpin": "린치핀",
-        "Invisible Women": "보이지 않는 여자들",
-        "The Socrates Express": "소크라테스 익스프레스",
-        "Orientalism": "오리엔탈리즘",
-        "The Big Con": "빅콘게임",
-        "The Contrarian": "역행자",
-        "Utopia": "유토피아",
-        "The ONE Thing": "원씽",
-        "Two Treatises of Government": "정부론",
-        "The Courage to Be Disliked": "미움받을 용기",
-        "The Magical Language of Others": "마법 같은 언어",
-        "One Hundred Years of Solitude": "백년 동안의 고독",
-        "Norwegian Wood": "노르웨이의 숲",
-        "Death of a Salesman": "세일즈맨의 죽음",
-        "Four Thousand Weeks": "4000주",
-        "Ikigai": "이키가이",
-        "The Book of Disquiet": "불안의 서",
-        "Andersen, Grimm Brothers, Perrault Fairy Tales": "안데르센,그림 형제,페로 동화",
-        "1984": "1984",
-        "Sapiens": "사피엔스",
-        "21 Lessons for the 21st Century": "21세기를 위한 21가지 제언",
-        "Homo Deus": "호모 데우스",
-        "Start With Why": "나는 왜 이 일을 하는가",
-        "Death What It Is Why It Matters": "죽음이란 무엇인가",
-        "Why Nations Fail": "국가는 왜 실패하는가",
-        "When Breath Becomes Air": "숨결이 바람이 될 때",
-        "The Anxious Generation": "불안 세대",
-        "Demian": "데미안",
-        "The Prince": "군주론",
-        "Zorba the Greek": "그리스인 조르바",
-        "The Vegetarian": "채식주의자",
-        "Almond": "아몬드",
-        "The Uncomfortable Convenience Store": "불편한 편의점",
-        "We Do Not Part": "작별하지 않는다",
-        "The Greenhouse at the End of the Earth": "지구 끝의 온실",
-        "The Tyranny of Merit": "공정하다는 착각",
-        "Justice: What's the Right Thing to Do?": "정의란 무엇인가",
-        "Guns, Germs, and Steel": "총, 균, 쇠",
-        "Aesop's Fables": "이솝우화",
-        "Discipline and Punish": "감시와 처벌",
-        "The Power of Contemplation": "고민하는 힘",
-        "The Regime of Permanent Defeat": "영속패전론",
-        "Wings": "날개",
-        "Wings and Crow's Eye View": "날개 오감도",
-        "Crow's Eye View": "오감도",
-        "The Man Standing Next": "남산의 부장들",
-        "Plagues That Changed History": "세계사를 바꾼 전염병들",
-        "Plagues and Peoples": "문명과 질병",
-        "The Unbearable Lightness of Being": "참을 수 없는 존재의 가벼움",
-        "The Origin of Religion": "종교의 기원",
-        "Lady Chatterley's Lover": "채털리 부인의 연인",
-        "The Plague": "페스트",
-        "Crime and Punishment": "죄와 벌",
-        "The Brothers Karamazov": "까르마조프가의 형제",
-        "The_Brothers_Karamazov": "까르마조프가의_형제",
-        "Jin Ping Mei": "금병매",
-        "Jin_Ping_Mei": "금병매",
-        "Mokminsimseo": "목민심서",
-        "Moby-Dick": "모비딕",
-        "Moby_Dick": "모비딕",
-        "The Midnight Library": "미드나잇 라이브러리",
-        "The_Midnight_Library": "미드나잇_라이브러리",
-        "The Silent Patient": "사일런트 페이션트",
-        "The_Silent_Patient": "사일런트_페이션트",
-        "The Boy is Coming": "소년이 온다",
-        "One Life": "단 한 번의 삶",
-        "One_Life": "단_한_번의_삶",
-        "Farewell": "작별인사",
-        "The Catcher in the Rye": "호밀밭의 파수꾼",
-        "Small Things Like These": "이처럼 사소한 것들",
-        "Small_Things_Like_These": "이처럼 사소한 것들",
-        "The Good Son": "종의 기원",
-        "The_Good_Son": "종의 기원",
-        "Buckeye": "벅아이",
-        "Animal Farm": "동물농장",
-        "Hamlet": "햄릿",
-        "Romeo and Juliet": "로미오와 줄리엣",
-        "Tristes Tropiques": "슬픈 열대",
-        "Sunrise on the Reaping": "선라이즈 온 더 리핑",
-        "The Anxious Generation": "불안 세대",
-        "The Loneliness of Sonia and Sunny": "소니아와 써니의 고독",
-        "Sátántangó": "사탄탱고",
-        "Sátántangó (사탄탱고)": "사탄탱고",
-        "The Alchemist": "연금술사",
-        "Co-Intelligence": "듀얼 브레인",
-        "Man's Search for Meaning": "죽음의 수용소에서",
-        "Atomic Habits": "아주 작은 습관의 힘",
-        "The Selfish Gene": "이기적 유전자",
-        "Steve Jobs": "스티브 잡스",
-        "The Little Prince": "어린왕자",
-        "My Name is Red": "내 이름은 빨강",
-        "The Psychology of Money": "돈의 심리학",
-        "Little Women": "작은 아씨들",
-        "How to Win Friends and Influence People": "인간관계론",
-        "Records of the Grand Historian": "사기",
-        "Shiji": "사기",
-        "The Subtle Art of Not Giving a F*ck": "신경 끄기의 기술",
-        "The Subtle Art of Not Giving a Fuck": "신경 끄기의 기술",
-        "The Almanack of Naval Ravikant": "네이벌 라비칸트 연감",
-        "The Millionaire Fastlane": "부의 추월차선",
-        "I Will Teach You to Be Rich": "나는 오늘도 경제적 자유를 꿈꾼다",
-        "Elon Musk": "일론 머스크",
-        "The Remains of the Day": "남아 있는 나날",
-        "The Life Cycle Completed": "인간의 위대한 여정",
-        "A Man Called Ove": "오베라는 남자",
-        "A Man Called Jesus": "예수라는 사나이",
-        "When Jesus Came to Harvard": "예수 하버드에 오다",
-        "Don Camillo": "신부님 우리들의 신부님",
-        "Youth and Reading": "청춘의 독서",
-        "The Gift of the Magi": "크리스마스 선물",
-        "The Nutcracker": "호두까기 인형",
-        "The Snowman": "스노우맨",
-        "I Am a Cat": "나는 고양이로소이다",
-        "I_Am_a_Cat": "나는_고양이로소이다",
-        "The Thinking Game": "생각하는 게임",
-        "The_Thinking_Game": "생각하는_게임",
-        "Essentialism": "에센셜리즘",
-        "Factfulness": "팩트풀니스",
-        "Capital in the Twenty-First Century": "21세기 자본",
-        "The Gene": "유전자",
-        "Hitchhiker's Guide to the Galaxy": "은하수를 여행하는 히치하이커를 위한 안내서",
-        "The Hitchhiker's Guide to the Galaxy": "은하수를 여행하는 히치하이커를 위한 안내서",
-        "Gödel, Escher, Bach: An Eternal Golden Braid": "괴델, 에셔, 바흐",
-        "Gödel Escher Bach": "괴델, 에셔, 바흐",
-        "The Sixth Extinction": "여섯 번째 대멸종",
-        "The Intelligent Investor": "현명한 투자자",
-        "Rich Dad Poor Dad": "부자 아빠 가난한 아빠",
-        "Deep Work": "딥 워크",
-        "Thinking, Fast and Slow": "생각에 관한 생각",
-        "Meditations": "명상록",
-        "Dopamine Nation": "도파민네이션",
-        "The Singularity Is Near": "특이점이 온다",
-        "Fooled by Randomness": "랜덤워크에 속지 마라",
-        "No Excuses!: The Power of Self-Discipline": "행동하지 않으면 인생은 바뀌지 않는다",
-        "No Excuses": "행동하지 않으면 인생은 바뀌지 않는다",
-        "Snow Country": "설국",
-        "Frankenstein": "프랑켄슈타인",
-        "The Sorrows of Young Werther": "젊은 베르테르의 슬픔",
-        "Thus Spoke Zarathustra": "차라투스트라는 이렇게 말했다",
-        "The Old Man and the Sea": "노인과 바다",
-        "A Farewell to Arms": "무기여 잘 있거라",
-        "The Stranger": "이방인",
-        "Gulliver's Travels": "걸리버 여행기",
-        "The Metamorphosis": "변신",
-        "Jane Eyre": "제인 에어",
-        "The God Delusion": "만들어진 신",
-        "A Small Ball Shot Up by a Dwarf": "난장이가 쏘아올린 작은 공",
-        "Plato's Dialogues": "플라톤 대화편",
-        "Plato's Dialogues: Philosophy is Love": "플라톤 대화편 : 철학은 사랑이다",
-        "The Great Gatsby": "위대한 개츠비",
-        "Das Kapital": "자본론",
-        "The Essence of Poetry and Masters": "시의 본질과 거장들",
-        "The Essence of Poetry and Masters: On Korean Poetry": "시의 본질과 거장들: 한국시에 대하여",
-        "Yukio Mishima: Patriotism and The Temple of the Golden Pavilion": "미시마 유키오 우국, 금각사",
-        "Lord of the Flies": "파리대왕",
-        "Don Quixote": "세르반테스 돈키호테",
-        "The Second Sex": "시몬 드 보부아르 제2의 성",
-        "Essays": "수상록",
-        "The Essays of Montaigne": "수상록",
-        "Future Self": "퓨처 셀프",
-        "The Neurotic's Guide to Avoiding Enlightenment": "뇌는 어떻게 나를 조종하는가",
-        "The Odyssey": "오다세이아",
-        "Winterreise": "슈베르트의 겨울 나그네",
-        "The Protestant Ethic and the Spirit of Capitalism": "프로테스탄티즘의 윤리와 자본주의 정신",
-        "Brave New World": "멋진 신세계",
-        "Grit": "그릿",
-        "Nexus": "넥서스",
-        "The 48 Laws of Power": "권력의 법칙",
-        "Why Fish Don't Exist": "물고기는 존재하지 않는다",
-        "No Longer Human": "인간 실격",
-        "Stolen Focus": "도둑맞은 집중력",
-        "Yolha Ilgi": "열하일기",
-        "Same as Ever": "불변의 법칙",
-        "Faust": "파우스트",
-        "Famous Korean Columnists": "한국의 명칼럼니스트",
-        "Famous_Korean_Columnists": "한국의_명칼럼니스트",
-        "Korean Essays": "한국의 수필",
-        "Seinos Teachings": "세이노의 가르침",
-        "Seinos_Teachings": "세이노의_가르침",
-        "The 2028 Global Intelligence Crisis": "THE 2028 GLOBAL INTELLIGENCE CRISIS",
-        "The_2028_Global_Intelligence_Crisis": "THE_2028_GLOBAL_INTELLIGENCE_CRISIS",
-        "On the Origin of Species": "다윈의 종의 기원",
-        "On_the_Origin_of_Species": "다윈의_종의_기원",
-        "Innate": "우리는 무엇을 타고나는가",
-        "Big History": "빅 히스토리",
-        "Pachinko": "파친코",
-        "Pachinko_": "파친코",
-        "Regarding the Pain of Others": "타인의 고통",
-        "Regarding_the_Pain_of_Others": "타인의_고통",
-        "Leverage": "레버리지",
-        "Leverage_": "레버리지",
-        "Tools of Titans": "타이탄의 도구들",
-        "Tools_of_Titans": "타이탄의_도구들",
-        "Condition of the First-Class": "일류의 조건",
-        "Condition_of_the_First-Class": "일류의_조건",
-        "The Condition of the First-Class": "일류의 조건",
-        "The Art of Worldly Wisdom": "사람을 얻는 지혜",
-        "The_Art_of_Worldly_Wisdom": "사람을_얻는_지혜",
-        "Art of Worldly Wisdom": "사람을 얻는 지혜",
-    }
-    
-    # 공백을 언더스코어로 변환한 버전도 확인
-    book_title_underscore = book_title.replace(' ', '_')
-    if book_title_underscore in reverse_title_map:
-        return reverse_title_map[book_title_underscore]
-    
-    # 매핑이 없으면 원본 반환 (이미 한글일 수도 있음)
-    result = reverse_title_map.get(book_title, book_title)
-    
-    # 결과가 여전히 영어인 경우 (한글이 없음), 한글 발음으로 변환 시도
-    if is_english_title(result):
-        # 간단한 발음 변환 (추후 개선 가능)
-        # 예: "Buckeye" -> "벅아이" 같은 매핑이 없으면 원본 반환
-        # 여기서는 매핑에 없으면 원본을 반환하되, generate_title에서 처리
-        pass
-    
-    return result
+
+def _trigrams(text: str) -> set:
+    """퍼지 조회용 트라이그램 (공백/구두점 제거 후 양끝 패딩)"""
+    compact = re.sub(r"[\W_]+", "", _fold(text))
+    padded = f"  {compact} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TranslationIndex:
+    """
+    한 방향(예: 한→영)의 번역 조회 인덱스
+
+    조회 순서:
+    1. 원본 키 (공백→언더스코어 변형 우선, 기존 동작과 동일)
+    2. 정규화 키 (대소문자/공백/언더스코어 무시)
+    3. 반대 방향 매핑을 뒤집은 정규화 키
+    4. (fuzzy=True일 때) 트라이그램 유사도가 가장 높은 키
+    """
+
+    def __init__(self, mapping: Dict[str, str], inverse_of: Optional[Dict[str, str]] = None,
+                 target: Optional[str] = None):
+        self.exact = dict(mapping)
+        self.folded: Dict[str, str] = {}
+        for key, value in self.exact.items():
+            self.folded.setdefault(_fold(key), value)
+
+        # 반대 방향 매핑 뒤집기 (원래 방향 값 → 키). 띄어쓴 키를 언더스코어 키보다 우선.
+        # 반대 방향 매핑에 섞인 역방향 행(예: 영→한 매핑의 "데미스 허사비스": "Demis Hassabis")을
+        # 뒤집으면 결과가 원래 언어로 돌아가므로, 결과가 목표 언어(target)가 아닌 항목은 건너뜀
+        self.inverse: Dict[str, str] = {}
+        for key, value in (inverse_of or {}).items():
+            if key == value:
+                continue
+            if target is not None and bool(_HANGUL.search(key)) != (target == "ko"):
+                continue
+            folded = _fold(value)
+            current = self.inverse.get(folded)
+            if current is None or ("_" in current and "_" not in key):
+                self.inverse[folded] = key
+
+        self._trigram_index: Optional[Dict[str, list]] = None
+        self._fuzzy_keys: list = []
+
+    def lookup(self, text: str) -> Optional[str]:
+        """정확/정규화/역방향 조회 (없으면 None)"""
+        for candidate in (text.replace(" ", "_"), text):
+            if candidate in self.exact:
+                return self.exact[candidate]
+        folded = _fold(text)
+        if folded in self.folded:
+            return self.folded[folded]
+        return self.inverse.get(folded)
+
+    def _build_trigram_index(self) -> None:
+        keys = {}
+        for folded, value in self.inverse.items():
+            keys[folded] = value
+        keys.update(self.folded)
+        self._fuzzy_keys = [(key, value, _trigrams(key)) for key, value in keys.items()]
+        index: Dict[str, list] = {}
+        for i, (_, _, grams) in enumerate(self._fuzzy_keys):
+            for gram in grams:
+                index.setdefault(gram, []).append(i)
+        self._trigram_index = index
+
+    def fuzzy_lookup(self, text: str, min_similarity: float = FUZZY_MIN_SIMILARITY) -> Optional[Tuple[str, str, float]]:
+        """
+        트라이그램 유사도로 가장 가까운 키 조회
+
+        Returns:
+            (매칭된 정규화 키, 번역, 유사도) 또는 None
+        """
+        if self._trigram_index is None:
+            self._build_trigram_index()
+        grams = _trigrams(text)
+        shared = Counter(i for gram in grams for i in self._trigram_index.get(gram, ()))
+        best = None
+        for i, count in shared.items():
+            key, value, key_grams = self._fuzzy_keys[i]
+            similarity = count / (len(grams) + len(key_grams) - count)
+            if similarity >= min_similarity and (best is None or similarity > best[2]):
+                best = (key, value, similarity)
+        return best
+
+    def translate(self, text: str, fuzzy: bool = False) -> str:
+        """번역 (매핑이 없으면 원본 반환)"""
+        result = self.lookup(text)
+        if result is None and fuzzy:
+            match = self.fuzzy_lookup(text)
+            result = match[1] if match else None
+        return text if result is None else result
+
+
+@lru_cache(maxsize=1)
+def _load_translation_data() -> Dict[str, Dict[str, str]]:
+    with open(TRANSLATIONS_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_translation_index(name: str) -> TranslationIndex:
+    """
+    컴파일된 번역 인덱스 반환 (프로세스당 한 번 생성)
+
+    Args:
+        name: "book_titles_ko_en" | "book_titles_en_ko" | "authors_ko_en" | "authors_en_ko"
+    """
+    data = _load_translation_data()
+    kind, source, target = name.rsplit("_", 2)
+    opposite = f"{kind}_{target}_{source}"
+    return TranslationIndex(data[name], inverse_of=data.get(opposite), target=target)
+
+
+def translate_book_title(book_title: str, fuzzy: bool = False) -> str:
+    """책 제목을 영어로 변환 (fuzzy=True면 비슷한 제목으로도 매칭)"""
+    return get_translation_index("book_titles_ko_en").translate(book_title, fuzzy=fuzzy)
+
+
+def translate_book_title_to_korean(book_title: str, fuzzy: bool = False) -> str:
+    """책 제목을 한글로 변환 (역방향, 매핑이 없으면 원본 반환)"""
+    return get_translation_index("book_titles_en_ko").translate(book_title, fuzzy=fuzzy)
 
 
 def is_english_title(book_title: str) -> bool:
@@ -1050,700 +194,12 @@ def remove_korean_from_text(text: str) -> str:
 
 def translate_author_name(author: str) -> str:
     """작가 이름을 영어로 변환"""
-    author_map = {
-        "서정주": "Seo Jeong-ju",
-        "박노해": "Park No-hae",
-        "서정주/박노해": "Seo Jeong-ju / Park No-hae",
-        "사마천": "Sima Qian",
-        "찰스 두히그": "Charles Duhigg",
-        "리처드 탈러": "Richard Thaler",
-        "게리 마커스": "Gary Marcus",
-        "김영하": "Kim Young-ha",
-        "한강": "Han Kang",
-        "우디 앨런": "Woody Allen",
-        "닐 게이먼": "Neil Gaiman",
-        "실록청": "Sillokcheong",
-        "구스타브 플로베르": "Gustave Flaubert",
-        "이병주": "Lee Byung-ju",
-        "강대진": "Kang Dae-jin",
-        "로버트 루트번스타인": "Robert Root-Bernstein",
-        "스티븐 핑커": "Steven Pinker",
-        "미치 앨봄": "Mitch Albom",
-        "조너선 스타인버그": "Jonathan Steinberg",
-        "올리버 스톤": "Oliver Stone",
-        "버트런드 러셀": "Bertrand Russell",
-        "프란츠 카프카": "Franz Kafka",
-        "함석헌": "Ham Sok-hon",
-        "씨알 함석헌": "Ham Sok-hon",
-        "김구": "Kim Gu",
-        "백범 김구": "Kim Gu",
-        "버트런드 러셀": "Bertrand Russell",
-        "에드워드 사이드": "Edward Said",
-        "히가시노 게이고": "Keigo Higashino",
-        "미하이 칙센트미하이": "Mihaly Csikszentmihalyi",
-        "채사장": "Chae Sa-jang",
-        "세스 고딘": "Seth Godin",
-        "캐럴라인 크리아도 페레스": "Caroline Criado Perez",
-        "에릭 와이너": "Eric Weiner",
-        "나심 탈레브": "Nassim Nicholas Taleb",
-        "나심 니콜라스 탈레브": "Nassim Nicholas Taleb",
-        "헬렌 피셔": "Helen Fisher",
-        "이기주": "Lee Ki-ju",
-        "페르낭 브로델": "Fernand Braudel",
-        "레프 톨스토이": "Leo Tolstoy",
-        "데이비드 모러": "David Maurer",
-        "자청": "Jacheong",
-        "토마스 모어": "Thomas More",
-        "게리 켈러": "Gary Keller",
-        "제이 파파산": "Jay Papasan",
-        "존 로크": "John Locke",
-        "기시미 이치로": "Ichiro Kishimi",
-        "고가 후미타케": "Fumitake Koga",
-        "다론 아세모글루": "Daron Acemoglu",
-        "제임스 로빈슨": "James A. Robinson",
-        "폴 칼라니티": "Paul Kalanithi",
-        "조나단 하이트": "Jonathan Haidt",
-        "김은국": "Richard E. Kim",
-        "카이 버드": "Kai Bird",
-        "Kai Bird": "Kai Bird",
-        "가브리엘 가르시아 마르케스": "Gabriel García Márquez",
-        "가르시아 마르케스": "Gabriel García Márquez",
-        "Gabriel García Márquez": "Gabriel García Márquez",
-        "García Márquez": "Gabriel García Márquez",
-        "Gabriel Garcia Marquez": "Gabriel García Márquez",
-        "Garcia Marquez": "Gabriel García Márquez",
-        "J.D. 샐린저": "J.D. Salinger",
-        "샐린저": "J.D. Salinger",
-        "J.D. Salinger": "J.D. Salinger",
-        "하퍼 리": "Harper Lee",
-        "Harper Lee": "Harper Lee",
-        "박민규": "Park Min-kyu",
-        "Park Min-kyu": "Park Min-kyu",
-        "지그문트 프로이트": "Sigmund Freud",
-        "지크문트 프로이트": "Sigmund Freud",
-        "프로이트": "Sigmund Freud",
-        "Sigmund Freud": "Sigmund Freud",
-        "장 자크 루소": "Jean-Jacques Rousseau",
-        "루소": "Jean-Jacques Rousseau",
-        "장자 (저자)": "Zhuangzi",
-        "Jean-Jacques Rousseau": "Jean-Jacques Rousseau",
-        "Rousseau": "Jean-Jacques Rousseau",
-        "베른하르트 슐링크": "Bernhard Schlink",
-        "슐링크": "Bernhard Schlink",
-        "Bernhard Schlink": "Bernhard Schlink",
-        "Schlink": "Bernhard Schlink",
-        "미셸 우엘백": "Michel Houellebecq",
-        "우엘백": "Michel Houellebecq",
-        "Michel Houellebecq": "Michel Houellebecq",
-        "Houellebecq": "Michel Houellebecq",
-        "D.H. 로렌스": "D.H. Lawrence",
-        "D. H. 로렌스": "D.H. Lawrence",
-        "데이비드 허버트 로렌스": "D.H. Lawrence",
-        "로렌스": "D.H. Lawrence",
-        "알베르 카뮈": "Albert Camus",
-        "카뮈": "Albert Camus",
-        "전경수": "Jeon Gyeong-su",
-        "마빈 해리스": "Marvin Harris",
-        "오비디우스": "Ovid",
-        "안톤 체호프": "Anton Chekhov",
-        "체호프": "Anton Chekhov",
-        "Anton Chekhov": "Anton Chekhov",
-        "Chekhov": "Anton Chekhov",
-        "이민진": "Min Jin Lee",
-        "Min Jin Lee": "Min Jin Lee",
-        "제인 오스틴": "Jane Austen",
-        "Jane Austen": "Jane Austen",
-        "새뮤얼 헌팅턴": "Samuel Huntington",
-        "새뮤얼 헌팅턴": "Samuel P. Huntington",
-        "Samuel Huntington": "Samuel Huntington",
-        "Samuel P. Huntington": "Samuel P. Huntington",
-        "루스 베네딕트": "Ruth Benedict",
-        "Ruth Benedict": "Ruth Benedict",
-        "스즈키 유이": "Yui Suzuki",
-        "Yui Suzuki": "Yui Suzuki",
-        "에드워드 콘제": "Edward Conze",
-        "Edward Conze": "Edward Conze",
-        "나카무라 하지메": "Hajime Nakamura",
-        "Hajime Nakamura": "Hajime Nakamura",
-        "고은지": "E.J. Koh",
-        "무라카미 하루키": "Murakami Haruki",
-        "하루키": "Haruki",
-        "유발 하라리": "Yuval Noah Harari",
-        "사이먼 사이넥": "Simon Sinek",
-        "셸리 케이건": "Shelly Kagan",
-        "조지 오웰": "George Orwell",
-        "어니스트 헤밍웨이": "Ernest Hemingway",
-        "아서 밀러": "Arthur Miller",
-        "클레어 키건": "Claire Keegan",
-        "키건": "Claire Keegan",
-        "Claire Keegan": "Claire Keegan",
-        "정유정": "Jeong You-jeong",
-        "Jeong You-jeong": "Jeong You-jeong",
-        "앤디 위어": "Andy Weir",
-        "Andy Weir": "Andy Weir",
-        "아르투어 쇼펜하우어": "Arthur Schopenhauer",
-        "쇼펜하우어": "Arthur Schopenhauer",
-        "Arthur Schopenhauer": "Arthur Schopenhauer",
-        "Arthur Miller": "Arthur Miller",
-        "올리버 버크먼": "Oliver Burkeman",
-        "Oliver Burkeman": "Oliver Burkeman",
-        "페르난두 페소아": "Fernando Pessoa",
-        "Fernando Pessoa": "Fernando Pessoa",
-        "윌리엄 셰익스피어": "William Shakespeare",
-        "도스토옙스키": "Fyodor Dostoevsky",
-        "헤르만 헤세": "Hermann Hesse",
-        "헤세": "Hermann Hesse",
-        "김용": "Jin Yong",
-        "Jin Yong": "Jin Yong",
-        "마이클 이스터": "Michael Easter",
-        "Michael Easter": "Michael Easter",
-        "파리드 자카리아": "Fareed Zakaria",
-        "Fareed Zakaria": "Fareed Zakaria",
-        "마키아벨리": "Niccolò Machiavelli",
-        "니콜로 마키아벨리": "Niccolò Machiavelli",
-        "이솝": "Aesop",
-        "미셸 푸코": "Michel Foucault",
-        "푸코": "Michel Foucault",
-        "강상중": "Kang Sang-jung",
-        "시라이 사토시": "Shirai Satoshi",
-        "손원평": "Son Won-pyung",
-        "김호연": "Kim Ho-yeon",
-        "김초엽": "Kim Cho-yeop",
-        "마이클 샌델": "Michael Sandel",
-        "재레드 다이아몬드": "Jared Diamond",
-        "이상": "Yi Sang",
-        "김충식": "Kim Chung-sik",
-        "브런 바너드": "Bryn Barnard",
-        "밀란 쿤데라": "Milan Kundera",
-        "쿤데라": "Milan Kundera",
-        "니코스 카잔차키스": "Nikos Kazantzakis",
-        "카잔차키스": "Nikos Kazantzakis",
-        "도스토옙스키": "Fyodor Dostoevsky",
-        "표도르 도스토옙스키": "Fyodor Dostoevsky",
-        "한강": "Han Kang",
-        "한강 작가": "Han Kang",
-        "파울로 코엘료": "Paulo Coelho",
-        "Paulo Coelho": "Paulo Coelho",
-        "Youngha Kim": "Youngha Kim",  # 영어 이름은 그대로 반환
-        "J.D. Salinger": "J.D. Salinger",
-        "제롬 데이비드 샐린저": "J.D. Salinger",
-        "샐린저": "J.D. Salinger",
-        "빅터 프랭클": "Viktor Frankl",
-        "Viktor Frankl": "Viktor Frankl",
-        "레이 달리오": "Ray Dalio",
-        "Ray Dalio": "Ray Dalio",
-        "빅터 E. 프랭클": "Viktor E. Frankl",
-        "Viktor E. Frankl": "Viktor E. Frankl",
-        "공자": "Confucius",
-        "Confucius": "Confucius",
-        "존 윌리엄스": "John Williams",
-        "John Williams": "John Williams",
-        "이선 몰릭": "Ethan Mollick",
-        "Ethan Mollick": "Ethan Mollick",
-        "제임스 클리어": "James Clear",
-        "James Clear": "James Clear",
-        "월터 아이작슨": "Walter Isaacson",
-        "Walter Isaacson": "Walter Isaacson",
-        "생텍쥐페리": "Antoine de Saint-Exupéry",
-        "앙투안 드 생텍쥐페리": "Antoine de Saint-Exupéry",
-        "Antoine de Saint-Exupéry": "Antoine de Saint-Exupéry",
-        "우르한 파묵": "Orhan Pamuk",
-        "Orhan Pamuk": "Orhan Pamuk",
-        "모건 하우설": "Morgan Housel",
-        "Morgan Housel": "Morgan Housel",
-        "루이자 메이 올콧": "Louisa May Alcott",
-        "Louisa May Alcott": "Louisa May Alcott",
-        "데일 카네기": "Dale Carnegie",
-        "Dale Carnegie": "Dale Carnegie",
-        "사마천": "Sima Qian",
-        "Sima Qian": "Sima Qian",
-        "마크 맨슨": "Mark Manson",
-        "Mark Manson": "Mark Manson",
-        "매트 헤이그": "Matt Haig",
-        "Matt Haig": "Matt Haig",
-        "알렉스 마이클리디스": "Alex Michaelides",
-        "Alex Michaelides": "Alex Michaelides",
-        "요한 하리": "Johann Hari",
-        "Johann Hari": "Johann Hari",
-        "박지원": "Park Jiwon",
-        "연암 박지원": "Park Jiwon",
-        "Park Jiwon": "Park Jiwon",
-        "웨인 다이어": "Wayne Dyer",
-        "Wayne Dyer": "Wayne Dyer",
-        "베르톨트 브레히트": "Bertolt Brecht",
-        "Bertolt Brecht": "Bertolt Brecht",
-        "나발 라비칸트": "Naval Ravikant",
-        "Naval Ravikant": "Naval Ravikant",
-        "엠제이 드마코": "MJ DeMarco",
-        "MJ DeMarco": "MJ DeMarco",
-        "람릿 세티": "Ramit Sethi",
-        "Ramit Sethi": "Ramit Sethi",
-        "가즈오 이시구로": "Kazuo Ishiguro",
-        "Kazuo Ishiguro": "Kazuo Ishiguro",
-        "에릭 에릭슨": "Erik Erikson",
-        "Erik Erikson": "Erik Erikson",
-        "프레드릭 배크만": "Fredrik Backman",
-        "Fredrik Backman": "Fredrik Backman",
-        "오 헨리": "O. Henry",
-        "O. Henry": "O. Henry",
-        "E.T.A. 호프만": "E.T.A. Hoffmann",
-        "호프만": "E.T.A. Hoffmann",
-        "E.T.A. Hoffmann": "E.T.A. Hoffmann",
-        "레이먼드 브릭스": "Raymond Briggs",
-        "브릭스": "Raymond Briggs",
-        "Raymond Briggs": "Raymond Briggs",
-        "그렉 맥커운": "Greg McKeown",
-        "그렉_맥커운": "Greg McKeown",
-        "Greg McKeown": "Greg McKeown",
-        "한스 로슬링": "Hans Rosling",
-        "한스_로슬링": "Hans Rosling",
-        "Hans Rosling": "Hans Rosling",
-        "토마 피케티": "Thomas Piketty",
-        "토마_피케티": "Thomas Piketty",
-        "Thomas Piketty": "Thomas Piketty",
-        "애나 렘키": "Anna Lembke",
-        "Anna Lembke": "Anna Lembke",
-        "레이 커즈와일": "Ray Kurzweil",
-        "커즈와일": "Kurzweil",
-        "Ray Kurzweil": "Ray Kurzweil",
-        "시다르타 무케르지": "Siddhartha Mukherjee",
-        "시다르타_무케르지": "Siddhartha Mukherjee",
-        "막스 베버": "Max Weber",
-        "Max Weber": "Max Weber",
-        "Siddhartha Mukherjee": "Siddhartha Mukherjee",
-        "더글라스 애덤스": "Douglas Adams",
-        "더글라스_애덤스": "Douglas Adams",
-        "Douglas Adams": "Douglas Adams",
-        "더글러스 호프스태터": "Douglas Hofstadter",
-        "더글러스_호프스태터": "Douglas Hofstadter",
-        "Douglas Hofstadter": "Douglas Hofstadter",
-        "엘리자베스 콜버트": "Elizabeth Kolbert",
-        "엘리자베스_콜버트": "Elizabeth Kolbert",
-        "Elizabeth Kolbert": "Elizabeth Kolbert",
-        "벤저민 그레이엄": "Benjamin Graham",
-        "벤저민_그레이엄": "Benjamin Graham",
-        "Benjamin Graham": "Benjamin Graham",
-        "로버트 기요사키": "Robert Kiyosaki",
-        "로버트_기요사키": "Robert Kiyosaki",
-        "Robert Kiyosaki": "Robert Kiyosaki",
-        "칼 뉴포트": "Cal Newport",
-        "칼_뉴포트": "Cal Newport",
-        "Cal Newport": "Cal Newport",
-        "대니얼 카너먼": "Daniel Kahneman",
-        "다니엘 카너먼": "Daniel Kahneman",
-        "다니엘_카너먼": "Daniel Kahneman",
-        "리처드 도킨스": "Richard Dawkins",
-        "리처드_도킨스": "Richard Dawkins",
-        "Richard Dawkins": "Richard Dawkins",
-        "메리 셸리": "Mary Shelley",
-        "메리_셸리": "Mary Shelley",
-        "Mary Shelley": "Mary Shelley",
-        "대니얼_카너먼": "Daniel Kahneman",
-        "Daniel Kahneman": "Daniel Kahneman",
-        "마르쿠스 아우렐리우스": "Marcus Aurelius",
-        "마르쿠스_아우렐리우스": "Marcus Aurelius",
-        "Marcus Aurelius": "Marcus Aurelius",
-        "나심 탈레브": "Nassim Taleb",
-        "나심_탈레브": "Nassim Taleb",
-        "Nassim Taleb": "Nassim Taleb",
-        "브라이언 트레이시": "Brian Tracy",
-        "브라이언_트레이시": "Brian Tracy",
-        "Brian Tracy": "Brian Tracy",
-        "가와바타 야스나리": "Yasunari Kawabata",
-        "가와바타_야스나리": "Yasunari Kawabata",
-        "Yasunari Kawabata": "Yasunari Kawabata",
-        "괴테": "Johann Wolfgang von Goethe",
-        "괴테_": "Johann Wolfgang von Goethe",
-        "Johann Wolfgang von Goethe": "Johann Wolfgang von Goethe",
-        "Goethe": "Johann Wolfgang von Goethe",
-        "니체": "Friedrich Nietzsche",
-        "니체_": "Friedrich Nietzsche",
-        "프리드리히 니체": "Friedrich Nietzsche",
-        "프리드리히_니체": "Friedrich Nietzsche",
-        "Friedrich Nietzsche": "Friedrich Nietzsche",
-        "Nietzsche": "Friedrich Nietzsche",
-        "프란츠 카프카": "Franz Kafka",
-        "카프카": "Franz Kafka",
-        "샬럿 브론테": "Charlotte Brontë",
-        "샬럿_브론테": "Charlotte Brontë",
-        "Charlotte Brontë": "Charlotte Brontë",
-        "Charlotte Bronte": "Charlotte Brontë",
-        "조세희": "Cho Se-hui",
-        "Cho Se-hui": "Cho Se-hui",
-        "Cho Sehee": "Cho Se-hui",
-        "플라톤": "Plato",
-        "Plato": "Plato",
-        "스콧 피츠제럴드": "F. Scott Fitzgerald",
-        "F. Scott Fitzgerald": "F. Scott Fitzgerald",
-        "피츠제럴드": "F. Scott Fitzgerald",
-        "Fitzgerald": "F. Scott Fitzgerald",
-        "카를 마르크스": "Karl Marx",
-        "마르크스": "Karl Marx",
-        "Karl Marx": "Karl Marx",
-        "Marx": "Karl Marx",
-        "칼 세이건": "Carl Sagan",
-        "칼_세이건": "Carl Sagan",
-        "Carl Sagan": "Carl Sagan",
-        "Sagan": "Carl Sagan",
-        "진 리스": "Jean Rhys",
-        "진_리스": "Jean Rhys",
-        "Jean Rhys": "Jean Rhys",
-        "Rhys": "Jean Rhys",
-        "윌리엄 골딩": "William Golding",
-        "윌리엄_골딩": "William Golding",
-        "William Golding": "William Golding",
-        "골딩": "William Golding",
-        "Golding": "William Golding",
-        "애덤 스미스": "Adam Smith",
-        "애덤_스미스": "Adam Smith",
-        "Adam Smith": "Adam Smith",
-        "이반 일리치": "Ivan Ilyich",
-        "이반_일리치": "Ivan Ilyich",
-        "Ivan Ilyich": "Ivan Ilyich",
-        "레프 톨스토이": "Leo Tolstoy",
-        "레프_톨스토이": "Leo Tolstoy",
-        "톨스토이": "Leo Tolstoy",
-        "Leo Tolstoy": "Leo Tolstoy",
-        "Tolstoy": "Leo Tolstoy",
-        "토마스 쿤": "Thomas Kuhn",
-        "토마스_쿤": "Thomas Kuhn",
-        "Thomas Kuhn": "Thomas Kuhn",
-        "쿤": "Thomas Kuhn",
-        "Kuhn": "Thomas Kuhn",
-        "클로드 레비스트로스": "Claude Lévi-Strauss",
-        "클로드_레비스트로스": "Claude Lévi-Strauss",
-        "레비스트로스": "Claude Lévi-Strauss",
-        "Claude Lévi-Strauss": "Claude Lévi-Strauss",
-        "Lévi-Strauss": "Claude Lévi-Strauss",
-        "벤저민 하디": "Benjamin Hardy",
-        "벤저민_하디": "Benjamin Hardy",
-        "Benjamin Hardy": "Benjamin Hardy",
-        "크리스 니바우어": "Chris Niebauer",
-        "크리스_니바우어": "Chris Niebauer",
-        "Chris Niebauer": "Chris Niebauer",
-        "호메로스": "Homer",
-        "Homer": "Homer",
-        "이언 보스트리지": "Ian Bostridge",
-        "이언_보스트리지": "Ian Bostridge",
-        "Ian Bostridge": "Ian Bostridge",
-        "올더스 헉슬리": "Aldous Huxley",
-        "올더스_헉슬리": "Aldous Huxley",
-        "헉슬리": "Aldous Huxley",
-        "Aldous Huxley": "Aldous Huxley",
-        "Huxley": "Aldous Huxley",
-        "앤절라 더크워스": "Angela Duckworth",
-        "앤절라_더크워스": "Angela Duckworth",
-        "더크워스": "Angela Duckworth",
-        "Angela Duckworth": "Angela Duckworth",
-        "Duckworth": "Angela Duckworth",
-        "브루스 커밍스": "Bruce Cumings",
-        "Bruce Cumings": "Bruce Cumings",
-        "로버트 그린": "Robert Greene",
-        "로버트_그린": "Robert Greene",
-        "Robert Greene": "Robert Greene",
-        "Greene": "Robert Greene",
-        "룰루 밀러": "Lulu Miller",
-        "룰루_밀러": "Lulu Miller",
-        "Lulu Miller": "Lulu Miller",
-        "모건 하우절": "Morgan Housel",
-        "캐럴 드웩": "Carol Dweck",
-        "Carol Dweck": "Carol Dweck",
-        "피터 아티아": "Peter Attia",
-        "Peter Attia": "Peter Attia",
-        "보니 가머스": "Bonnie Garmus",
-        "Bonnie Garmus": "Bonnie Garmus",
-        "자사": "Zisi",
-        "Zisi": "Zisi",
-        "공자의 손자": "Zisi",
-        "요네하라 마리": "Yonehara Mari",
-        "Yonehara Mari": "Yonehara Mari",
-        "하비 콕스": "Harvey Cox",
-        "Harvey Cox": "Harvey Cox",
-        "다가와 겐조": "Kenzo Tagawa",
-        "Kenzo Tagawa": "Kenzo Tagawa",
-        "조반니 과레스키": "Giovanni Guareschi",
-        "Giovanni Guareschi": "Giovanni Guareschi",
-        "유시민": "Rhyu Si-min",
-        "Rhyu Si-min": "Rhyu Si-min",
-        "다니엘 페나크": "Daniel Pennac",
-        "Daniel Pennac": "Daniel Pennac",
-        "피천득": "Pi Chon-deuk",
-        "Pi Chon-deuk": "Pi Chon-deuk",
-        "법정": "Beopjeong",
-        "Beopjeong": "Beopjeong",
-        "신영복": "Shin Yeong-bok",
-        "Shin Yeong-bok": "Shin Yeong-bok",
-        "피천득, 법정, 신영복": "Pi Chon-deuk, Beopjeong, Shin Yeong-bok",
-        "Pi Chon-deuk, Beopjeong, Shin Yeong-bok": "Pi Chon-deuk, Beopjeong, Shin Yeong-bok",
-        "프란스 드 발": "Frans de Waal",
-        "프란스_드_발": "Frans de Waal",
-        "Frans de Waal": "Frans de Waal",
-        "세이노": "Seino",
-        "Seino": "Seino",
-        "CITRINI RESEARCH": "Citrini Research",
-        "Citrini Research": "Citrini Research",
-        "시트리니 리서치": "Citrini Research",
-        "찰스 다윈": "Charles Darwin",
-        "찰스_다윈": "Charles Darwin",
-        "Charles Darwin": "Charles Darwin",
-        "케빈 J. 미첼": "Kevin J. Mitchell",
-        "케빈_J._미첼": "Kevin J. Mitchell",
-        "Kevin J. Mitchell": "Kevin J. Mitchell",
-        "데이비드 크리스천": "David Christian",
-        "데이비드_크리스천": "David Christian",
-        "David Christian": "David Christian",
-        "수잔 손택": "Susan Sontag",
-        "수잔_손택": "Susan Sontag",
-        "Susan Sontag": "Susan Sontag",
-        "Sontag": "Susan Sontag",
-        "롭 무어": "Rob Moore",
-        "롭_무어": "Rob Moore",
-        "Rob Moore": "Rob Moore",
-        "Moore": "Rob Moore",
-        "팀 페리스": "Tim Ferriss",
-        "팀_페리스": "Tim Ferriss",
-        "Tim Ferriss": "Tim Ferriss",
-        "Ferriss": "Tim Ferriss",
-        "사이토 다카시": "Takashi Saito",
-        "사이토_다카시": "Takashi Saito",
-        "Takashi Saito": "Takashi Saito",
-        "Saito": "Takashi Saito",
-        "발타자르 그라시안": "Baltasar Gracian",
-        "발타자르_그라시안": "Baltasar Gracian",
-        "Baltasar Gracian": "Baltasar Gracian",
-        "Gracian": "Baltasar Gracian",
-        "앤디 앤드루스": "Andy Andrews",
-        "앤디_앤드루스": "Andy Andrews",
-        "Andy Andrews": "Andy Andrews",
-        "Andrews": "Andy Andrews",
-        "이나모리 가즈오": "Kazuo Inamori",
-        "이나모리_가즈오": "Kazuo Inamori",
-        "Kazuo Inamori": "Kazuo Inamori",
-        "Inamori": "Kazuo Inamori",
-        "서머셋 몸": "W. Somerset Maugham",
-        "서머셋_몸": "W. Somerset Maugham",
-        "서머싯 몸": "W. Somerset Maugham",
-        "서머싯_몸": "W. Somerset Maugham",
-        "W. Somerset Maugham": "W. Somerset Maugham",
-        "Somerset Maugham": "W. Somerset Maugham",
-        "Maugham": "W. Somerset Maugham",
-        "다치바나 다카시": "Takashi Tachibana",
-        "다치바나_다카시": "Takashi Tachibana",
-        "Takashi Tachibana": "Takashi Tachibana",
-        # 일당백 시즌2 18~23화 저자
-        "그레고리 헨더슨": "Gregory Henderson",
-        "그레고리_헨더슨": "Gregory Henderson",
-        "Gregory Henderson": "Gregory Henderson",
-        "존 스타인벡": "John Steinbeck",
-        "존_스타인벡": "John Steinbeck",
-        "John Steinbeck": "John Steinbeck",
-        "Steinbeck": "John Steinbeck",
-        "레이먼드 챈들러": "Raymond Chandler",
-        "레이먼드_챈들러": "Raymond Chandler",
-        "Raymond Chandler": "Raymond Chandler",
-        "Chandler": "Raymond Chandler",
-        "사카이야 다이치": "Sakaiya Taichi",
-        "사카이야_다이치": "Sakaiya Taichi",
-        "Sakaiya Taichi": "Sakaiya Taichi",
-        "프랭크 바움": "L. Frank Baum",
-        "프랭크_바움": "L. Frank Baum",
-        "L. Frank Baum": "L. Frank Baum",
-        "Frank Baum": "L. Frank Baum",
-        "한기호 외": "Han Ki-ho et al.",
-        "한기호_외": "Han Ki-ho et al.",
-        "Han Ki-ho et al.": "Han Ki-ho et al.",
-    }
-
-    if author in author_map:
-        return author_map[author]
-
-    return author
+    return get_translation_index("authors_ko_en").translate(author)
 
 
 def translate_author_name_to_korean(author: str) -> str:
     """작가 이름을 한글로 변환 (역방향)"""
-    # 영어 -> 한글 매핑
-    reverse_author_map = {
-        "Kim Young-ha": "김영하",
-        "Han Kang": "한강",
-        "Woody Allen": "우디 앨런",
-        "Neil Gaiman": "닐 게이먼",
-        "Ham Sok-hon": "함석헌",
-        "Kim Gu": "김구",
-        "Bertrand Russell": "버트런드 러셀",
-        "Edward Said": "에드워드 사이드",
-        "Keigo Higashino": "히가시노 게이고",
-        "Mihaly Csikszentmihalyi": "미하이 칙센트미하이",
-        "Chae Sa-jang": "채사장",
-        "Seth Godin": "세스 고딘",
-        "Caroline Criado Perez": "캐럴라인 크리아도 페레스",
-        "Eric Weiner": "에릭 와이너",
-        "Nassim Nicholas Taleb": "나심 탈레브",
-        "Helen Fisher": "헬렌 피셔",
-        "Lee Ki-ju": "이기주",
-        "Fernand Braudel": "페르낭 브로델",
-        "Leo Tolstoy": "레프 톨스토이",
-        "David Maurer": "데이비드 모러",
-        "Jacheong": "자청",
-        "Thomas More": "토마스 모어",
-        "Gary Keller": "게리 켈러",
-        "Jay Papasan": "제이 파파산",
-        "John Locke": "존 로크",
-        "Ichiro Kishimi": "기시미 이치로",
-        "Fumitake Koga": "고가 후미타케",
-        "Daron Acemoglu": "다론 아세모글루",
-        "James A. Robinson": "제임스 로빈슨",
-        "Paul Kalanithi": "폴 칼라니티",
-        "Jonathan Haidt": "조나단 하이트",
-        "Gabriel García Márquez": "가르시아 마르케스",
-        "García Márquez": "가르시아 마르케스",
-        "Gabriel Garcia Marquez": "가르시아 마르케스",
-        "Garcia Marquez": "가르시아 마르케스",
-        "E.J. Koh": "고은지",
-        "Murakami Haruki": "무라카미 하루키",
-        "Haruki": "하루키",
-        "Yuval Noah Harari": "유발 하라리",
-        "Simon Sinek": "사이먼 사이넥",
-        "Shelly Kagan": "셸리 케이건",
-        "Jonathan Swift": "조너던 스위프트",
-        "Swift": "조너던 스위프트",
-        "George Orwell": "조지 오웰",
-        "Ernest Hemingway": "어니스트 헤밍웨이",
-        "Arthur Miller": "아서 밀러",
-        "Claire Keegan": "클레어 키건",
-        "Jeong You-jeong": "정유정",
-        "Arthur Schopenhauer": "아르투어 쇼펜하우어",
-        "Oliver Burkeman": "올리버 버크먼",
-        "Fernando Pessoa": "페르난두 페소아",
-        "Claude Lévi-Strauss": "클로드 레비스트로스",
-        "Lévi-Strauss": "클로드 레비스트로스",
-        "Albert Camus": "알베르 카뮈",
-        "Camus": "알베르 카뮈",
-        "Jonathan Swift": "조너던 스위프트",
-        "Swift": "조너던 스위프트",
-        "Franz Kafka": "프란츠 카프카",
-        "Kafka": "프란츠 카프카",
-        "William Shakespeare": "윌리엄 셰익스피어",
-        "Fyodor Dostoevsky": "표도르 도스토옙스키",
-        "Hermann Hesse": "헤르만 헤세",
-        "Niccolò Machiavelli": "니콜로 마키아벨리",
-        "Aesop": "이솝",
-        "Michel Foucault": "미셸 푸코",
-        "Kang Sang-jung": "강상중",
-        "Shirai Satoshi": "시라이 사토시",
-        "Yi Sang": "이상",
-        "Kim Chung-sik": "김충식",
-        "Bryn Barnard": "브런 바너드",
-        "Milan Kundera": "밀란 쿤데라",
-        "Nikos Kazantzakis": "니코스 카잔차키스",
-        "Han Kang": "한강",
-        "Son Won-pyung": "손원평",
-        "Kim Ho-yeon": "김호연",
-        "Kim Cho-yeop": "김초엽",
-        "Michael Sandel": "마이클 샌델",
-        "Jared Diamond": "재레드 다이아몬드",
-        "Ethan Mollick": "이선 몰릭",
-        "Viktor Frankl": "빅터 프랭클",
-        "James Clear": "제임스 클리어",
-        "Walter Isaacson": "월터 아이작슨",
-        "Antoine de Saint-Exupéry": "생텍쥐페리",
-        "Orhan Pamuk": "우르한 파묵",
-        "Morgan Housel": "모건 하우설",
-        "Louisa May Alcott": "루이자 메이 올콧",
-        "Dale Carnegie": "데일 카네기",
-        "Sima Qian": "사마천",
-        "Mark Manson": "마크 맨슨",
-        "Matt Haig": "매트 헤이그",
-        "Alex Michaelides": "알렉스 마이클리디스",
-        "Naval Ravikant": "나발 라비칸트",
-        "MJ DeMarco": "엠제이 드마코",
-        "Ramit Sethi": "람릿 세티",
-        "Kazuo Ishiguro": "가즈오 이시구로",
-        "Erik Erikson": "에릭 에릭슨",
-        "Fredrik Backman": "프레드릭 배크만",
-        "O. Henry": "오 헨리",
-        "Natsume Soseki": "나쓰메 소세키",
-        "Demis Hassabis": "데미스 허사비스",
-        "데미스 허사비스": "Demis Hassabis",
-        "DeepMind": "딥마인드",
-        "딥마인드": "DeepMind",
-        "Soseki": "나쓰메 소세키",
-        "나쓰메 소세키": "Natsume Soseki",
-        "나쓰메_소세키": "Natsume Soseki",
-        "E.T.A. Hoffmann": "E.T.A. 호프만",
-        "Raymond Briggs": "레이먼드 브릭스",
-        "Greg McKeown": "그렉 맥커운",
-        "Max Weber": "막스 베버",
-        "Hans Rosling": "한스 로슬링",
-        "Thomas Piketty": "토마 피케티",
-        "Anna Lembke": "애나 렘키",
-        "Ray Kurzweil": "레이 커즈와일",
-        "Kurzweil": "레이 커즈와일",
-        "Siddhartha Mukherjee": "시다르타 무케르지",
-        "Douglas Adams": "더글라스 애덤스",
-        "Douglas Hofstadter": "더글러스 호프스태터",
-        "Elizabeth Kolbert": "엘리자베스 콜버트",
-        "Benjamin Graham": "벤저민 그레이엄",
-        "Robert Kiyosaki": "로버트 기요사키",
-        "Cal Newport": "칼 뉴포트",
-        "Daniel Kahneman": "대니얼 카너먼",
-        "Marcus Aurelius": "마르쿠스 아우렐리우스",
-        "Nassim Taleb": "나심 탈레브",
-        "Brian Tracy": "브라이언 트레이시",
-        "Yasunari Kawabata": "가와바타 야스나리",
-        "Friedrich Nietzsche": "프리드리히 니체",
-        "Nietzsche": "프리드리히 니체",
-        "Johann Wolfgang von Goethe": "괴테",
-        "Goethe": "괴테",
-        "Franz Kafka": "프란츠 카프카",
-        "Kafka": "프란츠 카프카",
-        "Charlotte Brontë": "샬럿 브론테",
-        "Charlotte Bronte": "샬럿 브론테",
-        "리처드 도킨스": "Richard Dawkins",
-        "Richard Dawkins": "Richard Dawkins",
-        "Cho Se-hui": "조세희",
-        "Cho Sehee": "조세희",
-        "Plato": "플라톤",
-        "F. Scott Fitzgerald": "스콧 피츠제럴드",
-        "Fitzgerald": "스콧 피츠제럴드",
-        "Karl Marx": "카를 마르크스",
-        "Marx": "카를 마르크스",
-        "Benjamin Hardy": "벤저민 하디",
-        "Chris Niebauer": "크리스 니바우어",
-        "Homer": "호메로스",
-        "Ian Bostridge": "이언 보스트리지",
-        "Aldous Huxley": "올더스 헉슬리",
-        "Huxley": "올더스 헉슬리",
-        "Angela Duckworth": "앤절라 더크워스",
-        "Duckworth": "앤절라 더크워스",
-        "Lulu Miller": "룰루 밀러",
-        "Osamu Dazai": "다자이 오사무",
-        "Johann Hari": "요한 하리",
-        "Yeonam Park Jiwon": "연암 박지원",
-        "Park Jiwon": "박지원",
-        "Wayne Dyer": "웨인 다이어",
-        "Bertolt Brecht": "베르톨트 브레히트",
-        "Harvey Cox": "하비 콕스",
-        "Kenzo Tagawa": "다가와 겐조",
-        "Giovanni Guareschi": "조반니 과레스키",
-        "Rhyu Si-min": "유시민",
-        "Charles Darwin": "찰스 다윈",
-        "Frans de Waal": "프란스 드 발",
-        "Citrini Research": "시트리니 리서치",
-        "Kevin J. Mitchell": "케빈 J. 미첼",
-        "David Christian": "데이비드 크리스천",
-        "Min Jin Lee": "이민진",
-        "Susan Sontag": "수잔 손택",
-        "Rob Moore": "롭 무어",
-        "Tim Ferriss": "팀 페리스",
-        "Takashi Saito": "사이토 다카시",
-        "Baltasar Gracian": "발타자르 그라시안",
-    }
-
-    if author in reverse_author_map:
-        return reverse_author_map[author]
-    
-    return author
+    return get_translation_index("authors_en_ko").translate(author)
 
 
 def get_book_alternative_title(book_title: str) -> dict:
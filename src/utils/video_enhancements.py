@@ -213,7 +213,8 @@ def create_waveform_visualization(
     resolution: tuple = (1920, 1080),
     position: str = "bottom",
     height: int = 100,
-    color: str = "cyan"
+    color: str = "cyan",
+    seed: Optional[int] = None
 ):
     """
     오디오 파형 시각화 생성
@@ -225,14 +226,19 @@ def create_waveform_visualization(
         position: 위치 ('bottom', 'top', 'center')
         height: 파형 높이 (픽셀)
         color: 파형 색상
+        seed: envelope 계산 실패 시 더미 파형의 난수 시드 (같은 입력 → 같은 화면)
         
     Returns:
         VideoClip 또는 None
     """
     try:
-        from moviepy.editor import AudioFileClip, VideoClip
+        from moviepy.editor import VideoClip
         import numpy as np
         from PIL import Image, ImageDraw
+        try:
+            from utils.audio_analysis import AudioEnvelope, load_envelope
+        except ImportError:
+            from src.utils.audio_analysis import AudioEnvelope, load_envelope
         
         import os
 
@@ -243,39 +249,25 @@ def create_waveform_visualization(
         gamma = float(os.getenv("WAVEFORM_GAMMA", "0.60"))  # 다이내믹 레인지(낮을수록 더 역동적)
         alpha = int(os.getenv("WAVEFORM_ALPHA", "220"))     # 0~255
 
-        # 오디오 로드
-        audio = AudioFileClip(audio_path)
-        audio_fps = audio.fps  # 오디오 샘플레이트 저장
         fps = 30  # 비디오 프레임레이트
-        
-        # 오디오를 numpy array로 변환 (한 번만 로드)
+
+        # RMS/피크 envelope (ffmpeg 스트리밍 디코딩, 오디오 옆 .npy 캐시) — 전체 PCM을 올리지 않음
         try:
-            raw = audio.to_soundarray(fps=audio_fps)
-            # moviepy 버전에 따라 list/ndarray 등으로 올 수 있어 방어적으로 처리
-            if isinstance(raw, list):
-                raw = np.concatenate(raw, axis=0)
-            audio_array = np.asarray(raw)
-            # 스테레오인 경우 모노로 변환
-            if audio_array.ndim > 1:
-                audio_array = audio_array.mean(axis=1)
-            audio_array = audio_array.astype(np.float32, copy=False).reshape(-1)
+            envelope = load_envelope(audio_path)
         except Exception as e:
-            print(f"⚠️ 오디오 배열 변환 실패, 더미 데이터 사용: {e}")
+            print(f"⚠️ 오디오 envelope 계산 실패, 더미 데이터 사용: {e}")
             # 폴백: 간단한 더미 데이터
-            audio_array = (np.random.rand(int(audio_fps * duration)).astype(np.float32) * 0.1)
-        
-        # 오디오 리소스 정리
-        audio.close()
-        
+            dummy = np.random.default_rng(seed).random(max(1, int(duration * 100))).astype(np.float32) * 0.1
+            envelope = AudioEnvelope(rms=dummy, peak=dummy, frame_rate=100)
+
+        audio_duration = max(envelope.duration, 1e-3)
+
         # MoviePy CompositeVideoClip는 기본적으로 RGB(3채널) 프레임을 기대합니다.
         # 투명도를 유지하려면 RGBA 프레임을 그대로 반환하지 말고,
         # RGB 프레임 + 별도 mask(알파) 클립으로 분리해야 합니다.
         def render_waveform_rgba_frame(t: float) -> np.ndarray:
             """특정 시간의 RGBA 파형 프레임 생성 (H, W, 4)"""
-            # 해당 시간의 오디오 샘플 인덱스 계산
-            sample_idx = int(t * audio_fps)
-            if sample_idx >= len(audio_array):
-                sample_idx = len(audio_array) - 1
+            t = min(t, audio_duration)
 
             # 파형 이미지 생성 (투명 배경)
             img = Image.new('RGBA', (resolution[0], height), (0, 0, 0, 0))
@@ -285,32 +277,22 @@ def create_waveform_visualization(
             num_bars = 90  # 더 촘촘하게 → 더 역동적으로 보임
             bar_width = max(1, resolution[0] // num_bars)
 
-            # 주변 샘플을 분석하여 파형 생성 (시간에 따라 변화)
-            window_size = max(100, len(audio_array) // num_bars)
+            # 주변 구간을 분석하여 파형 생성 (시간에 따라 변화)
+            window = audio_duration / num_bars
+            bar_span = window / num_bars
+            # 스크롤 효과: 너무 정적이지 않게 약간 더 빠르게
+            time_offset = (t * 0.02) % window
 
             for i in range(num_bars):
-                # 각 바에 해당하는 샘플 범위 (시간에 따라 스크롤)
-                # 스크롤 효과(샘플 기준): 너무 정적이지 않게 약간 더 빠르게
-                time_offset = int(t * audio_fps * 0.02) % window_size
-                start_idx = max(
-                    0,
-                    sample_idx
-                    - window_size // 2
-                    + (i - num_bars // 2) * window_size // num_bars
-                    + time_offset,
-                )
-                end_idx = min(len(audio_array), start_idx + window_size // num_bars)
-
-                if start_idx < len(audio_array) and end_idx > start_idx:
-                    chunk = audio_array[start_idx:end_idx]
-                    if len(chunk) > 0:
-                        abs_chunk = np.abs(chunk)
-                        # mean(abs)는 너무 작게 나오는 경향 → peak/rms 기반으로 더 다이나믹하게
-                        peak95 = float(np.percentile(abs_chunk, 95))
-                        rms = float(np.sqrt(np.mean(chunk * chunk)))
-                        amplitude = max(peak95, rms)
-                    else:
-                        amplitude = 0.0
+                # 각 바에 해당하는 구간 (시간에 따라 스크롤)
+                start = max(0.0, t - window / 2 + (i - num_bars // 2) * bar_span + time_offset)
+
+                if start < audio_duration:
+                    rms_frames, peak_frames = envelope.window(start, start + bar_span)
+                    # 평균 진폭은 너무 작게 나오는 경향 → peak/rms 기반으로 더 다이나믹하게
+                    peak = float(np.median(peak_frames))
+                    rms = float(np.sqrt(np.mean(np.square(rms_frames))))
+                    amplitude = max(peak, rms)
                 else:
                     amplitude = 0.0
 
@@ -352,10 +334,19 @@ def create_waveform_visualization(
 
             return np.array(img)
 
+        # RGB 프레임과 mask가 같은 t를 연달아 요청하므로 마지막 프레임 재사용
+        last_frame = {"t": None, "rgba": None}
+
+        def cached_rgba_frame(t: float) -> np.ndarray:
+            if last_frame["t"] != t:
+                last_frame["rgba"] = render_waveform_rgba_frame(t)
+                last_frame["t"] = t
+            return last_frame["rgba"]
+
         def make_waveform_frame(t: float) -> np.ndarray:
             """RGB 프레임 (H, W, 3)"""
             try:
-                rgba = render_waveform_rgba_frame(t)
+                rgba = cached_rgba_frame(t)
                 return rgba[:, :, :3]
             except Exception:
                 return np.zeros((height, resolution[0], 3), dtype=np.uint8)
@@ -363,7 +354,7 @@ def create_waveform_visualization(
         def make_waveform_mask(t: float) -> np.ndarray:
             """Mask 프레임 (H, W), float 0..1"""
             try:
-                rgba = render_waveform_rgba_frame(t)
+                rgba = cached_rgba_frame(t)
                 alpha = rgba[:, :, 3].astype(np.float32) / 255.0
                 return alpha
             except Exception:
@@ -512,7 +503,8 @@ def enhance_video_with_visuals(
     language: str = "ko",
     enable_kinetic_typography: bool = True,
     enable_waveform: bool = True,
-    enable_footage: bool = False
+    enable_footage: bool = False,
+    seed: Optional[int] = None
 ):
     """
     영상에 시각적 요소 추가
@@ -525,6 +517,7 @@ def enhance_video_with_visuals(
         enable_kinetic_typography: 동적 자막 활성화
         enable_waveform: 파형 활성화
         enable_footage: 푸티지 활성화
+        seed: 난수를 쓰는 폴백의 시드 (구간 캐시 키에서 만들어 캐시된 구간과 같은 결과 보장)
         
     Returns:
         향상된 비디오 클립
@@ -589,7 +582,8 @@ def enhance_video_with_visuals(
                 resolution=video_clip.size if hasattr(video_clip, 'size') else (1920, 1080),
                 position="bottom",
                 height=waveform_height,
-                color="cyan"  # 시안색 파형
+                color="cyan",  # 시안색 파형
+                seed=seed
             )
             if waveform_clip:
                 enhanced_clips.append(waveform_clip)
@@ -0,0 +1,260 @@
+"""
+YouTube Data API 조건부 요청(ETag) 캐시
+
+영상 정보 조회(23), 제목으로 영상 찾기(17), 플레이리스트 목록(27)처럼 같은 리소스를
+반복해서 읽는 스크립트는 매번 쿼터를 씁니다. googleapiclient 서비스 객체의 http 계층을 감싸
+GET 응답을 ETag와 함께 `.cache/youtube_etag_cache.sqlite3`에 보관하고,
+
+- 같은 요청을 다시 보낼 때 `If-None-Match`를 붙여 304면 보관한 본문을 200으로 돌려줌
+- fresh_for초 안에 다시 읽으면 네트워크 요청 없이 보관본 반환
+- 같은 리소스 경로에 쓰기(POST/PUT/DELETE)가 성공하면 해당 경로 보관본 무효화
+- 절약한 쿼터 단위(quota_scheduler.METHOD_COSTS 기준)를 집계
+
+서비스 코드는 그대로 두고 build 직후 한 번 감싸면 됩니다.
+
+사용 예:
+    youtube = enable_etag_cache(build('youtube', 'v3', credentials=credentials), fresh_for=300)
+    ...
+    log_cache_stats(youtube, logger)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import httplib2
+except ImportError:  # googleapiclient가 없는 환경
+    httplib2 = None
+
+try:
+    from utils.quota_scheduler import method_cost
+except ImportError:
+    from src.utils.quota_scheduler import method_cost
+
+CACHE_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "youtube_etag_cache.sqlite3"
+
+# 스크립트 기본 fresh_for (초): 같은 실행 안의 반복 조회는 요청 생략
+DEFAULT_FRESH_SECONDS = 300
+
+# 캐시 키에서 제외할 쿼리 파라미터 (API 키 등)
+IGNORED_PARAMS = frozenset({"key", "quotaUser"})
+
+PathLike = Union[str, Path]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_path ON responses (path);
+"""
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    requests: int = 0          # 네트워크로 보낸 GET
+    not_modified: int = 0      # 304로 보관본 재사용
+    served_fresh: int = 0      # 요청 없이 보관본 반환
+    stored: int = 0            # 새로 보관한 응답
+    invalidated: int = 0       # 쓰기로 무효화한 보관본
+    units_saved: int = 0       # 절약한 쿼터 단위
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.requests + self.served_fresh
+        return (self.not_modified + self.served_fresh) / total if total else 0.0
+
+
+def quota_cost(path: str) -> int:
+    """요청 경로의 목록 조회 쿼터 비용 (/youtube/v3/search → 100)"""
+    resource = path.rstrip("/").rsplit("/", 1)[-1]
+    return method_cost(f"{resource}.list")
+
+
+def _normalize_uri(uri: str) -> Tuple[str, str]:
+    """(경로, 정렬된 쿼리 포함 URI) - API 키 등 제외"""
+    parts = urlsplit(uri)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in IGNORED_PARAMS)
+    return parts.path, urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def _response_etag(resp, content: bytes) -> Optional[str]:
+    """ETag 헤더, 없으면 JSON 본문의 etag 필드"""
+    etag = resp.get("etag") if hasattr(resp, "get") else None
+    if etag:
+        return etag
+    try:
+        etag = json.loads(content).get("etag")
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return f'"{etag}"' if etag and not etag.startswith('"') else etag
+
+
+class ETagCache:
+    """ETag 응답 보관소 (SQLite, 스레드 안전)"""
+
+    def __init__(self, db_path: PathLike = CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def get(self, cache_key: str) -> Optional[Tuple[str, str, bytes, float]]:
+        """(etag, content_type, body, stored_at) 또는 None"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT etag, content_type, body, stored_at FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+
+    def put(self, cache_key: str, path: str, etag: str, content_type: str, body: bytes) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, path, etag, content_type, body, time.time()),
+            )
+
+    def touch(self, cache_key: str) -> None:
+        """304 재검증 시각 갱신 (fresh_for 기준)"""
+        with self._connect() as conn:
+            conn.execute("UPDATE responses SET stored_at = ? WHERE cache_key = ?", (time.time(), cache_key))
+
+    def invalidate(self, path: str) -> int:
+        """경로(리소스)의 보관본 삭제"""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM responses WHERE path = ?", (path,)).rowcount
+
+
+class CachingHttp:
+    """
+    httplib2.Http 호환 래퍼 (googleapiclient가 `request(uri, method, body, headers)`로 호출)
+
+    GET만 캐시하며 그 외 요청과 재개 가능 업로드는 그대로 전달합니다.
+    """
+
+    def __init__(self, http, cache: Optional[ETagCache] = None, namespace: str = "", fresh_for: float = 0.0):
+        """
+        Args:
+            http: 원래 http 객체 (httplib2.Http, AuthorizedHttp 등)
+            cache: 보관소 (기본: CACHE_PATH)
+            namespace: 계정 구분자 (mine=True 등 계정별로 다른 응답 분리)
+            fresh_for: 이 시간(초) 안의 보관본은 재검증 없이 반환 (0이면 항상 재검증)
+        """
+        self.http = http
+        self.cache = cache or ETagCache()
+        self.namespace = namespace
+        self.fresh_for = fresh_for
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # credentials, timeout, close 등은 원래 http 객체로 위임
+        return getattr(self.http, name)
+
+    def _count(self, **increments) -> None:
+        with self._stats_lock:
+            for field_name, value in increments.items():
+                setattr(self.stats, field_name, getattr(self.stats, field_name) + value)
+
+    @staticmethod
+    def _cached_response(content_type: str):
+        return httplib2.Response({"status": "200", "content-type": content_type or "application/json"})
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        headers = dict(headers or {})
+        path, normalized = _normalize_uri(uri)
+
+        if method.upper() != "GET":
+            resp, content = self.http.request(uri, method, body=body, headers=headers, **kwargs)
+            if 200 <= resp.status < 300:
+                # 업로드 엔드포인트(/upload/youtube/v3/...)도 같은 리소스로 취급
+                removed = self.cache.invalidate(path.replace("/upload/", "/", 1))
+                if removed:
+                    self._count(invalidated=removed)
+            return resp, content
+
+        cache_key = hashlib.sha256(f"{self.namespace}\n{normalized}".encode("utf-8")).hexdigest()
+        cached = self.cache.get(cache_key)
+        if cached:
+            etag, content_type, cached_body, stored_at = cached
+            if self.fresh_for and time.time() - stored_at < self.fresh_for:
+                self._count(served_fresh=1, units_saved=quota_cost(path))
+                return self._cached_response(content_type), cached_body
+            headers["If-None-Match"] = etag
+
+        resp, content = self.http.request(uri, method, body=body, headers=headers, **kwargs)
+        self._count(requests=1)
+
+        if resp.status == 304 and cached:
+            self.cache.touch(cache_key)
+            self._count(not_modified=1, units_saved=quota_cost(path))
+            return self._cached_response(cached[1]), cached[2]
+
+        if resp.status == 200:
+            etag = _response_etag(resp, content)
+            if etag:
+                self.cache.put(cache_key, path, etag, resp.get("content-type", ""), content)
+                self._count(stored=1)
+        return resp, content
+
+
+def _credentials_namespace(http) -> str:
+    """인증 정보로 계정 구분자 생성 (토큰 원문은 저장하지 않음)"""
+    credentials = getattr(http, "credentials", None)
+    identity = getattr(credentials, "refresh_token", None) or getattr(credentials, "client_id", None)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16] if identity else ""
+
+
+def enable_etag_cache(service, cache: Optional[ETagCache] = None, fresh_for: float = 0.0,
+                      namespace: Optional[str] = None):
+    """
+    googleapiclient 서비스 객체에 ETag 캐시 적용 (같은 객체 반환)
+
+    이후 생성되는 요청은 모두 CachingHttp를 거칩니다. 이미 적용된 서비스는 그대로 반환.
+    """
+    http = getattr(service, "_http", None)
+    if http is None or isinstance(http, CachingHttp) or httplib2 is None:
+        return service
+    if namespace is None:
+        namespace = _credentials_namespace(http)
+    service._http = CachingHttp(http, cache=cache, namespace=namespace, fresh_for=fresh_for)
+    return service
+
+
+def cache_stats(service) -> Optional[CacheStats]:
+    """서비스 객체의 캐시 통계 (캐시 미적용이면 None)"""
+    http = getattr(service, "_http", None)
+    return http.stats if isinstance(http, CachingHttp) else None
+
+
+def log_cache_stats(service, log=print) -> Dict:
+    """캐시 통계 출력 (log: print 또는 logger.info)"""
+    stats = cache_stats(service)
+    if stats is None:
+        return {}
+    log(f"   🗃️ API 캐시: 요청 {stats.requests}회, 304 재사용 {stats.not_modified}회, "
+        f"요청 생략 {stats.served_fresh}회 → 쿼터 {stats.units_saved}단위 절약")
+    return asdict(stats)
@@ -0,0 +1,78 @@
+"""
+YouTube Analytics 일괄 리포트 테스트 (가짜 Analytics 서비스 사용)
+"""
+
+import pytest
+
+from src.utils import analytics_reports
+from src.utils.analytics_reports import collect_video_reports
+
+
+class _Request:
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self):
+        return self._response
+
+
+class FakeAnalytics:
+    """dimensions=video 리포트만 흉내내는 서비스 (필터된 영상 중 조회수 있는 영상만 행 반환)"""
+
+    def __init__(self, views):
+        self.views = views
+        self.queries = []
+
+    def reports(self):
+        return self
+
+    def query(self, **params):
+        self.queries.append(params)
+        ids = params['filters'].split('==', 1)[1].split(',')
+        metrics = params['metrics'].split(',')
+        rows = [[vid] + [self.views[vid] if name == 'views' else 1 for name in metrics]
+                for vid in ids if self.views.get(vid)]
+        rows.sort(key=lambda row: -row[1])
+        start = params['startIndex'] - 1
+        headers = [{'name': 'video'}] + [{'name': name} for name in metrics]
+        return _Request({'columnHeaders': headers, 'rows': rows[start:start + params['maxResults']]})
+
+
+def make_videos(count):
+    return [{'video_id': f'v{i}', 'published_at': f'2025-{1 + i % 12:02d}-01T00:00:00Z'} for i in range(count)]
+
+
+class TestCollectVideoReports:
+    def test_batches_and_pagination(self, monkeypatch):
+        monkeypatch.setattr(analytics_reports, 'VIDEO_FILTER_LIMIT', 5)
+        monkeypatch.setattr(analytics_reports, 'PAGE_SIZE', 3)
+        videos = make_videos(12)
+        analytics = FakeAnalytics({f'v{i}': 100 + i for i in range(12) if i != 7})
+
+        reports = collect_video_reports(analytics, 'UC1', videos, end_date='2026-01-31',
+                                        metrics=['views', 'likes'])
+
+        # 5 + 5 + 2개 배치, 배치당 페이지 2/2/1회
+        assert len(analytics.queries) == 5
+        assert all(q['dimensions'] == 'video' and q['ids'] == 'channel==UC1' for q in analytics.queries)
+        assert reports['v3']['rows'] == [[103, 1]]
+        assert [h['name'] for h in reports['v3']['columnHeaders']] == ['views', 'likes']
+        assert reports['v7']['rows'] == []
+        assert len(reports) == 12
+
+    def test_start_date_from_publish_dates(self):
+        videos = make_videos(3)  # 2025-01-01, 2025-02-01, 2025-03-01
+        analytics = FakeAnalytics({'v0': 1, 'v1': 2, 'v2': 3})
+
+        reports = collect_video_reports(analytics, 'UC1', videos, end_date='2026-01-31')
+
+        assert len(analytics.queries) == 1
+        assert analytics.queries[0]['startDate'] == '2025-01-01'
+        assert reports['v2']['startDate'] == '2025-03-01'
+
+        collect_video_reports(analytics, 'UC1', videos, start_date='2025-06-01', end_date='2026-01-31')
+        assert analytics.queries[-1]['startDate'] == '2025-06-01'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+산출물 그래프(증분 재빌드) 테스트
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.utils.artifact_graph import ArtifactGraph, FileHasher
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def hasher(tmp_path):
+    return FileHasher(cache_path=tmp_path / "hashes.json")
+
+
+def _graph(tmp_path, hasher, **tts_params):
+    graph = ArtifactGraph(tmp_path / "artifacts.json", root=tmp_path, hasher=hasher)
+    graph.stage("summary", outputs=["summary.md"], params={"duration": 5.0})
+    graph.stage("images", outputs=["images"])
+    graph.stage("tts", deps=["summary"], outputs=["summary.mp3"], params=tts_params or {"voice": "alloy"})
+    graph.stage("video", deps=["tts", "images"], outputs=["video.mp4"])
+    return graph
+
+
+class TestFileHasher:
+    def test_file_hash_cached_by_mtime(self, tmp_path, hasher):
+        """크기/mtime이 같으면 다시 읽지 않음"""
+        path = _write(tmp_path / "a.txt", "hello")
+        first = hasher.hash_file(path)
+        assert hasher.hash_file(path) == first
+        assert (hasher.hits, hasher.misses) == (1, 1)
+
+        _write(path, "world")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert hasher.hash_file(path) != first
+
+    def test_directory_hash(self, tmp_path, hasher):
+        """디렉토리 해시는 하위 파일 내용/이름에 따라 달라지고 숨김 파일은 무시"""
+        _write(tmp_path / "images" / "1.jpg", "a")
+        before = hasher.hash_path(tmp_path / "images")
+        _write(tmp_path / "images" / ".DS_Store", "x")
+        assert hasher.hash_path(tmp_path / "images") == before
+        _write(tmp_path / "images" / "2.jpg", "b")
+        assert hasher.hash_path(tmp_path / "images") != before
+        assert hasher.hash_path(tmp_path / "missing") is None
+
+    def test_cache_persisted(self, tmp_path, hasher):
+        path = _write(tmp_path / "a.txt", "hello")
+        hasher.hash_file(path)
+        hasher.save()
+        reloaded = FileHasher(cache_path=tmp_path / "hashes.json")
+        reloaded.hash_file(path)
+        assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+class TestArtifactGraph:
+    def _build_all(self, tmp_path, graph):
+        _write(tmp_path / "summary.md", "요약")
+        _write(tmp_path / "images" / "1.jpg", "img")
+        _write(tmp_path / "summary.mp3", "audio")
+        _write(tmp_path / "video.mp4", "video")
+        for name in ("summary", "images", "tts", "video"):
+            graph.record(name)
+
+    def test_unchanged_inputs_skip(self, tmp_path, hasher):
+        """기록 후 새 그래프에서도 모든 단계가 최신 상태"""
+        self._build_all(tmp_path, _graph(tmp_path, hasher))
+        graph = _graph(tmp_path, hasher)
+        assert graph.plan() == []
+
+    def test_first_run_needs_build(self, tmp_path, hasher):
+        graph = _graph(tmp_path, hasher)
+        assert graph.stale_reason("video") == "기록 없음"
+
+    def test_input_change_propagates_downstream(self, tmp_path, hasher):
+        """요약 텍스트를 고치면 TTS가 낡고, TTS 출력이 바뀌면 영상도 낡음"""
+        self._build_all(tmp_path, _graph(tmp_path, hasher))
+        _write(tmp_path / "summary.md", "수정된 요약")
+        graph = _graph(tmp_path, hasher)
+        assert graph.stale_reason("summary") is None
+        assert graph.stale_reason("tts") == "상위 단계 변경: summary"
+        assert graph.stale_reason("video") is None
+
+        _write(tmp_path / "summary.mp3", "new audio")
+        graph.record("tts")
+        assert graph.stale_reason("video") == "상위 단계 변경: tts"
+        assert graph.stale_reason("images") is None
+
+    def test_same_output_does_not_cascade(self, tmp_path, hasher):
+        """상위 단계를 다시 실행해도 출력이 같으면 하위 단계는 최신 유지"""
+        self._build_all(tmp_path, _graph(tmp_path, hasher))
+        graph = _graph(tmp_path, hasher, voice="nova")
+        assert graph.stale_reason("tts") == "파라미터 변경: voice"
+        graph.record("tts")
+        assert graph.stale_reason("video") is None
+
+    def test_missing_output_and_clean(self, tmp_path, hasher):
+        graph = _graph(tmp_path, hasher)
+        self._build_all(tmp_path, graph)
+        (tmp_path / "video.mp4").unlink()
+        assert graph.stale_reason("video") == "출력 없음: video.mp4"
+
+        removed = graph.clean("tts")
+        assert removed == [tmp_path / "summary.mp3"]
+        assert not graph.has_record("tts")
+
+    def test_run_skips_when_fresh(self, tmp_path, hasher):
+        graph = _graph(tmp_path, hasher)
+        calls = []
+
+        def build():
+            calls.append(1)
+            _write(tmp_path / "summary.md", "요약")
+            return {"words": 1}
+
+        assert graph.run("summary", build) == (True, {"words": 1})
+        assert graph.run("summary", build) == (False, {"words": 1})
+        assert graph.run("summary", build, force=True)[0] is True
+        assert len(calls) == 2
+
+    def test_unknown_dependency(self, tmp_path, hasher):
+        graph = ArtifactGraph(None, hasher=hasher)
+        with pytest.raises(ValueError):
+            graph.stage("video", deps=["tts"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""
+에셋 경로 해석기 테스트
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.utils.asset_resolver import AssetResolver
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def _bump_mtime(directory: Path) -> None:
+    """같은 시각 안에 추가된 파일도 감지되도록 디렉토리 mtime을 확실히 변경"""
+    st = directory.stat()
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "assets"
+
+
+class TestAssetResolver:
+    def test_summary_audio_priority(self, assets):
+        """kr 접미사 우선, summary가 longform보다 우선"""
+        _touch(assets / "audio" / "Sapiens_longform_kr.mp3")
+        _touch(assets / "audio" / "Sapiens_summary_ko.mp3")
+        resolver = AssetResolver()
+        assert resolver.summary_audio(None, "ko", "Sapiens").name == "Sapiens_longform_kr.mp3"
+
+        _touch(assets / "audio" / "Sapiens_summary_kr.mp3")
+        _bump_mtime(assets / "audio")
+        assert resolver.summary_audio(None, "ko", "Sapiens").name == "Sapiens_summary_kr.mp3"
+        assert resolver.summary_audio(None, "en", "Sapiens") is None
+
+    def test_korean_title_fallback(self, assets):
+        """영문 Safe Title로 없으면 한글 제목 기반 파일명 조회"""
+        _touch(assets / "video" / "없는책_notebooklm_kr.mp4")
+        resolver = AssetResolver()
+        assert resolver.notebooklm_video("없는책", "ko").name == "없는책_notebooklm_kr.mp4"
+
+    def test_review_audio_extensions(self, assets):
+        _touch(assets / "audio" / "Sapiens_review_en.wav")
+        _touch(assets / "audio" / "Sapiens_review_en.m4a")
+        resolver = AssetResolver()
+        assert resolver.review_audio(None, "en", "Sapiens").suffix == ".m4a"
+
+    def test_thumbnail_fallbacks(self, tmp_path):
+        out = tmp_path / "output"
+        _touch(out / "Sapiens_thumbnail.png")
+        resolver = AssetResolver()
+        assert resolver.thumbnail(out, ["Sapiens", "Sapiens_ko"], "ko").name == "Sapiens_thumbnail.png"
+
+        _touch(out / "Sapiens_ko_thumbnail_ko.jpg")
+        _bump_mtime(out)
+        assert resolver.thumbnail(out, ["Sapiens", "Sapiens_ko"], "ko").name == "Sapiens_ko_thumbnail_ko.jpg"
+
+    def test_exists_uses_directory_listing(self, tmp_path):
+        resolver = AssetResolver()
+        assert not resolver.exists(tmp_path / "missing_dir" / "a.mp4")
+        target = _touch(tmp_path / "parts" / "part1_video_kr.mp4")
+        assert resolver.exists(target)
+        assert not resolver.exists(tmp_path / "parts" / "part2_video_kr.mp4")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
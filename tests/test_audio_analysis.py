@@ -0,0 +1,95 @@
+"""
+스트리밍 오디오 분석(envelope) 테스트
+"""
+
+import os
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("imageio_ffmpeg")
+
+from src.utils.audio_analysis import (
+    AudioEnvelope,
+    compute_envelope,
+    envelope_cache_path,
+    load_envelope,
+)
+
+
+@pytest.fixture
+def tone_then_silence(tmp_path):
+    """1초 440Hz(진폭 0.5) + 1초 무음 모노 WAV"""
+    rate = 44100
+    t = np.arange(rate) / rate
+    samples = np.concatenate([0.5 * np.sin(2 * np.pi * 440 * t), np.zeros(rate)])
+    path = tmp_path / "tone.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+class TestComputeEnvelope:
+    def test_rms_and_peak(self, tone_then_silence):
+        env = compute_envelope(tone_then_silence)
+        assert env.duration == pytest.approx(2.0, abs=0.02)
+        rms, peak = env.window(0.2, 0.8)
+        assert float(np.median(rms)) == pytest.approx(0.5 / np.sqrt(2), abs=0.02)
+        assert float(np.median(peak)) == pytest.approx(0.5, abs=0.03)
+        rms, peak = env.window(1.2, 1.8)
+        assert float(rms.max()) < 1e-3
+
+    def test_chunk_boundaries_do_not_change_result(self, tone_then_silence):
+        """청크 크기와 관계없이 같은 envelope"""
+        big = compute_envelope(tone_then_silence, chunk_seconds=10.0)
+        small = compute_envelope(tone_then_silence, chunk_seconds=0.0137)
+        np.testing.assert_allclose(big.rms, small.rms, atol=1e-6)
+        np.testing.assert_allclose(big.peak, small.peak, atol=1e-6)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            compute_envelope(tmp_path / "nope.mp3")
+
+
+class TestEnvelopeCache:
+    def test_cached_next_to_audio(self, tone_then_silence):
+        env = load_envelope(tone_then_silence)
+        cache_path = envelope_cache_path(tone_then_silence)
+        assert cache_path.name == "tone.wav.env100.npy"
+        assert cache_path.exists()
+
+        cached = load_envelope(tone_then_silence)
+        assert isinstance(cached.rms, np.memmap)
+        np.testing.assert_allclose(cached.rms, env.rms)
+        assert cached.frame_rate == env.frame_rate
+
+    def test_stale_cache_recomputed(self, tone_then_silence):
+        cache_path = envelope_cache_path(tone_then_silence)
+        np.save(cache_path, np.zeros((2, 3), dtype=np.float32))
+        st = cache_path.stat()
+        os.utime(tone_then_silence, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_envelope(tone_then_silence).num_frames > 3
+
+
+class TestEnvelopeFeatures:
+    def test_loudness(self, tone_then_silence):
+        env = compute_envelope(tone_then_silence)
+        assert env.loudness_db(0.0, 1.0) == pytest.approx(20 * np.log10(0.5 / np.sqrt(2)), abs=0.5)
+        assert env.loudness_db(1.2, 1.8) < -60
+
+    def test_ducking_gain(self):
+        """내레이션 구간에서 줄고, 끝나면 release 동안 원래 음량으로 복귀"""
+        rms = np.concatenate([np.full(100, 0.3), np.zeros(200)]).astype(np.float32)
+        env = AudioEnvelope(rms=rms, peak=rms, frame_rate=100)
+        gain = env.ducking_gain(duck_db=-12.0, attack=0.05, release=0.4)
+        assert gain[90] == pytest.approx(10 ** (-12 / 20), abs=0.01)
+        assert gain[105] < gain[150] < gain[299]
+        assert gain[299] == pytest.approx(1.0, abs=0.02)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
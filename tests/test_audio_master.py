@@ -0,0 +1,120 @@
+"""
+무손실 오디오 마스터 테스트
+"""
+
+import os
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("imageio_ffmpeg")
+
+from src.utils.audio_master import (
+    MASTER_SAMPLE_RATE,
+    build_master,
+    export_delivery,
+    master_path_for,
+    resolve_master,
+)
+from src.utils.audio_mixer import decode_pcm
+from src.utils.media_probe import MediaProbe
+from src.utils.module_loader import load_script
+
+
+def write_wav(path, samples, rate=MASTER_SAMPLE_RATE):
+    """모노 16bit WAV 저장"""
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return path
+
+
+@pytest.fixture
+def chunks(tmp_path):
+    rng = np.random.default_rng(1)
+    first = rng.integers(-20000, 20000, MASTER_SAMPLE_RATE // 2)
+    second = rng.integers(-20000, 20000, MASTER_SAMPLE_RATE // 3)
+    return (
+        [write_wav(tmp_path / "c0.wav", first), write_wav(tmp_path / "c1.wav", second)],
+        np.concatenate([first, second]),
+    )
+
+
+class TestMasterPaths:
+    def test_master_path_for(self):
+        assert master_path_for("assets/audio/A_summary_kr.mp3").name == "A_summary_kr.flac"
+        assert master_path_for("assets/audio/A_summary_kr.wav").name == "A_summary_kr.wav"
+
+    def test_resolve_prefers_fresh_master(self, tmp_path):
+        delivery = tmp_path / "A_summary_kr.mp3"
+        assert resolve_master(delivery) == delivery
+
+        delivery.write_bytes(b"mp3")
+        master = master_path_for(delivery)
+        master.write_bytes(b"flac")
+        st = delivery.stat()
+        os.utime(master, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert resolve_master(delivery) == master
+
+        # 배포본을 직접 교체한 경우(마스터보다 새로움)는 배포본 사용
+        os.utime(delivery, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert resolve_master(delivery) == delivery
+
+
+class TestBuildMaster:
+    def test_concat_is_bit_exact(self, tmp_path, chunks):
+        """청크 연결 결과가 원본 샘플과 정확히 일치 (재인코딩 손실 없음)"""
+        chunk_paths, expected = chunks
+        master = build_master(chunk_paths, tmp_path / "A_summary_kr.flac")
+        assert not any(p.exists() for p in chunk_paths)
+
+        decoded = decode_pcm(master, sample_rate=MASTER_SAMPLE_RATE, channels=1)[:, 0]
+        np.testing.assert_array_equal(np.round(decoded * 32768).astype(np.int64), expected)
+
+    def test_export_delivery(self, tmp_path, chunks):
+        chunk_paths, expected = chunks
+        master = build_master(chunk_paths, tmp_path / "A_summary_kr.flac")
+        delivery = export_delivery(master, tmp_path / "A_summary_kr.mp3")
+        probe = MediaProbe(cache_path=tmp_path / "probe.json")
+        assert probe.duration(delivery) == pytest.approx(len(expected) / MASTER_SAMPLE_RATE, abs=0.1)
+
+
+class TestMultiTTSEngine:
+    def test_openai_writes_master_and_delivery(self, tmp_path):
+        """제공자 응답(FLAC)으로 마스터를 만들고 MP3는 마스터에서 한 번만 인코딩"""
+        source = tmp_path / "provider.wav"
+        write_wav(source, np.zeros(MASTER_SAMPLE_RATE, dtype=np.int16))
+        requests = []
+
+        class FakeSpeech:
+            def create(self, **kwargs):
+                requests.append(kwargs)
+
+                class Response:
+                    def iter_bytes(self):
+                        yield source.read_bytes()
+                return Response()
+
+        class FakeClient:
+            class audio:
+                speech = FakeSpeech()
+
+        module = load_script("09_text_to_speech_multi.py")
+        engine = module.MultiTTSEngine.__new__(module.MultiTTSEngine)
+        engine.provider = "openai"
+        engine.client = FakeClient()
+
+        output = tmp_path / "A_summary_kr.mp3"
+        assert engine.generate_speech("안녕하세요.", str(output), language="ko") == str(output)
+        assert requests[0]["response_format"] == "flac"
+        assert output.exists()
+        assert master_path_for(output).exists()
+        assert resolve_master(output) == master_path_for(output)
+        assert not list(tmp_path.glob("*_temp_*"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""
+NumPy PCM 오디오 믹서 테스트
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("imageio_ffmpeg")
+
+from src.utils.audio_mixer import AudioMixer, decode_pcm
+
+RATE = 8000
+
+
+def write_wav(path, samples, rate=RATE):
+    """모노 16bit WAV 저장"""
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((np.asarray(samples) * 32767).astype("<i2").tobytes())
+    return path
+
+
+class TestPlacement:
+    def test_sample_accurate_start_and_gap(self):
+        """start 위치부터 정확히 배치되고 사이 구간은 무음"""
+        mixer = AudioMixer(sample_rate=RATE, channels=1)
+        mixer.add(np.full(100, 0.5, dtype=np.float32), start=0.0)
+        mixer.add(np.full(100, 0.25, dtype=np.float32), start=200 / RATE)
+        out = mixer.render()[:, 0]
+        assert len(out) == 300
+        assert np.all(out[:100] == 0.5)
+        assert np.all(out[100:200] == 0.0)
+        assert np.all(out[200:] == 0.25)
+
+    def test_overlapping_tracks_are_summed_with_gain(self):
+        mixer = AudioMixer(sample_rate=RATE, channels=2)
+        mixer.add(np.full(100, 0.5, dtype=np.float32))
+        mixer.add(np.full(100, 0.5, dtype=np.float32), gain=0.2)
+        np.testing.assert_allclose(mixer.render(), 0.6, atol=1e-6)
+
+    def test_loop_wraps_from_offset(self):
+        """loop은 offset부터 소스 끝까지 재생 후 처음으로 순환"""
+        source = np.arange(10, dtype=np.float32)
+        mixer = AudioMixer(sample_rate=10, channels=1)
+        track = mixer.add(source, offset=0.7, duration=2.5, loop=True)
+        assert np.shares_memory(track.data, source)
+        out = mixer.render()[:, 0]
+        np.testing.assert_array_equal(out, [7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1])
+
+    def test_fades_and_extend(self):
+        mixer = AudioMixer(sample_rate=100, channels=1)
+        mixer.add(np.ones(100, dtype=np.float32), fade_in=0.1, fade_out=0.1)
+        mixer.extend_to(2.0)
+        out = mixer.render()[:, 0]
+        assert len(out) == 200
+        assert out[0] == 0.0 and out[5] == pytest.approx(0.5)
+        assert out[50] == 1.0
+        assert out[95] == pytest.approx(0.5)
+        assert np.all(out[100:] == 0.0)
+
+    def test_blocks_match_full_render(self):
+        """블록 경계와 관계없이 같은 결과 (loop/fade 포함)"""
+        rng = np.random.default_rng(0)
+        mixer = AudioMixer(sample_rate=RATE, channels=2)
+        mixer.add(rng.uniform(-0.3, 0.3, (RATE, 2)).astype(np.float32), start=0.1, fade_in=0.2, fade_out=0.3)
+        mixer.add(rng.uniform(-0.3, 0.3, (777, 2)).astype(np.float32), start=0.05, duration=1.2, loop=True, gain=0.5)
+        blocks = np.concatenate(list(mixer.iter_blocks(block_seconds=0.0371)))
+        np.testing.assert_allclose(blocks, np.clip(mixer.render(), -1, 1), atol=1e-6)
+
+
+class TestDucking:
+    def test_bgm_ducked_under_narration(self):
+        """내레이션 구간에서만 BGM 음량이 줄어듦"""
+        mixer = AudioMixer(sample_rate=RATE, channels=1)
+        voice = np.zeros(3 * RATE, dtype=np.float32)
+        voice[RATE:2 * RATE] = 0.3
+        narration = mixer.add(voice)
+        bgm = mixer.add(np.full(3 * RATE, 0.1, dtype=np.float32))
+        mixer.duck(bgm, under=[narration], duck_db=-12.0)
+
+        gains = bgm.gains(0, 3 * RATE, RATE)
+        assert gains[RATE // 2] == pytest.approx(1.0, abs=0.01)
+        assert gains[RATE + RATE // 2] == pytest.approx(10 ** (-12 / 20), abs=0.01)
+        assert gains[3 * RATE - 1] > 0.9
+
+
+class TestEncode:
+    def test_decode_place_and_export(self, tmp_path):
+        """파일 디코딩 → 배치 → 한 번 인코딩 후 다시 디코딩해 길이 확인"""
+        t = np.arange(RATE) / RATE
+        first = write_wav(tmp_path / "a.wav", 0.5 * np.sin(2 * np.pi * 440 * t))
+        second = write_wav(tmp_path / "b.wav", 0.5 * np.sin(2 * np.pi * 220 * t))
+
+        pcm = decode_pcm(first, sample_rate=RATE, channels=2)
+        assert pcm.shape == (RATE, 2)
+
+        mixer = AudioMixer(sample_rate=RATE, channels=2)
+        mixer.add(first)
+        mixer.add(second, start=1.5)
+        output = mixer.export(tmp_path / "mix.wav")
+        decoded = decode_pcm(output, sample_rate=RATE, channels=2)
+        assert len(decoded) == int(2.5 * RATE)
+        assert float(np.abs(decoded[RATE + 100:int(1.5 * RATE) - 100]).max()) < 1e-3
+
+        m4a = mixer.export(tmp_path / "mix.m4a", bitrate="64k")
+        assert m4a.stat().st_size > 0
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            AudioMixer().add(tmp_path / "nope.mp3")
+
+
+
+class TestEpisodeAudio:
+    def test_bgm_failure_is_not_silently_dropped(self, tmp_path):
+        """요청한 배경음악을 배치하지 못하면 배경음악 없는 트랙을 만들지 않고 실패"""
+        pytest.importorskip("moviepy")
+        from src.utils.module_loader import load_script
+
+        episode = load_script("create_full_episode.py")
+        clip_audio = write_wav(tmp_path / "clip.wav", np.zeros(RATE))
+        broken_bgm = tmp_path / "bgm.mp3"
+        broken_bgm.write_bytes(b"not audio")
+        output = tmp_path / "episode.mix.m4a"
+
+        with pytest.raises(RuntimeError):
+            episode.build_episode_audio([1.0, 1.0], [str(clip_audio), None], [1], output, str(broken_bgm))
+        assert not output.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
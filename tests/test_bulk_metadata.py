@@ -0,0 +1,145 @@
+"""
+영상 메타데이터 일괄 수정 엔진 테스트 (가짜 YouTube 서비스 사용)
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.utils.bulk_metadata import BulkMetadataUpdater, UpdateJournal, diff_snippet
+from src.utils.quota_scheduler import QuotaExhausted
+
+MARKER = "📖 이 책 구매하기:"
+
+
+class _Request:
+    def __init__(self, fn, params):
+        self._fn = fn
+        self._params = params
+
+    def execute(self):
+        return self._fn(self._params)
+
+
+class _Videos:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, **params):
+        return _Request(self._service._list, params)
+
+    def update(self, **params):
+        return _Request(self._service._update, params)
+
+
+class FakeYouTube:
+    """videos.list / videos.update만 흉내내는 서비스 (스레드 안전, 호출 기록)"""
+
+    def __init__(self, count, quota_after=None):
+        self.snippets = {
+            f"v{i}": {"title": f"[핵심 요약] 책 {i}", "description": f"설명 {i}", "tags": ["책"],
+                      "categoryId": "22", "channelTitle": "읽기 전용"}
+            for i in range(count)
+        }
+        self.lists = []
+        self.updates = []
+        self.quota_after = quota_after
+        self._lock = threading.Lock()
+
+    def videos(self):
+        return _Videos(self)
+
+    def _list(self, params):
+        ids = params["id"].split(",")
+        assert len(ids) <= 50
+        self.lists.append(ids)
+        return {"items": [{"id": vid, "snippet": dict(self.snippets[vid])} for vid in ids if vid in self.snippets]}
+
+    def _update(self, params):
+        body = params["body"]
+        with self._lock:
+            if self.quota_after is not None and len(self.updates) >= self.quota_after:
+                raise QuotaExhausted("videos.update", 50, 0, datetime.now())
+            assert "channelTitle" not in body["snippet"]  # 읽기 전용 필드는 보내지 않음
+            self.updates.append(body["id"])
+            self.snippets[body["id"]].update(body["snippet"])
+        return body
+
+
+def add_marker(video_id, snippet):
+    """v0은 대상 아님, 이미 마커가 있으면 그대로"""
+    if video_id == "v0":
+        return None
+    description = snippet["description"]
+    return {"description": description if MARKER in description else description + "\n" + MARKER}
+
+
+class TestBulkMetadataUpdater:
+    def test_batched_reads_and_skips_noop_updates(self):
+        youtube = FakeYouTube(120)
+        for vid in ("v1", "v2"):
+            youtube.snippets[vid]["description"] += "\n" + MARKER
+
+        result = BulkMetadataUpdater(youtube, service_factory=lambda: youtube, workers=4).run(
+            [f"v{i}" for i in range(120)] + ["gone"], add_marker
+        )
+
+        assert [len(batch) for batch in youtube.lists] == [50, 50, 21]
+        assert result.skipped == ["v0"]
+        assert sorted(result.unchanged) == ["v1", "v2"]
+        assert result.missing == ["gone"]
+        assert len(result.updated) == len(youtube.updates) == 117
+        assert youtube.snippets["v5"]["description"].endswith(MARKER)
+        assert youtube.snippets["v5"]["categoryId"] == "22"  # 기존 값 유지
+
+    def test_dry_run_only_plans(self):
+        youtube = FakeYouTube(3)
+        result = BulkMetadataUpdater(youtube).run(["v0", "v1", "v2"], add_marker, dry_run=True)
+        assert result.planned == ["v1", "v2"]
+        assert youtube.updates == []
+
+    def test_quota_stop_and_resume_from_journal(self, tmp_path):
+        youtube = FakeYouTube(10, quota_after=4)
+        journal = UpdateJournal(tmp_path / "job.jsonl")
+        ids = [f"v{i}" for i in range(10)]
+
+        first = BulkMetadataUpdater(youtube, journal=journal).run(ids, add_marker)
+        assert len(first.updated) == 4
+        assert len(first.deferred) == 5
+
+        # 다음 실행: 저널의 완료 영상은 조회도 하지 않음
+        youtube.quota_after = None
+        youtube.lists.clear()
+        second = BulkMetadataUpdater(youtube, journal=UpdateJournal(tmp_path / "job.jsonl")).run(ids, add_marker)
+        assert sorted(second.resumed) == sorted(first.updated)
+        assert not set(youtube.lists[0]) & set(first.updated)
+        assert sorted(second.updated) == sorted(first.deferred)
+        assert len(youtube.updates) == 9
+
+    def test_completed_run_clears_journal(self, tmp_path):
+        """보류/실패 없이 끝난 실행은 저널을 비워 다음 실행이 같은 영상을 다시 처리"""
+        youtube = FakeYouTube(3)
+        path = tmp_path / "job_force.jsonl"
+        ids = ["v1", "v2"]
+
+        first = BulkMetadataUpdater(youtube, journal=UpdateJournal(path)).run(ids, add_marker)
+        assert sorted(first.updated) == ids
+        assert not path.exists()
+
+        # 다음 실행(예: 템플릿을 바꾼 뒤 --force): 이전 완료 기록에 막히지 않음
+        for vid in ids:
+            youtube.snippets[vid]["description"] = "새 설명"
+        second = BulkMetadataUpdater(youtube, journal=UpdateJournal(path)).run(["v1"], add_marker)
+        assert second.resumed == []
+        assert second.updated == ["v1"]
+        assert youtube.updates == ["v1", "v2", "v1"]
+
+    def test_diff_snippet(self):
+        current = {"title": "a", "description": "b"}
+        assert diff_snippet(current, {"title": "a", "tags": []}) == []
+        assert diff_snippet(current, {"title": "a2", "description": "b"}) == ["title"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
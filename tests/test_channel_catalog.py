@@ -0,0 +1,163 @@
+"""
+로컬 채널 카탈로그 테스트 (가짜 YouTube 서비스 사용)
+"""
+
+import pytest
+
+from src.utils.channel_catalog import ChannelCatalog, load_channel_videos
+
+
+class _Request:
+    def __init__(self, fn, params):
+        self._fn = fn
+        self._params = params
+
+    def execute(self):
+        return self._fn(self._params)
+
+
+class _Resource:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def list(self, **params):
+        return _Request(self._fn, params)
+
+
+class FakeYouTube:
+    """channels / playlistItems / videos 목록 API만 흉내내는 서비스 (호출 기록)"""
+
+    def __init__(self, video_ids, page_size=50):
+        self.video_ids = list(video_ids)  # 최신순
+        self.page_size = page_size
+        self.views = {vid: 10 for vid in self.video_ids}
+        self.calls = []
+
+    def channels(self):
+        return _Resource(self._channel)
+
+    def playlistItems(self):
+        return _Resource(self._playlist_page)
+
+    def videos(self):
+        return _Resource(self._videos)
+
+    def _channel(self, params):
+        self.calls.append(("channels", params))
+        return {"items": [{"id": "UC1", "contentDetails": {"relatedPlaylists": {"uploads": "UU1"}}}]}
+
+    def _playlist_page(self, params):
+        self.calls.append(("playlistItems", params))
+        start = int(params.get("pageToken", 0))
+        page = self.video_ids[start:start + self.page_size]
+        response = {"items": [{"contentDetails": {"videoId": vid}} for vid in page]}
+        if start + self.page_size < len(self.video_ids):
+            response["nextPageToken"] = str(start + self.page_size)
+        return response
+
+    def _videos(self, params):
+        ids = params["id"].split(",")
+        assert len(ids) <= 50
+        self.calls.append(("videos", params))
+        items = []
+        for vid in ids:
+            if vid not in self.video_ids:
+                continue
+            number = int(vid[1:])
+            items.append({
+                "id": vid,
+                "snippet": {"title": f"title {vid}", "description": "desc", "tags": ["책"],
+                            "publishedAt": f"2026-01-01T00:{number // 60:02d}:{number % 60:02d}Z"},
+                "status": {"privacyStatus": "public"},
+                "statistics": {"viewCount": str(self.views[vid]), "likeCount": "1"},
+                "contentDetails": {"duration": "PT10M"},
+            })
+        return {"items": items}
+
+    def count(self, kind):
+        return sum(1 for name, _ in self.calls if name == kind)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "catalog.sqlite3"
+
+
+def video_ids(count):
+    """최신순 영상 ID (v{번호}, 번호가 클수록 최신)"""
+    return [f"v{i}" for i in range(count, 0, -1)]
+
+
+class TestChannelCatalog:
+    def test_initial_full_sync(self, db_path):
+        youtube = FakeYouTube(video_ids(120))
+        catalog = ChannelCatalog(youtube, "UC1", db_path=db_path)
+        result = catalog.sync()
+
+        assert result.full_scan
+        assert len(result.new_ids) == 120
+        assert youtube.count("playlistItems") == 3
+        assert youtube.count("videos") == 3  # 50 + 50 + 20
+
+        videos = catalog.videos()
+        assert [v["video_id"] for v in videos[:2]] == ["v120", "v119"]
+        assert videos[0]["views"] == 10
+        assert videos[0]["tags"] == ["책"]
+        assert videos[0]["privacy_status"] == "public"
+        assert catalog.raw("v1")["contentDetails"]["duration"] == "PT10M"
+
+    def test_incremental_sync_stops_at_known_video(self, db_path):
+        youtube = FakeYouTube(video_ids(120))
+        ChannelCatalog(youtube, "UC1", db_path=db_path).sync()
+
+        youtube.video_ids = ["v122", "v121"] + youtube.video_ids
+        youtube.views.update({"v122": 1, "v121": 1})
+        youtube.calls.clear()
+        result = ChannelCatalog(youtube, "UC1", db_path=db_path).sync()
+
+        assert result.new_ids == ["v122", "v121"]
+        assert not result.full_scan
+        assert youtube.count("playlistItems") == 1
+        assert youtube.count("videos") == 1
+        assert youtube.count("channels") == 0  # uploads 재생목록 ID 캐시
+
+    def test_refresh_updates_stats_and_removes_deleted(self, db_path):
+        youtube = FakeYouTube(video_ids(60))
+        catalog = ChannelCatalog(youtube, "UC1", db_path=db_path)
+        catalog.sync()
+
+        youtube.views["v60"] = 999
+        youtube.video_ids.remove("v30")
+        result = catalog.sync(refresh=True)
+
+        assert result.removed == ["v30"]
+        assert catalog.get("v60")["views"] == 999
+        assert catalog.get("v30") is None
+        assert len(catalog.videos()) == 59
+
+    def test_interrupted_first_sync_rescans(self, db_path):
+        youtube = FakeYouTube(video_ids(120))
+        original = youtube._videos
+
+        def failing(params):
+            raise RuntimeError("quota")
+        youtube._videos = failing
+        with pytest.raises(RuntimeError):
+            ChannelCatalog(youtube, "UC1", db_path=db_path).sync()
+
+        youtube._videos = original
+        result = ChannelCatalog(youtube, "UC1", db_path=db_path).sync()
+        assert result.full_scan
+        assert len(result.new_ids) == 120
+
+    def test_load_channel_videos_for_authenticated_channel(self, db_path):
+        youtube = FakeYouTube(video_ids(5))
+        messages = []
+        videos = load_channel_videos(youtube, limit=2, log=messages.append, db_path=db_path)
+        assert [v["video_id"] for v in videos] == ["v5", "v4"]
+        assert videos[0]["url"] == "https://www.youtube.com/watch?v=v5"
+        assert "신규 5개" in messages[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
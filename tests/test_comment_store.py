@@ -0,0 +1,154 @@
+"""
+댓글 스레드 저장소 / 증분 동기화 테스트 (가짜 YouTube 서비스 사용)
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.utils.comment_store import PAGE_SIZE, CommentStore, sync_comments
+from src.utils.quota_scheduler import QuotaExhausted
+
+OWNER = "UC_owner"
+
+
+def make_thread(video_id, n, author="UC_viewer", updated=None):
+    published = f"2026-01-01T00:{n // 60:02d}:{n % 60:02d}Z"
+    return {
+        "id": f"{video_id}-c{n}",
+        "snippet": {
+            "videoId": video_id,
+            "totalReplyCount": 0,
+            "topLevelComment": {"snippet": {
+                "videoId": video_id,
+                "authorChannelId": {"value": author},
+                "authorDisplayName": author,
+                "textOriginal": f"댓글 {n}",
+                "publishedAt": published,
+                "updatedAt": updated or published,
+                "likeCount": 0,
+            }},
+        },
+    }
+
+
+class _Request:
+    def __init__(self, fn, params):
+        self._fn = fn
+        self._params = params
+
+    def execute(self):
+        return self._fn(self._params)
+
+
+class _CommentThreads:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, **params):
+        return _Request(self._service._list, params)
+
+
+class FakeYouTube:
+    """commentThreads.list(order=time)만 흉내내는 서비스 (스레드 안전, 호출 기록)"""
+
+    def __init__(self, threads, quota_after=None):
+        self.threads = threads          # {video_id: [스레드, ...] (작성순)}
+        self.calls = []
+        self.quota_after = quota_after
+        self._lock = threading.Lock()
+
+    def commentThreads(self):
+        return _CommentThreads(self)
+
+    def _list(self, params):
+        assert params["order"] == "time"
+        with self._lock:
+            if self.quota_after is not None and len(self.calls) >= self.quota_after:
+                raise QuotaExhausted("commentThreads.list", 1, 0, datetime.now())
+            self.calls.append((params["videoId"], params.get("pageToken")))
+        items = list(reversed(self.threads[params["videoId"]]))  # 최신순
+        start = int(params.get("pageToken") or 0)
+        response = {"items": items[start:start + params["maxResults"]]}
+        if start + params["maxResults"] < len(items):
+            response["nextPageToken"] = str(start + params["maxResults"])
+        return response
+
+
+def catalog(youtube):
+    return [{"video_id": video_id, "comments": len(items)} for video_id, items in youtube.threads.items()]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CommentStore(tmp_path / "comments.sqlite3")
+
+
+class TestCommentSync:
+    def test_incremental_sync_stops_at_watermark(self, store):
+        youtube = FakeYouTube({
+            "a": [make_thread("a", n) for n in range(250)],
+            "b": [make_thread("b", 0, author=OWNER)],
+        })
+        first = sync_comments(store, youtube, catalog(youtube), service_factory=lambda: youtube, workers=2)
+        assert sorted(first.synced) == ["a", "b"]
+        assert first.new_threads == 251
+        assert len(youtube.calls) == 4  # a: 3페이지, b: 1페이지
+
+        # 댓글 수가 그대로인 영상은 조회하지 않고, 늘어난 영상은 첫 페이지에서 중단
+        youtube.threads["a"].append(make_thread("a", 250, author=OWNER))
+        youtube.calls.clear()
+        second = sync_comments(store, youtube, catalog(youtube))
+        assert second.unchanged == ["b"]
+        assert youtube.calls == [("a", None)]
+        assert second.new_threads == 1
+
+    def test_shrunk_count_rescans_and_removes(self, store):
+        youtube = FakeYouTube({"a": [make_thread("a", n) for n in range(PAGE_SIZE + 10)]})
+        sync_comments(store, youtube, catalog(youtube))
+
+        del youtube.threads["a"][3]
+        result = sync_comments(store, youtube, catalog(youtube))
+        assert result.removed_threads == 1
+        assert len(store.comments()) == PAGE_SIZE + 9
+
+    def test_quota_exhaustion_defers_remaining_videos(self, store):
+        youtube = FakeYouTube({video_id: [make_thread(video_id, 0)] for video_id in "abc"}, quota_after=1)
+        result = sync_comments(store, youtube, catalog(youtube))
+        assert result.synced == ["a"]
+        assert result.deferred == ["b", "c"]
+
+        # 보류된 영상은 동기화 기록이 없어 다음 실행에서 조회
+        youtube.quota_after = None
+        retry = sync_comments(store, youtube, catalog(youtube))
+        assert retry.unchanged == ["a"]
+        assert sorted(retry.synced) == ["b", "c"]
+
+
+class TestDeltaExport:
+    def test_only_new_or_edited_comments_are_pending(self, store):
+        youtube = FakeYouTube({"a": [make_thread("a", 0, author=OWNER), make_thread("a", 1)]})
+        sync_comments(store, youtube, catalog(youtube))
+
+        pending = store.comments(OWNER, pending_only=True)
+        assert [row["thread_id"] for row in pending] == ["a-c0"]
+        store.mark_exported(pending)
+        assert store.comments(OWNER, pending_only=True) == []
+
+        # 수정된 내 댓글 + 새 내 댓글 (full 동기화로 오래된 댓글 수정까지 반영)
+        youtube.threads["a"][0] = make_thread("a", 0, author=OWNER, updated="2026-02-01T00:00:00Z")
+        youtube.threads["a"].append(make_thread("a", 2, author=OWNER))
+        result = sync_comments(store, youtube, catalog(youtube), full=True)
+        assert (result.new_threads, result.changed_threads) == (1, 1)
+
+        pending = store.comments(OWNER, pending_only=True)
+        assert [(row["thread_id"], row["exported_updated_at"]) for row in pending] == [
+            ("a-c0", "2026-01-01T00:00:00Z"),
+            ("a-c2", None),
+        ]
+        assert len(store.comments(OWNER)) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,188 @@
+"""
+공통 HTTP 클라이언트 테스트 (로컬 테스트 서버 사용)
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.utils.http_client import AsyncHttpClient, CircuitOpenError, HttpClient
+from src.utils.retry_utils import parse_retry_after
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # 경로별 응답 시나리오: [(status, headers), ...] 순서대로 소비, 마지막 값 반복
+    # /slow로 시작하는 경로는 헤더를 보낸 뒤 본문을 늦게 보냄 (동시에 본문을 보내는 수 기록)
+    scenarios = {}
+    hits = {}
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        plan = self.scenarios.get(self.path, [(200, {})])
+        status, headers = plan[min(self.hits[self.path], len(plan)) - 1]
+        body = b"hello"
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.path.startswith("/slow"):
+            cls = type(self)
+            with cls.lock:
+                cls.active += 1
+                cls.peak = max(cls.peak, cls.active)
+            self.wfile.flush()
+            time.sleep(0.2)
+            with cls.lock:
+                cls.active -= 1
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.scenarios = {}
+    _Handler.hits = {}
+    _Handler.active = _Handler.peak = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+class TestHttpClient:
+    """재시도, 서킷 브레이커, 통계 테스트"""
+
+    def test_parse_retry_after(self):
+        """Retry-After: 초 단위와 HTTP-date 모두 해석"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_retries_429_using_retry_after(self, server):
+        """429 응답은 Retry-After만큼 기다린 뒤 재시도"""
+        _Handler.scenarios["/busy"] = [(429, {"Retry-After": "0"}), (200, {})]
+        client = HttpClient(retries=2, backoff=5.0)
+        resp = client.get(f"{server}/busy")
+        assert resp.status_code == 200
+        assert _Handler.hits["/busy"] == 2
+        host = next(iter(client.metrics().values()))
+        assert host["retries"] == 1
+        assert host["requests"] == 2
+
+    def test_client_errors_are_not_retried(self, server):
+        """404는 재시도하지 않고 그대로 반환"""
+        _Handler.scenarios["/missing"] = [(404, {})]
+        client = HttpClient(retries=3, backoff=0.0)
+        assert client.get(f"{server}/missing").status_code == 404
+        assert _Handler.hits["/missing"] == 1
+
+    def test_circuit_opens_after_consecutive_failures(self, server):
+        """연속 실패가 임계값에 도달하면 이후 요청은 즉시 실패"""
+        _Handler.scenarios["/down"] = [(503, {})]
+        client = HttpClient(retries=0, backoff=0.0, failure_threshold=2, reset_timeout=60)
+        client.get(f"{server}/down")
+        client.get(f"{server}/down")
+        with pytest.raises(CircuitOpenError):
+            client.get(f"{server}/down")
+        assert _Handler.hits["/down"] == 2
+        host = next(iter(client.metrics().values()))
+        assert host["circuit_open"]
+        assert host["short_circuited"] == 1
+
+    def test_half_open_trial_released_on_request_error(self, server):
+        """시험 요청이 재시도 대상이 아닌 예외로 끝나도 서킷이 막히지 않음"""
+        _Handler.scenarios["/down"] = [(503, {})]
+        client = HttpClient(retries=0, backoff=0.0, failure_threshold=1, reset_timeout=0)
+        client.get(f"{server}/down")
+        with pytest.raises(requests.exceptions.InvalidHeader):
+            client.get(f"{server}/a", headers={"X-Bad": "a\nb"})
+        assert client.get(f"{server}/a").status_code == 200
+
+    def test_metrics_count_bytes(self, server):
+        """수신 바이트와 요청 수 집계"""
+        client = HttpClient()
+        client.get(f"{server}/a")
+        client.get(f"{server}/b")
+        host = next(iter(client.metrics().values()))
+        assert host["requests"] == 2
+        assert host["bytes_received"] == 10
+
+    def test_download_writes_file(self, server, tmp_path):
+        """스트리밍 다운로드 후 파일 저장"""
+        client = HttpClient()
+        out = client.download(f"{server}/file", tmp_path / "out.bin")
+        assert out.read_bytes() == b"hello"
+        assert not (tmp_path / "out.bin.part").exists()
+
+    def test_post_not_retried_on_server_error(self, server):
+        """멱등이 아닌 POST는 5xx에 재시도하지 않고, 429에는 재시도"""
+        _Handler.scenarios["/submit"] = [(503, {}), (200, {})]
+        client = HttpClient(retries=3, backoff=0.0)
+        assert client.post(f"{server}/submit", data=b"x").status_code == 503
+        assert _Handler.hits["/submit"] == 1
+
+        _Handler.scenarios["/limited"] = [(429, {"Retry-After": "0"}), (200, {})]
+        assert client.post(f"{server}/limited", data=b"x").status_code == 200
+        assert _Handler.hits["/limited"] == 2
+
+    def test_download_holds_host_slot_until_body_is_read(self, server, tmp_path):
+        """호스트 동시성 제한은 본문을 다 받을 때까지 유지"""
+        client = HttpClient(max_per_host=1)
+        threads = [
+            threading.Thread(target=client.download, args=(f"{server}/slow{i}", tmp_path / f"{i}.bin"))
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert _Handler.peak == 1
+        assert all((tmp_path / f"{i}.bin").read_bytes() == b"hello" for i in range(3))
+
+    def test_download_releases_host_slot_during_backoff(self, server, tmp_path):
+        """재시도 대기 중에는 슬롯을 놓아 같은 호스트의 다른 다운로드를 막지 않음"""
+        _Handler.scenarios["/flaky"] = [(503, {}), (503, {}), (200, {})]
+        client = HttpClient(max_per_host=1, retries=2, backoff=0.5)
+        flaky = threading.Thread(target=client.download, args=(f"{server}/flaky", tmp_path / "flaky.bin"))
+        flaky.start()
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        client.download(f"{server}/ok", tmp_path / "ok.bin")
+        assert time.monotonic() - start < 0.2
+        assert flaky.is_alive()
+
+        flaky.join()
+        assert (tmp_path / "flaky.bin").read_bytes() == b"hello"
+
+    def test_async_facade_shares_client(self, server):
+        """비동기 인터페이스는 동기 클라이언트의 통계를 공유"""
+        client = HttpClient()
+        async_client = AsyncHttpClient(client)
+
+        async def fetch_all():
+            return await asyncio.gather(*(async_client.get(f"{server}/{i}") for i in range(3)))
+
+        responses = asyncio.run(fetch_all())
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert next(iter(client.metrics().values()))["requests"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""
+공통 이미지 로딩 유틸리티 테스트
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils.image_loader import image_size, load_rgb, load_rgb_resized, scaled_size
+
+
+@pytest.fixture
+def large_jpeg(tmp_path):
+    path = tmp_path / "large.jpg"
+    rng = np.random.default_rng(0)
+    Image.fromarray(rng.integers(0, 256, size=(3000, 4000, 3)).astype(np.uint8)).save(path)
+    return path
+
+
+class TestImageLoader:
+    """축소 디코딩 및 모드 정규화 테스트"""
+
+    def test_scaled_size_cover_and_contain(self):
+        """cover는 목표를 덮고 contain은 목표 안에 들어감"""
+        assert scaled_size((4000, 3000), (1920, 1080), "cover") == (1920, 1440)
+        assert scaled_size((4000, 3000), (1920, 1080), "contain") == (1440, 1080)
+
+    def test_draft_decodes_smaller_but_covers_target(self, large_jpeg):
+        """JPEG는 목표를 덮는 가장 작은 DCT 스케일로 디코딩"""
+        img = load_rgb(large_jpeg, (900, 600))
+        assert img.mode == "RGB"
+        assert img.size[0] < 4000
+        assert img.size[0] >= 900 and img.size[1] >= 600
+
+    def test_without_target_decodes_full_size(self, large_jpeg):
+        """목표 크기가 없으면 전체 해상도"""
+        assert load_rgb(large_jpeg).size == image_size(large_jpeg) == (4000, 3000)
+
+    def test_resized_matches_fit(self, large_jpeg):
+        """load_rgb_resized는 fit 크기로 정확히 리사이즈"""
+        assert load_rgb_resized(large_jpeg, (1920, 1080)).size == (1920, 1440)
+
+    def test_rgba_composited_on_background(self, tmp_path):
+        """투명 PNG는 지정한 배경색에 합성"""
+        path = tmp_path / "alpha.png"
+        Image.new("RGBA", (10, 10), (255, 0, 0, 0)).save(path)
+        assert load_rgb(path, background=(255, 255, 255)).getpixel((0, 0)) == (255, 255, 255)
+        assert load_rgb(path).getpixel((0, 0)) == (255, 0, 0)
+
+    def test_grayscale_and_palette_become_rgb(self, tmp_path):
+        """L/P 모드도 RGB로 정규화"""
+        gray = tmp_path / "gray.jpg"
+        Image.new("L", (10, 10), 128).save(gray)
+        palette = tmp_path / "palette.png"
+        Image.new("P", (10, 10), 3).save(palette)
+        assert load_rgb(gray).mode == "RGB"
+        assert load_rgb(palette).mode == "RGB"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+이미지 품질 사전 평가 모듈 테스트
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils.image_quality import measure_image, prerank_images
+
+
+def _save(path, array):
+    Image.fromarray(array.astype(np.uint8)).save(path, quality=95)
+    return path
+
+
+def _textured(seed, size=(720, 1280)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(*size, 3))
+
+
+class TestImageQuality:
+    """로컬 품질 점수 테스트"""
+
+    def test_sharp_image_is_usable(self, tmp_path):
+        """선명하고 16:9인 이미지는 사용 가능"""
+        q = measure_image(_save(tmp_path / "mood_1.jpg", _textured(1)))
+        assert q.usable, q.reasons
+        assert q.aspect_fit > 0.99
+        assert 0.0 < q.score <= 1.0
+
+    def test_flat_dark_image_is_rejected(self, tmp_path):
+        """단색의 어두운 이미지는 사용 불가"""
+        q = measure_image(_save(tmp_path / "mood_1.jpg", np.full((720, 1280, 3), 5)))
+        assert not q.usable
+        assert any("blurry" in r for r in q.reasons)
+        assert any("exposure" in r for r in q.reasons)
+
+    def test_low_resolution_is_rejected(self, tmp_path):
+        """해상도가 너무 낮은 이미지는 사용 불가"""
+        q = measure_image(_save(tmp_path / "mood_1.jpg", _textured(2, size=(200, 300))))
+        assert any("low resolution" in r for r in q.reasons)
+
+    def test_corrupt_file_is_rejected(self, tmp_path):
+        """디코딩할 수 없는 파일은 사용 불가"""
+        path = tmp_path / "mood_1.jpg"
+        path.write_bytes(b"not a jpeg")
+        assert not measure_image(path).usable
+
+    def test_duplicates_are_dropped(self, tmp_path):
+        """거의 같은 이미지는 하나만 남김"""
+        base = _textured(3)
+        a = _save(tmp_path / "mood_1.jpg", base)
+        b = _save(tmp_path / "mood_2.jpg", np.clip(base + 2, 0, 255))
+        c = _save(tmp_path / "mood_3.jpg", _textured(4))
+        usable, rejected = prerank_images([a, b, c])
+        assert len(usable) == 2
+        assert len(rejected) == 1
+        assert rejected[0].duplicate_of in (a, b)
+
+    def test_usable_sorted_by_score(self, tmp_path):
+        """사용 가능 이미지는 점수 내림차순"""
+        wide = _save(tmp_path / "mood_1.jpg", _textured(5))
+        square = _save(tmp_path / "mood_2.jpg", _textured(6, size=(900, 900)))
+        usable, _ = prerank_images([square, wide])
+        assert [q.path for q in usable] == [wide, square]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,67 @@
+"""
+렌더용 이미지 변형 생성 모듈 테스트
+"""
+
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils.image_variants import (
+    SHORTS_RESOLUTION,
+    VIDEO_RESOLUTION,
+    build_variants_for_dir,
+    kenburns_canvas_size,
+    load_render_variant,
+)
+
+
+def _save(path, width, height, seed=0):
+    rng = np.random.default_rng(seed)
+    Image.fromarray(rng.integers(0, 256, size=(height, width, 3)).astype(np.uint8)).save(path)
+    return path
+
+
+class TestImageVariants:
+    """렌더용 변형 생성/조회 테스트"""
+
+    def test_landscape_gets_kenburns_and_shorts(self, tmp_path):
+        """가로형 이미지는 Ken Burns 캔버스와 Shorts 크롭 생성"""
+        img = _save(tmp_path / "mood_1.jpg", 1600, 900)
+        assert build_variants_for_dir(tmp_path) == 1
+
+        canvas, original = load_render_variant(img, "kenburns")
+        assert original == (1600, 900)
+        assert (canvas.shape[1], canvas.shape[0]) == kenburns_canvas_size(original)
+        shorts, _ = load_render_variant(img, "shorts")
+        assert shorts.shape == (SHORTS_RESOLUTION[1], SHORTS_RESOLUTION[0], 3)
+        assert load_render_variant(img, "letterbox") is None
+
+    def test_portrait_gets_letterbox(self, tmp_path):
+        """16:9보다 좁은 이미지는 letterbox 프레임 생성"""
+        img = _save(tmp_path / "mood_1.jpg", 600, 900)
+        build_variants_for_dir(tmp_path)
+
+        frame, _ = load_render_variant(img, "letterbox")
+        assert frame.shape == (VIDEO_RESOLUTION[1], VIDEO_RESOLUTION[0], 3)
+        # 좌우 여백은 검은색
+        assert frame[:, :10].max() == 0
+        assert load_render_variant(img, "kenburns") is None
+
+    def test_modified_source_invalidates_variant(self, tmp_path):
+        """원본이 바뀌면 이전 변형은 사용하지 않음"""
+        img = _save(tmp_path / "mood_1.jpg", 1600, 900)
+        build_variants_for_dir(tmp_path)
+        _save(img, 1600, 900, seed=1)
+        os.utime(img, (1, 1))
+        assert load_render_variant(img, "shorts") is None
+
+        build_variants_for_dir(tmp_path)
+        assert load_render_variant(img, "shorts") is not None
+        # 이전 변형 파일은 정리됨
+        assert len(list((tmp_path / ".render").glob("*_shorts_*.jpg"))) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
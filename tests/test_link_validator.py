@@ -0,0 +1,191 @@
+"""
+구매 링크 일괄 검사 테스트 (가짜 HTTP 클라이언트 사용, 네트워크 없음)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+
+from src.utils import link_validator
+from src.utils.http_client import CircuitOpenError
+from src.utils.link_validator import (
+    AsyncLinkValidator,
+    LinkValidationCache,
+    _HostPacer,
+    extract_purchase_urls,
+    validate_purchase_urls,
+)
+
+ALADIN = "https://www.aladin.co.kr/shop/wproduct.aspx?ISBN=978{}"
+AMAZON = "https://www.amazon.com/s?k=book&tag=t-20"
+OTHER = "https://books.example.com/item/{}"
+
+
+class _Response:
+    def __init__(self, url, status_code=200):
+        self.url = url
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+
+class FakeHttp:
+    """
+    - 알라딘: ISBN이 0으로 끝나면 검색 결과로 리디렉션 (책 없음), 9로 끝나면 503,
+      8로 끝나면 타임아웃, 7로 끝나면 연결 오류, 6으로 끝나면 서킷 열림
+    - books.example.com: HEAD는 405, Range GET만 허용 (경로가 slow로 끝나면 타임아웃)
+    """
+
+    def __init__(self, latency=0.0):
+        self.calls = []
+        self.latency = latency
+        self.active = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+
+    def _enter(self, method, url, headers):
+        host = url.split("/")[2]
+        with self._lock:
+            self.calls.append((method, url, headers.get("Range")))
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(self.latency)
+        with self._lock:
+            self.active[host] -= 1
+
+    def head(self, url, headers=None, **kwargs):
+        self._enter("HEAD", url, headers or {})
+        if "example.com" in url:
+            return _Response(url, 405)
+        if url.endswith("9"):
+            return _Response(url, 503)
+        if url.endswith("8"):
+            raise requests.Timeout("read timed out")
+        if url.endswith("7"):
+            raise requests.ConnectionError("connection reset")
+        if url.endswith("6"):
+            raise CircuitOpenError("www.aladin.co.kr", 30)
+        if url.endswith("0"):
+            return _Response("https://www.aladin.co.kr/search/wsearchresult.aspx")
+        return _Response(url)
+
+    def get(self, url, headers=None, **kwargs):
+        assert kwargs.get("stream") and headers["Range"] == "bytes=0-0"  # 본문은 받지 않음
+        self._enter("GET", url, headers)
+        if url.endswith("slow"):
+            raise requests.ReadTimeout("read timed out")
+        return _Response(url, 206)
+
+
+@pytest.fixture
+def http(monkeypatch, tmp_path):
+    fake = FakeHttp()
+    monkeypatch.setattr(link_validator, "get_http_client", lambda: fake)
+    monkeypatch.setattr(link_validator, "_pacer", _HostPacer(interval=0))
+    monkeypatch.setattr(link_validator, "_cache", LinkValidationCache(tmp_path / "links.sqlite3"))
+    return fake
+
+
+class TestValidatePurchaseUrls:
+    def test_dedup_and_cache_across_comments(self, http):
+        comments = [
+            f"📖 이 책 구매하기:\n  알라딘: {ALADIN.format(1)}\n  Amazon: {AMAZON}\n",
+            f"📖 이 책 구매하기:\n  알라딘: {ALADIN.format(1)}.\n  알라딘: {ALADIN.format(0)}\n",
+        ]
+        urls = [url for text in comments for url in extract_purchase_urls(text)]
+        assert len(urls) == 4
+
+        results = validate_purchase_urls(urls)
+        assert set(results) == {ALADIN.format(1), ALADIN.format(0), AMAZON}
+        assert results[ALADIN.format(1)]["valid"]
+        assert not results[ALADIN.format(0)]["valid"]
+        # 알라딘은 HEAD만, Amazon은 형식 검사만
+        assert sorted(http.calls) == sorted([("HEAD", ALADIN.format(1), None), ("HEAD", ALADIN.format(0), None)])
+
+        # 이후 댓글별 검사는 캐시에서 (요청 없음)
+        http.calls.clear()
+        assert link_validator.validate_purchase_links_in_comment(comments[1], delay=5.0) == {
+            ALADIN.format(1): results[ALADIN.format(1)],
+            ALADIN.format(0): results[ALADIN.format(0)],
+        }
+        assert http.calls == []
+
+    def test_range_get_fallback_and_transient_errors(self, http):
+        results = validate_purchase_urls([OTHER.format(1), ALADIN.format(9)])
+        assert results[OTHER.format(1)] == {"valid": True, "reason": "HTTP 206"}
+        assert ("GET", OTHER.format(1), "bytes=0-0") in http.calls
+        assert results[ALADIN.format(9)] == {"valid": False, "reason": "HTTP 503"}
+
+        # 일시 오류(5xx)는 보관하지 않아 다음 실행에서 다시 검사
+        http.calls.clear()
+        validate_purchase_urls([OTHER.format(1), ALADIN.format(9)])
+        assert http.calls == [("HEAD", ALADIN.format(9), None)]
+
+    def test_network_errors_are_not_cached(self, http):
+        """타임아웃/연결 오류는 무효로 보관하지 않아 다음 검사에서 다시 요청"""
+        expected = {ALADIN.format(8): (False, "Timeout"), ALADIN.format(7): (False, "Connection error")}
+        for url, result in expected.items():
+            assert link_validator.validate_purchase_url(url) == result
+
+        http.calls.clear()
+        for url, result in expected.items():
+            assert link_validator.validate_purchase_url(url) == result
+        assert sorted(http.calls) == sorted(("HEAD", url, None) for url in expected)
+
+    def test_circuit_open_and_generic_timeouts_are_not_cached(self, http):
+        """서킷 열림, 기타 URL의 타임아웃도 일시 오류로 보고 보관하지 않음"""
+        urls = [ALADIN.format(6), OTHER.format("slow")]
+        results = validate_purchase_urls(urls)
+        assert not results[ALADIN.format(6)]["valid"]
+        assert "Circuit open" in results[ALADIN.format(6)]["reason"]
+        assert results[OTHER.format("slow")] == {"valid": False, "reason": "Timeout"}
+        assert link_validator._get_cache().get_many(urls) == {}
+
+        http.calls.clear()
+        assert link_validator.validate_purchase_url(OTHER.format("slow")) == (False, "Timeout")
+        assert ("GET", OTHER.format("slow"), "bytes=0-0") in http.calls
+
+    def test_persistent_cache_with_separate_ttls(self, http, tmp_path):
+        now = [1000.0]
+        path = tmp_path / "ttl.sqlite3"
+        cache = LinkValidationCache(path, valid_ttl=100, invalid_ttl=10, clock=lambda: now[0])
+        validator = AsyncLinkValidator(cache=cache)
+        asyncio.run(validator.validate_many([ALADIN.format(1), ALADIN.format(0)]))
+        assert len(http.calls) == 2
+
+        # 다른 프로세스(새 캐시 객체)에서도 결과 재사용, 무효 결과만 먼저 만료
+        reopened = LinkValidationCache(path, valid_ttl=100, invalid_ttl=10, clock=lambda: now[0])
+        now[0] += 50
+        assert reopened.get_many([ALADIN.format(1), ALADIN.format(0)]) == {
+            ALADIN.format(1): (True, "Book page found"),
+        }
+        assert asyncio.run(AsyncLinkValidator(cache=reopened).validate(ALADIN.format(0))) == (
+            False, "Book not found on Aladin (redirected to search)",
+        )
+        assert len(http.calls) == 3
+
+    def test_domain_concurrency_limit(self, http):
+        http.latency = 0.02
+        urls = [ALADIN.format(n) for n in range(1, 9)] + [OTHER.format(n) for n in range(8)]
+        validate_purchase_urls(urls, max_per_domain=3)
+        assert http.peak["www.aladin.co.kr"] <= 2  # DOMAIN_LIMITS
+        assert 1 < http.peak["books.example.com"] <= 3
+
+
+class TestHostPacer:
+    def test_interval_is_per_host(self):
+        sleeps = []
+        pacer = _HostPacer(interval=0.5, clock=lambda: 100.0, sleep=sleeps.append)
+        pacer.wait("https://www.aladin.co.kr/a")
+        pacer.wait("https://www.amazon.com/b")
+        pacer.wait("https://www.aladin.co.kr/c")
+        pacer.wait("https://www.aladin.co.kr/d")
+        assert sleeps == [0.5, 1.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
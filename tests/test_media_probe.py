@@ -0,0 +1,91 @@
+"""
+미디어 probe 캐시 테스트
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from src.utils.media_probe import MediaInfo, MediaProbe, parse_ffprobe_output
+
+
+FFPROBE_SAMPLE = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "mjpeg", "width": 600, "height": 600,
+         "avg_frame_rate": "0/0", "disposition": {"attached_pic": 1}},
+        {"codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+         "avg_frame_rate": "30000/1001", "r_frame_rate": "30000/1001"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2},
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "612.480000", "bit_rate": "2500000"},
+}
+
+
+@pytest.fixture(scope="module")
+def sample_video(tmp_path_factory):
+    """imageio-ffmpeg로 2초짜리 테스트 영상 생성"""
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    path = tmp_path_factory.mktemp("media") / "sample.mp4"
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-v", "error",
+         "-f", "lavfi", "-i", "testsrc=size=320x240:rate=25",
+         "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100",
+         "-t", "2", "-c:v", "libx264", "-c:a", "aac", "-shortest", str(path)],
+        check=True,
+    )
+    return path
+
+
+class TestParseFfprobe:
+    def test_streams_and_format(self):
+        """앨범 아트를 건너뛰고 첫 영상/오디오 스트림 정보 추출"""
+        info = parse_ffprobe_output(FFPROBE_SAMPLE)
+        assert info.duration == pytest.approx(612.48)
+        assert info.video_codec == "h264"
+        assert info.resolution == (1920, 1080)
+        assert info.fps == pytest.approx(29.97)
+        assert info.audio_codec == "aac"
+        assert info.sample_rate == 44100
+        assert info.channels == 2
+
+    def test_audio_only(self):
+        info = parse_ffprobe_output({"streams": [{"codec_type": "audio", "codec_name": "mp3", "duration": "12.5"}]})
+        assert info.duration == 12.5
+        assert info.has_audio and not info.has_video
+
+
+class TestMediaProbe:
+    def test_probe_and_cache(self, sample_video, tmp_path):
+        """두 번째 조회부터는 저장소 캐시 사용, 새 인스턴스에서도 유지"""
+        cache = tmp_path / "probe.json"
+        probe = MediaProbe(cache_path=cache)
+        info = probe.probe(sample_video)
+        assert info.duration == pytest.approx(2.0, abs=0.1)
+        assert info.resolution == (320, 240)
+        assert info.sample_rate == 44100
+        assert probe.probe(sample_video) == info
+        assert (probe.hits, probe.misses) == (1, 1)
+
+        reloaded = MediaProbe(cache_path=cache)
+        assert reloaded.duration(sample_video) == info.duration
+        assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+    def test_changed_file_is_reprobed(self, sample_video, tmp_path):
+        """mtime이 바뀌면 다시 probe"""
+        probe = MediaProbe(cache_path=tmp_path / "probe.json")
+        probe.probe(sample_video)
+        st = sample_video.stat()
+        os.utime(sample_video, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        probe.probe(sample_video)
+        assert probe.misses == 2
+
+    def test_missing_file(self, tmp_path):
+        assert MediaProbe(cache_path=None).probe(tmp_path / "nope.mp4") is None
+
+    def test_cached_entry_roundtrip(self):
+        assert MediaInfo(**vars(MediaInfo(duration=1.5, width=10, height=20))).resolution == (10, 20)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
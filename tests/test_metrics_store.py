@@ -0,0 +1,174 @@
+"""
+로컬 지표 저장소 테스트 (가짜 Analytics 서비스 사용)
+"""
+
+from datetime import date
+
+import pytest
+
+from src.utils import metrics_store
+from src.utils.metrics_store import (
+    DEFAULT_BACKFILL_DAYS,
+    MetricsStore,
+    backfill_days_for,
+    detect_genre,
+    sync_warehouse,
+)
+
+
+def report(*values, metrics=metrics_store.FACT_METRICS):
+    return {'columnHeaders': [{'name': name} for name in metrics], 'rows': [list(values)] if values else []}
+
+
+# 2026-03-02(월) 10:00 KST, 2026-03-03(화) 21:00 KST
+VIDEOS = [
+    {'video_id': 'a', 'title': '사피엔스 역사 요약', 'published_at': '2026-03-02T01:00:00Z', 'views': 500},
+    {'video_id': 'b', 'title': 'Atomic Habits summary', 'published_at': '2026-03-03T12:00:00Z', 'views': 80},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(tmp_path / "warehouse.sqlite3")
+    store.upsert_videos(VIDEOS)
+    store.append_day('2026-03-02', {'a': report(100, 10, 2, 50, 30), 'b': report()})
+    store.append_day('2026-03-03', {'a': report(40, 2, 1, 20, 60), 'b': report(20, 1, 0, 5, 15)})
+    store.append_day('2026-03-04', {'a': report(10, 0, 0, 5, 30), 'b': report(30, 3, 1, 10, 20)})
+    store.rebuild_rollups()
+    return store
+
+
+class TestMetricsStore:
+    def test_dimensions(self):
+        assert detect_genre('사피엔스 역사 요약') == 'history'
+        assert detect_genre('Atomic Habits summary') == 'psychology'
+        assert detect_genre('무제') == 'general'
+
+    def test_rollups(self, store):
+        weekday = store.rollup('weekday')
+        assert set(weekday) == {'0', '1'}
+        assert weekday['0']['avg_views_24h'] == 100
+        assert weekday['0']['avg_views_48h'] == 140
+        assert weekday['1']['avg_views_24h'] == 20
+        assert weekday['1']['avg_likes_24h'] == 1
+
+        hour = store.rollup('hour')
+        assert set(hour) == {'10', '21'}
+        assert store.rollup('language')['ko']['views'] == 150
+        assert store.rollup('genre')['psychology']['count'] == 1
+
+        with pytest.raises(ValueError):
+            store.rollup('country')
+
+    def test_period_reports(self, store):
+        channel = store.channel_report('2026-03-03', '2026-03-04')
+        assert channel['rows'][0][:3] == [100, 6, 2]
+        assert store.channel_report('2025-01-01', '2025-01-02') is None
+
+        videos = {v['video_id']: v for v in store.video_report('2026-03-03', '2026-03-03')}
+        assert videos['a']['views'] == 500  # 누적 조회수
+        assert videos['a']['analytics']['rows'][0][0] == 40  # 기간 조회수
+        assert videos['a']['genre'] == 'history'
+
+        recent = store.video_report('2026-03-03', '2026-03-04', published_since='2026-03-03')
+        assert [v['video_id'] for v in recent] == ['b']
+
+    def test_append_day_replaces(self, store):
+        store.append_day('2026-03-04', {'a': report(11, 0, 0, 5, 30)})
+        assert store.channel_report('2026-03-04', '2026-03-04')['rows'][0][0] == 11
+
+    def test_video_ctr(self, store):
+        reach = {'a': report(1000, 0.05, metrics=metrics_store.REACH_METRICS)}
+        store.append_day('2026-03-05', {'a': report(5, 0, 0, 1, 10)}, reach)
+        assert store.video_ctr('a', '2026-03-01', '2026-03-10') == 5.0
+        assert store.video_ctr('b', '2026-03-01', '2026-03-10') is None
+
+
+class _Request:
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self):
+        return self._response
+
+
+class FakeYouTube:
+    def channels(self):
+        return self
+
+    def list(self, **params):
+        return _Request({'items': [{'id': 'UC1', 'statistics': {'subscriberCount': '42'}}]})
+
+
+class FakeAnalytics:
+    """날짜별 영상 조회수 10, 노출 지표는 권한 없음"""
+
+    def __init__(self):
+        self.queries = []
+
+    def reports(self):
+        return self
+
+    def query(self, **params):
+        self.queries.append(params)
+        if 'impressions' in params['metrics']:
+            raise RuntimeError('Forbidden')
+        ids = params['filters'].split('==', 1)[1].split(',')
+        metric_count = len(params['metrics'].split(','))
+        rows = [[vid, 10] + [1] * (metric_count - 1) for vid in ids]
+        return _Request({'columnHeaders': [{'name': 'video'}], 'rows': rows})
+
+
+class TestSyncWarehouse:
+    def test_incremental_days(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics_store, 'load_channel_videos', lambda *args, **kwargs: VIDEOS)
+        store = MetricsStore(tmp_path / "warehouse.sqlite3")
+        analytics = FakeAnalytics()
+        messages = []
+
+        sync_warehouse(store, analytics, FakeYouTube(), 'UC1', days=5, log=messages.append,
+                       today=date(2026, 3, 6))
+        assert store.last_day() == '2026-03-05'
+        assert store.channel_info()['statistics']['subscriberCount'] == '42'
+        # 03-01은 업로드 전 → 조회 없음, 03-02~05 4일 (노출 지표는 첫 실패 후 생략)
+        fact_queries = [q for q in analytics.queries if 'impressions' not in q['metrics']]
+        assert len(fact_queries) == 4
+        assert sum(1 for q in analytics.queries if 'impressions' in q['metrics']) == 1
+        assert any('노출' in m for m in messages)
+        assert store.rollup('weekday')['0']['avg_views_24h'] == 10
+
+        analytics.queries.clear()
+        sync_warehouse(store, analytics, FakeYouTube(), 'UC1', days=5, log=messages.append,
+                       today=date(2026, 3, 7))
+        fact_queries = [q for q in analytics.queries if 'impressions' not in q['metrics']]
+        # 최근 REFRESH_DAYS일 재적재 + 새 날짜 1일
+        assert [q['startDate'] for q in fact_queries] == ['2026-03-03', '2026-03-04', '2026-03-05', '2026-03-06']
+
+    def test_backfill_extends_to_requested_period(self, tmp_path, monkeypatch):
+        """적재 시작일보다 앞선 기간을 요청하면 그 앞 날짜만 추가로 적재"""
+        monkeypatch.setattr(metrics_store, 'load_channel_videos', lambda *args, **kwargs: VIDEOS)
+        store = MetricsStore(tmp_path / "warehouse.sqlite3")
+        analytics = FakeAnalytics()
+        today = date(2026, 3, 10)
+
+        sync_warehouse(store, analytics, FakeYouTube(), 'UC1', days=3, log=print, today=today)
+        assert store.loaded_from() == '2026-03-07'
+        assert store.channel_report('2026-03-02', '2026-03-04') is None
+
+        # 리포트 기간에서 적재 기간 계산 (최소 DEFAULT_BACKFILL_DAYS)
+        assert backfill_days_for('2026-03-02', today=today) == DEFAULT_BACKFILL_DAYS
+        assert backfill_days_for('2025-10-01', today=today) == 160
+
+        analytics.queries.clear()
+        sync_warehouse(store, analytics, FakeYouTube(), 'UC1', days=backfill_days_for('2026-03-02', today=today),
+                       log=print, today=today)
+        fact_days = [q['startDate'] for q in analytics.queries if 'impressions' not in q['metrics']]
+        # 03-02~06 새로 적재 (업로드 전 날짜는 조회 없음) + 최근 REFRESH_DAYS일 재적재
+        assert fact_days == ['2026-03-02', '2026-03-03', '2026-03-04', '2026-03-05', '2026-03-06',
+                             '2026-03-07', '2026-03-08', '2026-03-09']
+        assert store.loaded_from() == '2025-12-10'
+        assert store.channel_report('2026-03-02', '2026-03-04') is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,81 @@
+"""
+모듈 로더 (스크립트 캐시 / 지연 import) 테스트
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils.module_loader import is_available, lazy_import, lazy_script, load_script
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _loaded_modules_after(code: str, cwd: Path) -> set:
+    """새 프로세스에서 code 실행 후 sys.modules 목록 (로그 파일은 cwd 아래에 생성)"""
+    script = (
+        "import sys, json\n"
+        f"sys.path.insert(0, {str(PROJECT_ROOT)!r})\n"
+        f"{code}\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True, check=True,
+    )
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestLoadScript:
+    def test_cached_per_path(self):
+        """같은 스크립트는 한 번만 실행"""
+        first = load_script("02_get_images.py")
+        assert load_script("02_get_images") is first
+        assert load_script(PROJECT_ROOT / "src" / "02_get_images.py") is first
+        assert hasattr(first, "ImageDownloader")
+
+    def test_missing_script(self):
+        with pytest.raises(FileNotFoundError):
+            load_script("99_does_not_exist.py")
+
+    def test_lazy_script(self):
+        module = lazy_script("02_get_images.py")
+        assert module.ImageDownloader is load_script("02_get_images.py").ImageDownloader
+
+
+class TestLazyImport:
+    def test_import_deferred_until_attribute_access(self, tmp_path):
+        modules = _loaded_modules_after(
+            "from src.utils.module_loader import lazy_import\n"
+            "mod = lazy_import('xml.dom.minidom')\n"
+            "assert not mod.is_loaded",
+            tmp_path,
+        )
+        assert "xml.dom.minidom" not in modules
+
+        proxy = lazy_import("xml.dom.minidom")
+        assert proxy.parseString("<a/>").documentElement.tagName == "a"
+        assert proxy.is_loaded
+
+    def test_is_available(self):
+        assert is_available("json")
+        assert not is_available("definitely_not_installed_pkg")
+        assert not is_available("definitely_not_installed_pkg.sub")
+
+    def test_metadata_scripts_skip_heavy_imports(self, tmp_path):
+        """메타데이터 경로는 moviepy/whisper/AI SDK를 불러오지 않음"""
+        modules = _loaded_modules_after(
+            "from src.utils.module_loader import load_script\n"
+            "load_script('20_create_episode_metadata.py')\n"
+            "load_script('08_create_and_preview_videos.py')\n"
+            "load_script('08_generate_summary.py')",
+            tmp_path,
+        )
+        for heavy in ("moviepy", "whisper", "torch", "openai", "anthropic"):
+            assert heavy not in modules
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+YouTube API 쿼터 스케줄러 테스트
+
+원장은 임시 SQLite 파일, API 응답은 googleapiclient의 HttpMockSequence를 사용합니다.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.utils.quota_scheduler import (
+    PRIORITY_COMMENT,
+    PRIORITY_METADATA,
+    PRIORITY_UPLOAD,
+    QUOTA_TIMEZONE,
+    QuotaExhausted,
+    QuotaLedger,
+    QuotaScheduler,
+    enable_quota_scheduler,
+    get_quota_scheduler,
+    method_cost,
+    quota_day,
+    request_method,
+)
+
+# 2026-03-02 12:00 (태평양 시간)
+NOON = datetime(2026, 3, 2, 12, 0, tzinfo=QUOTA_TIMEZONE).timestamp()
+
+
+def make_scheduler(ledger, priority=PRIORITY_METADATA, daily_limit=5000, **kwargs):
+    kwargs.setdefault("clock", lambda: NOON)
+    return QuotaScheduler(ledger, daily_limit=daily_limit, priority=priority, **kwargs)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return QuotaLedger(tmp_path / "ledger.sqlite3")
+
+
+class TestQuotaCosts:
+    def test_request_method(self):
+        base = "https://youtube.googleapis.com"
+        assert request_method(f"{base}/youtube/v3/videos?part=snippet&id=a") == "videos.list"
+        assert request_method(f"{base}/youtube/v3/videos?part=snippet", "PUT") == "videos.update"
+        assert request_method(f"{base}/youtube/v3/commentThreads", "POST") == "commentThreads.insert"
+        assert request_method(f"{base}/upload/youtube/v3/thumbnails/set?videoId=a", "POST") == "thumbnails.set"
+        assert request_method(f"{base}/upload/youtube/v3/videos?uploadType=resumable", "POST") == "videos.insert"
+        # 재개 업로드 청크와 다른 API는 집계하지 않음
+        assert request_method(f"{base}/upload/youtube/v3/videos?uploadType=resumable&upload_id=x", "PUT") is None
+        assert request_method("https://oauth2.googleapis.com/token", "POST") is None
+
+    def test_method_cost(self):
+        assert method_cost("videos.list") == 1
+        assert method_cost("search.list") == 100
+        assert method_cost("videos.update") == 50
+        assert method_cost("videos.insert") == 1600
+        # 읽기 전용 GET 하위 리소스는 조회 비용 (쓰기 비용으로 원장을 일찍 소진하지 않음)
+        assert method_cost("videos.getRating", "GET") == 1
+        assert method_cost("videos.rate", "POST") == 50
+        assert method_cost("captions.download", "GET") == 200
+
+
+class TestQuotaScheduler:
+    def test_priority_reserves_across_processes(self, ledger):
+        # 같은 원장을 쓰는 서로 다른 프로세스의 스케줄러
+        uploads = make_scheduler(ledger, PRIORITY_UPLOAD)
+        metadata = make_scheduler(ledger, PRIORITY_METADATA)
+        comments = make_scheduler(ledger, PRIORITY_COMMENT)
+
+        assert comments.remaining() == 1600  # 5000 - 업로드 2건 몫
+        uploads.acquire("videos.insert")
+        assert comments.remaining() == 0
+        assert not comments.can_afford("commentThreads.list", "commentThreads.insert")
+        with pytest.raises(QuotaExhausted):
+            comments.acquire("commentThreads.insert")
+
+        # 메타데이터는 업로드 1건 몫(1700)만 남기고 사용
+        assert metadata.remaining() == 1700
+        assert metadata.can_afford("videos.list", "videos.update")
+        with metadata.priority(PRIORITY_COMMENT):
+            assert metadata.remaining() == 0
+        with pytest.raises(QuotaExhausted):
+            metadata.require(*["videos.update"] * 35)
+
+        assert ledger.usage(quota_day(NOON)) == {"videos.insert": (1, 1600)}
+
+    def test_quota_day_rolls_over_and_pacing(self, ledger):
+        now = [NOON]
+        sleeps = []
+        scheduler = make_scheduler(ledger, PRIORITY_UPLOAD, daily_limit=101, min_interval=2.0,
+                                   clock=lambda: now[0], sleep=sleeps.append)
+
+        scheduler.acquire("search.list")
+        now[0] += 0.5
+        scheduler.acquire("videos.list")  # 2초 간격에서 이미 지난 0.5초는 차감
+        assert sleeps == [1.5]
+        assert scheduler.remaining() == 0
+
+        now[0] += 1
+        with pytest.raises(QuotaExhausted):
+            scheduler.acquire("videos.list")
+        assert sleeps == [1.5]  # 예약 실패는 대기 없음
+
+        now[0] = NOON + 12 * 3600  # 태평양 시간 자정 이후 → 새 쿼터 일자
+        assert quota_day(now[0]) != quota_day(NOON)
+        scheduler.acquire("videos.list")
+        assert scheduler.remaining() == 100
+        assert scheduler.units_spent == 102
+
+
+class TestQuotaHttp:
+    def test_quota_exceeded_response_stops_all_processes(self, ledger):
+        http_mock = pytest.importorskip("googleapiclient.http")
+        discovery = pytest.importorskip("googleapiclient.discovery")
+        quota_error = json.dumps({"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}})
+        http = http_mock.HttpMockSequence([
+            ({"status": "200"}, json.dumps({"items": [{"id": "a"}]})),
+            ({"status": "403"}, quota_error),
+        ])
+        youtube = discovery.build("youtube", "v3", http=http, static_discovery=True)
+        scheduler = make_scheduler(ledger, PRIORITY_METADATA)
+        assert enable_quota_scheduler(youtube, scheduler=scheduler) is youtube
+        assert get_quota_scheduler(enable_quota_scheduler(youtube)) is scheduler
+
+        assert youtube.videos().list(part="snippet", id="a").execute()["items"][0]["id"] == "a"
+        with pytest.raises(QuotaExhausted):
+            youtube.videos().update(part="snippet", body={"id": "a"}).execute()
+
+        # 원장이 소진으로 표시되어 다른 프로세스(우선순위 무관)도 요청 전에 중단
+        assert make_scheduler(ledger, PRIORITY_UPLOAD).remaining() == 0
+        with pytest.raises(QuotaExhausted):
+            youtube.videos().list(part="snippet", id="a").execute()
+        assert scheduler.calls == 2
+
+    def test_get_sub_resource_charged_as_read(self, ledger):
+        """videos.getRating 같은 GET 하위 리소스는 조회 비용 1단위로 기록"""
+        http_mock = pytest.importorskip("googleapiclient.http")
+        discovery = pytest.importorskip("googleapiclient.discovery")
+        http = http_mock.HttpMockSequence([({"status": "200"}, json.dumps({"items": []}))])
+        youtube = discovery.build("youtube", "v3", http=http, static_discovery=True)
+        scheduler = make_scheduler(ledger, PRIORITY_METADATA)
+        enable_quota_scheduler(youtube, scheduler=scheduler)
+
+        youtube.videos().getRating(id="a").execute()
+        assert scheduler.units_spent == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
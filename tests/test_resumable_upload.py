@@ -0,0 +1,204 @@
+"""
+재개 업로드 / 세션 기록 테스트
+
+로컬 가짜 업로드 서버(재개 업로드 프로토콜: 세션 시작 POST, Content-Range 청크 PUT,
+`bytes */크기` 상태 조회)에 실제 HTTP로 업로드합니다.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+from googleapiclient.errors import HttpError  # noqa: E402
+from googleapiclient.http import HttpRequest, MediaFileUpload, build_http  # noqa: E402
+
+from src.utils.resumable_upload import (  # noqa: E402
+    CHUNK_ALIGN,
+    UploadJournal,
+    chunk_size_for,
+    resolve_chunk_size,
+    resumable_upload,
+    upload_key,
+)
+
+CHUNK = CHUNK_ALIGN
+FILE_SIZE = 4 * CHUNK + 1000
+
+
+class FakeUploadServer:
+    """세션별 수신 바이트를 기억하는 가짜 YouTube 업로드 엔드포인트"""
+
+    def __init__(self):
+        self.sessions = {}          # upload_id → bytearray
+        self.starts = 0
+        self.bytes_received = 0
+        self.chunk_puts = 0
+        self.fail_chunks = set()    # 이 번호(1부터)의 청크 PUT에 503
+        self.fail_queries = 0       # 앞에서부터 이 개수만큼의 상태 조회(빈 PUT)에 503
+        self.expired = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=b"", headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.starts += 1
+                upload_id = f"u{server.starts}"
+                server.sessions[upload_id] = bytearray()
+                location = f"{server.base}/upload/youtube/v3/videos?uploadType=resumable&upload_id={upload_id}"
+                self._reply(200, headers={"Location": location})
+
+            def do_PUT(self):
+                upload_id = re.search(r"upload_id=(\w+)", self.path).group(1)
+                data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if upload_id in server.expired:
+                    return self._reply(404)
+                received = server.sessions[upload_id]
+                content_range = self.headers["Content-Range"]
+                total = int(content_range.split("/")[1])
+                if not data and server.fail_queries:
+                    server.fail_queries -= 1
+                    return self._reply(503)
+                if data:
+                    server.chunk_puts += 1
+                    if server.chunk_puts in server.fail_chunks:
+                        return self._reply(503)
+                    start = int(content_range.split()[1].split("-")[0])
+                    assert start == len(received), "오프셋이 서버 확인 위치와 다름"
+                    received.extend(data)
+                    server.bytes_received += len(data)
+                if len(received) == total:
+                    return self._reply(200, json.dumps({"id": f"video-{upload_id}"}).encode())
+                headers = {"Range": f"bytes=0-{len(received) - 1}"} if received else {}
+                self._reply(308, headers=headers)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    fake = FakeUploadServer()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "episode.mp4"
+    path.write_bytes(bytes(range(256)) * (FILE_SIZE // 256) + b"x" * (FILE_SIZE % 256))
+    return path
+
+
+def insert_request(server, video):
+    """videos().insert와 같은 형태의 재개 업로드 요청 (가짜 서버로)"""
+    media = MediaFileUpload(str(video), chunksize=CHUNK, resumable=True, mimetype="video/*")
+    return HttpRequest(
+        build_http(), lambda resp, content: json.loads(content),
+        f"{server.base}/upload/youtube/v3/videos?uploadType=resumable&part=snippet",
+        method="POST", body=json.dumps({"snippet": {"title": "t"}}),
+        headers={"content-type": "application/json"}, resumable=media,
+    )
+
+
+class TestResumableUpload:
+    def test_resume_after_crash_from_confirmed_offset(self, server, video, tmp_path):
+        journal = UploadJournal(tmp_path / "sessions.json")
+        key = upload_key(video, {"snippet": {"title": "t"}})
+
+        # 3번째 청크에서 서버 오류 + 재시도 없음 → 업로드 도중 프로세스 종료를 흉내
+        server.fail_chunks = {3}
+        with pytest.raises(HttpError):
+            resumable_upload(insert_request(server, video), journal=journal, key=key, max_retries=0)
+
+        entry = UploadJournal(tmp_path / "sessions.json").get(key)
+        assert entry["offset"] == 2 * CHUNK
+
+        # 새 프로세스: 새 요청 객체, 같은 기록 → 세션 시작 없이 확인된 위치부터 이어서
+        response = resumable_upload(insert_request(server, video), journal=UploadJournal(tmp_path / "sessions.json"),
+                                    key=key)
+        assert response == {"id": "video-u1"}
+        assert server.starts == 1
+        assert server.bytes_received == FILE_SIZE  # 다시 보낸 바이트 없음
+        assert bytes(server.sessions["u1"]) == video.read_bytes()
+        assert journal.get(key) is None
+
+    def test_transient_offset_query_error_retries(self, server, video, tmp_path):
+        """이어 올리기 전 위치 조회가 일시적으로 실패해도 중단하지 않고 재시도 후 이어서 전송"""
+        journal = UploadJournal(tmp_path / "sessions.json")
+        server.fail_chunks = {2}
+        with pytest.raises(HttpError):
+            resumable_upload(insert_request(server, video), journal=journal, key="k", max_retries=0)
+
+        server.fail_queries = 2
+        sleeps = []
+        response = resumable_upload(insert_request(server, video), journal=journal, key="k", sleep=sleeps.append)
+        assert response == {"id": "video-u1"}
+        assert server.starts == 1
+        assert server.bytes_received == FILE_SIZE
+        assert len(sleeps) == 1  # 첫 조회 실패는 루프로 넘기고, 루프 안 재조회 실패 1번만 대기
+        assert journal.get("k") is None
+
+    def test_transient_errors_retry_in_process(self, server, video, tmp_path):
+        server.fail_chunks = {2, 3}
+        sleeps = []
+        journal = UploadJournal(tmp_path / "sessions.json")
+        response = resumable_upload(insert_request(server, video), journal=journal, key="k", sleep=sleeps.append)
+        assert response == {"id": "video-u1"}
+        assert len(sleeps) == 2
+        assert server.bytes_received == FILE_SIZE
+
+    def test_expired_session_starts_over(self, server, video, tmp_path):
+        journal = UploadJournal(tmp_path / "sessions.json")
+        request = insert_request(server, video)
+        request.next_chunk()
+        journal.save("k", request.resumable_uri, request.resumable_progress, FILE_SIZE)
+        server.expired.add("u1")
+
+        response = resumable_upload(insert_request(server, video), journal=journal, key="k")
+        assert response == {"id": "video-u2"}
+        assert server.starts == 2
+
+
+class TestChunkSize:
+    def test_sized_to_link(self, monkeypatch):
+        monkeypatch.delenv("YOUTUBE_UPLOAD_CHUNK_MB", raising=False)
+        monkeypatch.delenv("YOUTUBE_UPLOAD_MBPS", raising=False)
+        assert chunk_size_for(1) == 8 * 1024 * 1024                # 느린 회선: 최소 8MiB
+        assert chunk_size_for(50) == 187_500_000 // CHUNK_ALIGN * CHUNK_ALIGN  # 50Mbps × 30초
+        assert chunk_size_for(10_000) == 256 * 1024 * 1024         # 빠른 회선: 최대 256MiB
+        assert resolve_chunk_size() == 32 * 1024 * 1024
+        assert resolve_chunk_size(chunk_mb=10.1) == 10 * 1024 * 1024  # 256KiB 배수로 내림
+        monkeypatch.setenv("YOUTUBE_UPLOAD_MBPS", "20")
+        assert resolve_chunk_size() == chunk_size_for(20)
+
+    def test_explicit_arguments_override_env(self, monkeypatch):
+        """인자로 준 회선 속도가 환경 변수 청크 크기보다 우선"""
+        monkeypatch.setenv("YOUTUBE_UPLOAD_CHUNK_MB", "16")
+        monkeypatch.delenv("YOUTUBE_UPLOAD_MBPS", raising=False)
+        assert resolve_chunk_size(upload_mbps=20) == chunk_size_for(20)
+        assert resolve_chunk_size(chunk_mb=64, upload_mbps=20) == 64 * 1024 * 1024
+        assert resolve_chunk_size() == 16 * 1024 * 1024
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,239 @@
+"""
+재시도 / 서킷 브레이커 유틸리티 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.retry_utils import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    add_retry_listener,
+    compute_backoff,
+    get_circuit_breaker,
+    is_transient_error,
+    remove_retry_listener,
+    retry_with_backoff,
+)
+
+
+class _HttpError(Exception):
+    """status_code 속성을 가진 HTTP 오류 흉내"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def events():
+    received = []
+    add_retry_listener(received.append)
+    yield received
+    remove_retry_listener(received.append)
+
+
+class TestErrorClassification:
+    def test_transient_errors(self):
+        """연결 오류와 429/5xx만 재시도 대상"""
+        assert is_transient_error(ConnectionError("reset"))
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(_HttpError(503))
+        assert is_transient_error(_HttpError(429))
+        assert not is_transient_error(_HttpError(404))
+        assert not is_transient_error(ValueError("bad input"))
+        assert not is_transient_error(FileNotFoundError("x.mp3"))
+        assert not is_transient_error(CircuitOpenError("pexels", 10))
+
+
+class TestBackoff:
+    def test_jitter_bounds(self):
+        """지터 전략별 대기 시간 범위"""
+        for _ in range(50):
+            assert compute_backoff(3, 1.0, 5.0, "none") == 5.0
+            assert 0 <= compute_backoff(2, 1.0, 10.0, "full") <= 4.0
+            assert 2.0 <= compute_backoff(2, 1.0, 10.0, "equal") <= 4.0
+            assert 1.0 <= compute_backoff(0, 1.0, 10.0, "decorrelated", previous=2.0) <= 6.0
+
+    def test_unknown_jitter(self):
+        with pytest.raises(ValueError):
+            retry_with_backoff(jitter="random")
+
+
+class TestRetryDecorator:
+    def test_retries_transient_then_succeeds(self, events):
+        """일시적 오류는 재시도 후 성공, 이벤트 발행"""
+        calls = []
+
+        @retry_with_backoff(retries=3, backoff_in_seconds=0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("reset")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert len(calls) == 3
+        kinds = [e["event"] for e in events]
+        assert kinds == ["retry", "retry", "recovered"]
+        assert events[0]["func"] == "flaky"
+
+    def test_permanent_error_not_retried(self):
+        """잘못된 입력 오류는 한 번만 시도"""
+        calls = []
+
+        @retry_with_backoff(retries=3, backoff_in_seconds=0)
+        def broken():
+            calls.append(1)
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            broken()
+        assert len(calls) == 1
+
+    def test_async_function(self):
+        """코루틴 함수도 재시도 (asyncio.sleep 사용)"""
+        calls = []
+
+        @retry_with_backoff(retries=2, backoff_in_seconds=0)
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise TimeoutError()
+            return 42
+
+        assert asyncio.run(flaky()) == 42
+        assert len(calls) == 2
+
+    def test_provider_circuit_fails_fast(self, events):
+        """제공자 서킷이 열리면 함수 호출 없이 즉시 실패"""
+        breaker = get_circuit_breaker("test_dead_api", failure_threshold=2, reset_timeout=60)
+        calls = []
+
+        @retry_with_backoff(retries=5, backoff_in_seconds=0, provider="test_dead_api")
+        def dead():
+            calls.append(1)
+            raise _HttpError(503)
+
+        with pytest.raises(CircuitOpenError):
+            dead()
+        assert len(calls) == 2
+        assert breaker.state == "open"
+        assert "circuit_open" in [e["event"] for e in events]
+
+        with pytest.raises(CircuitOpenError):
+            dead()
+        assert len(calls) == 2
+
+    def test_provider_callable(self):
+        """provider에 호출 인자로 이름을 만드는 함수 지정"""
+        seen = []
+
+        class Engine:
+            provider = "openai"
+
+            @retry_with_backoff(retries=0, provider=lambda self, *a, **k: f"tts_{self.provider}")
+            def run(self):
+                seen.append(get_circuit_breaker("tts_openai").state)
+                return "done"
+
+        assert Engine().run() == "done"
+        assert seen == ["closed"]
+
+    def test_budget_limits_retries(self, events):
+        """공유 재시도 예산이 바닥나면 더 이상 재시도하지 않음"""
+        budget = RetryBudget(max_tokens=1, refill_per_second=0)
+        calls = []
+
+        @retry_with_backoff(retries=5, backoff_in_seconds=0, budget=budget)
+        def flaky():
+            calls.append(1)
+            raise ConnectionError("reset")
+
+        with pytest.raises(ConnectionError):
+            flaky()
+        assert len(calls) == 2
+        assert events[-1]["event"] == "budget_exhausted"
+
+
+class TestCircuitBreaker:
+    def test_half_open_trial(self):
+        """reset_timeout 이후 한 번의 시험 호출 성공 시 닫힘"""
+        breaker = CircuitBreaker("half_open_test", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_trial_released_on_non_transient_error(self):
+        """시험 호출이 일시적이지 않은 오류로 끝나도 이후 호출이 막히지 않음"""
+        breaker = get_circuit_breaker("half_open_non_transient", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        calls = []
+
+        @retry_with_backoff(retries=3, backoff_in_seconds=0, provider="half_open_non_transient")
+        def call(value):
+            calls.append(value)
+            if value < 0:
+                raise ValueError("bad argument")
+            return value
+
+        with pytest.raises(ValueError):
+            call(-1)
+        assert breaker.state == "half_open"  # 판정 없이 해제
+        assert call(1) == 1
+        assert breaker.state == "closed"
+        assert calls == [-1, 1]
+
+        # 데코레이터 없이 직접 쓸 때도 guard가 시험 호출을 해제
+        breaker.record_failure()
+        with pytest.raises(KeyError):
+            with breaker.guard():
+                raise KeyError("x")
+        with breaker.guard():
+            breaker.record_success()
+        assert breaker.state == "closed"
+
+
+
+class TestImageProviderBreaker:
+    def test_dead_provider_stays_open_across_batches(self, monkeypatch, tmp_path):
+        """검색 오류를 삼키는 배치 다운로드가 열린 제공자 서킷을 닫지 않음"""
+        import sys
+
+        from src.utils.module_loader import load_script
+
+        script = load_script("02_get_images.py")
+        # 스크립트가 import한 retry_utils (sys.path에 따라 utils.* / src.utils.*)
+        retry_utils = sys.modules[script.retry_with_backoff.__module__]
+        breaker = retry_utils.CircuitBreaker("pexels", failure_threshold=2, reset_timeout=60)
+        monkeypatch.setitem(retry_utils._breakers, "pexels", breaker)
+        monkeypatch.setitem(retry_utils._budgets, "pexels", retry_utils.RetryBudget(100, refill_per_second=0))
+        monkeypatch.setattr(retry_utils.time, "sleep", lambda seconds: None)
+
+        searches = []
+
+        class DeadPexels:
+            def search(self, keyword, page, results_per_page):
+                searches.append(keyword)
+                raise ConnectionError("connection refused")
+
+        downloader = script.ImageDownloader()
+        downloader.pexels = DeadPexels()
+
+        assert downloader.download_mood_images_pexels(["숲", "바다"], num_images=4, output_dir=tmp_path) == []
+        assert breaker.state == "open"
+        assert len(searches) == 2  # 두 번째 실패에서 서킷이 열려 나머지 검색은 호출 없이 건너뜀
+
+        assert downloader.download_mood_images_pexels(["숲", "바다"], num_images=4, output_dir=tmp_path) == []
+        assert breaker.state == "open"
+        assert len(searches) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
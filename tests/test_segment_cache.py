@@ -0,0 +1,101 @@
+"""
+렌더링 구간 캐시 테스트
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from src.utils.media_probe import MediaProbe
+from src.utils.segment_cache import SegmentCache, concat_segments, segment_key, text_digest
+
+
+def _make_clip(path, frequency):
+    """imageio-ffmpeg로 1초짜리 영상 생성 (구간 연결 테스트용, 동일 인코딩 설정)"""
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-v", "error",
+         "-f", "lavfi", "-i", "testsrc=size=320x240:rate=25",
+         "-f", "lavfi", "-i", f"sine=frequency={frequency}:sample_rate=44100",
+         "-t", "1", "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(path)],
+        check=True,
+    )
+    return path
+
+
+def _write(path):
+    path.write_bytes(b"x")
+    return path
+
+
+class TestSegmentKey:
+    def test_key_depends_on_content_and_params(self, tmp_path):
+        audio = tmp_path / "summary.mp3"
+        audio.write_bytes(b"audio")
+        images = [tmp_path / "mood_01.jpg", tmp_path / "mood_02.jpg"]
+        for image in images:
+            image.write_bytes(image.name.encode())
+
+        key = segment_key("summary", files={"audio": audio, "images": images}, params={"fps": 30})
+        assert key.startswith("summary_")
+        assert key == segment_key("summary", files={"audio": audio, "images": images}, params={"fps": 30})
+        assert key != segment_key("summary", files={"audio": audio, "images": images}, params={"fps": 24})
+        assert key != segment_key("summary", files={"audio": audio, "images": images[::-1]}, params={"fps": 30})
+
+        audio.write_bytes(b"new audio")
+        assert key != segment_key("summary", files={"audio": audio, "images": images}, params={"fps": 30})
+
+    def test_text_digest(self):
+        assert text_digest(None) is None
+        assert text_digest("요약") == text_digest("요약") != text_digest("요약!")
+
+
+class TestSegmentCache:
+    def test_put_get_and_prune(self, tmp_path):
+        cache = SegmentCache(tmp_path / "segments", max_entries=2)
+        assert cache.get("a") is None
+
+        for i, key in enumerate(["a", "b", "c"]):
+            tmp = _write(cache.temp_path(key))
+            cached = cache.put(key, tmp)
+            os.utime(cached, (1000 + i, 1000 + i))
+            assert not tmp.exists()
+
+        cache.put("d", _write(cache.temp_path("d")))
+        assert cache.get("a") is None
+        assert cache.get("d") is not None
+        assert len(list((tmp_path / "segments").glob("*.mp4"))) == 2
+
+    def test_empty_file_is_miss(self, tmp_path):
+        cache = SegmentCache(tmp_path)
+        cache.path_for("a").write_bytes(b"")
+        assert cache.get("a") is None
+
+
+class TestConcatSegments:
+    def test_stream_copy_concat(self, tmp_path):
+        """같은 설정으로 인코딩된 구간은 재인코딩 없이 연결"""
+        first = _make_clip(tmp_path / "summary.mp4", 440)
+        second = _make_clip(tmp_path / "tail.mp4", 660)
+        output = tmp_path / "final.mp4"
+        assert concat_segments([first, second], output)
+        info = MediaProbe(cache_path=None).probe(output)
+        assert info.duration == pytest.approx(2.0, abs=0.15)
+        assert info.resolution == (320, 240)
+
+    def test_single_segment_copy(self, tmp_path):
+        """구간 하나만 있어도 (Summary만 있는 영상) 재인코딩 없이 그대로 복사"""
+        segment = _make_clip(tmp_path / "summary.mp4", 440)
+        output = tmp_path / "final.mp4"
+        assert concat_segments([segment], output)
+        probe = MediaProbe(cache_path=None)
+        assert probe.probe(output).duration == pytest.approx(probe.probe(segment).duration, abs=0.05)
+
+    def test_missing_input_fails(self, tmp_path):
+        pytest.importorskip("imageio_ffmpeg")
+        assert not concat_segments([tmp_path / "nope.mp4"], tmp_path / "out.mp4")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
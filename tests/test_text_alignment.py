@@ -0,0 +1,107 @@
+"""
+원본 텍스트 ↔ Whisper 전사 정렬 테스트
+"""
+
+import random
+import time
+
+import pytest
+
+from src.utils.text_alignment import (
+    align_sentences,
+    align_tokens,
+    normalize_token,
+    segments_to_words,
+    tokenize,
+)
+
+
+def timed_words(text, step=0.3):
+    """공백 단위 단어에 일정 간격 타임스탬프 부여"""
+    return [{"word": w, "start": i * step, "end": i * step + step} for i, w in enumerate(text.split())]
+
+
+class TestNormalize:
+    def test_korean_particles_removed(self):
+        assert normalize_token("인류는") == "인류"
+        assert normalize_token("사피엔스가,") == "사피엔스"
+        assert normalize_token("역사를") == normalize_token("역사")
+        # 어간이 한 글자가 되면 떼지 않음
+        assert normalize_token("나는") == "나는"
+
+    def test_english(self):
+        assert tokenize("Hello, World!", "en") == ["hello", "world"]
+
+
+class TestAlignTokens:
+    def test_substitution_insertion_deletion(self):
+        ref = ["a", "b", "c", "d", "e"]
+        hyp = ["a", "x", "c", "uh", "d"]
+        result = align_tokens(ref, hyp)
+        assert result[0] == (0, 0)
+        assert result[1] == (1, 2)
+        assert result[2] == (2, 0)
+        assert result[3] == (4, 0)
+        assert result[4] is None
+
+    def test_partial_match(self):
+        assert align_tokens(["사피엔스"], ["사피엔"])[0] == (0, 1)
+
+    def test_empty(self):
+        assert align_tokens(["a"], []) == [None]
+
+
+class TestAlignSentences:
+    def test_korean_sentences(self):
+        sentences = ["인류는 아프리카에서 시작되었습니다.", "사피엔스가 세계를 정복했다."]
+        # Whisper 전사: 조사 표기 차이 + 단어 하나 누락
+        words = timed_words("인류가 아프리카에서 시작되었습니다 사피엔스는 정복했다")
+        subtitles = align_sentences(sentences, words, "ko")
+        assert [s["text"] for s in subtitles] == sentences
+        assert subtitles[0]["start"] == 0.0
+        assert subtitles[0]["end"] == pytest.approx(0.9)
+        assert subtitles[1]["start"] == pytest.approx(0.9)
+        assert subtitles[1]["end"] == pytest.approx(1.5)
+
+    def test_unmatched_sentence_interpolated(self):
+        sentences = ["alpha beta gamma.", "zzz qqq.", "delta epsilon."]
+        words = timed_words("alpha beta gamma one two delta epsilon")
+        subtitles = align_sentences(sentences, words, "en")
+        assert subtitles[1]["start"] == pytest.approx(0.9)
+        assert subtitles[1]["end"] == pytest.approx(1.5)
+
+    def test_segments_min_ratio(self):
+        segments = [{"start": 0.0, "end": 2.0, "text": "completely different words"}]
+        assert align_sentences(["nothing in common here."], segments_to_words(segments), "en",
+                               min_match_ratio=0.3) is None
+
+        words = segments_to_words([{"start": 0.0, "end": 4.0, "text": "ab abcd"}])
+        assert words[0]["end"] == pytest.approx(4.0 * 2 / 6)
+
+    def test_long_transcript_without_drift(self):
+        """긴 전사에서도 누락/삽입/오인식 후 문장 경계가 밀리지 않고 빠르게 정렬"""
+        rng = random.Random(0)
+        vocab = [f"w{i}" for i in range(400)]
+        sentences = [" ".join(rng.choice(vocab) for _ in range(12)) + "." for _ in range(300)]
+        words, sentence_starts, t = [], [], 0.0
+        for sentence in sentences:
+            sentence_starts.append(t)
+            for word in sentence.rstrip(".").split():
+                if rng.random() < 0.05:
+                    continue  # 누락
+                if rng.random() < 0.05:
+                    words.append({"word": "uh", "start": t, "end": t + 0.1})
+                    t += 0.1
+                words.append({"word": word if rng.random() > 0.05 else word + "x", "start": t, "end": t + 0.3})
+                t += 0.3
+
+        started = time.perf_counter()
+        subtitles = align_sentences(sentences, words, "en")
+        assert time.perf_counter() - started < 2.0
+        assert len(subtitles) == len(sentences)
+        for subtitle, expected_start in zip(subtitles, sentence_starts):
+            assert abs(subtitle["start"] - expected_start) < 0.7
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
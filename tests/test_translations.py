@@ -0,0 +1,62 @@
+"""
+번역 인덱스 테스트
+"""
+
+import pytest
+
+from src.utils.translations import (
+    TranslationIndex,
+    get_translation_index,
+    translate_author_name,
+    translate_author_name_to_korean,
+    translate_book_title,
+    translate_book_title_to_korean,
+)
+
+
+class TestTranslationIndex:
+    def test_exact_and_folded_lookup(self):
+        """공백/언더스코어/대소문자 차이 무시"""
+        assert translate_book_title("습관의 힘") == "The Power of Habit"
+        assert translate_book_title("습관의_힘") == "The Power of Habit"
+        assert translate_book_title("파이프_이야기") == "The Pipe Stories"
+        assert translate_book_title("wizard of oz") == "The Wizard of Oz"
+
+    def test_underscore_variant_preferred(self):
+        """언더스코어 키에 별도 값이 있으면 기존처럼 우선 사용 (파일명용 값)"""
+        index = TranslationIndex({"단 한 번의 삶": "One Life", "단_한_번의_삶": "One_Life"})
+        assert index.translate("단 한 번의 삶") == "One_Life"
+
+    def test_bidirectional(self):
+        """한쪽 매핑에만 있는 항목도 반대 방향으로 조회"""
+        assert translate_book_title_to_korean("The Power of Habit") == "습관의 힘"
+        assert translate_author_name_to_korean("Charles Duhigg") == "찰스 두히그"
+        assert translate_author_name("김영하") == "Kim Young-ha"
+
+    def test_reverse_rows_keep_direction(self):
+        """반대 방향 매핑의 역방향 행을 뒤집어 원래 언어로 되돌리지 않음"""
+        for name in ("Demis Hassabis", "DeepMind", "Natsume Soseki"):
+            assert translate_author_name(name) == name
+        assert translate_author_name_to_korean("Demis Hassabis") == "데미스 허사비스"
+        assert translate_author_name("데미스 허사비스") == "Demis Hassabis"
+
+        index = TranslationIndex({}, inverse_of={"홍길동": "Hong Gildong", "Hong Gildong": "홍길동"}, target="en")
+        assert index.translate("Hong Gildong") == "Hong Gildong"
+        assert index.translate("홍길동") == "Hong Gildong"
+
+    def test_unknown_returns_original(self):
+        assert translate_book_title("없는 책 제목 123") == "없는 책 제목 123"
+        assert translate_author_name("Unknown Author") == "Unknown Author"
+
+    def test_fuzzy_fallback(self):
+        """띄어쓰기가 다른 제목은 fuzzy=True일 때만 매칭"""
+        assert translate_book_title("습관의힘") == "습관의힘"
+        assert translate_book_title("습관의힘", fuzzy=True) == "The Power of Habit"
+        assert get_translation_index("book_titles_ko_en").fuzzy_lookup("전혀 다른 문장입니다") is None
+
+    def test_index_compiled_once(self):
+        assert get_translation_index("authors_ko_en") is get_translation_index("authors_ko_en")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+YouTube Data API ETag 캐시 테스트
+
+로컬 가짜 YouTube 서버(http.server)에 실제 googleapiclient 서비스 객체로 요청합니다.
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+httplib2 = pytest.importorskip("httplib2")
+discovery = pytest.importorskip("googleapiclient.discovery")
+
+from src.utils.youtube_cache import ETagCache, cache_stats, enable_etag_cache, quota_cost
+
+
+class FakeYouTubeServer:
+    """videos/search 목록과 videos 수정만 흉내내는 서버 (If-None-Match → 304)"""
+
+    def __init__(self):
+        self.titles = {"v1": "사피엔스", "v2": "코스모스"}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, payload):
+                body = json.dumps(payload).encode("utf-8")
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return 304
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return 200
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                ids = query.get("id", [""])[0].split(",")
+                items = [{"id": vid, "snippet": {"title": server.titles[vid]}} for vid in ids if vid in server.titles]
+                status = self._send_json({"kind": "youtube#videoListResponse", "items": items})
+                server.requests.append(("GET", parts.path, self.headers.get("If-None-Match"), status))
+
+            def do_PUT(self):
+                length = int(self.headers.get("Content-Length", 0))
+                video = json.loads(self.rfile.read(length))
+                server.titles[video["id"]] = video["snippet"]["title"]
+                server.requests.append(("PUT", urlsplit(self.path).path, None, 200))
+                self._send_json(video)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    with FakeYouTubeServer() as fake:
+        yield fake
+
+
+def build_service(server, tmp_path, fresh_for=0.0):
+    service = discovery.build(
+        "youtube", "v3", http=httplib2.Http(), static_discovery=True,
+        client_options={"api_endpoint": server.endpoint},
+    )
+    return enable_etag_cache(service, cache=ETagCache(tmp_path / "etag.sqlite3"), fresh_for=fresh_for)
+
+
+class TestETagCache:
+    def test_revalidates_with_if_none_match(self, server, tmp_path):
+        youtube = build_service(server, tmp_path)
+
+        first = youtube.videos().list(part="snippet", id="v1").execute()
+        second = youtube.videos().list(part="snippet", id="v1").execute()
+
+        assert first == second
+        assert second["items"][0]["snippet"]["title"] == "사피엔스"
+        assert server.requests[0][2] is None
+        assert server.requests[1][2] is not None and server.requests[1][3] == 304
+        stats = cache_stats(youtube)
+        assert (stats.requests, stats.not_modified, stats.units_saved) == (2, 1, 1)
+
+        # 새 서비스 객체(다음 실행)도 보관본으로 재검증
+        youtube = build_service(server, tmp_path)
+        youtube.videos().list(part="snippet", id="v1").execute()
+        assert server.requests[-1][3] == 304
+
+    def test_fresh_reads_skip_network_and_writes_invalidate(self, server, tmp_path):
+        youtube = build_service(server, tmp_path, fresh_for=300)
+
+        youtube.videos().list(part="snippet", id="v1").execute()
+        youtube.videos().list(part="snippet", id="v1").execute()
+        assert len(server.requests) == 1
+        assert cache_stats(youtube).served_fresh == 1
+
+        youtube.videos().update(part="snippet", body={"id": "v1", "snippet": {"title": "사피엔스 (개정)"}}).execute()
+        assert cache_stats(youtube).invalidated == 1
+
+        updated = youtube.videos().list(part="snippet", id="v1").execute()
+        assert updated["items"][0]["snippet"]["title"] == "사피엔스 (개정)"
+        assert server.requests[-1][2] is None
+
+    def test_enable_is_idempotent_and_quota_costs(self, server, tmp_path):
+        youtube = build_service(server, tmp_path)
+        http = youtube._http
+        assert enable_etag_cache(youtube)._http is http
+        assert quota_cost("/youtube/v3/search") == 100
+        assert quota_cost("/youtube/v3/videos") == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])